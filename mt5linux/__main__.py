@@ -10,6 +10,9 @@ Usage:
     python -m mt5linux --server
     python -m mt5linux --server --host 0.0.0.0 --port 50051 --debug
 
+    # Benchmark RPC latency against a local simulated bridge
+    python -m mt5linux bench --output bench.json
+
     # Client usage (in Python code)
     with MetaTrader5(host="windows-ip", port=50051) as mt5:
         mt5.initialize(login=12345)
@@ -22,6 +25,7 @@ import logging
 import sys
 
 from mt5linux import __version__
+from mt5linux.bench import main as bench_main
 from mt5linux.bridge import main as bridge_main
 
 logger = logging.getLogger(__name__)
@@ -35,6 +39,7 @@ mt5linux v{__version__} - MetaTrader5 Client/Server for Linux via gRPC
 Usage:
     python -m mt5linux              # Show this info
     python -m mt5linux --server     # Run gRPC server (Windows with MT5)
+    python -m mt5linux bench        # Benchmark RPC latency (simulated bridge)
 
 Server Options:
     --server              Start gRPC bridge server
@@ -42,6 +47,12 @@ Server Options:
     -p, --port PORT       Listen port (default: 50051)
     --workers N           Worker threads (default: 10)
     -d, --debug           Enable debug logging
+    --simulate            Serve a simulated terminal (no MetaTrader5 needed)
+
+Benchmark Options (python -m mt5linux bench --help):
+    -n, --iterations N    Measured calls per scenario (default: 100)
+    -o, --output PATH     JSON report (default: mt5linux-bench.json)
+    --compare REPORT      Print p50/p99 changes against an earlier report
 
 Client Usage (Python):
 
@@ -77,6 +88,10 @@ def main() -> int:
         server_args = [a for a in args if a not in {"--server", "-s"}]
         return bridge_main(server_args)
 
+    # Benchmark subcommand
+    if args and args[0] == "bench":
+        return bench_main(args[1:])
+
     # Check for help
     if "-h" in args or "--help" in args:
         _print_info()
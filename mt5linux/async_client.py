@@ -32,15 +32,20 @@ Compatible with grpcio 1.60+ and Python 3.13+.
 from __future__ import annotations
 
 import asyncio
+import functools
 import logging
+import time
 
 # pylint: disable=no-member  # Protobuf generated code has dynamic members
-from contextlib import suppress
+from collections import deque
+from concurrent.futures import Future
+from contextlib import contextmanager, suppress
 from datetime import UTC, datetime, timedelta
-from typing import TYPE_CHECKING, Self, cast
+from typing import TYPE_CHECKING, Literal, Self, cast, overload
 
 import grpc
 import grpc.aio
+import numpy as np
 import orjson
 
 from mt5linux.constants import MT5Constants as c
@@ -54,9 +59,14 @@ from mt5linux.utilities import MT5Utilities as u
 from . import mt5_pb2, mt5_pb2_grpc
 
 if TYPE_CHECKING:
-    from collections.abc import Awaitable, Callable
+    from collections.abc import (
+        AsyncIterator,
+        Awaitable,
+        Callable,
+        Iterator,
+        Sequence,
+    )
 
-    import numpy as np
     from numpy.typing import NDArray
 
 # TypeVar for generic return type in _resilient_call
@@ -70,6 +80,28 @@ _NOT_CONNECTED_MSG = "MT5 connection not established - call connect() first"
 # Health check failure threshold before marking disconnected
 _HEALTH_CHECK_FAILURE_THRESHOLD = 3
 
+# Incremental rates fetch window past max(now, last cached bar): bar times are
+# broker server time, which can run hours ahead of UTC
+_RATES_RANGE_LOOKAHEAD = timedelta(days=7)
+
+# OrderSendBatch runs orders in waves of the bridge's MT5 workers (4 by
+# default); the stream deadline allows one call timeout per wave plus one
+_ORDER_BATCH_WAVE = 4
+
+# Broker server time can also lag UTC by up to 12h (UTC-12): stored segments
+# ending within that lag of the settle cutoff are clipped by the server clock
+_MAX_SERVER_TIME_LAG = 12 * 3600
+
+# Operations that don't require terminal connection
+# - initialize/login: These establish the connection
+# - shutdown: Disconnecting doesn't need connection
+# - terminal_info: Used BY the terminal check (avoid infinite recursion)
+# - version: Basic info, doesn't need broker connection
+# - bridge_metrics: Bridge diagnostics, never touches the terminal
+_TERMINAL_CHECK_EXCLUDED_OPS = frozenset(
+    {"initialize", "login", "shutdown", "terminal_info", "version", "bridge_metrics"}
+)
+
 # gRPC channel options from config (no more hardcoded values)
 _CHANNEL_OPTIONS = _settings.get_grpc_channel_options()
 
@@ -77,6 +109,64 @@ _CHANNEL_OPTIONS = _settings.get_grpc_channel_options()
 JSONValue = t.JSONValue
 
 
+# grpc-stubs make it generic; the runtime class is not subscriptable
+if TYPE_CHECKING:
+    _UnaryUnaryInterceptor = grpc.aio.UnaryUnaryClientInterceptor[object, object]
+else:
+    _UnaryUnaryInterceptor = grpc.aio.UnaryUnaryClientInterceptor
+
+
+class _StageTimingInterceptor(_UnaryUnaryInterceptor):
+    """Record the gRPC round trip and bridge stages of unary calls.
+
+    Runs in the calling task's context, so calls outside a u.Metrics scope
+    pass straight through. Bridge stages come from the mt5-stages trailer.
+    """
+
+    async def intercept_unary_unary(
+        self,
+        continuation: Callable[
+            [grpc.aio.ClientCallDetails, object],
+            grpc.aio.UnaryUnaryCall[object, object],
+        ],
+        client_call_details: grpc.aio.ClientCallDetails,
+        request: object,
+    ) -> grpc.aio.UnaryUnaryCall[object, object]:
+        """Await the call and record its timings before handing it back."""
+        # grpc-stubs type continuation as returning the call; grpc.aio
+        # returns a coroutine resolving to it
+        invoke = cast(
+            "Callable[[grpc.aio.ClientCallDetails, object], "
+            "Awaitable[grpc.aio.UnaryUnaryCall[object, object]]]",
+            continuation,
+        )
+        if u.Metrics.current() is None:
+            return await invoke(client_call_details, request)
+        start = time.perf_counter()
+        call = await invoke(client_call_details, request)
+        try:
+            await call
+        except grpc.aio.AioRpcError:
+            u.Metrics.record("rpc", time.perf_counter() - start)
+            raise
+        u.Metrics.record_rpc(
+            time.perf_counter() - start, await call.trailing_metadata()
+        )
+        return call
+
+
+def _insecure_channel(target: str, settings: MT5Settings) -> grpc.aio.Channel:
+    """Open the bridge channel, with stage timing when enabled."""
+    interceptors = (
+        [_StageTimingInterceptor()] if settings.enable_stage_metrics else None
+    )
+    return grpc.aio.insecure_channel(
+        target,
+        options=_CHANNEL_OPTIONS,
+        interceptors=cast("Sequence[grpc.aio.ClientInterceptor] | None", interceptors),
+    )
+
+
 def _make_stub(channel: grpc.aio.Channel) -> mt5_pb2_grpc.MT5ServiceStub:
     """Create a typed async MT5 service stub from generated gRPC code."""
     stub_factory = cast(
@@ -86,6 +176,57 @@ def _make_stub(channel: grpc.aio.Channel) -> mt5_pb2_grpc.MT5ServiceStub:
     return stub_factory(channel)
 
 
+def _dict_data(data: bytes) -> dict[str, object] | None:
+    """Parse a serialized DictData response into a dict."""
+    return u.Data.json_to_dict(mt5_pb2.DictData.FromString(data).json_data)
+
+
+def _int_response(data: bytes) -> int:
+    """Parse a serialized IntResponse value."""
+    return mt5_pb2.IntResponse.FromString(data).value
+
+
+def _record_filter(
+    where: t.RecordFilterDict | None,
+) -> mt5_pb2.RecordFilter | None:
+    """Build the bridge-side row filter of a list getter (None = no filter)."""
+    if not where:
+        return None
+    data: dict[str, object] = dict(where)
+    for key in ("time_from", "time_to"):
+        if key in data:
+            data[key] = u.Data.to_timestamp(cast("datetime | int", data[key]))
+    return mt5_pb2.RecordFilter(**data)
+
+
+def _list_options(
+    request: mt5_pb2.PositionsRequest | mt5_pb2.OrdersRequest | mt5_pb2.HistoryRequest,
+    *,
+    as_array: bool,
+    fields: Sequence[str] | None,
+    record_filter: mt5_pb2.RecordFilter | None,
+) -> None:
+    """Set the result shape, projection and row filter of a list request."""
+    request.as_array = as_array
+    if fields:
+        request.fields.extend(fields)
+    if record_filter is not None:
+        request.where.CopyFrom(record_filter)
+
+
+def _filter_key(record_filter: mt5_pb2.RecordFilter | None) -> bytes | None:
+    """Hashable coalescing key for a row filter."""
+    if record_filter is None:
+        return None
+    return record_filter.SerializeToString(deterministic=True)
+
+
+def _dict_list(data: bytes) -> list[dict[str, object]] | None:
+    """Parse a serialized DictList response into dicts."""
+    json_items = list(mt5_pb2.DictList.FromString(data).json_items)
+    return u.Data.unwrap_proto_list_to_dicts(json_items)
+
+
 class AsyncMetaTrader5(AsyncMT5Protocol):
     """Async wrapper for MetaTrader5 client using native gRPC async.
 
@@ -112,6 +253,7 @@ class AsyncMetaTrader5(AsyncMT5Protocol):
         *,
         health_check_interval: int = _settings.timeout_health_check,
         max_reconnect_attempts: int = _settings.retry_max_attempts,
+        config: MT5Settings | None = None,
     ) -> None:
         """Initialize async MT5 client.
 
@@ -121,6 +263,8 @@ class AsyncMetaTrader5(AsyncMT5Protocol):
             timeout: Timeout in seconds for MT5 operations.
             health_check_interval: Seconds between connection health checks.
             max_reconnect_attempts: Max attempts for reconnection.
+            config: Settings for resilience, caches and the request queue
+                (default: MT5Settings() from the environment).
 
         """
         self._host = host
@@ -136,7 +280,7 @@ class AsyncMetaTrader5(AsyncMT5Protocol):
         self._lock = asyncio.Lock()
 
         # Resilience components (opt-in via config)
-        self._settings = _settings
+        self._settings = config if config is not None else _settings
         self._circuit_breaker: u.CircuitBreaker | None = None
         if self._settings.enable_circuit_breaker:
             self._circuit_breaker = u.CircuitBreaker(
@@ -149,9 +293,51 @@ class AsyncMetaTrader5(AsyncMT5Protocol):
         self._health_monitor_running = False
         self._consecutive_failures = 0
 
+        # Cached terminal connectivity (avoids terminal_info before every call)
+        self._connectivity = u.ConnectivityState(config=self._settings)
+
+        # Builds response models (validated, or constructed when trusted)
+        self._models = u.ModelFactory(config=self._settings)
+
+        # Per-stage request timings (enable_stage_metrics)
+        self._metrics: u.Metrics.Recorder = u.Metrics.Histograms()
+
+        # Opt-in symbol metadata cache (symbol_cache_ttl > 0)
+        self._symbol_cache: u.TTLCache[MT5Models.SymbolInfo] = u.TTLCache(
+            max_size=self._settings.symbol_cache_max_size,
+            ttl=self._settings.symbol_cache_ttl,
+        )
+        self._symbols_cache: u.TTLCache[tuple[MT5Models.SymbolInfo, ...]] = u.TTLCache(
+            max_size=self._settings.symbol_cache_max_size,
+            ttl=self._settings.symbol_cache_ttl,
+        )
+        # time.monotonic() of the last quote overlay per cached symbol
+        self._symbol_quoted_at: dict[str, float] = {}
+
+        # Opt-in incremental OHLCV cache for copy_rates_from_pos(start_pos=0)
+        self._rates_cache = u.RatesCache(
+            max_bytes=self._settings.rates_cache_max_bytes,
+        )
+
+        # Opt-in on-disk history for copy_ticks_range/copy_rates_range
+        self._history_store: u.HistoryStore | None = None
+        if self._settings.history_store_path:
+            self._history_store = u.HistoryStore(config=self._settings)
+
+        # Recent deals indexed by request_id for ambiguous-order verification
+        self._deal_journal: u.DealJournal[MT5Models.Deal] = u.DealJournal(
+            window_seconds=self._settings.tx_verify_search_window_minutes * 60,
+        )
+
+        # Set when the bridge lacks the typed market data RPCs
+        self._typed_rpc_unsupported = False
+
         # Request queue for parallel execution (100% transparent)
         self._queue: u.RequestQueue | None = None
 
+        # Duplicates slow idempotent reads (hedge_reads, set up by connect)
+        self._hedger: u.Hedger | None = None
+
         # Write-Ahead Log for order persistence (100% transparent)
         self._wal: u.WAL | None = None
 
@@ -169,6 +355,43 @@ class AsyncMetaTrader5(AsyncMT5Protocol):
         """Check if client is connected."""
         return self._channel is not None
 
+    @property
+    def metrics(self) -> u.Metrics.Recorder:
+        """Recorder of per-stage request timings (enable_stage_metrics).
+
+        Defaults to in-memory u.Metrics.Histograms: snapshot() for p50/p95/p99
+        per operation and stage, to_openmetrics() for a scrape endpoint.
+        Assign any object with observe(operation, stage, seconds) to export
+        elsewhere.
+        """
+        return self._metrics
+
+    @metrics.setter
+    def metrics(self, recorder: u.Metrics.Recorder) -> None:
+        self._metrics = recorder
+
+    @property
+    def is_available(self) -> bool:
+        """Check if client is connected and its circuit breaker is not open."""
+        cb = self._circuit_breaker
+        return self.is_connected and (cb is None or not cb.is_open)
+
+    @property
+    def circuit_status(self) -> dict[str, str | int] | None:
+        """Get circuit breaker status (None when the breaker is disabled)."""
+        cb = self._circuit_breaker
+        return None if cb is None else cb.get_status()
+
+    @property
+    def queue_status(self) -> dict[str, int] | None:
+        """Get request queue concurrency status (None when not connected).
+
+        Holds the adaptive in-flight limit, its min/max bounds, how often it
+        was cut, and the in_flight and pending request counts.
+        """
+        queue = self._queue
+        return None if queue is None else queue.get_status()
+
     def __getattr__(self, name: str) -> int:
         """Get MT5 constants (TIMEFRAME_H1, ORDER_TYPE_BUY, etc).
 
@@ -222,8 +445,9 @@ class AsyncMetaTrader5(AsyncMT5Protocol):
             target = f"{self._host}:{self._port}"
             log.debug("Connecting to gRPC server at %s", target)
 
-            self._channel = grpc.aio.insecure_channel(target, options=_CHANNEL_OPTIONS)
+            self._channel = _insecure_channel(target, self._settings)
             self._stub = _make_stub(self._channel)
+            self._typed_rpc_unsupported = False
 
             # Load constants from server
             await self._load_constants()
@@ -238,6 +462,8 @@ class AsyncMetaTrader5(AsyncMT5Protocol):
             # Start request queue (100% transparent - parallel execution)
             self._queue = u.RequestQueue(self._settings)
             await self._queue.start()
+            if self._settings.hedge_reads and self._hedger is None:
+                self._hedger = u.Hedger(config=self._settings)
 
             log.info("Connected to MT5 gRPC server at %s", target)
 
@@ -276,6 +502,7 @@ class AsyncMetaTrader5(AsyncMT5Protocol):
         channel = self._channel
         self._channel = None
         self._stub = None
+        self._connectivity.invalidate()
 
         try:
             await channel.close(grace=None)
@@ -423,7 +650,7 @@ class AsyncMetaTrader5(AsyncMT5Protocol):
 
             # Create new connection
             target = f"{self._host}:{self._port}"
-            self._channel = grpc.aio.insecure_channel(target, options=_CHANNEL_OPTIONS)
+            self._channel = _insecure_channel(target, self._settings)
             self._stub = _make_stub(self._channel)
 
             # Test connection with health check
@@ -550,6 +777,7 @@ class AsyncMetaTrader5(AsyncMT5Protocol):
                             self._stub.HealthCheck(mt5_pb2.Empty()),
                             timeout=5.0,
                         )
+                        self._connectivity.record(connected=result.connected)
                         if not result.connected:
                             log.warning("Health check: MT5 terminal not connected")
                             self._consecutive_failures += 1
@@ -559,6 +787,7 @@ class AsyncMetaTrader5(AsyncMT5Protocol):
 
                     except TimeoutError:
                         log.warning("Health check timeout")
+                        self._connectivity.invalidate()
                         self._consecutive_failures += 1
                         threshold = _HEALTH_CHECK_FAILURE_THRESHOLD
                         if self._consecutive_failures >= threshold:
@@ -570,6 +799,7 @@ class AsyncMetaTrader5(AsyncMT5Protocol):
 
                     except grpc.aio.AioRpcError as e:
                         log.warning("Health check gRPC error: %s", e)
+                        self._connectivity.invalidate()
                         self._consecutive_failures += 1
 
             except asyncio.CancelledError:
@@ -625,6 +855,28 @@ class AsyncMetaTrader5(AsyncMT5Protocol):
         if self._circuit_breaker is not None:
             self._circuit_breaker.record_failure()
 
+    def _record_call_success(self, operation: str, result: object) -> None:
+        """Refresh connectivity state from a completed call's result.
+
+        A login-dependent call returning data proves the terminal is
+        connected, which refreshes the cached state without a terminal_info
+        probe. A None result is how MT5 reports most failures (including a
+        dead terminal), so it leaves the state to age out and be re-probed.
+
+        Args:
+            operation: Name of the completed operation.
+            result: Value returned by the call.
+
+        """
+        if result is not None and operation not in _TERMINAL_CHECK_EXCLUDED_OPS:
+            self._connectivity.record(connected=True)
+
+    def _record_call_failure(self, error: Exception | None = None) -> None:
+        """Record failed operation, invalidating connectivity on link errors."""
+        self._record_circuit_failure(error)
+        if error is not None and u.ErrorClassifier.is_connectivity_error(error):
+            self._connectivity.invalidate()
+
     def _check_circuit_breaker(self, operation: str) -> None:
         """Check if circuit breaker allows operation.
 
@@ -647,6 +899,10 @@ class AsyncMetaTrader5(AsyncMT5Protocol):
         connection. This method waits for the terminal to be connected, retrying
         gRPC reconnection and terminal reinitialization as needed.
 
+        Hot path: answered from the cached connectivity state while it is fresh
+        (see terminal_state_staleness). A live terminal_info probe only runs when
+        the state is stale, unknown, or was invalidated by a connectivity error.
+
         Excluded operations (don't require terminal connection):
         - initialize: This IS the connection operation
         - shutdown: Disconnecting doesn't need connection
@@ -658,21 +914,34 @@ class AsyncMetaTrader5(AsyncMT5Protocol):
             ConnectionError: If terminal cannot be connected after max retries.
 
         """
-        # Operations that don't require terminal connection
-        # - initialize/login: These establish the connection
-        # - shutdown: Disconnecting doesn't need connection
-        # - terminal_info: Used BY this check (avoid infinite recursion)
-        # - version: Basic info, doesn't need broker connection
-        excluded_ops = {"initialize", "login", "shutdown", "terminal_info", "version"}
-        if operation in excluded_ops:
-            return  # Skip check for these operations
+        # Skip for excluded operations, or when recently observed connected
+        if (
+            operation in _TERMINAL_CHECK_EXCLUDED_OPS
+            or self._connectivity.is_fresh_connected()
+        ):
+            return
+
+        with u.Metrics.stage("precheck"):
+            await self._probe_terminal_connected(operation)
+
+    async def _probe_terminal_connected(self, operation: str) -> None:
+        """Probe terminal_info until connected, reconnecting in between.
+
+        Args:
+            operation: Name of operation for logging.
+
+        Raises:
+            ConnectionError: If terminal cannot be connected after max retries.
 
+        """
         max_attempts = self._settings.retry_max_attempts
         for attempt in range(max_attempts):
             try:
                 # terminal_info uses partial resilience (no CB, no reinit)
                 info = await self.terminal_info()
-                if info is not None and info.connected:
+                connected = info is not None and bool(info.connected)
+                self._connectivity.record(connected=connected)
+                if connected:
                     return  # Terminal connected, proceed with operation
 
                 # Not connected - try to reconnect
@@ -755,6 +1024,9 @@ class AsyncMetaTrader5(AsyncMT5Protocol):
 
         Delegates to u.RetryStrategy.async_retry_with_backoff()
         with circuit breaker hooks for unified retry logic.
+        With enable_stage_metrics, the call runs in a u.Metrics scope for
+        operation, so its stages (precheck, queue_wait, rpc, decode, ...)
+        and total time land in self.metrics.
 
         Args:
             operation: Name of the operation for logging.
@@ -769,26 +1041,81 @@ class AsyncMetaTrader5(AsyncMT5Protocol):
             Exception: Non-retryable exceptions propagate immediately.
 
         """
-        # 1. Check if circuit allows execution BEFORE retry loop
-        self._check_circuit_breaker(operation)
-
-        # 2. Ensure terminal connected BEFORE executing operation
-        # Operations requiring login MUST have terminal_info().connected == True
-        await self._ensure_terminal_connected_for_operation(operation)
+        with self._metrics_scope(operation):
+            # 1. Check if circuit allows execution BEFORE retry loop
+            self._check_circuit_breaker(operation)
 
-        # 3. Define before_retry callback for gRPC reconnection + terminal reinit
-        async def _before_retry() -> None:
+            # 2. Ensure terminal connected BEFORE executing operation
+            # Operations requiring login MUST have terminal_info().connected == True
             await self._ensure_terminal_connected_for_operation(operation)
 
-        # 4. Delegate to unified retry implementation with CB hooks
-        return await u.RetryStrategy.async_retry_with_backoff(
-            call_factory,
-            _settings,
+            # 3. Define before_retry callback for gRPC reconnection + terminal reinit
+            # A retry means the call failed: drop cached state to force a live probe
+            async def _before_retry() -> None:
+                self._connectivity.invalidate()
+                await self._ensure_terminal_connected_for_operation(operation)
+
+            # 4. Delegate to unified retry implementation with CB hooks
+            result = await u.RetryStrategy.async_retry_with_backoff(
+                call_factory,
+                _settings,
+                operation,
+                should_retry=u.ErrorClassifier.is_retryable_exception,
+                on_success=self._record_circuit_success,
+                on_failure=self._record_call_failure,
+                before_retry=_before_retry,
+            )
+            self._record_call_success(operation, result)
+            return result
+
+    @contextmanager
+    def _metrics_scope(self, operation: str) -> Iterator[None]:
+        """Scope stage timings to operation and record its total time."""
+        if not self._settings.enable_stage_metrics:
+            yield
+            return
+        start = time.perf_counter()
+        with u.Metrics.scope(self._metrics, operation):
+            try:
+                yield
+            finally:
+                u.Metrics.record("total", time.perf_counter() - start)
+
+    async def _read_call(
+        self,
+        operation: str,
+        call_factory: Callable[[], Awaitable[T]],
+        *key_args: object,
+    ) -> T:
+        """Execute read-only call through the request queue with resilience.
+
+        Each attempt of _resilient_call is submitted to the RequestQueue, so
+        queue_max_concurrent bounds in-flight RPCs on the bridge and identical
+        concurrent reads (same operation and arguments) coalesce into one RPC.
+        Operations listed in queue_bypass_operations skip the queue. With
+        hedge_reads, a slow RPC of an eligible operation is duplicated inside
+        its queue slot (see u.Hedger), after coalescing.
+
+        Args:
+            operation: Name of the operation (priority and coalescing key).
+            call_factory: Callable returning an awaitable (the gRPC call).
+            *key_args: Call arguments identifying the request for coalescing.
+
+        Returns:
+            Result of the gRPC call (shared between coalesced callers).
+
+        """
+        attempt = call_factory
+        if self._hedger is not None and u.Hedger.is_eligible(operation):
+            attempt = functools.partial(self._hedger.run, operation, call_factory)
+
+        if operation in self._settings.queue_bypass_operations:
+            return await self._resilient_call(operation, attempt)
+
+        coalesce_key = u.RequestQueue.make_coalesce_key(operation, *key_args)
+        return await self._resilient_call(
             operation,
-            should_retry=u.ErrorClassifier.is_retryable_exception,
-            on_success=self._record_circuit_success,
-            on_failure=self._record_circuit_failure,
-            before_retry=_before_retry,
+            lambda: self._queued_call(operation, attempt, coalesce_key),
         )
 
     # =========================================================================
@@ -863,6 +1190,10 @@ class AsyncMetaTrader5(AsyncMT5Protocol):
             response = await stub.Initialize(request, timeout=self._timeout)
             return response.result
 
+        # May attach to a different account/server: cached data can differ
+        self.invalidate_symbol()
+        self.invalidate_rates()
+        self._deal_journal.clear()
         return await self._resilient_call("initialize", _call)
 
     async def login(
@@ -903,6 +1234,9 @@ class AsyncMetaTrader5(AsyncMT5Protocol):
             response = await stub.Login(request, timeout=self._timeout)
             return response.result
 
+        self.invalidate_symbol()
+        self.invalidate_rates()
+        self._deal_journal.clear()
         return await self._resilient_call("login", _call)
 
     async def shutdown(self) -> None:
@@ -942,6 +1276,25 @@ class AsyncMetaTrader5(AsyncMT5Protocol):
 
         return await self._resilient_call("health_check", _call)
 
+    async def bridge_metrics(self) -> dict[str, object]:
+        """Get bridge runtime metrics (mt5linux extension).
+
+        Returns:
+            Dict with the bridge MT5 call executor state under "mt5_executor":
+            queued/running/hung calls, completed/errors/timeouts/rejected
+            counters and a cumulative "latency_ms" histogram.
+
+        """
+
+        async def _call() -> dict[str, object]:
+            stub = self._ensure_connected()
+            response = await stub.GetBridgeMetrics(
+                mt5_pb2.Empty(), timeout=self._timeout
+            )
+            return u.Data.json_to_dict(response.json_data) or {}
+
+        return await self._resilient_call("bridge_metrics", _call)
+
     async def version(self) -> tuple[int, int, str] | None:
         """Get MT5 terminal version.
 
@@ -957,7 +1310,7 @@ class AsyncMetaTrader5(AsyncMT5Protocol):
                 return None
             return (response.major, response.minor, response.build)
 
-        return await self._resilient_call("version", _call)
+        return await self._read_call("version", _call)
 
     async def last_error(self) -> tuple[int, str]:
         """Get last error code and description.
@@ -972,7 +1325,7 @@ class AsyncMetaTrader5(AsyncMT5Protocol):
             response = await stub.LastError(mt5_pb2.Empty(), timeout=self._timeout)
             return (response.code, response.message)
 
-        return await self._resilient_call("last_error", _call)
+        return await self._read_call("last_error", _call)
 
     async def terminal_info(self) -> MT5Models.TerminalInfo | None:
         """Get terminal information with gRPC retry (NO circuit breaker).
@@ -995,7 +1348,7 @@ class AsyncMetaTrader5(AsyncMT5Protocol):
             stub = self._ensure_connected()
             response = await stub.TerminalInfo(mt5_pb2.Empty(), timeout=self._timeout)
             result_dict = u.Data.json_to_dict(response.json_data)
-            return MT5Models.TerminalInfo.from_mt5(result_dict)
+            return self._models.build(MT5Models.TerminalInfo, result_dict)
 
         async def _reconnect_grpc_only() -> None:
             """Reconnect gRPC with backoff - NO terminal reinitialize."""
@@ -1003,17 +1356,18 @@ class AsyncMetaTrader5(AsyncMT5Protocol):
                 with suppress(Exception):
                     await self._reconnect_with_backoff()
 
-        try:
-            return await u.RetryStrategy.async_retry_with_backoff(
-                _call,
-                self._settings,
-                "terminal_info",
-                should_retry=u.ErrorClassifier.is_retryable_exception,
-                before_retry=_reconnect_grpc_only,
-                # NO on_success/on_failure = NO circuit breaker
-            )
-        except u.Exceptions.MaxRetriesError:
-            return None
+        with self._metrics_scope("terminal_info"):
+            try:
+                return await u.RetryStrategy.async_retry_with_backoff(
+                    _call,
+                    self._settings,
+                    "terminal_info",
+                    should_retry=u.ErrorClassifier.is_retryable_exception,
+                    before_retry=_reconnect_grpc_only,
+                    # NO on_success/on_failure = NO circuit breaker
+                )
+            except u.Exceptions.MaxRetriesError:
+                return None
 
     async def account_info(self) -> MT5Models.AccountInfo | None:
         """Get account information.
@@ -1027,9 +1381,9 @@ class AsyncMetaTrader5(AsyncMT5Protocol):
             stub = self._ensure_connected()
             response = await stub.AccountInfo(mt5_pb2.Empty(), timeout=self._timeout)
             result_dict = u.Data.json_to_dict(response.json_data)
-            return MT5Models.AccountInfo.from_mt5(result_dict)
+            return self._models.build(MT5Models.AccountInfo, result_dict)
 
-        return await self._resilient_call("account_info", _call)
+        return await self._read_call("account_info", _call)
 
     async def current_account(self) -> MT5Models.CurrentAccount:
         """Report which broker/login this container is on (mt5linux extension).
@@ -1134,13 +1488,17 @@ class AsyncMetaTrader5(AsyncMT5Protocol):
             response = await stub.SymbolsTotal(mt5_pb2.Empty(), timeout=self._timeout)
             return response.value
 
-        return await self._resilient_call("symbols_total", _call)
+        return await self._read_call("symbols_total", _call)
 
     async def symbols_get(
         self, group: str | None = None
     ) -> tuple[MT5Models.SymbolInfo, ...] | None:
         """Get available symbols with optional group filter.
 
+        Served from the symbol cache when symbol_cache_ttl > 0 (all
+        SymbolInfo.VOLATILE_FIELDS are as of the cached fetch; symbol_info()
+        bounds their age, refresh_symbols() reloads the group).
+
         Args:
             group: Optional group filter pattern.
 
@@ -1148,7 +1506,14 @@ class AsyncMetaTrader5(AsyncMT5Protocol):
             Tuple of SymbolInfo objects or None.
 
         """
+        cached = self._symbols_cache.get(repr(group))
+        if cached is not None:
+            return cached
+        return await self._fetch_symbols(group)
 
+    async def _fetch_symbols(
+        self, group: str | None
+    ) -> tuple[MT5Models.SymbolInfo, ...] | None:
         async def _call() -> tuple[MT5Models.SymbolInfo, ...] | None:
             stub = self._ensure_connected()
             request = mt5_pb2.SymbolsRequest()
@@ -1158,16 +1523,27 @@ class AsyncMetaTrader5(AsyncMT5Protocol):
             dicts = u.Data.unwrap_symbols_chunks(response)
             if dicts is None:
                 return None
-            result = [
-                s for d in dicts if (s := MT5Models.SymbolInfo.from_mt5(d)) is not None
-            ]
-            return tuple(result) if result else None
+            result = self._models.build_many(MT5Models.SymbolInfo, dicts)
+            return result or None
 
-        return await self._resilient_call("symbols_get", _call)
+        symbols = await self._read_call("symbols_get", _call, group)
+        if symbols is not None and self._symbols_cache.enabled:
+            self._symbols_cache.set(repr(group), symbols)
+            for info in symbols:
+                self._symbol_cache.set(info.name, info)
+                self._symbol_quoted_at.pop(info.name, None)
+        return symbols
 
     async def symbol_info(self, symbol: str) -> MT5Models.SymbolInfo | None:
         """Get detailed symbol information.
 
+        With symbol_cache_ttl > 0, contract data is served from the symbol
+        cache; once its quotes are older than symbol_cache_quote_ttl, they
+        are refreshed from symbol_info_tick instead of a full fetch and the
+        refreshed entry is cached (spread is recomputed from bid/ask). Other
+        SymbolInfo.VOLATILE_FIELDS (tick value, session stats, price change)
+        are refetched once older than symbol_cache_volatile_ttl.
+
         Args:
             symbol: Symbol name (e.g., "EURUSD").
 
@@ -1175,15 +1551,105 @@ class AsyncMetaTrader5(AsyncMT5Protocol):
             SymbolInfo object or None.
 
         """
+        cached = await self._cached_symbol(symbol)
+        if cached is not None:
+            return cached
 
         async def _call() -> MT5Models.SymbolInfo | None:
             stub = self._ensure_connected()
             request = mt5_pb2.SymbolRequest(symbol=symbol)
+            if self._use_typed_rpc():
+                try:
+                    typed = await stub.SymbolInfoTyped(request, timeout=self._timeout)
+                except grpc.RpcError as e:
+                    self._check_typed_rpc_error(e)
+                else:
+                    if not typed.HasField("info"):
+                        return None
+                    return MT5Models.SymbolInfo.from_proto(typed.info)
             response = await stub.SymbolInfo(request, timeout=self._timeout)
             result_dict = u.Data.json_to_dict(response.json_data)
-            return MT5Models.SymbolInfo.from_mt5(result_dict)
+            return self._models.build(MT5Models.SymbolInfo, result_dict)
+
+        result = await self._read_call("symbol_info", _call, symbol)
+        if result is not None:
+            self._symbol_cache.set(symbol, result)
+            self._symbol_quoted_at.pop(symbol, None)
+        return result
+
+    async def _cached_symbol(self, symbol: str) -> MT5Models.SymbolInfo | None:
+        """Serve symbol_info from the cache, overlaying stale quotes.
+
+        Quotes older than symbol_cache_quote_ttl (since the full fetch or the
+        last overlay) are replaced from the current tick and the overlaid
+        entry is cached with the contract's original expiry. An entry whose
+        full fetch is older than symbol_cache_volatile_ttl is a miss, since
+        a tick cannot refresh the rest of SymbolInfo.VOLATILE_FIELDS.
 
-        return await self._resilient_call("symbol_info", _call)
+        Args:
+            symbol: Symbol name.
+
+        Returns:
+            Cached SymbolInfo, or None on a miss, on stale volatile fields
+            or if no tick is available.
+
+        """
+        entry = self._symbol_cache.get_entry(symbol)
+        if entry is None:
+            return None
+        info, age = entry
+        if age >= self._settings.symbol_cache_volatile_ttl:
+            return None
+        quoted_at = self._symbol_quoted_at.get(symbol)
+        if quoted_at is not None:
+            age = time.monotonic() - quoted_at
+        if age < self._settings.symbol_cache_quote_ttl:
+            return info
+        tick = await self.symbol_info_tick(symbol)
+        if tick is None:
+            return None
+        fields = MT5Models.SymbolInfo.QUOTE_FIELDS
+        quote: dict[str, object] = {f: getattr(tick, f) for f in fields}
+        if info.point > 0:
+            quote["spread"] = round((tick.ask - tick.bid) / info.point)
+        refreshed = info.model_copy(update=quote)
+        self._symbol_cache.replace(symbol, refreshed)
+        self._symbol_quoted_at[symbol] = time.monotonic()
+        return refreshed
+
+    def invalidate_symbol(self, symbol: str | None = None) -> None:
+        """Drop cached symbol metadata (mt5linux extension).
+
+        Args:
+            symbol: Symbol to drop; None clears the whole symbol cache.
+                Cached symbols_get groups are always dropped since they may
+                contain the symbol.
+
+        """
+        if symbol is None:
+            self._symbol_cache.clear()
+            self._symbol_quoted_at.clear()
+        else:
+            self._symbol_cache.pop(symbol)
+            self._symbol_quoted_at.pop(symbol, None)
+        self._symbols_cache.clear()
+
+    async def refresh_symbols(
+        self, group: str | None = None
+    ) -> tuple[MT5Models.SymbolInfo, ...] | None:
+        """Reload symbols from the terminal, bypassing the cache (mt5linux extension).
+
+        Repopulates the symbol cache with the fresh results.
+
+        Args:
+            group: Optional group filter pattern.
+
+        Returns:
+            Tuple of SymbolInfo objects or None.
+
+        """
+        self._symbols_cache.pop(repr(group))
+        return await self._fetch_symbols(group)
 
     async def symbol_info_tick(self, symbol: str) -> MT5Models.Tick | None:
         """Get current tick data for a symbol.
@@ -1199,11 +1665,32 @@ class AsyncMetaTrader5(AsyncMT5Protocol):
         async def _call() -> MT5Models.Tick | None:
             stub = self._ensure_connected()
             request = mt5_pb2.SymbolRequest(symbol=symbol)
+            if self._use_typed_rpc():
+                try:
+                    typed = await stub.SymbolInfoTickTyped(
+                        request, timeout=self._timeout
+                    )
+                except grpc.RpcError as e:
+                    self._check_typed_rpc_error(e)
+                else:
+                    if not typed.HasField("tick"):
+                        return None
+                    return MT5Models.Tick.from_proto(typed.tick)
             response = await stub.SymbolInfoTick(request, timeout=self._timeout)
             result_dict = u.Data.json_to_dict(response.json_data)
-            return MT5Models.Tick.from_mt5(result_dict)
+            return self._models.build(MT5Models.Tick, result_dict)
+
+        return await self._read_call("symbol_info_tick", _call, symbol)
 
-        return await self._resilient_call("symbol_info_tick", _call)
+    def _use_typed_rpc(self) -> bool:
+        return self._settings.typed_market_data and not self._typed_rpc_unsupported
+
+    def _check_typed_rpc_error(self, error: grpc.RpcError) -> None:
+        """Re-raise error unless it means the bridge lacks the typed RPCs."""
+        if error.code() != grpc.StatusCode.UNIMPLEMENTED:
+            raise error
+        log.debug("Typed market data RPCs unavailable, using JSON")
+        self._typed_rpc_unsupported = True
 
     async def symbol_select(self, symbol: str, *, enable: bool = True) -> bool:
         """Select/deselect symbol in Market Watch.
@@ -1223,7 +1710,126 @@ class AsyncMetaTrader5(AsyncMT5Protocol):
             response = await stub.SymbolSelect(request, timeout=self._timeout)
             return response.result
 
-        return await self._resilient_call("symbol_select", _call)
+        result = await self._resilient_call("symbol_select", _call)
+        # visible/select flags changed: cached metadata is out of date
+        self.invalidate_symbol(symbol)
+        return result
+
+    # =========================================================================
+    # STREAMING METHODS (mt5linux extension)
+    # =========================================================================
+
+    async def subscribe_ticks(
+        self,
+        symbols: str | Sequence[str],
+        *,
+        interval_ms: int | None = None,
+    ) -> AsyncIterator[tuple[str, MT5Models.Tick]]:
+        """Stream tick updates for one or more symbols.
+
+        Uses the server-streaming SubscribeTicks RPC: the bridge polls
+        symbol_info_tick and pushes only ticks whose time_msc changed, so
+        there is no per-tick request overhead. No retry mid-stream - on a
+        gRPC error the iterator raises and the caller re-subscribes.
+
+        Args:
+            symbols: Symbol name or sequence of symbol names.
+            interval_ms: Server poll interval in milliseconds (bridge default
+                if None).
+
+        Yields:
+            (symbol, Tick) tuples as ticks change.
+
+        Raises:
+            ConnectionError: If circuit breaker is OPEN or terminal unavailable.
+            grpc.aio.AioRpcError: If the stream fails.
+
+        """
+        operation = "subscribe_ticks"
+        self._check_circuit_breaker(operation)
+        await self._ensure_terminal_connected_for_operation(operation)
+
+        stub = self._ensure_connected()
+        request = mt5_pb2.TickSubscribeRequest(
+            symbols=[symbols] if isinstance(symbols, str) else list(symbols),
+        )
+        if interval_ms is not None:
+            request.interval_ms = interval_ms
+        if self._settings.typed_market_data:
+            # Bridges without typed ticks ignore the flag and send json_data
+            request.typed = True
+
+        call = stub.SubscribeTicks(request)
+        try:
+            async for update in call:
+                if update.HasField("tick"):
+                    yield update.symbol, MT5Models.Tick.from_proto(update.tick)
+                    continue
+                tick = MT5Models.Tick.from_mt5(u.Data.json_to_dict(update.json_data))
+                if tick is not None:
+                    yield update.symbol, tick
+        except grpc.aio.AioRpcError as e:
+            if e.code() != grpc.StatusCode.CANCELLED:
+                self._record_call_failure(e)
+            raise
+        finally:
+            call.cancel()
+
+    async def subscribe_book(
+        self,
+        symbols: str | Sequence[str],
+        *,
+        interval_ms: int | None = None,
+    ) -> AsyncIterator[tuple[str, NDArray[np.void]]]:
+        """Stream market depth (DOM) for one or more symbols.
+
+        Uses the server-streaming SubscribeBook RPC: the bridge subscribes
+        the books (market_book_add), sends one snapshot per symbol and then
+        only changed levels. A local u.BookState per symbol applies them, so
+        there is no polling loop over market_book_get. No retry mid-stream -
+        on a gRPC error the iterator raises and the caller re-subscribes.
+
+        Args:
+            symbols: Symbol name or sequence of symbol names.
+            interval_ms: Server snapshot interval in milliseconds (bridge
+                default if None).
+
+        Yields:
+            (symbol, book) tuples on every change; book is a new structured
+            array (DtypeRegistry.BOOK) ordered like market_book_get.
+
+        Raises:
+            ConnectionError: If circuit breaker is OPEN or terminal unavailable.
+            MT5Utilities.Exceptions.Error: If an update arrives out of sequence.
+            grpc.aio.AioRpcError: If the stream fails.
+
+        """
+        operation = "subscribe_book"
+        self._check_circuit_breaker(operation)
+        await self._ensure_terminal_connected_for_operation(operation)
+
+        stub = self._ensure_connected()
+        request = mt5_pb2.BookSubscribeRequest(
+            symbols=[symbols] if isinstance(symbols, str) else list(symbols),
+        )
+        if interval_ms is not None:
+            request.interval_ms = interval_ms
+
+        books: dict[str, u.BookState] = {}
+        call = stub.SubscribeBook(request)
+        try:
+            async for update in call:
+                book = books.get(update.symbol)
+                if book is None:
+                    book = books[update.symbol] = u.BookState(update.symbol)
+                book.apply(update.sequence, update.levels, snapshot=update.snapshot)
+                yield update.symbol, book.to_array()
+        except grpc.aio.AioRpcError as e:
+            if e.code() != grpc.StatusCode.CANCELLED:
+                self._record_call_failure(e)
+            raise
+        finally:
+            call.cancel()
 
     # =========================================================================
     # MARKET DATA METHODS
@@ -1258,9 +1864,13 @@ class AsyncMetaTrader5(AsyncMT5Protocol):
                 count=count,
             )
             response = await stub.CopyRatesFrom(request, timeout=self._timeout)
-            return u.Data.numpy_from_proto(response)
+            return u.Data.numpy_from_proto(
+                response, copy=self._settings.numpy_owned_arrays
+            )
 
-        return await self._resilient_call("copy_rates_from", _call)
+        return await self._read_call(
+            "copy_rates_from", _call, symbol, timeframe, date_from, count
+        )
 
     async def copy_rates_from_pos(
         self,
@@ -1271,6 +1881,11 @@ class AsyncMetaTrader5(AsyncMT5Protocol):
     ) -> NDArray[np.void] | None:
         """Copy OHLCV rates from a bar position.
 
+        With rates_cache_max_bytes > 0, start_pos=0 requests are served from
+        the rates cache: only bars from the newest cached bar onwards are
+        fetched (copy_rates_range) and appended. If that fetch fails, the
+        series is dropped and fetched in full instead of served stale.
+
         Args:
             symbol: Symbol name.
             timeframe: Timeframe constant.
@@ -1281,7 +1896,57 @@ class AsyncMetaTrader5(AsyncMT5Protocol):
             NumPy structured array with OHLCV data or None.
 
         """
+        if start_pos == 0 and self._rates_cache.enabled:
+            return await self._cached_rates_from_pos(symbol, timeframe, count)
+        return await self._fetch_rates_from_pos(symbol, timeframe, start_pos, count)
+
+    async def _cached_rates_from_pos(
+        self,
+        symbol: str,
+        timeframe: int,
+        count: int,
+    ) -> NDArray[np.void] | None:
+        cache = self._rates_cache
+        since = cache.last_time(symbol, timeframe)
+        if since is not None and cache.count(symbol, timeframe) >= count:
+            date_to = (
+                max(datetime.now(UTC), datetime.fromtimestamp(since, UTC))
+                + _RATES_RANGE_LOOKAHEAD
+            )
+            fresh = await self.copy_rates_range(
+                symbol, timeframe, since, int(date_to.timestamp())
+            )
+            if fresh is not None:
+                cache.merge(symbol, timeframe, fresh)
+                cached = cache.tail(symbol, timeframe, count)
+                if cached is not None:
+                    return cached
+            # Never serve cached bars that could not be brought up to date
+            cache.invalidate(symbol, timeframe)
+        bars = await self._fetch_rates_from_pos(symbol, timeframe, 0, count)
+        if bars is not None:
+            cache.replace(symbol, timeframe, bars)
+        return bars
+
+    def invalidate_rates(
+        self, symbol: str | None = None, timeframe: int | None = None
+    ) -> None:
+        """Drop cached OHLCV bars (mt5linux extension).
+
+        Args:
+            symbol: Symbol to drop (None = all symbols).
+            timeframe: Timeframe to drop (None = all timeframes).
+
+        """
+        self._rates_cache.invalidate(symbol, timeframe)
 
+    async def _fetch_rates_from_pos(
+        self,
+        symbol: str,
+        timeframe: int,
+        start_pos: int,
+        count: int,
+    ) -> NDArray[np.void] | None:
         async def _call() -> NDArray[np.void] | None:
             stub = self._ensure_connected()
             request = mt5_pb2.CopyRatesPosRequest(
@@ -1291,9 +1956,13 @@ class AsyncMetaTrader5(AsyncMT5Protocol):
                 count=count,
             )
             response = await stub.CopyRatesFromPos(request, timeout=self._timeout)
-            return u.Data.numpy_from_proto(response)
+            return u.Data.numpy_from_proto(
+                response, copy=self._settings.numpy_owned_arrays
+            )
 
-        return await self._resilient_call("copy_rates_from_pos", _call)
+        return await self._read_call(
+            "copy_rates_from_pos", _call, symbol, timeframe, start_pos, count
+        )
 
     async def copy_rates_range(
         self,
@@ -1311,10 +1980,28 @@ class AsyncMetaTrader5(AsyncMT5Protocol):
             date_to: End date as datetime or Unix timestamp.
 
         Returns:
-            NumPy structured array with OHLCV data or None.
+            NumPy structured array with OHLCV data or None. Served from the
+            history store when history_store_path is set (may be a read-only
+            memory-mapped view).
 
         """
+        if self._history_store is not None:
+            return await self._stored_range(
+                "rates",
+                symbol,
+                timeframe,
+                (date_from, date_to),
+                lambda lo, hi: self._fetch_rates_range(symbol, timeframe, lo, hi),
+            )
+        return await self._fetch_rates_range(symbol, timeframe, date_from, date_to)
 
+    async def _fetch_rates_range(
+        self,
+        symbol: str,
+        timeframe: int,
+        date_from: datetime | int,
+        date_to: datetime | int,
+    ) -> NDArray[np.void] | None:
         async def _call() -> NDArray[np.void] | None:
             stub = self._ensure_connected()
             request = mt5_pb2.CopyRatesRangeRequest(
@@ -1324,9 +2011,13 @@ class AsyncMetaTrader5(AsyncMT5Protocol):
                 date_to=u.Data.to_timestamp(date_to),
             )
             response = await stub.CopyRatesRange(request, timeout=self._timeout)
-            return u.Data.numpy_from_proto(response)
+            return u.Data.numpy_from_proto(
+                response, copy=self._settings.numpy_owned_arrays
+            )
 
-        return await self._resilient_call("copy_rates_range", _call)
+        return await self._read_call(
+            "copy_rates_range", _call, symbol, timeframe, date_from, date_to
+        )
 
     async def copy_ticks_from(
         self,
@@ -1357,9 +2048,13 @@ class AsyncMetaTrader5(AsyncMT5Protocol):
                 flags=flags,
             )
             response = await stub.CopyTicksFrom(request, timeout=self._timeout)
-            return u.Data.numpy_from_proto(response)
+            return u.Data.numpy_from_proto(
+                response, copy=self._settings.numpy_owned_arrays
+            )
 
-        return await self._resilient_call("copy_ticks_from", _call)
+        return await self._read_call(
+            "copy_ticks_from", _call, symbol, date_from, count, flags
+        )
 
     async def copy_ticks_range(
         self,
@@ -1377,10 +2072,50 @@ class AsyncMetaTrader5(AsyncMT5Protocol):
             flags: Copy ticks flags.
 
         Returns:
-            NumPy structured array with tick data or None.
+            NumPy structured array with tick data or None. Served from the
+            history store when history_store_path is set (may be a read-only
+            memory-mapped view).
+
+        """
+        if self._history_store is None:
+            return await self._fetch_ticks_range(symbol, date_from, date_to, flags)
+        ticks = await self._stored_range(
+            "ticks",
+            symbol,
+            flags,
+            (date_from, date_to),
+            lambda lo, hi: self._fetch_tick_seconds(symbol, lo, hi, flags),
+        )
+        if ticks is None or "time_msc" not in (ticks.dtype.names or ()):
+            return ticks
+        # The store covers whole seconds; the terminal stops at date_to.000
+        end_msc = int(u.Data.to_timestamp(date_to) or 0) * 1000
+        stop = int(np.searchsorted(ticks["time_msc"], end_msc, side="right"))
+        return ticks[:stop] if stop else None
+
+    async def _fetch_tick_seconds(
+        self, symbol: str, start: int, end: int, flags: int
+    ) -> NDArray[np.void] | None:
+        """Fetch every tick of the whole seconds start..end for the store.
 
+        The terminal's date_to is an exact instant, so copy_ticks_range(a, b)
+        misses ticks after b.000. The store marks second b covered, so the
+        fetch runs to end + 1 and drops the ticks of that next second.
         """
+        ticks = await self._fetch_ticks_range(symbol, start, end + 1, flags)
+        if ticks is None:
+            return None
+        if "time_msc" in (ticks.dtype.names or ()):
+            return ticks[ticks["time_msc"] < (end + 1) * 1000]
+        return ticks[ticks["time"] <= end]
 
+    async def _fetch_ticks_range(
+        self,
+        symbol: str,
+        date_from: datetime | int,
+        date_to: datetime | int,
+        flags: int,
+    ) -> NDArray[np.void] | None:
         async def _call() -> NDArray[np.void] | None:
             stub = self._ensure_connected()
             request = mt5_pb2.CopyTicksRangeRequest(
@@ -1390,15 +2125,227 @@ class AsyncMetaTrader5(AsyncMT5Protocol):
                 flags=flags,
             )
             response = await stub.CopyTicksRange(request, timeout=self._timeout)
-            return u.Data.numpy_from_proto(response)
+            return u.Data.numpy_from_proto(
+                response, copy=self._settings.numpy_owned_arrays
+            )
 
-        return await self._resilient_call("copy_ticks_range", _call)
+        return await self._read_call(
+            "copy_ticks_range", _call, symbol, date_from, date_to, flags
+        )
 
-    # =========================================================================
-    # TRADING METHODS
-    # =========================================================================
+    async def _server_time(self, symbol: str) -> float:
+        """Broker server clock (Unix seconds) from the symbol's last tick.
 
-    async def order_calc_margin(
+        The last tick never runs ahead of the server clock. Without a tick
+        the local clock minus the largest server lag is assumed.
+        """
+        tick = await self.symbol_info_tick(symbol)
+        if tick is None:
+            return time.time() - _MAX_SERVER_TIME_LAG
+        return float(tick.time)
+
+    async def _stored_range(
+        self,
+        kind: str,
+        symbol: str,
+        key: int,
+        date_range: tuple[datetime | int, datetime | int],
+        fetch: Callable[[int, int], Awaitable[NDArray[np.void] | None]],
+    ) -> NDArray[np.void] | None:
+        """Serve a range from the history store, fetching only missing segments.
+
+        Args:
+            kind: Series kind ("ticks" or "rates").
+            symbol: Symbol name.
+            key: Copy flags (ticks) or timeframe (rates).
+            date_range: Requested (date_from, date_to).
+            fetch: Bridge fetch for a (from, to) segment in Unix seconds.
+
+        Returns:
+            Rows of the whole range in time order, or None if empty.
+
+        """
+        store = cast("u.HistoryStore", self._history_store)
+        start = int(u.Data.to_timestamp(date_range[0]) or 0)
+        end = int(u.Data.to_timestamp(date_range[1]) or 0)
+        # Below this the local clock clips like the server clock would
+        local_safe = store.settled_end(kind, key, time.time() - _MAX_SERVER_TIME_LAG)
+        server_time: float | None = None
+        parts: list[NDArray[np.void]] = []
+        for lo, hi, covered in store.plan(kind, symbol, key, start, end):
+            if covered:
+                rows = await asyncio.to_thread(store.read, kind, symbol, key, lo, hi)
+            else:
+                rows = await fetch(lo, hi)
+                if rows is not None and hi > local_safe and server_time is None:
+                    server_time = await self._server_time(symbol)
+                await asyncio.to_thread(
+                    store.write,
+                    kind,
+                    symbol,
+                    key,
+                    (lo, hi),
+                    rows,
+                    server_time=server_time,
+                )
+            if rows is not None and len(rows):
+                parts.append(rows)
+        if not parts:
+            return None
+        if len(parts) == 1:
+            return parts[0]
+        return np.concatenate(parts)
+
+    def clear_history_store(
+        self, kind: str | None = None, symbol: str | None = None
+    ) -> None:
+        """Delete persisted history (mt5linux extension).
+
+        Args:
+            kind: "ticks" or "rates" (None = both).
+            symbol: Symbol to delete (None = all symbols).
+
+        """
+        if self._history_store is not None:
+            self._history_store.clear(kind, symbol)
+
+    async def iter_ticks(
+        self,
+        symbol: str,
+        date_from: datetime | int,
+        date_to: datetime | int,
+        flags: int = c.MarketData.CopyTicksFlag.ALL,
+        *,
+        chunk: timedelta | int | None = None,
+    ) -> AsyncIterator[NDArray[np.void]]:
+        """Download a large tick range as time-ordered chunks (mt5linux extension).
+
+        The range is split into windows of chunk seconds, fetched concurrently
+        (up to download_concurrency in flight, each through the request queue
+        and the history store when enabled) and yielded in time order. Peak
+        memory stays at a few chunks regardless of the range length, and no
+        single message approaches grpc_max_message_size.
+
+        Args:
+            symbol: Symbol name.
+            date_from: Start date as datetime or Unix timestamp.
+            date_to: End date as datetime or Unix timestamp.
+            flags: Copy ticks flags (default COPY_TICKS_ALL).
+            chunk: Window size (default download_chunk_seconds).
+
+        Yields:
+            Non-empty tick arrays, oldest first, without overlap.
+
+        """
+        start = int(u.Data.to_timestamp(date_from) or 0)
+        end = int(u.Data.to_timestamp(date_to) or 0)
+        bounds = range(start, end + 1, self._chunk_seconds(chunk))
+
+        async def _fetch(i: int) -> NDArray[np.void] | None:
+            last = i == len(bounds) - 1
+            hi = end if last else bounds[i + 1]
+            ticks = await self.copy_ticks_range(symbol, bounds[i], hi, flags)
+            if ticks is None or last:
+                return ticks
+            # Windows share their boundary second; keep it for the next window
+            # so ticks inside that second are neither lost nor duplicated
+            if "time_msc" in (ticks.dtype.names or ()):
+                ticks = ticks[ticks["time_msc"] < hi * 1000]
+            else:
+                ticks = ticks[ticks["time"] < hi]
+            return ticks if len(ticks) else None
+
+        pending: deque[asyncio.Task[NDArray[np.void] | None]] = deque()
+        next_index = 0
+        try:
+            while next_index < len(bounds) or pending:
+                while (
+                    next_index < len(bounds)
+                    and len(pending) < self._settings.download_concurrency
+                ):
+                    pending.append(asyncio.create_task(_fetch(next_index)))
+                    next_index += 1
+                ticks = await pending.popleft()
+                if ticks is not None and len(ticks):
+                    yield ticks
+        finally:
+            for task in pending:
+                task.cancel()
+            await asyncio.gather(*pending, return_exceptions=True)
+
+    async def download_ticks(
+        self,
+        symbol: str,
+        date_from: datetime | int,
+        date_to: datetime | int,
+        flags: int = c.MarketData.CopyTicksFlag.ALL,
+        *,
+        chunk: timedelta | int | None = None,
+        on_chunk: Callable[[NDArray[np.void]], object] | None = None,
+    ) -> NDArray[np.void] | None:
+        """Download a large tick range in concurrent chunks (mt5linux extension).
+
+        See iter_ticks() for chunking. Without on_chunk each chunk is copied
+        into one result array as it arrives: the array is preallocated for
+        the first chunk's size times the window count, grown geometrically if
+        that falls short and trimmed at the end, so peak memory stays close
+        to the result. With on_chunk each chunk is handed to the callback
+        (sync or async) in time order and nothing is retained, keeping peak
+        memory flat.
+
+        Args:
+            symbol: Symbol name.
+            date_from: Start date as datetime or Unix timestamp.
+            date_to: End date as datetime or Unix timestamp.
+            flags: Copy ticks flags (default COPY_TICKS_ALL).
+            chunk: Window size (default download_chunk_seconds).
+            on_chunk: Optional per-chunk consumer.
+
+        Returns:
+            All ticks in time order, or None if empty or on_chunk is given.
+
+        """
+        start = int(u.Data.to_timestamp(date_from) or 0)
+        end = int(u.Data.to_timestamp(date_to) or 0)
+        windows = len(range(start, end + 1, self._chunk_seconds(chunk)))
+        out: NDArray[np.void] | None = None
+        size = 0
+        async for ticks in self.iter_ticks(
+            symbol, date_from, date_to, flags, chunk=chunk
+        ):
+            if on_chunk is not None:
+                result = on_chunk(ticks)
+                if asyncio.iscoroutine(result):
+                    await result
+                continue
+            needed = size + len(ticks)
+            if out is None:
+                out = np.empty(max(len(ticks) * windows, needed), dtype=ticks.dtype)
+            elif needed > len(out):
+                grown = np.empty(max(2 * len(out), needed), dtype=out.dtype)
+                grown[:size] = out[:size]
+                out = grown
+            out[size:needed] = ticks
+            size = needed
+        if out is None:
+            return None
+        # Sole owner of the buffer: shrink in place instead of copying
+        out.resize(size, refcheck=False)
+        return out
+
+    def _chunk_seconds(self, chunk: timedelta | int | None) -> int:
+        """Download window length in seconds (default download_chunk_seconds)."""
+        if isinstance(chunk, timedelta):
+            step = int(chunk.total_seconds())
+        else:
+            step = chunk or self._settings.download_chunk_seconds
+        return max(step, 1)
+
+    # =========================================================================
+    # TRADING METHODS
+    # =========================================================================
+
+    async def order_calc_margin(
         self,
         action: int,
         symbol: str,
@@ -1429,7 +2376,9 @@ class AsyncMetaTrader5(AsyncMT5Protocol):
             response = await stub.OrderCalcMargin(request, timeout=self._timeout)
             return response.value if response.HasField("value") else None
 
-        return await self._resilient_call("order_calc_margin", _call)
+        return await self._read_call(
+            "order_calc_margin", _call, action, symbol, volume, price
+        )
 
     async def order_calc_profit(
         self,
@@ -1465,7 +2414,9 @@ class AsyncMetaTrader5(AsyncMT5Protocol):
             response = await stub.OrderCalcProfit(request, timeout=self._timeout)
             return response.value if response.HasField("value") else None
 
-        return await self._resilient_call("order_calc_profit", _call)
+        return await self._read_call(
+            "order_calc_profit", _call, action, symbol, volume, price_open, price_close
+        )
 
     async def order_check(
         self, request: dict[str, JSONValue]
@@ -1646,9 +2597,20 @@ class AsyncMetaTrader5(AsyncMT5Protocol):
             loop = asyncio.get_running_loop()
             pending[request_id] = loop.create_future()
 
+        # First attempts share one OrderSendBatch stream; retries use OrderSend
+        batcher: u.MicroBatcher[dict[str, JSONValue], MT5Models.OrderResult | None]
+        batcher = u.MicroBatcher(
+            self._dispatch_order_batch,
+            expected=len(prepared_requests),
+            linger=self._settings.order_batch_linger_ms / 1000,
+        )
+        first_attempt = batcher.submit if self._settings.order_batch_rpc else None
+
         async def _execute_one(req: dict[str, JSONValue], rid: str) -> None:
             try:
-                result = await self._safe_order_send(req)
+                result = await self._safe_order_send(
+                    req, first_attempt, operation="order_send_batch"
+                )
                 if result is not None:
                     pending[rid].set_result(result)
                     if on_each_complete:
@@ -1722,6 +2684,12 @@ class AsyncMetaTrader5(AsyncMT5Protocol):
     async def _safe_order_send(
         self,
         request: dict[str, JSONValue],
+        first_attempt: (
+            Callable[[dict[str, JSONValue]], Awaitable[MT5Models.OrderResult | None]]
+            | None
+        ) = None,
+        *,
+        operation: str = "order_send",
     ) -> MT5Models.OrderResult | None:
         """Send order with full transaction handling via TransactionOrchestrator.
 
@@ -1736,6 +2704,9 @@ class AsyncMetaTrader5(AsyncMT5Protocol):
 
         Args:
             request: Order request dictionary.
+            first_attempt: Optional sender for attempt 0 (order_send_batch
+                passes its OrderSendBatch batcher); retries always use OrderSend.
+            operation: Stage metrics operation the order is recorded under.
 
         Returns:
             OrderResult with guaranteed correct status, or None.
@@ -1750,9 +2721,15 @@ class AsyncMetaTrader5(AsyncMT5Protocol):
         async def execute_grpc(
             grpc_request: dict[str, object], attempt: int
         ) -> object | None:
-            return await self._execute_order_grpc(
-                cast("dict[str, JSONValue]", grpc_request), attempt
-            )
+            order = cast("dict[str, JSONValue]", grpc_request)
+            if attempt == 0 and first_attempt is not None:
+                try:
+                    return await first_attempt(order)
+                except grpc.RpcError as e:
+                    if e.code() != grpc.StatusCode.UNIMPLEMENTED:
+                        raise
+                    log.debug("OrderSendBatch unavailable, using OrderSend")
+            return await self._execute_order_grpc(order, attempt)
 
         async def verify_state(result: object, request_id: str | None) -> object | None:
             if not isinstance(result, MT5Models.OrderResult):
@@ -1780,7 +2757,8 @@ class AsyncMetaTrader5(AsyncMT5Protocol):
 
         # Execute via orchestrator
         orchestrator = u.TransactionOrchestrator(self._settings, deps)
-        result = await orchestrator.execute(dict(request))
+        with self._metrics_scope(operation):
+            result = await orchestrator.execute(dict(request))
 
         # Cast result to expected type (orchestrator returns generic object)
         if isinstance(result, MT5Models.OrderResult):
@@ -1822,6 +2800,89 @@ class AsyncMetaTrader5(AsyncMT5Protocol):
             )
         return result
 
+    async def _dispatch_order_batch(
+        self,
+        requests: list[dict[str, JSONValue]],
+    ) -> AsyncIterator[tuple[int, MT5Models.OrderResult | None]]:
+        """Send first attempts of several orders in one OrderSendBatch stream.
+
+        The stream deadline is one call timeout per wave of bridge workers
+        (plus one), not per order, so a stalled stream is given up, and its
+        orders verified, in bounded time.
+
+        Args:
+            requests: Prepared order request dictionaries.
+
+        Yields:
+            (index in requests, parsed OrderResult or None) as each completes.
+            An order the bridge could not confirm is reported as a TIMEOUT
+            result, so the orchestrator verifies it before any resend. If the
+            stream fails, every order without a result is reported that way
+            too, since the bridge may already have executed it.
+
+        Raises:
+            grpc.RpcError: UNIMPLEMENTED, when the bridge has no OrderSendBatch
+                (no order was sent, callers fall back to OrderSend).
+
+        """
+        if self._settings.tx_log_critical:
+            log.info("TX_INTENT: order_send_batch orders=%d", len(requests))
+
+        stub = self._ensure_connected()
+        grpc_request = mt5_pb2.OrderBatchRequest(
+            orders=[
+                mt5_pb2.OrderRequest(json_request=orjson.dumps(r).decode())
+                for r in requests
+            ]
+        )
+        waves = -(-len(requests) // _ORDER_BATCH_WAVE)
+        stream = stub.OrderSendBatch(grpc_request, timeout=self._timeout * (waves + 1))
+        unconfirmed = set(range(len(requests)))
+        try:
+            async for item in stream:
+                result = self._order_batch_result(item)
+                unconfirmed.discard(item.index)
+                yield item.index, result
+        except Exception as e:
+            if (
+                isinstance(e, grpc.RpcError)
+                and e.code() == grpc.StatusCode.UNIMPLEMENTED
+            ):
+                raise
+            log.warning(
+                "TX_RESULT: order_send_batch stream failed, %d orders unconfirmed: %s",
+                len(unconfirmed),
+                e,
+            )
+            error = f"OrderSendBatch stream failed: {e}"
+            for index in sorted(unconfirmed):
+                yield (
+                    index,
+                    MT5Models.OrderResult(
+                        retcode=c.Order.TradeRetcode.TIMEOUT, comment=error
+                    ),
+                )
+
+    def _order_batch_result(
+        self, item: mt5_pb2.OrderBatchResult
+    ) -> MT5Models.OrderResult | None:
+        """Parse one OrderSendBatch result (errors become TIMEOUT results)."""
+        if item.error:
+            log.warning("TX_RESULT: order_send_batch[%d] %s", item.index, item.error)
+            return MT5Models.OrderResult(
+                retcode=c.Order.TradeRetcode.TIMEOUT, comment=item.error
+            )
+        result = MT5Models.OrderResult.from_mt5(u.Data.json_to_dict(item.json_data))
+        if result and self._settings.tx_log_critical:
+            log.info(
+                "TX_RESULT: order_send_batch[%d] retcode=%d deal=%d order=%d",
+                item.index,
+                result.retcode,
+                result.deal,
+                result.order,
+            )
+        return result
+
     async def _verify_order_state(
         self,
         result: MT5Models.OrderResult,
@@ -2070,9 +3131,11 @@ class AsyncMetaTrader5(AsyncMT5Protocol):
     ) -> MT5Models.OrderResult | None:
         """Verify order by comment field match.
 
-        Searches recent history deals for matching request_id in comment.
-        This provides definitive proof of execution when order/deal IDs
-        weren't returned in the ambiguous response.
+        Looks up the request_id in the deal journal after a delta fetch of
+        deals newer than the journal cursor (the first fetch covers
+        tx_verify_search_window_minutes). This provides definitive proof of
+        execution when order/deal IDs weren't returned in the ambiguous
+        response.
 
         Args:
             request_id: Request ID to search for.
@@ -2082,48 +3145,39 @@ class AsyncMetaTrader5(AsyncMT5Protocol):
             Verified OrderResult if found, None otherwise.
 
         """
-        now = datetime.now(UTC)
-        # Use configurable window to handle clock skew and propagation delays
-        search_window = self._settings.tx_verify_search_window_minutes
-        from_time = now - timedelta(minutes=search_window)
 
-        # Search recent deals by comment (uses raw method - no resilience)
-        deals = await self._history_deals_get_raw(date_from=from_time, date_to=now)
-        tracker = u.TransactionHandler.RequestTracker
+        async def _fetch(
+            date_from: datetime, date_to: datetime
+        ) -> tuple[MT5Models.Deal, ...] | None:
+            # Raw method - no resilience (called by the verification layer)
+            return await self._history_deals_get_raw(
+                date_from=date_from, date_to=date_to
+            )
 
-        # CRITICAL FIX v4: Explicitly handle None vs empty list
-        # - None: Could be gRPC error (logged elsewhere)
-        # - []: No deals in time window (normal)
-        # - (): Empty tuple (treat same as [])
-        if deals is None:
+        # A failed fetch still leaves earlier deals searchable
+        if not await self._deal_journal.refresh(_fetch):
             log.debug("TX_VERIFY: history_deals_get returned None")
-            return None
 
-        if not deals:  # Empty list or tuple
-            log.debug("TX_VERIFY: No deals in search window")
+        deal = self._deal_journal.get(request_id)
+        if deal is None:
             return None
 
-        for deal in deals:
-            req_id = tracker.extract_request_id(deal.comment)
-            if req_id == request_id:
-                log.info(
-                    "TX_VERIFY: Found deal %d by comment match %s",
-                    deal.ticket,
-                    request_id,
-                )
-                return MT5Models.OrderResult(
-                    retcode=c.Order.TradeRetcode.DONE,
-                    deal=deal.ticket,
-                    order=deal.order,
-                    volume=deal.volume,
-                    price=deal.price,
-                    bid=result.bid,
-                    ask=result.ask,
-                    comment=deal.comment,
-                    request_id=result.request_id,
-                )
-
-        return None
+        log.info(
+            "TX_VERIFY: Found deal %d by comment match %s",
+            deal.ticket,
+            request_id,
+        )
+        return MT5Models.OrderResult(
+            retcode=c.Order.TradeRetcode.DONE,
+            deal=deal.ticket,
+            order=deal.order,
+            volume=deal.volume,
+            price=deal.price,
+            bid=result.bid,
+            ask=result.ask,
+            comment=deal.comment,
+            request_id=result.request_id,
+        )
 
     # =========================================================================
     # INFRASTRUCTURE-LAYER RAW METHODS (NO RESILIENCE)
@@ -2164,7 +3218,7 @@ class AsyncMetaTrader5(AsyncMT5Protocol):
             dicts = u.Data.unwrap_proto_list_to_dicts(json_items)
             if dicts is None:
                 return None
-            return tuple(MT5Models.Order.model_validate(d) for d in dicts)
+            return self._models.build_many(MT5Models.Order, dicts)
         except (grpc.RpcError, ConnectionError) as e:
             log.debug("_orders_get_raw gRPC failed: %s", e)
             return None
@@ -2200,7 +3254,7 @@ class AsyncMetaTrader5(AsyncMT5Protocol):
             dicts = u.Data.unwrap_proto_list_to_dicts(json_items)
             if dicts is None:
                 return None
-            return tuple(MT5Models.Order.model_validate(d) for d in dicts)
+            return self._models.build_many(MT5Models.Order, dicts)
         except (grpc.RpcError, ConnectionError) as e:
             log.debug("_history_orders_get_raw gRPC failed: %s", e)
             return None
@@ -2250,7 +3304,7 @@ class AsyncMetaTrader5(AsyncMT5Protocol):
             dicts = u.Data.unwrap_proto_list_to_dicts(json_items)
             if dicts is None:
                 return None
-            return tuple(MT5Models.Deal.model_validate(d) for d in dicts)
+            return self._models.build_many(MT5Models.Deal, dicts)
         except (grpc.RpcError, ConnectionError) as e:
             log.debug("_history_deals_get_raw gRPC failed: %s", e)
             return None
@@ -2272,27 +3326,134 @@ class AsyncMetaTrader5(AsyncMT5Protocol):
             response = await stub.PositionsTotal(mt5_pb2.Empty(), timeout=self._timeout)
             return response.value
 
-        return await self._resilient_call("positions_total", _call)
+        return await self._read_call("positions_total", _call)
+
+    @overload
+    async def positions_get(
+        self,
+        symbol: str | None = None,
+        group: str | None = None,
+        ticket: int | None = None,
+        *,
+        as_array: Literal[False] = False,
+        validate: bool | None = None,
+        fields: Sequence[str] | None = None,
+        where: t.RecordFilterDict | None = None,
+        return_format: Literal["model"] = "model",
+    ) -> tuple[MT5Models.Position, ...] | None: ...
+
+    @overload
+    async def positions_get(
+        self,
+        symbol: str | None = None,
+        group: str | None = None,
+        ticket: int | None = None,
+        *,
+        as_array: Literal[True],
+        validate: bool | None = None,
+        fields: Sequence[str] | None = None,
+        where: t.RecordFilterDict | None = None,
+        return_format: t.ReturnFormat = "model",
+    ) -> NDArray[np.void] | None: ...
+
+    @overload
+    async def positions_get(
+        self,
+        symbol: str | None = None,
+        group: str | None = None,
+        ticket: int | None = None,
+        *,
+        as_array: Literal[False] = False,
+        validate: bool | None = None,
+        fields: Sequence[str] | None = None,
+        where: t.RecordFilterDict | None = None,
+        return_format: Literal["array"],
+    ) -> NDArray[np.void] | None: ...
+
+    @overload
+    async def positions_get(
+        self,
+        symbol: str | None = None,
+        group: str | None = None,
+        ticket: int | None = None,
+        *,
+        as_array: Literal[False] = False,
+        validate: bool | None = None,
+        fields: Sequence[str] | None = None,
+        where: t.RecordFilterDict | None = None,
+        return_format: Literal["namedtuple"],
+    ) -> tuple[t.TradePosition, ...] | None: ...
+
+    @overload
+    async def positions_get(
+        self,
+        symbol: str | None = None,
+        group: str | None = None,
+        ticket: int | None = None,
+        *,
+        as_array: bool = False,
+        validate: bool | None = None,
+        fields: Sequence[str] | None = None,
+        where: t.RecordFilterDict | None = None,
+        return_format: t.ReturnFormat = "model",
+    ) -> (
+        tuple[MT5Models.Position, ...]
+        | tuple[t.TradePosition, ...]
+        | NDArray[np.void]
+        | None
+    ): ...
 
     async def positions_get(
         self,
         symbol: str | None = None,
         group: str | None = None,
         ticket: int | None = None,
-    ) -> tuple[MT5Models.Position, ...] | None:
+        *,
+        as_array: bool = False,
+        validate: bool | None = None,
+        fields: Sequence[str] | None = None,
+        where: t.RecordFilterDict | None = None,
+        return_format: t.ReturnFormat = "model",
+    ) -> (
+        tuple[MT5Models.Position, ...]
+        | tuple[t.TradePosition, ...]
+        | NDArray[np.void]
+        | None
+    ):
         """Get open positions with optional filters.
 
         Args:
             symbol: Filter by symbol name.
             group: Symbol group filter.
             ticket: Specific position ticket.
+            as_array: Return a columnar NumPy structured array (one field
+                per MT5 field) instead of models - skips per-row JSON
+                decoding and model construction.
+            validate: Validate rows with pydantic (None = validate_models
+                setting); False builds models with model_construct.
+            fields: Columns to fetch (ticket is always included); the rest
+                take model/record defaults. None fetches every field.
+            where: Row filter applied by the bridge before serialization
+                (magic, type, entry, position_id, time_from/time_to,
+                comment_prefix); see MT5Types.RecordFilterDict.
+            return_format: "model" (pydantic models), "namedtuple"
+                (MT5Types.TradePosition records in MetaTrader5 field order)
+                or "array" (same as as_array).
 
         Returns:
-            Tuple of Position objects or None.
+            Tuple of Position objects, records if return_format is
+            "namedtuple", structured array if as_array or "array", or None.
 
         """
-
-        async def _call() -> tuple[MT5Models.Position, ...] | None:
+        fmt: t.ReturnFormat = "array" if as_array else return_format
+        record_filter = _record_filter(where)
+
+        async def _call() -> (
+            tuple[MT5Models.Position, ...]
+            | tuple[t.TradePosition, ...]
+            | NDArray[np.void]
+            | None
+        ):
             stub = self._ensure_connected()
             request = mt5_pb2.PositionsRequest()
             if symbol is not None:
@@ -2301,14 +3462,38 @@ class AsyncMetaTrader5(AsyncMT5Protocol):
                 request.group = group
             if ticket is not None:
                 request.ticket = ticket
+            _list_options(
+                request,
+                as_array=fmt != "model",
+                fields=fields,
+                record_filter=record_filter,
+            )
             response = await stub.PositionsGet(request, timeout=self._timeout)
+            if fmt == "array":
+                return u.Data.numpy_from_proto(
+                    response.array, copy=self._settings.numpy_owned_arrays
+                )
+            if fmt == "namedtuple":
+                return u.Data.records_from_array(
+                    t.TradePosition, u.Data.numpy_from_proto(response.array)
+                )
             json_items = list(response.json_items)
             dicts = u.Data.unwrap_proto_list_to_dicts(json_items)
             if dicts is None:
                 return None
-            return tuple(MT5Models.Position.model_validate(d) for d in dicts)
-
-        return await self._resilient_call("positions_get", _call)
+            return self._models.build_many(MT5Models.Position, dicts, validate=validate)
+
+        return await self._read_call(
+            "positions_get",
+            _call,
+            symbol,
+            group,
+            ticket,
+            fmt,
+            validate,
+            tuple(fields or ()),
+            _filter_key(record_filter),
+        )
 
     # =========================================================================
     # ORDERS METHODS
@@ -2327,27 +3512,128 @@ class AsyncMetaTrader5(AsyncMT5Protocol):
             response = await stub.OrdersTotal(mt5_pb2.Empty(), timeout=self._timeout)
             return response.value
 
-        return await self._resilient_call("orders_total", _call)
+        return await self._read_call("orders_total", _call)
 
+    @overload
     async def orders_get(
         self,
         symbol: str | None = None,
         group: str | None = None,
         ticket: int | None = None,
-    ) -> tuple[MT5Models.Order, ...] | None:
+        *,
+        as_array: Literal[False] = False,
+        validate: bool | None = None,
+        fields: Sequence[str] | None = None,
+        where: t.RecordFilterDict | None = None,
+        return_format: Literal["model"] = "model",
+    ) -> tuple[MT5Models.Order, ...] | None: ...
+
+    @overload
+    async def orders_get(
+        self,
+        symbol: str | None = None,
+        group: str | None = None,
+        ticket: int | None = None,
+        *,
+        as_array: Literal[True],
+        validate: bool | None = None,
+        fields: Sequence[str] | None = None,
+        where: t.RecordFilterDict | None = None,
+        return_format: t.ReturnFormat = "model",
+    ) -> NDArray[np.void] | None: ...
+
+    @overload
+    async def orders_get(
+        self,
+        symbol: str | None = None,
+        group: str | None = None,
+        ticket: int | None = None,
+        *,
+        as_array: Literal[False] = False,
+        validate: bool | None = None,
+        fields: Sequence[str] | None = None,
+        where: t.RecordFilterDict | None = None,
+        return_format: Literal["array"],
+    ) -> NDArray[np.void] | None: ...
+
+    @overload
+    async def orders_get(
+        self,
+        symbol: str | None = None,
+        group: str | None = None,
+        ticket: int | None = None,
+        *,
+        as_array: Literal[False] = False,
+        validate: bool | None = None,
+        fields: Sequence[str] | None = None,
+        where: t.RecordFilterDict | None = None,
+        return_format: Literal["namedtuple"],
+    ) -> tuple[t.TradeOrder, ...] | None: ...
+
+    @overload
+    async def orders_get(
+        self,
+        symbol: str | None = None,
+        group: str | None = None,
+        ticket: int | None = None,
+        *,
+        as_array: bool = False,
+        validate: bool | None = None,
+        fields: Sequence[str] | None = None,
+        where: t.RecordFilterDict | None = None,
+        return_format: t.ReturnFormat = "model",
+    ) -> (
+        tuple[MT5Models.Order, ...] | tuple[t.TradeOrder, ...] | NDArray[np.void] | None
+    ): ...
+
+    async def orders_get(
+        self,
+        symbol: str | None = None,
+        group: str | None = None,
+        ticket: int | None = None,
+        *,
+        as_array: bool = False,
+        validate: bool | None = None,
+        fields: Sequence[str] | None = None,
+        where: t.RecordFilterDict | None = None,
+        return_format: t.ReturnFormat = "model",
+    ) -> (
+        tuple[MT5Models.Order, ...] | tuple[t.TradeOrder, ...] | NDArray[np.void] | None
+    ):
         """Get pending orders with optional filters.
 
         Args:
             symbol: Filter by symbol name.
             group: Symbol group filter.
             ticket: Specific order ticket.
+            as_array: Return a columnar NumPy structured array (one field
+                per MT5 field) instead of models - skips per-row JSON
+                decoding and model construction.
+            validate: Validate rows with pydantic (None = validate_models
+                setting); False builds models with model_construct.
+            fields: Columns to fetch (ticket is always included); the rest
+                take model/record defaults. None fetches every field.
+            where: Row filter applied by the bridge before serialization
+                (magic, type, entry, position_id, time_from/time_to,
+                comment_prefix); see MT5Types.RecordFilterDict.
+            return_format: "model" (pydantic models), "namedtuple"
+                (MT5Types.TradeOrder records in MetaTrader5 field order)
+                or "array" (same as as_array).
 
         Returns:
-            Tuple of Order objects or None.
+            Tuple of Order objects, records if return_format is
+            "namedtuple", structured array if as_array or "array", or None.
 
         """
-
-        async def _call() -> tuple[MT5Models.Order, ...] | None:
+        fmt: t.ReturnFormat = "array" if as_array else return_format
+        record_filter = _record_filter(where)
+
+        async def _call() -> (
+            tuple[MT5Models.Order, ...]
+            | tuple[t.TradeOrder, ...]
+            | NDArray[np.void]
+            | None
+        ):
             stub = self._ensure_connected()
             request = mt5_pb2.OrdersRequest()
             if symbol is not None:
@@ -2356,14 +3642,38 @@ class AsyncMetaTrader5(AsyncMT5Protocol):
                 request.group = group
             if ticket is not None:
                 request.ticket = ticket
+            _list_options(
+                request,
+                as_array=fmt != "model",
+                fields=fields,
+                record_filter=record_filter,
+            )
             response = await stub.OrdersGet(request, timeout=self._timeout)
+            if fmt == "array":
+                return u.Data.numpy_from_proto(
+                    response.array, copy=self._settings.numpy_owned_arrays
+                )
+            if fmt == "namedtuple":
+                return u.Data.records_from_array(
+                    t.TradeOrder, u.Data.numpy_from_proto(response.array)
+                )
             json_items = list(response.json_items)
             dicts = u.Data.unwrap_proto_list_to_dicts(json_items)
             if dicts is None:
                 return None
-            return tuple(MT5Models.Order.model_validate(d) for d in dicts)
-
-        return await self._resilient_call("orders_get", _call)
+            return self._models.build_many(MT5Models.Order, dicts, validate=validate)
+
+        return await self._read_call(
+            "orders_get",
+            _call,
+            symbol,
+            group,
+            ticket,
+            fmt,
+            validate,
+            tuple(fields or ()),
+            _filter_key(record_filter),
+        )
 
     # =========================================================================
     # HISTORY METHODS
@@ -2394,8 +3704,9 @@ class AsyncMetaTrader5(AsyncMT5Protocol):
             response = await stub.HistoryOrdersTotal(request, timeout=self._timeout)
             return response.value
 
-        return await self._resilient_call("history_orders_total", _call)
+        return await self._read_call("history_orders_total", _call, date_from, date_to)
 
+    @overload
     async def history_orders_get(
         self,
         date_from: datetime | int | None = None,
@@ -2403,7 +3714,96 @@ class AsyncMetaTrader5(AsyncMT5Protocol):
         group: str | None = None,
         ticket: int | None = None,
         position: int | None = None,
-    ) -> tuple[MT5Models.Order, ...] | None:
+        *,
+        as_array: Literal[False] = False,
+        validate: bool | None = None,
+        fields: Sequence[str] | None = None,
+        where: t.RecordFilterDict | None = None,
+        return_format: Literal["model"] = "model",
+    ) -> tuple[MT5Models.Order, ...] | None: ...
+
+    @overload
+    async def history_orders_get(
+        self,
+        date_from: datetime | int | None = None,
+        date_to: datetime | int | None = None,
+        group: str | None = None,
+        ticket: int | None = None,
+        position: int | None = None,
+        *,
+        as_array: Literal[True],
+        validate: bool | None = None,
+        fields: Sequence[str] | None = None,
+        where: t.RecordFilterDict | None = None,
+        return_format: t.ReturnFormat = "model",
+    ) -> NDArray[np.void] | None: ...
+
+    @overload
+    async def history_orders_get(
+        self,
+        date_from: datetime | int | None = None,
+        date_to: datetime | int | None = None,
+        group: str | None = None,
+        ticket: int | None = None,
+        position: int | None = None,
+        *,
+        as_array: Literal[False] = False,
+        validate: bool | None = None,
+        fields: Sequence[str] | None = None,
+        where: t.RecordFilterDict | None = None,
+        return_format: Literal["array"],
+    ) -> NDArray[np.void] | None: ...
+
+    @overload
+    async def history_orders_get(
+        self,
+        date_from: datetime | int | None = None,
+        date_to: datetime | int | None = None,
+        group: str | None = None,
+        ticket: int | None = None,
+        position: int | None = None,
+        *,
+        as_array: Literal[False] = False,
+        validate: bool | None = None,
+        fields: Sequence[str] | None = None,
+        where: t.RecordFilterDict | None = None,
+        return_format: Literal["namedtuple"],
+    ) -> tuple[t.TradeOrder, ...] | None: ...
+
+    @overload
+    async def history_orders_get(
+        self,
+        date_from: datetime | int | None = None,
+        date_to: datetime | int | None = None,
+        group: str | None = None,
+        ticket: int | None = None,
+        position: int | None = None,
+        *,
+        as_array: bool = False,
+        validate: bool | None = None,
+        fields: Sequence[str] | None = None,
+        where: t.RecordFilterDict | None = None,
+        return_format: t.ReturnFormat = "model",
+    ) -> (
+        tuple[MT5Models.Order, ...] | tuple[t.TradeOrder, ...] | NDArray[np.void] | None
+    ): ...
+
+    async def history_orders_get(
+        self,
+        date_from: datetime | int | None = None,
+        date_to: datetime | int | None = None,
+        group: str | None = None,
+        ticket: int | None = None,
+        position: int | None = None,
+        *,
+        as_array: bool = False,
+        validate: bool | None = None,
+        fields: Sequence[str] | None = None,
+        where: t.RecordFilterDict | None = None,
+        return_format: t.ReturnFormat = "model",
+    ) -> (
+        tuple[MT5Models.Order, ...] | tuple[t.TradeOrder, ...] | NDArray[np.void] | None
+    ):
         """Get historical orders with filters.
 
         Args:
@@ -2412,13 +3812,34 @@ class AsyncMetaTrader5(AsyncMT5Protocol):
             group: Symbol group filter.
             ticket: Specific order ticket.
             position: Position ID filter.
+            as_array: Return a columnar NumPy structured array (one field
+                per MT5 field) instead of models - skips per-row JSON
+                decoding and model construction.
+            validate: Validate rows with pydantic (None = validate_models
+                setting); False builds models with model_construct.
+            fields: Columns to fetch (ticket is always included); the rest
+                take model/record defaults. None fetches every field.
+            where: Row filter applied by the bridge before serialization
+                (magic, type, entry, position_id, time_from/time_to,
+                comment_prefix); see MT5Types.RecordFilterDict.
+            return_format: "model" (pydantic models), "namedtuple"
+                (MT5Types.TradeOrder records in MetaTrader5 field order)
+                or "array" (same as as_array).
 
         Returns:
-            Tuple of Order objects or None.
+            Tuple of Order objects, records if return_format is
+            "namedtuple", structured array if as_array or "array", or None.
 
         """
-
-        async def _call() -> tuple[MT5Models.Order, ...] | None:
+        fmt: t.ReturnFormat = "array" if as_array else return_format
+        record_filter = _record_filter(where)
+
+        async def _call() -> (
+            tuple[MT5Models.Order, ...]
+            | tuple[t.TradeOrder, ...]
+            | NDArray[np.void]
+            | None
+        ):
             stub = self._ensure_connected()
             request = mt5_pb2.HistoryRequest()
             if date_from is not None:
@@ -2431,14 +3852,40 @@ class AsyncMetaTrader5(AsyncMT5Protocol):
                 request.ticket = ticket
             if position is not None:
                 request.position = position
+            _list_options(
+                request,
+                as_array=fmt != "model",
+                fields=fields,
+                record_filter=record_filter,
+            )
             response = await stub.HistoryOrdersGet(request, timeout=self._timeout)
+            if fmt == "array":
+                return u.Data.numpy_from_proto(
+                    response.array, copy=self._settings.numpy_owned_arrays
+                )
+            if fmt == "namedtuple":
+                return u.Data.records_from_array(
+                    t.TradeOrder, u.Data.numpy_from_proto(response.array)
+                )
             json_items = list(response.json_items)
             dicts = u.Data.unwrap_proto_list_to_dicts(json_items)
             if dicts is None:
                 return None
-            return tuple(MT5Models.Order.model_validate(d) for d in dicts)
-
-        return await self._resilient_call("history_orders_get", _call)
+            return self._models.build_many(MT5Models.Order, dicts, validate=validate)
+
+        return await self._read_call(
+            "history_orders_get",
+            _call,
+            date_from,
+            date_to,
+            group,
+            ticket,
+            position,
+            fmt,
+            validate,
+            tuple(fields or ()),
+            _filter_key(record_filter),
+        )
 
     async def history_deals_total(
         self,
@@ -2465,8 +3912,9 @@ class AsyncMetaTrader5(AsyncMT5Protocol):
             response = await stub.HistoryDealsTotal(request, timeout=self._timeout)
             return response.value
 
-        return await self._resilient_call("history_deals_total", _call)
+        return await self._read_call("history_deals_total", _call, date_from, date_to)
 
+    @overload
     async def history_deals_get(
         self,
         date_from: datetime | int | None = None,
@@ -2474,7 +3922,94 @@ class AsyncMetaTrader5(AsyncMT5Protocol):
         group: str | None = None,
         ticket: int | None = None,
         position: int | None = None,
-    ) -> tuple[MT5Models.Deal, ...] | None:
+        *,
+        as_array: Literal[False] = False,
+        validate: bool | None = None,
+        fields: Sequence[str] | None = None,
+        where: t.RecordFilterDict | None = None,
+        return_format: Literal["model"] = "model",
+    ) -> tuple[MT5Models.Deal, ...] | None: ...
+
+    @overload
+    async def history_deals_get(
+        self,
+        date_from: datetime | int | None = None,
+        date_to: datetime | int | None = None,
+        group: str | None = None,
+        ticket: int | None = None,
+        position: int | None = None,
+        *,
+        as_array: Literal[True],
+        validate: bool | None = None,
+        fields: Sequence[str] | None = None,
+        where: t.RecordFilterDict | None = None,
+        return_format: t.ReturnFormat = "model",
+    ) -> NDArray[np.void] | None: ...
+
+    @overload
+    async def history_deals_get(
+        self,
+        date_from: datetime | int | None = None,
+        date_to: datetime | int | None = None,
+        group: str | None = None,
+        ticket: int | None = None,
+        position: int | None = None,
+        *,
+        as_array: Literal[False] = False,
+        validate: bool | None = None,
+        fields: Sequence[str] | None = None,
+        where: t.RecordFilterDict | None = None,
+        return_format: Literal["array"],
+    ) -> NDArray[np.void] | None: ...
+
+    @overload
+    async def history_deals_get(
+        self,
+        date_from: datetime | int | None = None,
+        date_to: datetime | int | None = None,
+        group: str | None = None,
+        ticket: int | None = None,
+        position: int | None = None,
+        *,
+        as_array: Literal[False] = False,
+        validate: bool | None = None,
+        fields: Sequence[str] | None = None,
+        where: t.RecordFilterDict | None = None,
+        return_format: Literal["namedtuple"],
+    ) -> tuple[t.TradeDeal, ...] | None: ...
+
+    @overload
+    async def history_deals_get(
+        self,
+        date_from: datetime | int | None = None,
+        date_to: datetime | int | None = None,
+        group: str | None = None,
+        ticket: int | None = None,
+        position: int | None = None,
+        *,
+        as_array: bool = False,
+        validate: bool | None = None,
+        fields: Sequence[str] | None = None,
+        where: t.RecordFilterDict | None = None,
+        return_format: t.ReturnFormat = "model",
+    ) -> (
+        tuple[MT5Models.Deal, ...] | tuple[t.TradeDeal, ...] | NDArray[np.void] | None
+    ): ...
+
+    async def history_deals_get(
+        self,
+        date_from: datetime | int | None = None,
+        date_to: datetime | int | None = None,
+        group: str | None = None,
+        ticket: int | None = None,
+        position: int | None = None,
+        *,
+        as_array: bool = False,
+        validate: bool | None = None,
+        fields: Sequence[str] | None = None,
+        where: t.RecordFilterDict | None = None,
+        return_format: t.ReturnFormat = "model",
+    ) -> tuple[MT5Models.Deal, ...] | tuple[t.TradeDeal, ...] | NDArray[np.void] | None:
         """Get historical deals with filters.
 
         Args:
@@ -2483,13 +4018,34 @@ class AsyncMetaTrader5(AsyncMT5Protocol):
             group: Symbol group filter.
             ticket: Specific deal ticket.
             position: Position ID filter.
+            as_array: Return a columnar NumPy structured array (one field
+                per MT5 field) instead of models - skips per-row JSON
+                decoding and model construction.
+            validate: Validate rows with pydantic (None = validate_models
+                setting); False builds models with model_construct.
+            fields: Columns to fetch (ticket is always included); the rest
+                take model/record defaults. None fetches every field.
+            where: Row filter applied by the bridge before serialization
+                (magic, type, entry, position_id, time_from/time_to,
+                comment_prefix); see MT5Types.RecordFilterDict.
+            return_format: "model" (pydantic models), "namedtuple"
+                (MT5Types.TradeDeal records in MetaTrader5 field order)
+                or "array" (same as as_array).
 
         Returns:
-            Tuple of Deal objects or None.
+            Tuple of Deal objects, records if return_format is
+            "namedtuple", structured array if as_array or "array", or None.
 
         """
-
-        async def _call() -> tuple[MT5Models.Deal, ...] | None:
+        fmt: t.ReturnFormat = "array" if as_array else return_format
+        record_filter = _record_filter(where)
+
+        async def _call() -> (
+            tuple[MT5Models.Deal, ...]
+            | tuple[t.TradeDeal, ...]
+            | NDArray[np.void]
+            | None
+        ):
             stub = self._ensure_connected()
             request = mt5_pb2.HistoryRequest()
             if date_from is not None:
@@ -2502,14 +4058,40 @@ class AsyncMetaTrader5(AsyncMT5Protocol):
                 request.ticket = ticket
             if position is not None:
                 request.position = position
+            _list_options(
+                request,
+                as_array=fmt != "model",
+                fields=fields,
+                record_filter=record_filter,
+            )
             response = await stub.HistoryDealsGet(request, timeout=self._timeout)
+            if fmt == "array":
+                return u.Data.numpy_from_proto(
+                    response.array, copy=self._settings.numpy_owned_arrays
+                )
+            if fmt == "namedtuple":
+                return u.Data.records_from_array(
+                    t.TradeDeal, u.Data.numpy_from_proto(response.array)
+                )
             json_items = list(response.json_items)
             dicts = u.Data.unwrap_proto_list_to_dicts(json_items)
             if dicts is None:
                 return None
-            return tuple(MT5Models.Deal.model_validate(d) for d in dicts)
-
-        return await self._resilient_call("history_deals_get", _call)
+            return self._models.build_many(MT5Models.Deal, dicts, validate=validate)
+
+        return await self._read_call(
+            "history_deals_get",
+            _call,
+            date_from,
+            date_to,
+            group,
+            ticket,
+            position,
+            fmt,
+            validate,
+            tuple(fields or ()),
+            _filter_key(record_filter),
+        )
 
     # =========================================================================
     # MARKET DEPTH METHODS
@@ -2536,22 +4118,83 @@ class AsyncMetaTrader5(AsyncMT5Protocol):
 
         return await self._resilient_call("market_book_add", _call)
 
+    @overload
+    async def market_book_get(
+        self,
+        symbol: str,
+        *,
+        validate: bool | None = None,
+        return_format: Literal["model"] = "model",
+    ) -> tuple[MT5Models.BookEntry, ...] | None: ...
+
+    @overload
+    async def market_book_get(
+        self,
+        symbol: str,
+        *,
+        validate: bool | None = None,
+        return_format: Literal["namedtuple"],
+    ) -> tuple[t.BookInfo, ...] | None: ...
+
+    @overload
+    async def market_book_get(
+        self,
+        symbol: str,
+        *,
+        validate: bool | None = None,
+        return_format: Literal["array"],
+    ) -> NDArray[np.void] | None: ...
+
+    @overload
     async def market_book_get(
-        self, symbol: str
-    ) -> tuple[MT5Models.BookEntry, ...] | None:
+        self,
+        symbol: str,
+        *,
+        validate: bool | None = None,
+        return_format: t.ReturnFormat = "model",
+    ) -> (
+        tuple[MT5Models.BookEntry, ...]
+        | tuple[t.BookInfo, ...]
+        | NDArray[np.void]
+        | None
+    ): ...
+
+    async def market_book_get(
+        self,
+        symbol: str,
+        *,
+        validate: bool | None = None,
+        return_format: t.ReturnFormat = "model",
+    ) -> (
+        tuple[MT5Models.BookEntry, ...]
+        | tuple[t.BookInfo, ...]
+        | NDArray[np.void]
+        | None
+    ):
         """Get market depth (DOM) data for a symbol.
 
         Requires prior market_book_add call.
 
         Args:
             symbol: Symbol name to get market depth for.
+            validate: Validate entries with pydantic (None = validate_models
+                setting); False builds models with model_construct.
+            return_format: "model" (pydantic models), "namedtuple"
+                (MT5Types.BookInfo records in MetaTrader5 field order)
+                or "array" (structured array, DtypeRegistry.BOOK).
 
         Returns:
-            Tuple of BookEntry objects or None.
+            Tuple of BookEntry objects, records or structured array per
+            return_format, or None.
 
         """
 
-        async def _call() -> tuple[MT5Models.BookEntry, ...] | None:
+        async def _call() -> (
+            tuple[MT5Models.BookEntry, ...]
+            | tuple[t.BookInfo, ...]
+            | NDArray[np.void]
+            | None
+        ):
             stub = self._ensure_connected()
             request = mt5_pb2.SymbolRequest(symbol=symbol)
             response = await stub.MarketBookGet(request, timeout=self._timeout)
@@ -2559,9 +4202,18 @@ class AsyncMetaTrader5(AsyncMT5Protocol):
             dicts = u.Data.unwrap_proto_list_to_dicts(json_items)
             if dicts is None:
                 return None
-            return tuple(MT5Models.BookEntry.model_validate(d) for d in dicts)
+            if return_format == "model":
+                return self._models.build_many(
+                    MT5Models.BookEntry, dicts, validate=validate
+                )
+            records = u.Data.records_from_dicts(t.BookInfo, dicts)
+            if return_format == "namedtuple":
+                return records
+            return np.array(list(records), dtype=u.Data.DtypeRegistry.BOOK)
 
-        return await self._resilient_call("market_book_get", _call)
+        return await self._read_call(
+            "market_book_get", _call, symbol, validate, return_format
+        )
 
     async def market_book_release(self, symbol: str) -> bool:
         """Unsubscribe from market depth (DOM) for a symbol.
@@ -2581,3 +4233,313 @@ class AsyncMetaTrader5(AsyncMT5Protocol):
             return response.result
 
         return await self._resilient_call("market_book_release", _call)
+
+    # =========================================================================
+    # PIPELINED READS (mt5linux extension)
+    # =========================================================================
+
+    def batch(self) -> AsyncMT5Batch:
+        """Start a pipelined read batch (mt5linux extension).
+
+        Reads queued on the returned builder are sent as one Batch RPC when
+        the ``async with`` block exits; the bridge runs them back-to-back, so
+        the results are close in time (not an atomic snapshot: other requests
+        may reach the terminal in between). Calls the bridge could not start
+        within its MT5 call timeout fail with their own error.
+
+        Example:
+            >>> async with mt5.batch() as b:
+            ...     account = b.account_info()
+            ...     positions = b.positions_get(symbol="EURUSD")
+            >>> account.result().equity
+
+        Returns:
+            AsyncMT5Batch builder.
+
+        """
+        return AsyncMT5Batch(
+            self._execute_batch,
+            models=self._models,
+            copy_arrays=self._settings.numpy_owned_arrays,
+        )
+
+    async def _execute_batch(
+        self, calls: Sequence[tuple[str, object]]
+    ) -> list[tuple[bytes, str]]:
+        """Send (RPC name, request) pairs as one Batch RPC.
+
+        Bridges without Batch (UNIMPLEMENTED) are served by issuing the
+        calls individually and concurrently.
+
+        Args:
+            calls: Ordered (MT5Service method name, request message) pairs.
+
+        Returns:
+            (serialized response, error) per call, in order.
+
+        """
+        grpc_request = mt5_pb2.BatchRequest(
+            calls=[
+                mt5_pb2.BatchCall(method=method, request=request.SerializeToString())
+                for method, request in calls
+            ]
+        )
+
+        async def _call() -> list[tuple[bytes, str]]:
+            stub = self._ensure_connected()
+            try:
+                response = await stub.Batch(
+                    grpc_request, timeout=self._timeout * max(len(calls), 1)
+                )
+            except grpc.RpcError as e:
+                if e.code() != grpc.StatusCode.UNIMPLEMENTED:
+                    raise
+                log.debug("Batch unavailable, issuing %d calls", len(calls))
+                return await self._execute_unbatched(stub, calls)
+            return [(r.response, r.error) for r in response.results]
+
+        return await self._read_call("batch", _call, grpc_request.SerializeToString())
+
+    async def _execute_unbatched(
+        self,
+        stub: mt5_pb2_grpc.MT5ServiceStub,
+        calls: Sequence[tuple[str, object]],
+    ) -> list[tuple[bytes, str]]:
+        async def _one(method: str, request: object) -> tuple[bytes, str]:
+            try:
+                response = await getattr(stub, method)(request, timeout=self._timeout)
+            except grpc.RpcError as e:
+                if u.ErrorClassifier.is_retryable_exception(e):
+                    raise
+                return b"", f"{e.code().name}: {e.details()}"
+            return response.SerializeToString(), ""
+
+        return list(await asyncio.gather(*[_one(m, r) for m, r in calls]))
+
+
+class AsyncMT5Batch:
+    """Pipelined read builder returned by AsyncMetaTrader5.batch().
+
+    Each builder method queues one read and returns a concurrent.futures
+    Future, so both async and sync callers can read it with ``.result()``
+    once the batch has executed. Reads are parsed exactly like the matching
+    client methods but bypass the client-side caches: a batch always asks
+    the terminal. A read that fails on the bridge sets MT5Error on its own
+    future only; a failure of the whole RPC sets it on every future and is
+    raised from execute().
+
+    Consistency: a batch saves round-trips; it is not a point-in-time
+    snapshot. The bridge runs the reads in order, back-to-back, but other
+    requests (and, with several MT5 workers, other batches) may reach the
+    terminal between them, so e.g. account_info() and positions_get() can
+    straddle a fill. Bridges without the Batch RPC run the reads as
+    concurrent individual calls. Derive cross-read invariants from one
+    read where possible.
+
+    """
+
+    def __init__(
+        self,
+        dispatch: Callable[
+            [Sequence[tuple[str, object]]], Awaitable[list[tuple[bytes, str]]]
+        ],
+        *,
+        models: u.ModelFactory,
+        copy_arrays: bool = False,
+    ) -> None:
+        """Initialize an empty batch.
+
+        Args:
+            dispatch: Sends (RPC name, request) pairs and returns
+                (serialized response, error) per call.
+            models: Factory building the response models.
+            copy_arrays: Return owned NumPy arrays (numpy_owned_arrays).
+
+        """
+        self._dispatch = dispatch
+        self._models = models
+        self._copy_arrays = copy_arrays
+        self._calls: list[
+            tuple[
+                str,
+                object,
+                Callable[[bytes], None],
+                Callable[[BaseException], None],
+            ]
+        ] = []
+
+    def __len__(self) -> int:
+        """Return the number of queued reads."""
+        return len(self._calls)
+
+    async def __aenter__(self) -> Self:
+        """Return the builder."""
+        return self
+
+    async def __aexit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc_val: BaseException | None,
+        exc_tb: object,
+    ) -> None:
+        """Execute the batch, or cancel its futures if the block raised."""
+        if exc_type is None:
+            await self.execute()
+        else:
+            self.cancel()
+
+    def _add[R](
+        self, method: str, request: object, parse: Callable[[bytes], R]
+    ) -> Future[R]:
+        future: Future[R] = Future()
+
+        def _resolve(data: bytes) -> None:
+            try:
+                future.set_result(parse(data))
+            except Exception as e:  # noqa: BLE001 - surfaced through the future
+                future.set_exception(e)
+
+        self._calls.append((method, request, _resolve, future.set_exception))
+        return future
+
+    async def execute(self) -> None:
+        """Send all queued reads as one Batch RPC and settle their futures.
+
+        Raises:
+            grpc.RpcError: If the Batch RPC itself fails (after retries).
+
+        """
+        calls, self._calls = self._calls, []
+        if not calls:
+            return
+        try:
+            results = await self._dispatch(
+                [(method, request) for method, request, _, _ in calls]
+            )
+        except BaseException as e:
+            for _, _, _, fail in calls:
+                fail(e)
+            raise
+        for (method, _, resolve, fail), (data, error) in zip(
+            calls, results, strict=True
+        ):
+            if error:
+                fail(u.Exceptions.Error(f"{method}: {error}"))
+            else:
+                resolve(data)
+
+    def cancel(self) -> None:
+        """Drop queued reads without sending them."""
+        calls, self._calls = self._calls, []
+        for method, _, _, fail in calls:
+            fail(u.Exceptions.Error(f"{method}: batch cancelled"))
+
+    def _build_list[M: MT5Models.Base](
+        self, model: type[M], data: bytes
+    ) -> tuple[M, ...] | None:
+        dicts = _dict_list(data)
+        if dicts is None:
+            return None
+        return self._models.build_many(model, dicts)
+
+    def _numpy(self, data: bytes) -> NDArray[np.void] | None:
+        return u.Data.numpy_from_proto(
+            mt5_pb2.NumpyArray.FromString(data),
+            copy=self._copy_arrays,
+        )
+
+    def terminal_info(self) -> Future[MT5Models.TerminalInfo | None]:
+        """Queue a terminal_info read."""
+        return self._add(
+            "TerminalInfo",
+            mt5_pb2.Empty(),
+            lambda data: self._models.build(MT5Models.TerminalInfo, _dict_data(data)),
+        )
+
+    def account_info(self) -> Future[MT5Models.AccountInfo | None]:
+        """Queue a account_info read."""
+        return self._add(
+            "AccountInfo",
+            mt5_pb2.Empty(),
+            lambda data: self._models.build(MT5Models.AccountInfo, _dict_data(data)),
+        )
+
+    def symbols_total(self) -> Future[int]:
+        """Queue a symbols_total read."""
+        return self._add("SymbolsTotal", mt5_pb2.Empty(), _int_response)
+
+    def symbol_info(self, symbol: str) -> Future[MT5Models.SymbolInfo | None]:
+        """Queue a symbol_info read."""
+        return self._add(
+            "SymbolInfo",
+            mt5_pb2.SymbolRequest(symbol=symbol),
+            lambda data: self._models.build(MT5Models.SymbolInfo, _dict_data(data)),
+        )
+
+    def symbol_info_tick(self, symbol: str) -> Future[MT5Models.Tick | None]:
+        """Queue a symbol_info_tick read."""
+        return self._add(
+            "SymbolInfoTick",
+            mt5_pb2.SymbolRequest(symbol=symbol),
+            lambda data: self._models.build(MT5Models.Tick, _dict_data(data)),
+        )
+
+    def copy_rates_from_pos(
+        self, symbol: str, timeframe: int, start_pos: int, count: int
+    ) -> Future[NDArray[np.void] | None]:
+        """Queue a copy_rates_from_pos read."""
+        return self._add(
+            "CopyRatesFromPos",
+            mt5_pb2.CopyRatesPosRequest(
+                symbol=symbol, timeframe=timeframe, start_pos=start_pos, count=count
+            ),
+            self._numpy,
+        )
+
+    def positions_total(self) -> Future[int]:
+        """Queue a positions_total read."""
+        return self._add("PositionsTotal", mt5_pb2.Empty(), _int_response)
+
+    def positions_get(
+        self,
+        symbol: str | None = None,
+        group: str | None = None,
+        ticket: int | None = None,
+    ) -> Future[tuple[MT5Models.Position, ...] | None]:
+        """Queue a positions_get read."""
+        request = mt5_pb2.PositionsRequest()
+        if symbol is not None:
+            request.symbol = symbol
+        if group is not None:
+            request.group = group
+        if ticket is not None:
+            request.ticket = ticket
+        return self._add(
+            "PositionsGet",
+            request,
+            lambda data: self._build_list(MT5Models.Position, data),
+        )
+
+    def orders_total(self) -> Future[int]:
+        """Queue a orders_total read."""
+        return self._add("OrdersTotal", mt5_pb2.Empty(), _int_response)
+
+    def orders_get(
+        self,
+        symbol: str | None = None,
+        group: str | None = None,
+        ticket: int | None = None,
+    ) -> Future[tuple[MT5Models.Order, ...] | None]:
+        """Queue a orders_get read."""
+        request = mt5_pb2.OrdersRequest()
+        if symbol is not None:
+            request.symbol = symbol
+        if group is not None:
+            request.group = group
+        if ticket is not None:
+            request.ticket = ticket
+        return self._add(
+            "OrdersGet",
+            request,
+            lambda data: self._build_list(MT5Models.Order, data),
+        )
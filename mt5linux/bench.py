@@ -0,0 +1,567 @@
+"""End-to-end latency benchmarks for mt5linux.
+
+Runs the real bridge (MT5GRPCServicer) serving a seeded MT5Simulator on
+127.0.0.1 and drives it with AsyncMetaTrader5 and MetaTrader5, so every
+number includes the client resilience layers, gRPC, the bridge and
+serialization - everything but the terminal, whose cost is modelled by
+--sim-latency-ms. Per scenario and client it reports p50/p95/p99 latency,
+throughput and the peak Python allocation of one call, and writes a JSON
+report tagged with the git commit so runs can be compared across commits.
+
+Scenarios: symbol_info_tick, copy_rates_from_pos (100/10k/100k bars),
+copy_ticks_range, positions_get (10/1k rows), history_deals_get (50k rows),
+order_send and order_send_batch. The batch runs on the async client only:
+the sync wrapper returns as soon as the orders are queued.
+
+Usage:
+    python -m mt5linux bench
+    python -m mt5linux bench --iterations 200 --output bench.json
+    python -m mt5linux bench --compare bench-main.json
+
+Hierarchy Level: 5
+- Imports: AsyncMetaTrader5, MetaTrader5, MT5GRPCServicer, MT5Simulator
+- Used by: python -m mt5linux bench, tests/benchmarks
+
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import logging
+import platform
+import subprocess
+import tempfile
+import time
+import tracemalloc
+from concurrent import futures
+from dataclasses import asdict, dataclass, field
+from datetime import UTC, datetime
+from pathlib import Path
+from typing import TYPE_CHECKING, Self, cast
+
+import grpc
+import numpy as np
+import orjson
+
+from mt5linux import __version__, mt5_pb2_grpc
+from mt5linux.async_client import AsyncMetaTrader5
+from mt5linux.bridge import MT5GRPCServicer
+from mt5linux.client import MetaTrader5
+from mt5linux.constants import MT5Constants as c
+from mt5linux.settings import MT5Settings
+from mt5linux.simulator import MT5Simulator
+
+if TYPE_CHECKING:
+    from collections.abc import Awaitable, Callable, Mapping, Sequence
+    from types import ModuleType, TracebackType
+
+    from mt5linux.models import MT5Models
+    from mt5linux.types import MT5Types as t
+
+log = logging.getLogger(__name__)
+
+_SEED = 7
+_WARMUP = 3
+_ALLOC_CALLS = 3
+_HEAVY_DIVISOR = 10
+_BATCH_SIZE = 10
+_RATES_COUNTS = (100, 10_000, 100_000)
+_TICKS_WINDOW = 600  # seconds, 6000 ticks at the simulator's 100 ms
+_POSITION_SYMBOLS = {"EURUSD": 10, "GBPUSD": 1_000}
+_HISTORY_SYMBOL = "XAUUSD"
+_HISTORY_DEALS = 50_000
+_ORDER_SYMBOL = "BTCUSD"
+_BALANCE = 100_000_000.0  # margin for the seeded positions and order_send
+
+
+@dataclass(frozen=True)
+class Scenario:
+    """One benchmarked client call."""
+
+    name: str
+    method: str
+    args: tuple[object, ...] = ()
+    kwargs: Mapping[str, object] = field(default_factory=dict)
+    rows: int | None = None
+    """Rows the seeded bridge returns at least (None when not fixed)."""
+    heavy: bool = False
+    """Run iterations // 10 times (large payloads)."""
+    async_only: bool = False
+
+
+@dataclass(frozen=True)
+class BenchResult:
+    """Latency distribution and cost of one scenario on one client."""
+
+    scenario: str
+    client: str
+    iterations: int
+    rows: int
+    p50_ms: float
+    p95_ms: float
+    p99_ms: float
+    mean_ms: float
+    max_ms: float
+    throughput: float
+    """Completed calls per second over the measured loop."""
+    alloc_peak_kib: float
+    """Median peak of traced Python allocations during one call (client
+    and in-process bridge)."""
+
+
+def _order(symbol: str = _ORDER_SYMBOL) -> dict[str, object]:
+    return {
+        "action": int(c.Order.TradeAction.DEAL),
+        "symbol": symbol,
+        "volume": 0.01,
+        "type": int(c.Order.OrderType.BUY),
+        "deviation": 50,
+    }
+
+
+def scenarios(now: float | None = None) -> list[Scenario]:
+    """Return the benchmark scenarios, ranges ending at now (epoch seconds)."""
+    end = int(time.time() if now is None else now)
+    m1 = int(c.MarketData.TimeFrame.M1)
+    return [
+        Scenario("symbol_info_tick", "symbol_info_tick", ("EURUSD",)),
+        *(
+            Scenario(
+                f"copy_rates_from_pos[{count}]",
+                "copy_rates_from_pos",
+                ("EURUSD", m1, 0, count),
+                rows=count,
+                heavy=count == _RATES_COUNTS[-1],
+            )
+            for count in _RATES_COUNTS
+        ),
+        Scenario(
+            "copy_ticks_range",
+            "copy_ticks_range",
+            ("EURUSD", end - _TICKS_WINDOW, end, int(c.MarketData.CopyTicksFlag.ALL)),
+        ),
+        *(
+            Scenario(
+                f"positions_get[{count}]",
+                "positions_get",
+                kwargs={"symbol": symbol},
+                rows=count,
+            )
+            for symbol, count in _POSITION_SYMBOLS.items()
+        ),
+        Scenario(
+            f"history_deals_get[{_HISTORY_DEALS}]",
+            "history_deals_get",
+            (0, end + 86_400),
+            {"group": _HISTORY_SYMBOL},
+            rows=_HISTORY_DEALS,
+            heavy=True,
+        ),
+        Scenario("order_send", "order_send", (_order(),)),
+        Scenario(
+            f"order_send_batch[{_BATCH_SIZE}]",
+            "order_send_batch",
+            ([_order() for _ in range(_BATCH_SIZE)],),
+            async_only=True,
+        ),
+    ]
+
+
+class LocalBridge:
+    """Bridge serving a seeded MT5Simulator on an ephemeral localhost port.
+
+    The simulator is seeded with 10 EURUSD and 1000 GBPUSD positions and
+    50k XAUUSD history deals before the server starts.
+    """
+
+    def __init__(self, *, latency_ms: float = 0.0, workers: int = 10) -> None:
+        """Initialize the bridge.
+
+        Args:
+            latency_ms: Simulated terminal latency of every MT5 call.
+            workers: gRPC server worker threads.
+
+        """
+        self.simulator = MT5Simulator(
+            seed=_SEED, latency_ms=latency_ms, balance=_BALANCE
+        )
+        self.simulator.initialize()
+        for symbol, count in _POSITION_SYMBOLS.items():
+            self.simulator.seed_trades(symbol, positions=count)
+        self.simulator.seed_trades(_HISTORY_SYMBOL, round_trips=_HISTORY_DEALS // 2)
+        self.port = 0
+        self._workers = workers
+        self._server: grpc.Server | None = None
+        self._servicer: MT5GRPCServicer | None = None
+
+    def __enter__(self) -> Self:
+        """Start serving."""
+        self._servicer = MT5GRPCServicer(mt5_module=cast("ModuleType", self.simulator))
+        self._server = grpc.server(
+            futures.ThreadPoolExecutor(max_workers=self._workers),
+            interceptors=[self._servicer.stage_interceptor()],
+        )
+        register_servicer = cast(
+            "Callable[[MT5GRPCServicer, grpc.Server], None]",
+            mt5_pb2_grpc.add_MT5ServiceServicer_to_server,
+        )
+        register_servicer(self._servicer, self._server)
+        self.port = self._server.add_insecure_port("127.0.0.1:0")
+        self._server.start()
+        return self
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc_val: BaseException | None,
+        exc_tb: TracebackType | None,
+    ) -> None:
+        """Stop serving."""
+        if self._server is not None:
+            self._server.stop(grace=None)
+        if self._servicer is not None:
+            self._servicer.close()
+
+
+def _rows(result: object) -> int:
+    if result is None:
+        return 0
+    if isinstance(result, (list, tuple, np.ndarray)):
+        return len(result)
+    return 1
+
+
+def _summarize(  # noqa: PLR0913 - one argument per measured quantity
+    scenario: Scenario,
+    client: str,
+    latencies: Sequence[float],
+    *,
+    elapsed: float,
+    rows: int,
+    allocs: Sequence[int],
+) -> BenchResult:
+    ms = np.asarray(latencies) * 1000
+    p50, p95, p99 = np.percentile(ms, [50, 95, 99])
+    return BenchResult(
+        scenario=scenario.name,
+        client=client,
+        iterations=len(ms),
+        rows=rows,
+        p50_ms=round(float(p50), 3),
+        p95_ms=round(float(p95), 3),
+        p99_ms=round(float(p99), 3),
+        mean_ms=round(float(ms.mean()), 3),
+        max_ms=round(float(ms.max()), 3),
+        throughput=round(len(ms) / elapsed, 1) if elapsed else 0.0,
+        alloc_peak_kib=round(float(np.median(allocs)) / 1024, 1) if allocs else 0.0,
+    )
+
+
+def _count(scenario: Scenario, iterations: int) -> int:
+    return max(iterations // _HEAVY_DIVISOR, 5) if scenario.heavy else iterations
+
+
+async def _measure_async(
+    scenario: Scenario,
+    call: Callable[[], Awaitable[object]],
+    iterations: int,
+    concurrency: int,
+) -> BenchResult:
+    """Time call() with concurrency workers sharing the iterations."""
+    rows = 0
+    for _ in range(_WARMUP):
+        rows = _rows(await call())
+    allocs: list[int] = []
+    tracemalloc.start()
+    try:
+        for _ in range(_ALLOC_CALLS):
+            tracemalloc.reset_peak()
+            baseline = tracemalloc.get_traced_memory()[0]
+            await call()
+            allocs.append(tracemalloc.get_traced_memory()[1] - baseline)
+    finally:
+        tracemalloc.stop()
+
+    latencies: list[float] = []
+
+    async def worker(count: int) -> None:
+        for _ in range(count):
+            start = time.perf_counter()
+            await call()
+            latencies.append(time.perf_counter() - start)
+
+    total = _count(scenario, iterations)
+    workers = max(1, min(concurrency, total))
+    shares = [total // workers + (i < total % workers) for i in range(workers)]
+    start = time.perf_counter()
+    await asyncio.gather(*(worker(share) for share in shares))
+    elapsed = time.perf_counter() - start
+    return _summarize(
+        scenario, "async", latencies, elapsed=elapsed, rows=rows, allocs=allocs
+    )
+
+
+def _measure_sync(
+    scenario: Scenario, call: Callable[[], object], iterations: int
+) -> BenchResult:
+    """Time call() sequentially."""
+    rows = 0
+    for _ in range(_WARMUP):
+        rows = _rows(call())
+    allocs: list[int] = []
+    tracemalloc.start()
+    try:
+        for _ in range(_ALLOC_CALLS):
+            tracemalloc.reset_peak()
+            baseline = tracemalloc.get_traced_memory()[0]
+            call()
+            allocs.append(tracemalloc.get_traced_memory()[1] - baseline)
+    finally:
+        tracemalloc.stop()
+
+    latencies: list[float] = []
+    start = time.perf_counter()
+    for _ in range(_count(scenario, iterations)):
+        began = time.perf_counter()
+        call()
+        latencies.append(time.perf_counter() - began)
+    elapsed = time.perf_counter() - start
+    return _summarize(
+        scenario, "sync", latencies, elapsed=elapsed, rows=rows, allocs=allocs
+    )
+
+
+def async_call(
+    client: AsyncMetaTrader5, scenario: Scenario
+) -> Callable[[], Awaitable[object]]:
+    """Bind a scenario to an async client; batches resolve when all orders do."""
+    if scenario.method == "order_send_batch":
+        (requests,) = scenario.args
+
+        async def batch() -> object:
+            done: asyncio.Future[dict[str, MT5Models.OrderResult | Exception]]
+            done = asyncio.get_running_loop().create_future()
+            await client.order_send_batch(
+                cast("list[dict[str, t.JSONValue]]", requests),
+                on_all_complete=done.set_result,
+            )
+            return list((await done).values())
+
+        return batch
+    method = getattr(client, scenario.method)
+    return lambda: method(*scenario.args, **scenario.kwargs)
+
+
+def sync_call(client: MetaTrader5, scenario: Scenario) -> Callable[[], object]:
+    """Bind a scenario to a sync client."""
+    method = getattr(client, scenario.method)
+    return lambda: method(*scenario.args, **scenario.kwargs)
+
+
+async def _run_async(
+    port: int,
+    settings: MT5Settings,
+    cases: Sequence[Scenario],
+    iterations: int,
+    concurrency: int,
+) -> list[BenchResult]:
+    client = AsyncMetaTrader5(host="127.0.0.1", port=port, config=settings)
+    results: list[BenchResult] = []
+    async with client:
+        await client.initialize()
+        for scenario in cases:
+            result = await _measure_async(
+                scenario, async_call(client, scenario), iterations, concurrency
+            )
+            log.info(_format(result))
+            results.append(result)
+    return results
+
+
+def _run_sync(
+    port: int,
+    settings: MT5Settings,
+    cases: Sequence[Scenario],
+    iterations: int,
+) -> list[BenchResult]:
+    client = MetaTrader5(host="127.0.0.1", port=port, config=settings)
+    results: list[BenchResult] = []
+    with client:
+        client.initialize()
+        for scenario in cases:
+            if scenario.async_only:
+                continue
+            result = _measure_sync(scenario, sync_call(client, scenario), iterations)
+            log.info(_format(result))
+            results.append(result)
+    return results
+
+
+def _git_commit() -> str | None:
+    try:
+        completed = subprocess.run(  # noqa: S603 - fixed argv, no shell
+            ["git", "rev-parse", "--short", "HEAD"],  # noqa: S607 - git from PATH
+            capture_output=True,
+            check=True,
+            text=True,
+            cwd=Path(__file__).parent,
+        )
+    except (OSError, subprocess.CalledProcessError):
+        return None
+    return completed.stdout.strip() or None
+
+
+def run_benchmarks(
+    *,
+    iterations: int = 100,
+    concurrency: int = 1,
+    latency_ms: float = 0.0,
+    clients: Sequence[str] = ("async", "sync"),
+    only: Sequence[str] = (),
+) -> dict[str, object]:
+    """Run the scenarios against a local simulated bridge.
+
+    Args:
+        iterations: Measured calls per scenario (heavy scenarios run a tenth).
+        concurrency: Concurrent async callers (the sync client runs one).
+        latency_ms: Simulated terminal latency of every MT5 call.
+        clients: Clients to benchmark ("async", "sync").
+        only: Scenario name prefixes to run (all when empty).
+
+    Returns:
+        JSON-serializable report: run metadata and one entry per scenario
+        and client.
+
+    """
+    cases = [s for s in scenarios() if not only or s.name.startswith(tuple(only))]
+    results: list[BenchResult] = []
+    with (
+        tempfile.TemporaryDirectory(prefix="mt5linux-bench-") as tmp,
+        LocalBridge(latency_ms=latency_ms) as bridge,
+    ):
+        settings = MT5Settings(wal_path=str(Path(tmp) / "wal.db"))
+        if "async" in clients:
+            results += asyncio.run(
+                _run_async(bridge.port, settings, cases, iterations, concurrency)
+            )
+        if "sync" in clients:
+            results += _run_sync(bridge.port, settings, cases, iterations)
+    return {
+        "version": __version__,
+        "commit": _git_commit(),
+        "timestamp": datetime.now(UTC).isoformat(timespec="seconds"),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "iterations": iterations,
+        "concurrency": concurrency,
+        "latency_ms": latency_ms,
+        "results": [asdict(result) for result in results],
+    }
+
+
+def _format(result: BenchResult) -> str:
+    return (
+        f"{result.client:5} {result.scenario:28} rows={result.rows:<6} "
+        f"p50={result.p50_ms:8.3f}ms p95={result.p95_ms:8.3f}ms "
+        f"p99={result.p99_ms:8.3f}ms {result.throughput:9.1f}/s "
+        f"alloc={result.alloc_peak_kib:9.1f}KiB"
+    )
+
+
+def compare(baseline: Mapping[str, object], current: Mapping[str, object]) -> str:
+    """Render p50/p99 changes of current against a baseline report."""
+    old = {
+        (r["client"], r["scenario"]): r
+        for r in cast("list[dict[str, object]]", baseline["results"])
+    }
+    lines = [f"vs {baseline.get('commit') or 'baseline'}:"]
+    for row in cast("list[dict[str, object]]", current["results"]):
+        before = old.get((row["client"], row["scenario"]))
+        if before is None:
+            continue
+        deltas = [
+            f"{key[:3]} {cast('float', before[key]):.3f}->{cast('float', row[key]):.3f}"
+            f" ({cast('float', row[key]) / cast('float', before[key]) - 1:+.0%})"
+            for key in ("p50_ms", "p99_ms")
+            if before[key]
+        ]
+        lines.append(f"{row['client']:5} {row['scenario']:28} " + "  ".join(deltas))
+    return "\n".join(lines)
+
+
+def main(argv: list[str] | None = None) -> int:
+    """Run the benchmark suite from the command line.
+
+    Args:
+        argv: Command line arguments (defaults to sys.argv[1:]).
+
+    Returns:
+        Exit code (0 for success).
+
+    """
+    parser = argparse.ArgumentParser(
+        prog="python -m mt5linux bench",
+        description="End-to-end RPC latency benchmarks against a local bridge",
+    )
+    parser.add_argument(
+        "-n",
+        "--iterations",
+        type=int,
+        default=100,
+        help="Measured calls per scenario (default: 100)",
+    )
+    parser.add_argument(
+        "--concurrency",
+        type=int,
+        default=1,
+        help="Concurrent async callers (default: 1)",
+    )
+    parser.add_argument(
+        "--sim-latency-ms",
+        type=float,
+        default=0.0,
+        help="Simulated latency added to every MT5 call (default: 0.0)",
+    )
+    parser.add_argument(
+        "--client",
+        choices=["async", "sync"],
+        action="append",
+        help="Client to benchmark (repeatable, default: both)",
+    )
+    parser.add_argument(
+        "-k",
+        "--only",
+        action="append",
+        default=[],
+        help="Run scenarios whose name starts with this prefix (repeatable)",
+    )
+    parser.add_argument(
+        "-o",
+        "--output",
+        default="mt5linux-bench.json",
+        help="JSON report path (default: mt5linux-bench.json)",
+    )
+    parser.add_argument(
+        "--compare",
+        metavar="REPORT",
+        help="Baseline JSON report to compare against",
+    )
+    args = parser.parse_args(argv)
+    logging.basicConfig(level=logging.WARNING, format="%(message)s")
+    log.setLevel(logging.INFO)
+
+    report = run_benchmarks(
+        iterations=args.iterations,
+        concurrency=args.concurrency,
+        latency_ms=args.sim_latency_ms,
+        clients=args.client or ("async", "sync"),
+        only=args.only,
+    )
+    output = Path(args.output)
+    output.write_bytes(orjson.dumps(report, option=orjson.OPT_INDENT_2))
+    log.info("Report written to %s", output)
+    if args.compare:
+        baseline = orjson.loads(Path(args.compare).read_bytes())
+        log.info(compare(baseline, report))
+    return 0
@@ -5,15 +5,20 @@ with Windows Python + MetaTrader5 module.
 
 STANDALONE: This file has NO dependencies on other mt5linux modules.
 Copy only this file + grpcio + protobuf + generated pb2 files to Wine.
+The one exception is --simulate, which lazily imports mt5linux.simulator to
+serve a simulated terminal on plain Linux (load tests, CI).
 
 Features:
 - gRPC-based service (replaces RPyC)
 - Concurrent request handling via ThreadPoolExecutor
+- Persistent bounded MT5 call executor with timeout abandonment and metrics
+- Per-stage request timing (MT5 call, encode) returned as trailing metadata
 - Signal handling (SIGTERM/SIGINT) for clean container stops
 - Data materialization (_asdict() for NamedTuples)
 - Chunked symbols_get for large datasets (9000+)
+- Server-streaming tick subscription (SubscribeTicks, changed ticks only)
 - Debug logging for every function call
-- NO STUBS - fails if MT5 unavailable
+- NO STUBS - fails if MT5 unavailable (unless --simulate is given)
 - Complete MT5 API coverage including Market Depth (DOM)
 - MT5 constants exposed for client usage
 - Secure: no raw module exposure, controlled API surface
@@ -23,14 +28,18 @@ Features:
 Usage:
     wine python.exe -m mt5linux.bridge --host 0.0.0.0 --port 50051
     wine python.exe bridge.py --host 0.0.0.0 --port 50051 --debug
+    python -m mt5linux.bridge --simulate --sim-latency-ms 2  # plain Linux
 """
 
 # pylint: disable=no-member  # Protobuf generated code has dynamic members
 from __future__ import annotations
 
 import argparse
+import bisect
+import functools
 import inspect
 import logging
+import math
 import operator
 import os
 import re
@@ -40,21 +49,26 @@ import sys
 import threading
 import time
 from concurrent import futures
+from contextvars import ContextVar, copy_context
 from pathlib import Path
 from typing import TYPE_CHECKING, cast
 
 import grpc
-import MetaTrader5  # pyright: ignore[reportMissingImports]
+import numpy as np
 import orjson
 
 from . import mt5_pb2, mt5_pb2_grpc
 
+try:
+    import MetaTrader5  # pyright: ignore[reportMissingImports]
+except ImportError:  # Plain Linux: only a simulated terminal can be served
+    MetaTrader5 = None  # type: ignore[assignment]
+
 if TYPE_CHECKING:
-    from collections.abc import Callable, Iterable
+    from collections.abc import Callable, Iterable, Iterator, Mapping
     from datetime import datetime
     from types import FrameType, ModuleType
 
-    import numpy as np
     from numpy.typing import NDArray
 
 # Module logger
@@ -66,40 +80,515 @@ _server: grpc.Server | None = None  # pylint: disable=invalid-name  # Module-pri
 # Global MT5 call timeout (configurable via --mt5-timeout)
 _mt5_call_timeout: float = 30.0  # pylint: disable=invalid-name  # Module-private global
 
+# Default server-side poll interval for SubscribeTicks (milliseconds)
+_TICK_POLL_INTERVAL_MS = 50
+
+# Default server-side snapshot interval for SubscribeBook (milliseconds)
+_BOOK_POLL_INTERVAL_MS = 50
+
+# Worker threads for timeout-protected MT5 calls (configurable via --mt5-workers)
+_MT5_CALL_WORKERS = 4
+
+# Share of gRPC server workers that Subscribe* streams may hold at once (each
+# stream keeps its worker for its whole life; the rest stay free for unary RPCs)
+_STREAM_WORKER_SHARE = 0.5
+
+# Read-only RPCs that may be pipelined through Batch
+_BATCH_METHODS = frozenset(
+    {
+        "Version",
+        "LastError",
+        "TerminalInfo",
+        "AccountInfo",
+        "SymbolsTotal",
+        "SymbolsGet",
+        "SymbolInfo",
+        "SymbolInfoTick",
+        "SymbolInfoTyped",
+        "SymbolInfoTickTyped",
+        "CopyRatesFrom",
+        "CopyRatesFromPos",
+        "CopyRatesRange",
+        "CopyTicksFrom",
+        "CopyTicksRange",
+        "OrderCalcMargin",
+        "OrderCalcProfit",
+        "OrderCheck",
+        "PositionsTotal",
+        "PositionsGet",
+        "OrdersTotal",
+        "OrdersGet",
+        "HistoryOrdersTotal",
+        "HistoryOrdersGet",
+        "HistoryDealsTotal",
+        "HistoryDealsGet",
+        "MarketBookGet",
+    }
+)
 
-def _call_mt5_with_timeout(
-    func: Callable[..., object],
-    *args: object,
-    **kwargs: object,
-) -> object:
-    """Execute MT5 call with timeout protection.
 
-    Wraps potentially blocking MT5 calls to prevent indefinite hangs.
-    Uses ThreadPoolExecutor for timeout capability on synchronous calls.
+# =============================================================================
+# Per-request stage timing (returned to clients as trailing metadata)
+# =============================================================================
 
-    Args:
-        func: MT5 function to call.
-        *args: Positional arguments for the function.
-        **kwargs: Keyword arguments for the function.
+# Trailing metadata key carrying "stage=ms,..." timings of one request
+_STAGES_TRAILER = "mt5-stages"
+
+# Stage histogram upper bounds in milliseconds (cumulative, +Inf implied)
+_STAGE_BUCKETS_MS: tuple[float, ...] = (
+    0.1,
+    0.25,
+    0.5,
+    1.0,
+    2.5,
+    5.0,
+    10.0,
+    25.0,
+    50.0,
+    100.0,
+    250.0,
+    1000.0,
+    5000.0,
+    30000.0,
+)
+
+
+class _StageTimes:
+    """Stage durations of one bridge request, in seconds.
+
+    Stages: handler (whole RPC handler), mt5_queue (wait for an MT5 call
+    worker), mt5_call (terminal calls) and encode (JSON/numpy/protobuf
+    conversion of MT5 results). Repeated stages accumulate.
+    """
+
+    __slots__ = ("encoding", "seconds")
+
+    def __init__(self) -> None:
+        self.seconds: dict[str, float] = {}
+        self.encoding = False
+
+    def add(self, stage: str, seconds: float) -> None:
+        self.seconds[stage] = self.seconds.get(stage, 0.0) + seconds
+
+    def trailer(self) -> str:
+        return ",".join(f"{k}={v * 1000.0:.3f}" for k, v in self.seconds.items())
+
+
+# Timings of the request being handled (None outside _StageTimingInterceptor)
+_request_stages: ContextVar[_StageTimes | None] = ContextVar(
+    "mt5_request_stages", default=None
+)
 
-    Returns:
-        Result of the MT5 function call.
 
-    Raises:
-        TimeoutError: If the call exceeds the timeout.
-        Exception: Re-raised from the MT5 function.
+def _timed_mt5_call[**P, R](func: Callable[P, R]) -> Callable[P, R]:
+    """Wrap an MT5 function to record its duration as the mt5_call stage."""
 
+    @functools.wraps(func)
+    def wrapper(*args: P.args, **kwargs: P.kwargs) -> R:
+        stages = _request_stages.get()
+        if stages is None:
+            return func(*args, **kwargs)
+        start = time.perf_counter()
+        try:
+            return func(*args, **kwargs)
+        finally:
+            stages.add("mt5_call", time.perf_counter() - start)
+
+    return wrapper
+
+
+def _timed_encode[**P, R](func: Callable[P, R]) -> Callable[P, R]:
+    """Wrap a serializer to record its duration as the encode stage.
+
+    Nested serializers (per-row JSON inside a list encoder) count once.
     """
-    with futures.ThreadPoolExecutor(max_workers=1) as executor:
-        future: futures.Future[object] = executor.submit(func, *args, **kwargs)
+
+    @functools.wraps(func)
+    def wrapper(*args: P.args, **kwargs: P.kwargs) -> R:
+        stages = _request_stages.get()
+        if stages is None or stages.encoding:
+            return func(*args, **kwargs)
+        stages.encoding = True
+        start = time.perf_counter()
         try:
-            return future.result(timeout=_mt5_call_timeout)
+            return func(*args, **kwargs)
+        finally:
+            stages.encoding = False
+            stages.add("encode", time.perf_counter() - start)
+
+    return wrapper
+
+
+class _StageTimedModule:
+    """MT5 module proxy timing every function call as the mt5_call stage.
+
+    Constants and record classes pass through untouched, so dir()/getattr()
+    introspection (GetConstants, GetMethods, GetModels) sees the module as
+    is. Outside a timed request the wrappers call straight through.
+    """
+
+    def __init__(self, module: ModuleType) -> None:
+        self._module = module
+        self._wrapped: dict[str, Callable[..., object]] = {}
+
+    def __getattr__(self, name: str) -> object:
+        attr = getattr(self._module, name)
+        if not inspect.isroutine(attr):
+            return attr
+        wrapped = self._wrapped.get(name)
+        # Bound methods are recreated per access but compare equal
+        if wrapped is None or getattr(wrapped, "__wrapped__", None) != attr:
+            wrapped = _timed_mt5_call(cast("Callable[..., object]", attr))
+            self._wrapped[name] = wrapped
+        return wrapped
+
+    def __dir__(self) -> list[str]:
+        return dir(self._module)
+
+
+class _StageMetrics:
+    """Per-RPC stage latency histograms of the bridge.
+
+    Thread-safe: histograms are guarded by a single lock.
+    """
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._counts: dict[tuple[str, str], list[int]] = {}
+        self._sums_ms: dict[tuple[str, str], float] = {}
+
+    def observe(self, method: str, seconds: Mapping[str, float]) -> None:
+        """Record the stage timings of one request to method."""
+        with self._lock:
+            for stage, value in seconds.items():
+                key = (method, stage)
+                counts = self._counts.get(key)
+                if counts is None:
+                    counts = self._counts[key] = [0] * (len(_STAGE_BUCKETS_MS) + 1)
+                elapsed_ms = value * 1000.0
+                counts[bisect.bisect_left(_STAGE_BUCKETS_MS, elapsed_ms)] += 1
+                self._sums_ms[key] = self._sums_ms.get(key, 0.0) + elapsed_ms
+
+    def snapshot(self) -> dict[str, JSONValue]:
+        """Return stage histograms keyed by RPC method, then stage.
+
+        Returns:
+            JSON-serializable dict; histogram buckets are cumulative and keyed
+            by their upper bound in milliseconds.
+
+        """
+        with self._lock:
+            methods: dict[str, dict[str, JSONValue]] = {}
+            for (method, stage), counts in sorted(self._counts.items()):
+                buckets: dict[str, JSONValue] = {}
+                cumulative = 0
+                for bound, count in zip(_STAGE_BUCKETS_MS, counts, strict=False):
+                    cumulative += count
+                    buckets[f"{bound:g}"] = cumulative
+                buckets["+Inf"] = cumulative + counts[-1]
+                methods.setdefault(method, {})[stage] = {
+                    "count": cumulative + counts[-1],
+                    "sum": self._sums_ms[method, stage],
+                    "buckets": buckets,
+                }
+            return cast("dict[str, JSONValue]", methods)
+
+
+# grpc-stubs make these generic; the runtime classes are not subscriptable
+if TYPE_CHECKING:
+    _ServerInterceptor = grpc.ServerInterceptor[object, object]
+    _MethodHandler = grpc.RpcMethodHandler[object, object]
+else:
+    _ServerInterceptor = grpc.ServerInterceptor
+
+
+class _StageTimingInterceptor(_ServerInterceptor):
+    """Time unary RPCs and return their stages in the mt5-stages trailer.
+
+    Each unary-unary handler runs with a fresh _StageTimes in context; its
+    total time is recorded as the handler stage next to the stages recorded
+    inside it, folded into the servicer's _StageMetrics and sent to the
+    client as trailing metadata ("handler=1.204,mt5_call=0.913,..." in ms).
+    Streaming RPCs pass through untimed.
+    """
+
+    def __init__(self, metrics: _StageMetrics) -> None:
+        self._metrics = metrics
+        self._handlers: dict[str, _MethodHandler] = {}
+
+    def intercept_service(
+        self,
+        continuation: Callable[[grpc.HandlerCallDetails], _MethodHandler | None],
+        handler_call_details: grpc.HandlerCallDetails,
+    ) -> _MethodHandler | None:
+        """Return the timed handler for unary RPCs, others unchanged."""
+        method = handler_call_details.method
+        timed = self._handlers.get(method)
+        if timed is not None:
+            return timed
+        handler = continuation(handler_call_details)
+        if handler is None or handler.unary_unary is None:
+            return handler
+        timed = grpc.unary_unary_rpc_method_handler(
+            self._timed(method.rsplit("/", 1)[-1], handler.unary_unary),
+            request_deserializer=handler.request_deserializer,
+            response_serializer=handler.response_serializer,
+        )
+        self._handlers[method] = timed
+        return timed
+
+    def _timed(
+        self,
+        method: str,
+        behavior: Callable[[object, grpc.ServicerContext], object],
+    ) -> Callable[[object, grpc.ServicerContext], object]:
+        metrics = self._metrics
+
+        def handle(request: object, context: grpc.ServicerContext) -> object:
+            stages = _StageTimes()
+            token = _request_stages.set(stages)
+            start = time.perf_counter()
+            try:
+                response = behavior(request, context)
+            finally:
+                stages.add("handler", time.perf_counter() - start)
+                _request_stages.reset(token)
+                metrics.observe(method, stages.seconds)
+            context.set_trailing_metadata(((_STAGES_TRAILER, stages.trailer()),))
+            return response
+
+        return handle
+
+
+class _MT5CallExecutor:
+    """Persistent, bounded executor for blocking MT5 terminal calls.
+
+    Owned by MT5GRPCServicer for its whole lifetime, so market-data RPCs do not
+    pay thread creation per call. A call that exceeds the timeout is abandoned:
+    if it never started it is cancelled, otherwise its worker is counted as
+    hung and the gRPC worker returns immediately instead of waiting for it.
+    When every worker is hung, new calls are rejected instead of queued.
+
+    Thread-safe: counters are guarded by a single lock.
+    """
+
+    # Latency histogram upper bounds in milliseconds (cumulative, +Inf implied)
+    _LATENCY_BUCKETS_MS: tuple[float, ...] = (
+        1.0,
+        5.0,
+        10.0,
+        25.0,
+        50.0,
+        100.0,
+        250.0,
+        500.0,
+        1000.0,
+        5000.0,
+        30000.0,
+    )
+
+    def __init__(self, max_workers: int, timeout: float) -> None:
+        """Create the executor.
+
+        Args:
+            max_workers: Worker threads available for MT5 calls.
+            timeout: Seconds to wait for a call before abandoning it.
+
+        """
+        self._max_workers = max_workers
+        self._timeout = timeout
+        self._pool = futures.ThreadPoolExecutor(
+            max_workers=max_workers,
+            thread_name_prefix="mt5-call",
+        )
+        self._lock = threading.Lock()
+        self._queued = 0
+        self._running = 0
+        self._hung = 0
+        self._completed = 0
+        self._errors = 0
+        self._timeouts = 0
+        self._rejected = 0
+        self._latency_sum_ms = 0.0
+        self._latency_max_ms = 0.0
+        self._latency_counts = [0] * (len(self._LATENCY_BUCKETS_MS) + 1)
+
+    @property
+    def max_workers(self) -> int:
+        """Worker threads available for MT5 calls."""
+        return self._max_workers
+
+    @property
+    def timeout(self) -> float:
+        """Seconds a call may run before it is abandoned."""
+        return self._timeout
+
+    def submit(
+        self,
+        func: Callable[..., object],
+        *args: object,
+        **kwargs: object,
+    ) -> futures.Future[object]:
+        """Queue an MT5 call without waiting for it.
+
+        The caller owns the timeout: pass futures that are not done in time to
+        abandon() so hung workers are accounted for.
+
+        Args:
+            func: MT5 function to call.
+            *args: Positional arguments for the function.
+            **kwargs: Keyword arguments for the function.
+
+        Returns:
+            Future resolving to the MT5 function result.
+
+        Raises:
+            TimeoutError: If all workers are hung.
+
+        """
+        func_name = getattr(func, "__name__", str(func))
+        with self._lock:
+            if self._hung >= self._max_workers:
+                self._rejected += 1
+                msg = (
+                    f"MT5 call {func_name} rejected: "
+                    f"all {self._max_workers} MT5 workers are hung"
+                )
+                log.error(msg)
+                raise TimeoutError(msg)
+            self._queued += 1
+        # Run in a copy of the caller's context so the worker's MT5 call and
+        # queue wait land in the request's stage timings
+        return self._pool.submit(
+            copy_context().run, self._run, func, args, kwargs, time.perf_counter()
+        )
+
+    def call(
+        self,
+        func: Callable[..., object],
+        *args: object,
+        **kwargs: object,
+    ) -> object:
+        """Execute MT5 call with timeout protection.
+
+        Args:
+            func: MT5 function to call.
+            *args: Positional arguments for the function.
+            **kwargs: Keyword arguments for the function.
+
+        Returns:
+            Result of the MT5 function call.
+
+        Raises:
+            TimeoutError: If the call exceeds the timeout or all workers are hung.
+            Exception: Re-raised from the MT5 function.
+
+        """
+        future = self.submit(func, *args, **kwargs)
+        try:
+            return future.result(timeout=self._timeout)
         except futures.TimeoutError:
+            self.abandon(future)
             func_name = getattr(func, "__name__", str(func))
-            msg = f"MT5 call {func_name} timed out after {_mt5_call_timeout}s"
+            msg = f"MT5 call {func_name} timed out after {self._timeout}s"
             log.error(msg)
             raise TimeoutError(msg) from None
 
+    def _run(
+        self,
+        func: Callable[..., object],
+        args: tuple[object, ...],
+        kwargs: dict[str, object],
+        submitted: float,
+    ) -> object:
+        with self._lock:
+            self._queued -= 1
+            self._running += 1
+        start = time.perf_counter()
+        stages = _request_stages.get()
+        if stages is not None:
+            stages.add("mt5_queue", start - submitted)
+        failed = True
+        try:
+            result = func(*args, **kwargs)
+            failed = False
+            return result
+        finally:
+            self._observe((time.perf_counter() - start) * 1000.0, failed=failed)
+
+    def _observe(self, elapsed_ms: float, *, failed: bool) -> None:
+        with self._lock:
+            self._running -= 1
+            if failed:
+                self._errors += 1
+            else:
+                self._completed += 1
+            self._latency_sum_ms += elapsed_ms
+            self._latency_max_ms = max(self._latency_max_ms, elapsed_ms)
+            for i, bound in enumerate(self._LATENCY_BUCKETS_MS):
+                if elapsed_ms <= bound:
+                    self._latency_counts[i] += 1
+                    break
+            else:
+                self._latency_counts[-1] += 1
+
+    def abandon(self, future: futures.Future[object]) -> None:
+        """Give up on a submitted call (cancel it, or count its worker as hung)."""
+        with self._lock:
+            self._timeouts += 1
+        if future.cancel():
+            # Never started: drop it from the queue, no worker is lost
+            with self._lock:
+                self._queued -= 1
+            return
+        with self._lock:
+            self._hung += 1
+        future.add_done_callback(self._release_hung)
+
+    def _release_hung(self, _future: futures.Future[object]) -> None:
+        with self._lock:
+            self._hung -= 1
+        log.warning("MT5 call abandoned after timeout has finished")
+
+    def snapshot(self) -> dict[str, JSONValue]:
+        """Return queue depth, call counters and latency histogram.
+
+        Returns:
+            JSON-serializable dict; histogram buckets are cumulative and keyed
+            by their upper bound in milliseconds.
+
+        """
+        with self._lock:
+            buckets: dict[str, JSONValue] = {}
+            cumulative = 0
+            for bound, count in zip(
+                self._LATENCY_BUCKETS_MS, self._latency_counts, strict=False
+            ):
+                cumulative += count
+                buckets[f"{bound:g}"] = cumulative
+            buckets["+Inf"] = cumulative + self._latency_counts[-1]
+            return {
+                "max_workers": self._max_workers,
+                "timeout": self._timeout,
+                "queued": self._queued,
+                "running": self._running,
+                "hung": self._hung,
+                "completed": self._completed,
+                "errors": self._errors,
+                "timeouts": self._timeouts,
+                "rejected": self._rejected,
+                "latency_ms": {
+                    "count": self._completed + self._errors,
+                    "sum": self._latency_sum_ms,
+                    "max": self._latency_max_ms,
+                    "buckets": buckets,
+                },
+            }
+
+    def shutdown(self) -> None:
+        """Stop accepting calls; does not wait for hung MT5 calls."""
+        self._pool.shutdown(wait=False, cancel_futures=True)
+
 
 # =============================================================================
 # JSON Value Types (standalone - no external dependencies)
@@ -110,6 +599,7 @@ type JSONPrimitive = str | int | float | bool | None
 type JSONValue = JSONPrimitive | list[JSONValue] | dict[str, JSONValue]
 
 
+@_timed_encode
 def _json_serialize(data: dict[str, JSONValue]) -> str:
     """Serialize dict to JSON string using orjson for high performance.
 
@@ -126,6 +616,11 @@ def _json_serialize(data: dict[str, JSONValue]) -> str:
     return orjson.dumps(data, default=str).decode()
 
 
+def _row_attr(row: object, names: tuple[str, ...]) -> object:
+    """Get the first attribute of an MT5 record that exists (None if none)."""
+    return next((getattr(row, name) for name in names if hasattr(row, name)), None)
+
+
 def _json_deserialize(json_str: str) -> dict[str, JSONValue]:
     """Deserialize JSON string to dict using orjson for high performance.
 
@@ -162,16 +657,40 @@ class MT5GRPCServicer(mt5_pb2_grpc.MT5ServiceServicer):
     """
 
     _mt5_module: ModuleType = MetaTrader5
-    _mt5_lock: threading.RLock = threading.RLock()
     # Only one demo-creation wizard may run at a time (it drives the shared GUI);
     # a non-blocking acquire lets CreateDemoAccount REJECT concurrent calls instead
     # of queueing 300s subprocesses (DoS amplification).
     _wizard_lock: threading.Lock = threading.Lock()
 
-    def __init__(self) -> None:
-        """Initialize the MT5 gRPC servicer and connect to MT5 terminal."""
+    def __init__(
+        self,
+        mt5_workers: int = _MT5_CALL_WORKERS,
+        mt5_module: ModuleType | None = None,
+        server_workers: int = 10,
+    ) -> None:
+        """Initialize the MT5 gRPC servicer and connect to MT5 terminal.
+
+        Args:
+            mt5_workers: Worker threads for timeout-protected MT5 calls.
+            mt5_module: Module-like object to serve instead of MetaTrader5
+                (e.g. mt5linux.simulator.MT5Simulator).
+            server_workers: Worker threads of the gRPC server; Subscribe*
+                streams may hold at most _STREAM_WORKER_SHARE of them.
+
+        """
         super().__init__()
         log.info("MT5GRPCServicer initializing...")
+        if mt5_module is not None:
+            self._mt5_module = mt5_module
+        if self._mt5_module is not None:
+            self._mt5_module = cast("ModuleType", _StageTimedModule(self._mt5_module))
+        self._stage_metrics = _StageMetrics()
+        self._mt5_executor = _MT5CallExecutor(
+            max_workers=mt5_workers,
+            timeout=_mt5_call_timeout,
+        )
+        self._max_streams = max(int(server_workers * _STREAM_WORKER_SHARE), 1)
+        self._stream_slots = threading.BoundedSemaphore(self._max_streams)
 
         # Auto-initialize connection to MT5 terminal
         if self._mt5_module is not None:
@@ -186,6 +705,23 @@ class MT5GRPCServicer(mt5_pb2_grpc.MT5ServiceServicer):
 
         log.info("MT5GRPCServicer initialized")
 
+    def close(self) -> None:
+        """Release the MT5 call executor (does not wait for hung calls)."""
+        self._mt5_executor.shutdown()
+
+    def stage_interceptor(self) -> _ServerInterceptor:
+        """Server interceptor timing this servicer's RPC stages.
+
+        Install it on the server serving this servicer (serve() does) to get
+        per-stage histograms in GetBridgeMetrics and the mt5-stages trailer
+        on every unary response.
+
+        Returns:
+            Interceptor for grpc.server(interceptors=[...]).
+
+        """
+        return _StageTimingInterceptor(self._stage_metrics)
+
     # =========================================================================
     # HELPER FUNCTIONS (PRIVATE)
     # =========================================================================
@@ -201,6 +737,47 @@ class MT5GRPCServicer(mt5_pb2_grpc.MT5ServiceServicer):
             msg = "MT5 module not loaded - initialize first"
             raise RuntimeError(msg)
 
+    def _claim_stream(self, context: grpc.ServicerContext, method: str) -> None:
+        """Take a stream slot, or reject the stream with RESOURCE_EXHAUSTED.
+
+        Release the slot with self._stream_slots.release() when the stream ends.
+
+        Args:
+            context: gRPC servicer context of the stream.
+            method: RPC name for the rejection message.
+
+        """
+        if not self._stream_slots.acquire(blocking=False):
+            log.warning("%s: rejected, %d streams open", method, self._max_streams)
+            context.abort(
+                grpc.StatusCode.RESOURCE_EXHAUSTED,
+                f"{method}: all {self._max_streams} stream slots are in use",
+            )
+
+    def _stream_call(
+        self,
+        context: grpc.ServicerContext,
+        func: Callable[..., object],
+        *args: object,
+    ) -> object:
+        """Run a stream's MT5 call on the executor, ending the stream on timeout.
+
+        Args:
+            context: gRPC servicer context of the stream.
+            func: MT5 function to call.
+            *args: Positional arguments for the function.
+
+        Returns:
+            Result of the MT5 function call.
+
+        """
+        try:
+            return self._mt5_executor.call(func, *args)
+        except TimeoutError as e:
+            context.abort(grpc.StatusCode.DEADLINE_EXCEEDED, str(e))
+            raise  # unreachable: abort raises
+
+    @_timed_encode
     def _namedtuple_to_dict(
         self,
         obj: object,
@@ -226,6 +803,26 @@ class MT5GRPCServicer(mt5_pb2_grpc.MT5ServiceServicer):
                     data[field] = nested._asdict()
         return data
 
+    @_timed_encode
+    def _typed_message[M](self, message_cls: type[M], obj: object) -> M:
+        """Build a typed protobuf message from an MT5 namedtuple.
+
+        Fields are copied by name; namedtuple fields the message does not
+        declare (newer terminal builds) are skipped.
+
+        Args:
+            message_cls: Generated message class (e.g. mt5_pb2.Tick).
+            obj: Object with _asdict() method (namedtuple-like).
+
+        Returns:
+            Message instance.
+
+        """
+        fields = message_cls.DESCRIPTOR.fields_by_name
+        data = self._namedtuple_to_dict(obj)
+        return message_cls(**{k: v for k, v in data.items() if k in fields})
+
+    @_timed_encode
     def _numpy_to_proto(
         self,
         arr: NDArray[np.void] | None,
@@ -247,6 +844,178 @@ class MT5GRPCServicer(mt5_pb2_grpc.MT5ServiceServicer):
             shape=list(arr.shape),
         )
 
+    @_timed_encode
+    def _records_to_array(
+        self,
+        records: Iterable[object] | None,
+        fields: tuple[str, ...] | None = None,
+    ) -> NDArray[np.void] | None:
+        """Convert namedtuple records to a columnar numpy structured array.
+
+        Field dtypes are inferred from the first record: str -> fixed-width
+        unicode sized to the longest value, float -> <f8, everything else
+        (int/bool/enum) -> <i8. Avoids per-row JSON on both ends.
+
+        Args:
+            records: Sequence of namedtuples (positions, orders, deals) or None.
+            fields: Projection from _project_fields (None = all fields).
+
+        Returns:
+            Structured array with one field per (projected) namedtuple field,
+            or None.
+
+        """
+        rows = cast(
+            "list[tuple[object, ...]]",
+            list(records) if records is not None else [],
+        )
+        names: tuple[str, ...] | None = (
+            getattr(rows[0], "_fields", None) if rows else None
+        )
+        if not names:
+            return None
+        columns = [
+            (index, name)
+            for index, name in enumerate(names)
+            if fields is None or name in fields
+        ]
+        first = rows[0]
+        dtype: list[tuple[str, str]] = []
+        for index, name in columns:
+            value = first[index]
+            if isinstance(value, str):
+                width = max(len(cast("str", row[index])) for row in rows) or 1
+                dtype.append((name, f"<U{width}"))
+            elif isinstance(value, float):
+                dtype.append((name, "<f8"))
+            else:
+                dtype.append((name, "<i8"))
+        if fields is None:
+            return np.array([tuple(row) for row in rows], dtype=dtype)
+        getter = operator.itemgetter(*(index for index, _ in columns))
+        picked = [getter(row) for row in rows]
+        if len(columns) == 1:
+            picked = [(value,) for value in picked]
+        return np.array(picked, dtype=dtype)
+
+    def _project_fields(self, requested: Iterable[str]) -> tuple[str, ...] | None:
+        """Normalize a fields projection from a list request.
+
+        Args:
+            requested: Field names from request.fields (empty = all).
+
+        Returns:
+            Requested names plus ticket (always kept so rows stay
+            identifiable), or None for no projection.
+
+        """
+        names = tuple(requested)
+        if not names:
+            return None
+        return ("ticket", *(name for name in names if name != "ticket"))
+
+    def _filter_records(
+        self,
+        records: Iterable[object] | None,
+        where: mt5_pb2.RecordFilter,
+    ) -> list[object] | None:
+        """Apply RecordFilter predicates to positions, orders or deals.
+
+        Row time is ``time`` (positions, deals) or ``time_setup`` (orders);
+        position_id falls back to ``identifier`` for positions. Rows without
+        a filtered attribute (e.g. entry on orders) never match.
+
+        Args:
+            records: Namedtuples from MT5 or None.
+            where: Predicates; unset fields do not filter.
+
+        Returns:
+            Matching rows in MT5 order, or None if records is None.
+
+        """
+        if records is None:
+            return None
+        members = [
+            (names, frozenset(values))
+            for names, values in (
+                (("magic",), where.magic),
+                (("type",), where.type),
+                (("entry",), where.entry),
+                (("position_id", "identifier"), where.position_id),
+            )
+            if values
+        ]
+        windowed = where.HasField("_time_from") or where.HasField("_time_to")
+        low = where.time_from if where.HasField("_time_from") else -math.inf
+        high = where.time_to if where.HasField("_time_to") else math.inf
+        prefix = where.comment_prefix
+
+        def _matches(row: object) -> bool:
+            if any(_row_attr(row, names) not in allowed for names, allowed in members):
+                return False
+            if windowed:
+                when = _row_attr(row, ("time", "time_setup"))
+                if not isinstance(when, int) or not low <= when <= high:
+                    return False
+            return str(getattr(row, "comment", "")).startswith(prefix)
+
+        return [row for row in records if _matches(row)]
+
+    @_timed_encode
+    def _select_records(
+        self,
+        request: mt5_pb2.PositionsRequest
+        | mt5_pb2.OrdersRequest
+        | mt5_pb2.HistoryRequest,
+        records: Iterable[object] | None,
+        method: str,
+    ) -> mt5_pb2.DictList:
+        """Filter, project and serialize list results for a list request.
+
+        Filters and projection run before serialization, so dropped rows and
+        columns cost neither JSON/array encoding nor wire bytes.
+
+        Args:
+            request: List request with as_array, fields and where.
+            records: Namedtuples from MT5 or None.
+            method: RPC name for logging.
+
+        Returns:
+            DictList with json_items, or DictList.array when as_array is set.
+
+        """
+        rows = (
+            self._filter_records(records, request.where)
+            if request.HasField("where")
+            else records
+        )
+        fields = self._project_fields(request.fields)
+
+        if request.as_array:
+            array = self._records_to_array(rows, fields)
+            log.debug(
+                "%s: returned %s rows (array)",
+                method,
+                0 if array is None else len(array),
+            )
+            return mt5_pb2.DictList(array=self._numpy_to_proto(array))
+
+        if rows is None:
+            log.debug("%s: result=None", method)
+            return mt5_pb2.DictList(json_items=[])
+
+        if fields is None:
+            json_items = [_json_serialize(self._namedtuple_to_dict(r)) for r in rows]
+        else:
+            json_items = []
+            for row in rows:
+                data = self._namedtuple_to_dict(row)
+                json_items.append(
+                    _json_serialize({k: data[k] for k in fields if k in data})
+                )
+        log.debug("%s: returned %s rows", method, len(json_items))
+        return mt5_pb2.DictList(json_items=json_items)
+
     def _validate_symbol(self, symbol: str, func_name: str) -> bool:
         """Validate symbol is not empty.
 
@@ -856,6 +1625,33 @@ class MT5GRPCServicer(mt5_pb2_grpc.MT5ServiceServicer):
         log.debug("GetModels: returned %s models", len(models))
         return mt5_pb2.ModelsResponse(models=models, total=len(models))
 
+    def GetBridgeMetrics(
+        self,
+        request: mt5_pb2.Empty,
+        context: grpc.ServicerContext,
+    ) -> mt5_pb2.DictData:
+        """Get bridge runtime metrics.
+
+        Reports the MT5 call executor state: queue depth, running and hung
+        calls, timeout/rejection counters and a call latency histogram, plus
+        per-RPC stage histograms (handler, mt5_queue, mt5_call, encode) when
+        stage_interceptor() is installed. Does not touch the MT5 terminal.
+
+        Args:
+            request: Empty request.
+            context: gRPC servicer context.
+
+        Returns:
+            DictData with JSON-serialized metrics.
+
+        """
+        log.debug("GetBridgeMetrics: called")
+        data: dict[str, JSONValue] = {
+            "mt5_executor": self._mt5_executor.snapshot(),
+            "stages": self._stage_metrics.snapshot(),
+        }
+        return mt5_pb2.DictData(json_data=_json_serialize(data))
+
     # =========================================================================
     # ACCOUNT/TERMINAL INFO
     # =========================================================================
@@ -935,7 +1731,7 @@ class MT5GRPCServicer(mt5_pb2_grpc.MT5ServiceServicer):
                     data = cast("dict[str, object]", parsed)
         connected = False
         try:
-            terminal = _call_mt5_with_timeout(self._mt5_module.terminal_info)
+            terminal = self._mt5_executor.call(self._mt5_module.terminal_info)
             connected = bool(getattr(terminal, "connected", False))
         except (TimeoutError, OSError, RuntimeError) as exc:
             log.debug("GetProvisionedAccount: live connected check failed: %s", exc)
@@ -1061,12 +1857,12 @@ class MT5GRPCServicer(mt5_pb2_grpc.MT5ServiceServicer):
         log.debug("SymbolsGet: group=%s", group)
 
         if group:
-            result = _call_mt5_with_timeout(
+            result = self._mt5_executor.call(
                 self._mt5_module.symbols_get,
                 group=group,
             )
         else:
-            result = _call_mt5_with_timeout(
+            result = self._mt5_executor.call(
                 self._mt5_module.symbols_get,
             )
 
@@ -1145,6 +1941,59 @@ class MT5GRPCServicer(mt5_pb2_grpc.MT5ServiceServicer):
         )
         return mt5_pb2.DictData(json_data=_json_serialize(data))
 
+    def SymbolInfoTyped(
+        self,
+        request: mt5_pb2.SymbolRequest,
+        context: grpc.ServicerContext,
+    ) -> mt5_pb2.SymbolInfoResponse:
+        """Get detailed symbol information as a typed message.
+
+        Same data as SymbolInfo without the dict/JSON round-trip.
+
+        Args:
+            request: Symbol name to query.
+            context: gRPC servicer context.
+
+        Returns:
+            SymbolInfoResponse; info is unset if the symbol is unknown.
+
+        """
+        self._ensure_mt5_loaded()
+        log.debug("SymbolInfoTyped: symbol=%s", request.symbol)
+        if not self._validate_symbol(request.symbol, "SymbolInfoTyped"):
+            return mt5_pb2.SymbolInfoResponse()
+        result = self._mt5_module.symbol_info(request.symbol)
+        if result is None:
+            return mt5_pb2.SymbolInfoResponse()
+        return mt5_pb2.SymbolInfoResponse(
+            info=self._typed_message(mt5_pb2.SymbolInfo, result)
+        )
+
+    def SymbolInfoTickTyped(
+        self,
+        request: mt5_pb2.SymbolRequest,
+        context: grpc.ServicerContext,
+    ) -> mt5_pb2.TickResponse:
+        """Get current tick data for a symbol as a typed message.
+
+        Same data as SymbolInfoTick without the dict/JSON round-trip.
+
+        Args:
+            request: Symbol name to query.
+            context: gRPC servicer context.
+
+        Returns:
+            TickResponse; tick is unset if MT5 returned None.
+
+        """
+        self._ensure_mt5_loaded()
+        if not self._validate_symbol(request.symbol, "SymbolInfoTickTyped"):
+            return mt5_pb2.TickResponse()
+        result = self._mt5_module.symbol_info_tick(request.symbol)
+        if result is None:
+            return mt5_pb2.TickResponse()
+        return mt5_pb2.TickResponse(tick=self._typed_message(mt5_pb2.Tick, result))
+
     def SymbolSelect(
         self,
         request: mt5_pb2.SymbolSelectRequest,
@@ -1171,6 +2020,237 @@ class MT5GRPCServicer(mt5_pb2_grpc.MT5ServiceServicer):
         log.debug("SymbolSelect: result=%s", result)
         return mt5_pb2.BoolResponse(result=bool(result))
 
+    def SubscribeTicks(
+        self,
+        request: mt5_pb2.TickSubscribeRequest,
+        context: grpc.ServicerContext,
+    ) -> Iterator[mt5_pb2.TickUpdate]:
+        """Stream tick updates for a set of symbols.
+
+        Polls symbol_info_tick server-side and pushes a tick only when its
+        time_msc changed since the last push for that symbol. Runs until the
+        client cancels the stream; holds one server worker while active, so
+        streams beyond _STREAM_WORKER_SHARE of the server workers are rejected
+        with RESOURCE_EXHAUSTED. Polls run on the MT5 executor; one that times
+        out ends the stream with DEADLINE_EXCEEDED.
+
+        Args:
+            request: Symbols to follow and optional poll interval.
+            context: gRPC servicer context.
+
+        Yields:
+            TickUpdate with symbol and the tick, typed if request.typed,
+            otherwise JSON-serialized.
+
+        """
+        self._ensure_mt5_loaded()
+        symbols = [
+            symbol
+            for symbol in dict.fromkeys(request.symbols)
+            if self._validate_symbol(symbol, "SubscribeTicks")
+        ]
+        interval_ms = (
+            request.interval_ms
+            if request.HasField("interval_ms") and request.interval_ms > 0
+            else _TICK_POLL_INTERVAL_MS
+        )
+        log.debug(
+            "SubscribeTicks: symbols=%d interval=%dms",
+            len(symbols),
+            interval_ms,
+        )
+        if not symbols:
+            return
+
+        self._claim_stream(context, "SubscribeTicks")
+        try:
+            # Wake the poll loop as soon as the client cancels
+            stopped = threading.Event()
+            context.add_callback(stopped.set)
+
+            last_time_msc: dict[str, int] = {}
+            while context.is_active():
+                for symbol in symbols:
+                    tick = self._stream_call(
+                        context, self._mt5_module.symbol_info_tick, symbol
+                    )
+                    if tick is None:
+                        continue
+                    time_msc = getattr(tick, "time_msc", None)
+                    if time_msc is not None and last_time_msc.get(symbol) == time_msc:
+                        continue
+                    if time_msc is not None:
+                        last_time_msc[symbol] = time_msc
+                    if request.typed:
+                        yield mt5_pb2.TickUpdate(
+                            symbol=symbol,
+                            tick=self._typed_message(mt5_pb2.Tick, tick),
+                        )
+                        continue
+                    data = self._namedtuple_to_dict(tick)
+                    yield mt5_pb2.TickUpdate(
+                        symbol=symbol, json_data=_json_serialize(data)
+                    )
+                if stopped.wait(interval_ms / 1000):
+                    break
+        finally:
+            self._stream_slots.release()
+        log.debug("SubscribeTicks: stream closed")
+
+    def _book_levels(self, entries: Iterable[object]) -> dict[tuple[int, float], float]:
+        """Index market_book_get entries by (type, price).
+
+        Args:
+            entries: BookInfo namedtuples from MT5.
+
+        Returns:
+            volume_dbl per (type, price) level.
+
+        """
+        book: dict[tuple[int, float], float] = {}
+        for entry in entries:
+            volume = float(getattr(entry, "volume_dbl", 0.0)) or float(
+                getattr(entry, "volume", 0)
+            )
+            price = float(getattr(entry, "price", 0.0))
+            book[int(getattr(entry, "type", 0)), price] = volume
+        return book
+
+    def _book_delta(
+        self,
+        previous: dict[tuple[int, float], float],
+        current: dict[tuple[int, float], float],
+    ) -> list[mt5_pb2.BookLevel]:
+        """Levels that changed between two book snapshots.
+
+        Args:
+            previous: Last book sent to the client.
+            current: Book just read from MT5.
+
+        Returns:
+            New or changed levels, plus removed levels with volume 0.
+
+        """
+        levels = [
+            mt5_pb2.BookLevel(
+                type=key[0], price=key[1], volume=int(volume), volume_dbl=volume
+            )
+            for key, volume in current.items()
+            if previous.get(key) != volume
+        ]
+        levels.extend(
+            mt5_pb2.BookLevel(type=key[0], price=key[1])
+            for key in previous
+            if key not in current
+        )
+        return levels
+
+    def SubscribeBook(
+        self,
+        request: mt5_pb2.BookSubscribeRequest,
+        context: grpc.ServicerContext,
+    ) -> Iterator[mt5_pb2.BookUpdate]:
+        """Stream market depth as one snapshot followed by level deltas.
+
+        Subscribes each symbol with market_book_add, then reads
+        market_book_get every interval and pushes only levels whose volume
+        changed (removed levels with volume 0). Each symbol has its own
+        gap-free sequence starting at 1 with the snapshot. Runs until the
+        client cancels the stream; holds one server worker while active, so
+        streams beyond _STREAM_WORKER_SHARE of the server workers are rejected
+        with RESOURCE_EXHAUSTED. MT5 calls run on the MT5 executor; one that
+        times out ends the stream with DEADLINE_EXCEEDED.
+        Books stay subscribed afterwards (MarketBookRelease releases them).
+
+        Args:
+            request: Symbols to follow and optional snapshot interval.
+            context: gRPC servicer context.
+
+        Yields:
+            BookUpdate with symbol, sequence and the snapshot or delta levels.
+
+        """
+        self._ensure_mt5_loaded()
+        valid = [
+            symbol
+            for symbol in dict.fromkeys(request.symbols)
+            if self._validate_symbol(symbol, "SubscribeBook")
+        ]
+        if not valid:
+            return
+        interval_ms = (
+            request.interval_ms
+            if request.HasField("interval_ms") and request.interval_ms > 0
+            else _BOOK_POLL_INTERVAL_MS
+        )
+
+        self._claim_stream(context, "SubscribeBook")
+        try:
+            symbols = [
+                symbol
+                for symbol in valid
+                if self._stream_call(context, self._mt5_module.market_book_add, symbol)
+            ]
+            log.debug(
+                "SubscribeBook: symbols=%d interval=%dms",
+                len(symbols),
+                interval_ms,
+            )
+            if symbols:
+                yield from self._poll_books(context, symbols, interval_ms)
+        finally:
+            self._stream_slots.release()
+        log.debug("SubscribeBook: stream closed")
+
+    def _poll_books(
+        self,
+        context: grpc.ServicerContext,
+        symbols: list[str],
+        interval_ms: int,
+    ) -> Iterator[mt5_pb2.BookUpdate]:
+        """Poll subscribed books until the client cancels (SubscribeBook loop).
+
+        Args:
+            context: gRPC servicer context of the stream.
+            symbols: Symbols already added with market_book_add.
+            interval_ms: Snapshot interval.
+
+        Yields:
+            BookUpdate with the first snapshot, then deltas, per symbol.
+
+        """
+        # Wake the poll loop as soon as the client cancels
+        stopped = threading.Event()
+        context.add_callback(stopped.set)
+
+        books: dict[str, dict[tuple[int, float], float]] = {}
+        sequences: dict[str, int] = dict.fromkeys(symbols, 0)
+        while context.is_active():
+            for symbol in symbols:
+                entries = self._stream_call(
+                    context, self._mt5_module.market_book_get, symbol
+                )
+                if entries is None:
+                    continue
+                current = self._book_levels(cast("Iterable[object]", entries))
+                previous = books.get(symbol)
+                if previous is None:
+                    levels = self._book_delta({}, current)
+                else:
+                    levels = self._book_delta(previous, current)
+                    if not levels:
+                        continue
+                books[symbol] = current
+                sequences[symbol] += 1
+                yield mt5_pb2.BookUpdate(
+                    symbol=symbol,
+                    sequence=sequences[symbol],
+                    snapshot=previous is None,
+                    levels=levels,
+                )
+            if stopped.wait(interval_ms / 1000):
+                break
+
     # =========================================================================
     # MARKET DATA - RATES
     # =========================================================================
@@ -1201,7 +2281,7 @@ class MT5GRPCServicer(mt5_pb2_grpc.MT5ServiceServicer):
             return self._numpy_to_proto(None)
         if not self._validate_count(request.count, "CopyRatesFrom"):
             return self._numpy_to_proto(None)
-        result = _call_mt5_with_timeout(
+        result = self._mt5_executor.call(
             self._mt5_module.copy_rates_from,
             request.symbol,
             request.timeframe,
@@ -1241,7 +2321,7 @@ class MT5GRPCServicer(mt5_pb2_grpc.MT5ServiceServicer):
             return self._numpy_to_proto(None)
         if not self._validate_count(request.count, "CopyRatesFromPos"):
             return self._numpy_to_proto(None)
-        result = _call_mt5_with_timeout(
+        result = self._mt5_executor.call(
             self._mt5_module.copy_rates_from_pos,
             request.symbol,
             request.timeframe,
@@ -1285,7 +2365,7 @@ class MT5GRPCServicer(mt5_pb2_grpc.MT5ServiceServicer):
             "CopyRatesRange",
         ):
             return self._numpy_to_proto(None)
-        result = _call_mt5_with_timeout(
+        result = self._mt5_executor.call(
             self._mt5_module.copy_rates_range,
             request.symbol,
             request.timeframe,
@@ -1329,7 +2409,7 @@ class MT5GRPCServicer(mt5_pb2_grpc.MT5ServiceServicer):
             return self._numpy_to_proto(None)
         if not self._validate_count(request.count, "CopyTicksFrom"):
             return self._numpy_to_proto(None)
-        result = _call_mt5_with_timeout(
+        result = self._mt5_executor.call(
             self._mt5_module.copy_ticks_from,
             request.symbol,
             request.date_from,
@@ -1373,7 +2453,7 @@ class MT5GRPCServicer(mt5_pb2_grpc.MT5ServiceServicer):
             "CopyTicksRange",
         ):
             return self._numpy_to_proto(None)
-        result = _call_mt5_with_timeout(
+        result = self._mt5_executor.call(
             self._mt5_module.copy_ticks_range,
             request.symbol,
             request.date_from,
@@ -1523,6 +2603,95 @@ class MT5GRPCServicer(mt5_pb2_grpc.MT5ServiceServicer):
         )
         return mt5_pb2.DictData(json_data=_json_serialize(data))
 
+    def OrderSendBatch(
+        self,
+        request: mt5_pb2.OrderBatchRequest,
+        context: grpc.ServicerContext,
+    ) -> Iterator[mt5_pb2.OrderBatchResult]:
+        """Send several trading orders in parallel on the MT5 call executor.
+
+        Orders are submitted to the executor at once and each result is
+        streamed as soon as its order_send returns, tagged with the order's
+        index in the request. Every order is decoded before any is
+        submitted, so a malformed request aborts the batch with
+        INVALID_ARGUMENT before MT5 sees any order. An order that cannot be
+        dispatched, raises, or is still running when the batch deadline (the
+        per-call timeout for every wave of max_workers orders) expires is
+        reported with error set; the client must verify such orders before
+        resending them.
+
+        Args:
+            request: JSON-serialized order request dicts.
+            context: gRPC servicer context.
+
+        Yields:
+            OrderBatchResult per order, in completion order.
+
+        """
+        self._ensure_mt5_loaded()
+        executor = self._mt5_executor
+        log.debug("OrderSendBatch: orders=%d", len(request.orders))
+
+        orders: list[dict[str, JSONValue]] = []
+        for index, order in enumerate(request.orders):
+            try:
+                order_dict = _json_deserialize(order.json_request)
+            except orjson.JSONDecodeError as e:
+                context.abort(grpc.StatusCode.INVALID_ARGUMENT, f"order {index}: {e}")
+            if not isinstance(order_dict, dict):
+                context.abort(
+                    grpc.StatusCode.INVALID_ARGUMENT,
+                    f"order {index}: expected a JSON object",
+                )
+            orders.append(order_dict)
+
+        pending: dict[futures.Future[object], int] = {}
+        for index, order_dict in enumerate(orders):
+            try:
+                future = executor.submit(self._mt5_module.order_send, order_dict)
+            except TimeoutError as e:
+                yield mt5_pb2.OrderBatchResult(index=index, error=str(e))
+                continue
+            pending[future] = index
+
+        waves = -(-len(pending) // executor.max_workers)
+        try:
+            for future in futures.as_completed(
+                list(pending), timeout=executor.timeout * max(waves, 1)
+            ):
+                yield self._order_batch_result(pending.pop(future), future)
+        except futures.TimeoutError:
+            for future, index in pending.items():
+                executor.abandon(future)
+                yield mt5_pb2.OrderBatchResult(
+                    index=index,
+                    error=f"order_send timed out after {executor.timeout}s",
+                )
+            log.error("OrderSendBatch: %d orders timed out", len(pending))
+
+    def _order_batch_result(
+        self,
+        index: int,
+        future: futures.Future[object],
+    ) -> mt5_pb2.OrderBatchResult:
+        """Convert a finished order_send future into an OrderBatchResult."""
+        try:
+            result = future.result()
+        except Exception as e:  # noqa: BLE001 - reported per order
+            log.warning("OrderSendBatch[%d] exception: %s", index, e)
+            return mt5_pb2.OrderBatchResult(index=index, error=str(e))
+        if result is None:
+            return mt5_pb2.OrderBatchResult(index=index, json_data="")
+        data = self._namedtuple_to_dict(result, nested_fields=["request"])
+        log.info(
+            "OrderSendBatch[%d]: retcode=%s order=%s deal=%s",
+            index,
+            data.get("retcode"),
+            data.get("order"),
+            data.get("deal"),
+        )
+        return mt5_pb2.OrderBatchResult(index=index, json_data=_json_serialize(data))
+
     # =========================================================================
     # POSITION OPERATIONS
     # =========================================================================
@@ -1559,7 +2728,9 @@ class MT5GRPCServicer(mt5_pb2_grpc.MT5ServiceServicer):
             context: gRPC servicer context.
 
         Returns:
-            DictList with JSON-serialized position data.
+            DictList with JSON-serialized position data,
+            or DictList.array when request.as_array is set; request.where
+            and request.fields filter rows and project columns first.
 
         """
         self._ensure_mt5_loaded()
@@ -1582,13 +2753,7 @@ class MT5GRPCServicer(mt5_pb2_grpc.MT5ServiceServicer):
         else:
             result = self._mt5_module.positions_get()
 
-        if result is None:
-            log.debug("PositionsGet: result=None")
-            return mt5_pb2.DictList(json_items=[])
-
-        json_items = [_json_serialize(self._namedtuple_to_dict(p)) for p in result]
-        log.debug("PositionsGet: returned %s positions", len(json_items))
-        return mt5_pb2.DictList(json_items=json_items)
+        return self._select_records(request, result, "PositionsGet")
 
     # =========================================================================
     # ORDER OPERATIONS
@@ -1626,7 +2791,9 @@ class MT5GRPCServicer(mt5_pb2_grpc.MT5ServiceServicer):
             context: gRPC servicer context.
 
         Returns:
-            DictList with JSON-serialized order data.
+            DictList with JSON-serialized order data,
+            or DictList.array when request.as_array is set; request.where
+            and request.fields filter rows and project columns first.
 
         """
         self._ensure_mt5_loaded()
@@ -1649,13 +2816,7 @@ class MT5GRPCServicer(mt5_pb2_grpc.MT5ServiceServicer):
         else:
             result = self._mt5_module.orders_get()
 
-        if result is None:
-            log.debug("OrdersGet: result=None")
-            return mt5_pb2.DictList(json_items=[])
-
-        json_items = [_json_serialize(self._namedtuple_to_dict(o)) for o in result]
-        log.debug("OrdersGet: returned %s orders", len(json_items))
-        return mt5_pb2.DictList(json_items=json_items)
+        return self._select_records(request, result, "OrdersGet")
 
     # =========================================================================
     # HISTORY OPERATIONS
@@ -1704,7 +2865,9 @@ class MT5GRPCServicer(mt5_pb2_grpc.MT5ServiceServicer):
             context: gRPC servicer context.
 
         Returns:
-            DictList with JSON-serialized historical order data.
+            DictList with JSON-serialized historical order data,
+            or DictList.array when request.as_array is set; request.where
+            and request.fields filter rows and project columns first.
 
         """
         self._ensure_mt5_loaded()
@@ -1736,12 +2899,7 @@ class MT5GRPCServicer(mt5_pb2_grpc.MT5ServiceServicer):
         else:
             result = self._mt5_module.history_orders_get()
 
-        if result is None:
-            return mt5_pb2.DictList(json_items=[])
-
-        json_items = [_json_serialize(self._namedtuple_to_dict(o)) for o in result]
-        log.debug("HistoryOrdersGet: returned %s orders", len(json_items))
-        return mt5_pb2.DictList(json_items=json_items)
+        return self._select_records(request, result, "HistoryOrdersGet")
 
     def HistoryDealsTotal(
         self,
@@ -1786,7 +2944,9 @@ class MT5GRPCServicer(mt5_pb2_grpc.MT5ServiceServicer):
             context: gRPC servicer context.
 
         Returns:
-            DictList with JSON-serialized historical deal data.
+            DictList with JSON-serialized historical deal data,
+            or DictList.array when request.as_array is set; request.where
+            and request.fields filter rows and project columns first.
 
         """
         self._ensure_mt5_loaded()
@@ -1818,12 +2978,7 @@ class MT5GRPCServicer(mt5_pb2_grpc.MT5ServiceServicer):
         else:
             result = self._mt5_module.history_deals_get()
 
-        if result is None:
-            return mt5_pb2.DictList(json_items=[])
-
-        json_items = [_json_serialize(self._namedtuple_to_dict(d)) for d in result]
-        log.debug("HistoryDealsGet: returned %s deals", len(json_items))
-        return mt5_pb2.DictList(json_items=json_items)
+        return self._select_records(request, result, "HistoryDealsGet")
 
     # =========================================================================
     # MARKET DEPTH (DOM) OPERATIONS
@@ -1903,6 +3058,70 @@ class MT5GRPCServicer(mt5_pb2_grpc.MT5ServiceServicer):
         log.debug("MarketBookRelease: result=%s", result)
         return mt5_pb2.BoolResponse(result=bool(result))
 
+    # =========================================================================
+    # PIPELINED READS
+    # =========================================================================
+
+    def Batch(
+        self,
+        request: mt5_pb2.BatchRequest,
+        context: grpc.ServicerContext,
+    ) -> mt5_pb2.BatchResponse:
+        """Execute several read RPCs back-to-back in one round-trip.
+
+        Each call names an MT5Service read RPC (see _BATCH_METHODS) and carries
+        its serialized request; it runs through the same handler as the
+        standalone RPC. Calls run in order on one thread, back-to-back, but
+        not atomically: other RPCs and batches may reach the terminal between
+        them, so the results are close in time rather than a snapshot. The
+        whole batch gets one MT5 call timeout; calls not started by then are
+        reported as errors instead of run. A failing or disallowed call is
+        reported in its own result and does not abort the batch.
+
+        Args:
+            request: Ordered list of (method, serialized request) calls.
+            context: gRPC servicer context.
+
+        Returns:
+            BatchResponse with one result per call, in request order.
+
+        """
+        self._ensure_mt5_loaded()
+        log.debug("Batch: calls=%d", len(request.calls))
+        timeout = self._mt5_executor.timeout
+        deadline = time.monotonic() + timeout
+        results: list[mt5_pb2.BatchResult] = []
+        for call in request.calls:
+            if time.monotonic() > deadline:
+                results.append(
+                    mt5_pb2.BatchResult(
+                        error=f"{call.method} not run: batch exceeded {timeout}s"
+                    )
+                )
+                continue
+            results.append(self._batch_call(call, context))
+        return mt5_pb2.BatchResponse(results=results)
+
+    def _batch_call(
+        self,
+        call: mt5_pb2.BatchCall,
+        context: grpc.ServicerContext,
+    ) -> mt5_pb2.BatchResult:
+        """Run one Batch call through its RPC handler."""
+        if call.method not in _BATCH_METHODS:
+            return mt5_pb2.BatchResult(error=f"{call.method} is not batchable")
+        method = mt5_pb2.DESCRIPTOR.services_by_name["MT5Service"].methods_by_name[
+            call.method
+        ]
+        request_cls = getattr(mt5_pb2, method.input_type.name)
+        try:
+            sub_request = request_cls.FromString(call.request)
+            response = getattr(self, call.method)(sub_request, context)
+        except Exception as e:  # noqa: BLE001 - reported per call
+            log.warning("Batch %s exception: %s", call.method, e)
+            return mt5_pb2.BatchResult(error=f"{type(e).__name__}: {e}")
+        return mt5_pb2.BatchResult(response=response.SerializeToString())
+
 
 # =============================================================================
 # SERVER SETUP AND LIFECYCLE
@@ -1944,6 +3163,8 @@ def serve(
     host: str = "0.0.0.0",
     port: int = 50051,
     max_workers: int = 10,
+    mt5_workers: int = _MT5_CALL_WORKERS,
+    mt5_module: ModuleType | None = None,
 ) -> None:
     """Start the gRPC server.
 
@@ -1951,16 +3172,24 @@ def serve(
         host: Host address to bind to.
         port: Port number to listen on.
         max_workers: Maximum number of worker threads.
+        mt5_workers: Worker threads for timeout-protected MT5 calls.
+        mt5_module: Module-like object to serve instead of MetaTrader5.
 
     """
     global _server
 
-    _server = grpc.server(futures.ThreadPoolExecutor(max_workers=max_workers))
+    servicer = MT5GRPCServicer(
+        mt5_workers=mt5_workers, mt5_module=mt5_module, server_workers=max_workers
+    )
+    _server = grpc.server(
+        futures.ThreadPoolExecutor(max_workers=max_workers),
+        interceptors=[servicer.stage_interceptor()],
+    )
     register_servicer = cast(
         "Callable[[MT5GRPCServicer, grpc.Server], None]",
         mt5_pb2_grpc.add_MT5ServiceServicer_to_server,
     )
-    register_servicer(MT5GRPCServicer(), _server)
+    register_servicer(servicer, _server)
     server_address = f"{host}:{port}"
     _server.add_insecure_port(server_address)
 
@@ -1969,7 +3198,10 @@ def serve(
 
     _server.start()
     log.info("Server started, waiting for connections...")
-    _server.wait_for_termination()
+    try:
+        _server.wait_for_termination()
+    finally:
+        servicer.close()
 
 
 def main(argv: list[str] | None = None) -> int:
@@ -2013,6 +3245,35 @@ def main(argv: list[str] | None = None) -> int:
         default=30.0,
         help="MT5 call timeout in seconds (default: 30.0)",
     )
+    parser.add_argument(
+        "--mt5-workers",
+        type=int,
+        default=_MT5_CALL_WORKERS,
+        help=f"MT5 call worker threads (default: {_MT5_CALL_WORKERS})",
+    )
+    parser.add_argument(
+        "--simulate",
+        action="store_true",
+        help="Serve a simulated terminal instead of MetaTrader5 (load tests)",
+    )
+    parser.add_argument(
+        "--sim-seed",
+        type=int,
+        default=0,
+        help="Simulator price path seed (default: 0)",
+    )
+    parser.add_argument(
+        "--sim-latency-ms",
+        type=float,
+        default=0.0,
+        help="Simulated latency added to every MT5 call (default: 0.0)",
+    )
+    parser.add_argument(
+        "--sim-symbols",
+        type=int,
+        default=0,
+        help="Extra synthetic symbols served by the simulator (default: 0)",
+    )
     args = parser.parse_args(argv)
 
     # Update global MT5 call timeout
@@ -2025,10 +3286,33 @@ def main(argv: list[str] | None = None) -> int:
     signal.signal(signal.SIGINT, _graceful_shutdown)
 
     log.debug("Debug logging enabled")
-    log.debug("Workers=%s", args.workers)
+    log.debug("Workers=%s mt5_workers=%s", args.workers, args.mt5_workers)
+
+    mt5_module: ModuleType | None = None
+    if args.simulate:
+        from .simulator import MT5Simulator  # only with --simulate
+
+        mt5_module = cast(
+            "ModuleType",
+            MT5Simulator(
+                seed=args.sim_seed,
+                latency_ms=args.sim_latency_ms,
+                extra_symbols=args.sim_symbols,
+            ),
+        )
+        log.info("Serving simulated MT5 terminal (seed=%s)", args.sim_seed)
+    elif MetaTrader5 is None:
+        log.error("MetaTrader5 module not installed (use --simulate to test)")
+        return 1
 
     try:
-        serve(host=args.host, port=args.port, max_workers=args.workers)
+        serve(
+            host=args.host,
+            port=args.port,
+            max_workers=args.workers,
+            mt5_workers=args.mt5_workers,
+            mt5_module=mt5_module,
+        )
     except KeyboardInterrupt:
         log.info("Server interrupted by user")
     except Exception:
@@ -25,22 +25,27 @@ from __future__ import annotations
 
 import asyncio
 import logging
-from typing import TYPE_CHECKING, Any, Self
+from contextlib import contextmanager
+from typing import TYPE_CHECKING, Any, Literal, Self, overload
 
 from mt5linux import mt5_pb2
 from mt5linux.async_client import AsyncMetaTrader5
+from mt5linux.constants import MT5Constants as c
 from mt5linux.protocols import MT5Protocol
 from mt5linux.settings import MT5Settings
 
 if TYPE_CHECKING:
-    from collections.abc import Callable, Coroutine
-    from datetime import datetime
+    from collections.abc import Callable, Coroutine, Iterator, Sequence
+    from datetime import datetime, timedelta
     from types import TracebackType
 
     import numpy as np
     from numpy.typing import NDArray
 
+    from mt5linux.async_client import AsyncMT5Batch
     from mt5linux.models import MT5Models
+    from mt5linux.types import MT5Types as t
+    from mt5linux.utilities import MT5Utilities as u
 
 log = logging.getLogger(__name__)
 
@@ -70,6 +75,8 @@ class MetaTrader5(MT5Protocol):
         host: str = _settings.host,
         port: int = _settings.grpc_port,
         timeout: int = _settings.timeout_connection,
+        *,
+        config: MT5Settings | None = None,
     ) -> None:
         """Initialize sync MT5 client.
 
@@ -77,9 +84,13 @@ class MetaTrader5(MT5Protocol):
             host: gRPC server address.
             port: gRPC server port.
             timeout: Timeout in seconds for MT5 operations.
+            config: Settings passed to the async client (default:
+                MT5Settings() from the environment).
 
         """
-        self._async_client = AsyncMetaTrader5(host=host, port=port, timeout=timeout)
+        self._async_client = AsyncMetaTrader5(
+            host=host, port=port, timeout=timeout, config=config
+        )
         self._loop: asyncio.AbstractEventLoop | None = None
 
     def _get_loop(self) -> asyncio.AbstractEventLoop:
@@ -106,6 +117,15 @@ class MetaTrader5(MT5Protocol):
         """Check if client is connected to gRPC server."""
         return self._async_client.is_connected
 
+    @property
+    def metrics(self) -> u.Metrics.Recorder:
+        """Recorder of per-stage request timings (see AsyncMetaTrader5.metrics)."""
+        return self._async_client.metrics
+
+    @metrics.setter
+    def metrics(self, recorder: u.Metrics.Recorder) -> None:
+        self._async_client.metrics = recorder
+
     def __getattr__(self, name: str) -> int:
         """Get MT5 constants (TIMEFRAME_H1, ORDER_TYPE_BUY, etc).
 
@@ -328,6 +348,15 @@ class MetaTrader5(MT5Protocol):
         """
         return self._run(self._async_client.health_check())
 
+    def bridge_metrics(self) -> dict[str, object]:
+        """Get bridge runtime metrics (mt5linux extension).
+
+        Returns:
+            Dict with the bridge MT5 call executor state.
+
+        """
+        return self._run(self._async_client.bridge_metrics())
+
     def version(self) -> tuple[int, int, str] | None:
         """Get MT5 terminal version.
 
@@ -431,6 +460,29 @@ class MetaTrader5(MT5Protocol):
         """
         return self._run(self._async_client.symbol_info(symbol))
 
+    def invalidate_symbol(self, symbol: str | None = None) -> None:
+        """Drop cached symbol metadata (mt5linux extension).
+
+        Args:
+            symbol: Symbol to drop; None clears the whole symbol cache.
+
+        """
+        self._async_client.invalidate_symbol(symbol)
+
+    def refresh_symbols(
+        self, group: str | None = None
+    ) -> tuple[MT5Models.SymbolInfo, ...] | None:
+        """Reload symbols from the terminal, bypassing the cache (mt5linux extension).
+
+        Args:
+            group: Optional group filter pattern.
+
+        Returns:
+            Tuple of SymbolInfo objects or None.
+
+        """
+        return self._run(self._async_client.refresh_symbols(group))
+
     def symbol_info_tick(self, symbol: str) -> MT5Models.Tick | None:
         """Get current tick data for a symbol.
 
@@ -456,6 +508,175 @@ class MetaTrader5(MT5Protocol):
         """
         return self._run(self._async_client.symbol_select(symbol, enable=enable))
 
+    # =========================================================================
+    # STREAMING METHODS (mt5linux extension)
+    # =========================================================================
+
+    def subscribe_ticks(
+        self,
+        symbols: str | Sequence[str],
+        *,
+        interval_ms: int | None = None,
+    ) -> Iterator[tuple[str, MT5Models.Tick]]:
+        """Stream tick updates for one or more symbols (blocking generator).
+
+        Each iteration runs the event loop until the next tick arrives.
+        Closing the generator (break / close()) cancels the stream.
+
+        Args:
+            symbols: Symbol name or sequence of symbol names.
+            interval_ms: Server poll interval in milliseconds.
+
+        Yields:
+            (symbol, Tick) tuples as ticks change.
+
+        """
+        stream = self._async_client.subscribe_ticks(symbols, interval_ms=interval_ms)
+
+        async def _next() -> tuple[str, MT5Models.Tick]:
+            return await anext(stream)
+
+        try:
+            while True:
+                try:
+                    yield self._run(_next())
+                except StopAsyncIteration:
+                    return
+        finally:
+            self._run(stream.aclose())
+
+    def subscribe_book(
+        self,
+        symbols: str | Sequence[str],
+        *,
+        interval_ms: int | None = None,
+    ) -> Iterator[tuple[str, NDArray[np.void]]]:
+        """Stream market depth for one or more symbols (blocking generator).
+
+        Each iteration runs the event loop until the next book change.
+        Closing the generator (break / close()) cancels the stream.
+
+        Args:
+            symbols: Symbol name or sequence of symbol names.
+            interval_ms: Server snapshot interval in milliseconds.
+
+        Yields:
+            (symbol, book) tuples; book is a DtypeRegistry.BOOK array.
+
+        """
+        stream = self._async_client.subscribe_book(symbols, interval_ms=interval_ms)
+
+        async def _next() -> tuple[str, NDArray[np.void]]:
+            return await anext(stream)
+
+        try:
+            while True:
+                try:
+                    yield self._run(_next())
+                except StopAsyncIteration:
+                    return
+        finally:
+            self._run(stream.aclose())
+
+    def iter_ticks(
+        self,
+        symbol: str,
+        date_from: datetime | int,
+        date_to: datetime | int,
+        flags: int = c.MarketData.CopyTicksFlag.ALL,
+        *,
+        chunk: timedelta | int | None = None,
+    ) -> Iterator[NDArray[np.void]]:
+        """Download a large tick range as time-ordered chunks (blocking generator).
+
+        Args:
+            symbol: Symbol name.
+            date_from: Start date as datetime or Unix timestamp.
+            date_to: End date as datetime or Unix timestamp.
+            flags: Copy ticks flags (default COPY_TICKS_ALL).
+            chunk: Window size in seconds (default download_chunk_seconds).
+
+        Yields:
+            Non-empty tick arrays, oldest first, without overlap.
+
+        """
+        stream = self._async_client.iter_ticks(
+            symbol, date_from, date_to, flags, chunk=chunk
+        )
+
+        async def _next() -> NDArray[np.void]:
+            return await anext(stream)
+
+        try:
+            while True:
+                try:
+                    yield self._run(_next())
+                except StopAsyncIteration:
+                    return
+        finally:
+            self._run(stream.aclose())
+
+    def download_ticks(  # noqa: PLR0913
+        self,
+        symbol: str,
+        date_from: datetime | int,
+        date_to: datetime | int,
+        flags: int = c.MarketData.CopyTicksFlag.ALL,
+        *,
+        chunk: timedelta | int | None = None,
+        on_chunk: Callable[[NDArray[np.void]], object] | None = None,
+    ) -> NDArray[np.void] | None:
+        """Download a large tick range in concurrent chunks (mt5linux extension).
+
+        Args:
+            symbol: Symbol name.
+            date_from: Start date as datetime or Unix timestamp.
+            date_to: End date as datetime or Unix timestamp.
+            flags: Copy ticks flags (default COPY_TICKS_ALL).
+            chunk: Window size in seconds (default download_chunk_seconds).
+            on_chunk: Optional per-chunk consumer (nothing is retained).
+
+        Returns:
+            All ticks in time order, or None if empty or on_chunk is given.
+
+        """
+        return self._run(
+            self._async_client.download_ticks(
+                symbol, date_from, date_to, flags, chunk=chunk, on_chunk=on_chunk
+            )
+        )
+
+    # =========================================================================
+    # PIPELINED READS (mt5linux extension)
+    # =========================================================================
+
+    @contextmanager
+    def batch(self) -> Iterator[AsyncMT5Batch]:
+        """Pipeline several reads into one Batch RPC (mt5linux extension).
+
+        The batch is sent when the with block exits; each builder method
+        returns a Future whose result() is available after the block. The
+        reads run back-to-back on the bridge, not as an atomic snapshot
+        (see AsyncMT5Batch).
+
+        Example:
+            >>> with mt5.batch() as b:
+            ...     account = b.account_info()
+            ...     tick = b.symbol_info_tick("EURUSD")
+            >>> account.result().balance
+
+        Yields:
+            AsyncMT5Batch builder.
+
+        """
+        builder = self._async_client.batch()
+        try:
+            yield builder
+        except BaseException:
+            builder.cancel()
+            raise
+        self._run(builder.execute())
+
     # =========================================================================
     # MARKET DATA METHODS
     # =========================================================================
@@ -506,6 +727,30 @@ class MetaTrader5(MT5Protocol):
             self._async_client.copy_rates_from_pos(symbol, timeframe, start_pos, count)
         )
 
+    def invalidate_rates(
+        self, symbol: str | None = None, timeframe: int | None = None
+    ) -> None:
+        """Drop cached OHLCV bars (mt5linux extension).
+
+        Args:
+            symbol: Symbol to drop (None = all symbols).
+            timeframe: Timeframe to drop (None = all timeframes).
+
+        """
+        self._async_client.invalidate_rates(symbol, timeframe)
+
+    def clear_history_store(
+        self, kind: str | None = None, symbol: str | None = None
+    ) -> None:
+        """Delete persisted history (mt5linux extension).
+
+        Args:
+            kind: "ticks" or "rates" (None = both).
+            symbol: Symbol to delete (None = all symbols).
+
+        """
+        self._async_client.clear_history_store(kind, symbol)
+
     def copy_rates_range(
         self,
         symbol: str,
@@ -749,25 +994,134 @@ class MetaTrader5(MT5Protocol):
         """
         return self._run(self._async_client.positions_total())
 
+    @overload
+    def positions_get(
+        self,
+        symbol: str | None = None,
+        group: str | None = None,
+        ticket: int | None = None,
+        *,
+        as_array: Literal[False] = False,
+        validate: bool | None = None,
+        fields: Sequence[str] | None = None,
+        where: t.RecordFilterDict | None = None,
+        return_format: Literal["model"] = "model",
+    ) -> tuple[MT5Models.Position, ...] | None: ...
+
+    @overload
+    def positions_get(
+        self,
+        symbol: str | None = None,
+        group: str | None = None,
+        ticket: int | None = None,
+        *,
+        as_array: Literal[True],
+        validate: bool | None = None,
+        fields: Sequence[str] | None = None,
+        where: t.RecordFilterDict | None = None,
+        return_format: t.ReturnFormat = "model",
+    ) -> NDArray[np.void] | None: ...
+
+    @overload
     def positions_get(
         self,
         symbol: str | None = None,
         group: str | None = None,
         ticket: int | None = None,
-    ) -> tuple[MT5Models.Position, ...] | None:
+        *,
+        as_array: Literal[False] = False,
+        validate: bool | None = None,
+        fields: Sequence[str] | None = None,
+        where: t.RecordFilterDict | None = None,
+        return_format: Literal["array"],
+    ) -> NDArray[np.void] | None: ...
+
+    @overload
+    def positions_get(
+        self,
+        symbol: str | None = None,
+        group: str | None = None,
+        ticket: int | None = None,
+        *,
+        as_array: Literal[False] = False,
+        validate: bool | None = None,
+        fields: Sequence[str] | None = None,
+        where: t.RecordFilterDict | None = None,
+        return_format: Literal["namedtuple"],
+    ) -> tuple[t.TradePosition, ...] | None: ...
+
+    @overload
+    def positions_get(
+        self,
+        symbol: str | None = None,
+        group: str | None = None,
+        ticket: int | None = None,
+        *,
+        as_array: bool = False,
+        validate: bool | None = None,
+        fields: Sequence[str] | None = None,
+        where: t.RecordFilterDict | None = None,
+        return_format: t.ReturnFormat = "model",
+    ) -> (
+        tuple[MT5Models.Position, ...]
+        | tuple[t.TradePosition, ...]
+        | NDArray[np.void]
+        | None
+    ): ...
+
+    def positions_get(  # noqa: PLR0913 - MT5 API filters + result format
+        self,
+        symbol: str | None = None,
+        group: str | None = None,
+        ticket: int | None = None,
+        *,
+        as_array: bool = False,
+        validate: bool | None = None,
+        fields: Sequence[str] | None = None,
+        where: t.RecordFilterDict | None = None,
+        return_format: t.ReturnFormat = "model",
+    ) -> (
+        tuple[MT5Models.Position, ...]
+        | tuple[t.TradePosition, ...]
+        | NDArray[np.void]
+        | None
+    ):
         """Get open positions with optional filters.
 
         Args:
             symbol: Filter by symbol name.
             group: Symbol group filter.
             ticket: Specific position ticket.
+            as_array: Return a columnar NumPy structured array (one field
+                per MT5 field) instead of models - skips per-row JSON
+                decoding and model construction.
+            validate: Validate rows with pydantic (None = validate_models
+                setting); False builds models with model_construct.
+            fields: Columns to fetch (ticket is always included); the rest
+                take model/record defaults. None fetches every field.
+            where: Row filter applied by the bridge before serialization
+                (magic, type, entry, position_id, time_from/time_to,
+                comment_prefix); see MT5Types.RecordFilterDict.
+            return_format: "model" (pydantic models), "namedtuple"
+                (MT5Types.TradePosition records in MetaTrader5 field order)
+                or "array" (same as as_array).
 
         Returns:
-            Tuple of Position objects or None.
+            Tuple of Position objects, records if return_format is
+            "namedtuple", structured array if as_array or "array", or None.
 
         """
         return self._run(
-            self._async_client.positions_get(symbol=symbol, group=group, ticket=ticket)
+            self._async_client.positions_get(
+                symbol=symbol,
+                group=group,
+                ticket=ticket,
+                as_array=as_array,
+                validate=validate,
+                fields=fields,
+                where=where,
+                return_format=return_format,
+            )
         )
 
     # =========================================================================
@@ -783,25 +1137,128 @@ class MetaTrader5(MT5Protocol):
         """
         return self._run(self._async_client.orders_total())
 
+    @overload
+    def orders_get(
+        self,
+        symbol: str | None = None,
+        group: str | None = None,
+        ticket: int | None = None,
+        *,
+        as_array: Literal[False] = False,
+        validate: bool | None = None,
+        fields: Sequence[str] | None = None,
+        where: t.RecordFilterDict | None = None,
+        return_format: Literal["model"] = "model",
+    ) -> tuple[MT5Models.Order, ...] | None: ...
+
+    @overload
     def orders_get(
         self,
         symbol: str | None = None,
         group: str | None = None,
         ticket: int | None = None,
-    ) -> tuple[MT5Models.Order, ...] | None:
+        *,
+        as_array: Literal[True],
+        validate: bool | None = None,
+        fields: Sequence[str] | None = None,
+        where: t.RecordFilterDict | None = None,
+        return_format: t.ReturnFormat = "model",
+    ) -> NDArray[np.void] | None: ...
+
+    @overload
+    def orders_get(
+        self,
+        symbol: str | None = None,
+        group: str | None = None,
+        ticket: int | None = None,
+        *,
+        as_array: Literal[False] = False,
+        validate: bool | None = None,
+        fields: Sequence[str] | None = None,
+        where: t.RecordFilterDict | None = None,
+        return_format: Literal["array"],
+    ) -> NDArray[np.void] | None: ...
+
+    @overload
+    def orders_get(
+        self,
+        symbol: str | None = None,
+        group: str | None = None,
+        ticket: int | None = None,
+        *,
+        as_array: Literal[False] = False,
+        validate: bool | None = None,
+        fields: Sequence[str] | None = None,
+        where: t.RecordFilterDict | None = None,
+        return_format: Literal["namedtuple"],
+    ) -> tuple[t.TradeOrder, ...] | None: ...
+
+    @overload
+    def orders_get(
+        self,
+        symbol: str | None = None,
+        group: str | None = None,
+        ticket: int | None = None,
+        *,
+        as_array: bool = False,
+        validate: bool | None = None,
+        fields: Sequence[str] | None = None,
+        where: t.RecordFilterDict | None = None,
+        return_format: t.ReturnFormat = "model",
+    ) -> (
+        tuple[MT5Models.Order, ...] | tuple[t.TradeOrder, ...] | NDArray[np.void] | None
+    ): ...
+
+    def orders_get(  # noqa: PLR0913 - MT5 API filters + result format
+        self,
+        symbol: str | None = None,
+        group: str | None = None,
+        ticket: int | None = None,
+        *,
+        as_array: bool = False,
+        validate: bool | None = None,
+        fields: Sequence[str] | None = None,
+        where: t.RecordFilterDict | None = None,
+        return_format: t.ReturnFormat = "model",
+    ) -> (
+        tuple[MT5Models.Order, ...] | tuple[t.TradeOrder, ...] | NDArray[np.void] | None
+    ):
         """Get pending orders with optional filters.
 
         Args:
             symbol: Filter by symbol name.
             group: Symbol group filter.
             ticket: Specific order ticket.
+            as_array: Return a columnar NumPy structured array (one field
+                per MT5 field) instead of models - skips per-row JSON
+                decoding and model construction.
+            validate: Validate rows with pydantic (None = validate_models
+                setting); False builds models with model_construct.
+            fields: Columns to fetch (ticket is always included); the rest
+                take model/record defaults. None fetches every field.
+            where: Row filter applied by the bridge before serialization
+                (magic, type, entry, position_id, time_from/time_to,
+                comment_prefix); see MT5Types.RecordFilterDict.
+            return_format: "model" (pydantic models), "namedtuple"
+                (MT5Types.TradeOrder records in MetaTrader5 field order)
+                or "array" (same as as_array).
 
         Returns:
-            Tuple of Order objects or None.
+            Tuple of Order objects, records if return_format is
+            "namedtuple", structured array if as_array or "array", or None.
 
         """
         return self._run(
-            self._async_client.orders_get(symbol=symbol, group=group, ticket=ticket)
+            self._async_client.orders_get(
+                symbol=symbol,
+                group=group,
+                ticket=ticket,
+                as_array=as_array,
+                validate=validate,
+                fields=fields,
+                where=where,
+                return_format=return_format,
+            )
         )
 
     # =========================================================================
@@ -825,6 +1282,71 @@ class MetaTrader5(MT5Protocol):
         """
         return self._run(self._async_client.history_orders_total(date_from, date_to))
 
+    @overload
+    def history_orders_get(
+        self,
+        date_from: datetime | int | None = None,
+        date_to: datetime | int | None = None,
+        group: str | None = None,
+        ticket: int | None = None,
+        position: int | None = None,
+        *,
+        as_array: Literal[False] = False,
+        validate: bool | None = None,
+        fields: Sequence[str] | None = None,
+        where: t.RecordFilterDict | None = None,
+        return_format: Literal["model"] = "model",
+    ) -> tuple[MT5Models.Order, ...] | None: ...
+
+    @overload
+    def history_orders_get(
+        self,
+        date_from: datetime | int | None = None,
+        date_to: datetime | int | None = None,
+        group: str | None = None,
+        ticket: int | None = None,
+        position: int | None = None,
+        *,
+        as_array: Literal[True],
+        validate: bool | None = None,
+        fields: Sequence[str] | None = None,
+        where: t.RecordFilterDict | None = None,
+        return_format: t.ReturnFormat = "model",
+    ) -> NDArray[np.void] | None: ...
+
+    @overload
+    def history_orders_get(
+        self,
+        date_from: datetime | int | None = None,
+        date_to: datetime | int | None = None,
+        group: str | None = None,
+        ticket: int | None = None,
+        position: int | None = None,
+        *,
+        as_array: Literal[False] = False,
+        validate: bool | None = None,
+        fields: Sequence[str] | None = None,
+        where: t.RecordFilterDict | None = None,
+        return_format: Literal["array"],
+    ) -> NDArray[np.void] | None: ...
+
+    @overload
+    def history_orders_get(
+        self,
+        date_from: datetime | int | None = None,
+        date_to: datetime | int | None = None,
+        group: str | None = None,
+        ticket: int | None = None,
+        position: int | None = None,
+        *,
+        as_array: Literal[False] = False,
+        validate: bool | None = None,
+        fields: Sequence[str] | None = None,
+        where: t.RecordFilterDict | None = None,
+        return_format: Literal["namedtuple"],
+    ) -> tuple[t.TradeOrder, ...] | None: ...
+
+    @overload
     def history_orders_get(
         self,
         date_from: datetime | int | None = None,
@@ -832,7 +1354,32 @@ class MetaTrader5(MT5Protocol):
         group: str | None = None,
         ticket: int | None = None,
         position: int | None = None,
-    ) -> tuple[MT5Models.Order, ...] | None:
+        *,
+        as_array: bool = False,
+        validate: bool | None = None,
+        fields: Sequence[str] | None = None,
+        where: t.RecordFilterDict | None = None,
+        return_format: t.ReturnFormat = "model",
+    ) -> (
+        tuple[MT5Models.Order, ...] | tuple[t.TradeOrder, ...] | NDArray[np.void] | None
+    ): ...
+
+    def history_orders_get(  # noqa: PLR0913 - MT5 API filters + as_array
+        self,
+        date_from: datetime | int | None = None,
+        date_to: datetime | int | None = None,
+        group: str | None = None,
+        ticket: int | None = None,
+        position: int | None = None,
+        *,
+        as_array: bool = False,
+        validate: bool | None = None,
+        fields: Sequence[str] | None = None,
+        where: t.RecordFilterDict | None = None,
+        return_format: t.ReturnFormat = "model",
+    ) -> (
+        tuple[MT5Models.Order, ...] | tuple[t.TradeOrder, ...] | NDArray[np.void] | None
+    ):
         """Get historical orders with filters.
 
         Args:
@@ -841,9 +1388,23 @@ class MetaTrader5(MT5Protocol):
             group: Symbol group filter.
             ticket: Specific order ticket.
             position: Position ID filter.
+            as_array: Return a columnar NumPy structured array (one field
+                per MT5 field) instead of models - skips per-row JSON
+                decoding and model construction.
+            validate: Validate rows with pydantic (None = validate_models
+                setting); False builds models with model_construct.
+            fields: Columns to fetch (ticket is always included); the rest
+                take model/record defaults. None fetches every field.
+            where: Row filter applied by the bridge before serialization
+                (magic, type, entry, position_id, time_from/time_to,
+                comment_prefix); see MT5Types.RecordFilterDict.
+            return_format: "model" (pydantic models), "namedtuple"
+                (MT5Types.TradeOrder records in MetaTrader5 field order)
+                or "array" (same as as_array).
 
         Returns:
-            Tuple of Order objects or None.
+            Tuple of Order objects, records if return_format is
+            "namedtuple", structured array if as_array or "array", or None.
 
         """
         return self._run(
@@ -853,6 +1414,11 @@ class MetaTrader5(MT5Protocol):
                 group=group,
                 ticket=ticket,
                 position=position,
+                as_array=as_array,
+                validate=validate,
+                fields=fields,
+                where=where,
+                return_format=return_format,
             )
         )
 
@@ -873,6 +1439,23 @@ class MetaTrader5(MT5Protocol):
         """
         return self._run(self._async_client.history_deals_total(date_from, date_to))
 
+    @overload
+    def history_deals_get(
+        self,
+        date_from: datetime | int | None = None,
+        date_to: datetime | int | None = None,
+        group: str | None = None,
+        ticket: int | None = None,
+        position: int | None = None,
+        *,
+        as_array: Literal[False] = False,
+        validate: bool | None = None,
+        fields: Sequence[str] | None = None,
+        where: t.RecordFilterDict | None = None,
+        return_format: Literal["model"] = "model",
+    ) -> tuple[MT5Models.Deal, ...] | None: ...
+
+    @overload
     def history_deals_get(
         self,
         date_from: datetime | int | None = None,
@@ -880,7 +1463,78 @@ class MetaTrader5(MT5Protocol):
         group: str | None = None,
         ticket: int | None = None,
         position: int | None = None,
-    ) -> tuple[MT5Models.Deal, ...] | None:
+        *,
+        as_array: Literal[True],
+        validate: bool | None = None,
+        fields: Sequence[str] | None = None,
+        where: t.RecordFilterDict | None = None,
+        return_format: t.ReturnFormat = "model",
+    ) -> NDArray[np.void] | None: ...
+
+    @overload
+    def history_deals_get(
+        self,
+        date_from: datetime | int | None = None,
+        date_to: datetime | int | None = None,
+        group: str | None = None,
+        ticket: int | None = None,
+        position: int | None = None,
+        *,
+        as_array: Literal[False] = False,
+        validate: bool | None = None,
+        fields: Sequence[str] | None = None,
+        where: t.RecordFilterDict | None = None,
+        return_format: Literal["array"],
+    ) -> NDArray[np.void] | None: ...
+
+    @overload
+    def history_deals_get(
+        self,
+        date_from: datetime | int | None = None,
+        date_to: datetime | int | None = None,
+        group: str | None = None,
+        ticket: int | None = None,
+        position: int | None = None,
+        *,
+        as_array: Literal[False] = False,
+        validate: bool | None = None,
+        fields: Sequence[str] | None = None,
+        where: t.RecordFilterDict | None = None,
+        return_format: Literal["namedtuple"],
+    ) -> tuple[t.TradeDeal, ...] | None: ...
+
+    @overload
+    def history_deals_get(
+        self,
+        date_from: datetime | int | None = None,
+        date_to: datetime | int | None = None,
+        group: str | None = None,
+        ticket: int | None = None,
+        position: int | None = None,
+        *,
+        as_array: bool = False,
+        validate: bool | None = None,
+        fields: Sequence[str] | None = None,
+        where: t.RecordFilterDict | None = None,
+        return_format: t.ReturnFormat = "model",
+    ) -> (
+        tuple[MT5Models.Deal, ...] | tuple[t.TradeDeal, ...] | NDArray[np.void] | None
+    ): ...
+
+    def history_deals_get(  # noqa: PLR0913 - MT5 API filters + as_array
+        self,
+        date_from: datetime | int | None = None,
+        date_to: datetime | int | None = None,
+        group: str | None = None,
+        ticket: int | None = None,
+        position: int | None = None,
+        *,
+        as_array: bool = False,
+        validate: bool | None = None,
+        fields: Sequence[str] | None = None,
+        where: t.RecordFilterDict | None = None,
+        return_format: t.ReturnFormat = "model",
+    ) -> tuple[MT5Models.Deal, ...] | tuple[t.TradeDeal, ...] | NDArray[np.void] | None:
         """Get historical deals with filters.
 
         Args:
@@ -889,9 +1543,23 @@ class MetaTrader5(MT5Protocol):
             group: Symbol group filter.
             ticket: Specific deal ticket.
             position: Position ID filter.
+            as_array: Return a columnar NumPy structured array (one field
+                per MT5 field) instead of models - skips per-row JSON
+                decoding and model construction.
+            validate: Validate rows with pydantic (None = validate_models
+                setting); False builds models with model_construct.
+            fields: Columns to fetch (ticket is always included); the rest
+                take model/record defaults. None fetches every field.
+            where: Row filter applied by the bridge before serialization
+                (magic, type, entry, position_id, time_from/time_to,
+                comment_prefix); see MT5Types.RecordFilterDict.
+            return_format: "model" (pydantic models), "namedtuple"
+                (MT5Types.TradeDeal records in MetaTrader5 field order)
+                or "array" (same as as_array).
 
         Returns:
-            Tuple of Deal objects or None.
+            Tuple of Deal objects, records if return_format is
+            "namedtuple", structured array if as_array or "array", or None.
 
         """
         return self._run(
@@ -901,6 +1569,11 @@ class MetaTrader5(MT5Protocol):
                 group=group,
                 ticket=ticket,
                 position=position,
+                as_array=as_array,
+                validate=validate,
+                fields=fields,
+                where=where,
+                return_format=return_format,
             )
         )
 
@@ -920,17 +1593,79 @@ class MetaTrader5(MT5Protocol):
         """
         return self._run(self._async_client.market_book_add(symbol))
 
-    def market_book_get(self, symbol: str) -> tuple[MT5Models.BookEntry, ...] | None:
+    @overload
+    def market_book_get(
+        self,
+        symbol: str,
+        *,
+        validate: bool | None = None,
+        return_format: Literal["model"] = "model",
+    ) -> tuple[MT5Models.BookEntry, ...] | None: ...
+
+    @overload
+    def market_book_get(
+        self,
+        symbol: str,
+        *,
+        validate: bool | None = None,
+        return_format: Literal["namedtuple"],
+    ) -> tuple[t.BookInfo, ...] | None: ...
+
+    @overload
+    def market_book_get(
+        self,
+        symbol: str,
+        *,
+        validate: bool | None = None,
+        return_format: Literal["array"],
+    ) -> NDArray[np.void] | None: ...
+
+    @overload
+    def market_book_get(
+        self,
+        symbol: str,
+        *,
+        validate: bool | None = None,
+        return_format: t.ReturnFormat = "model",
+    ) -> (
+        tuple[MT5Models.BookEntry, ...]
+        | tuple[t.BookInfo, ...]
+        | NDArray[np.void]
+        | None
+    ): ...
+
+    def market_book_get(
+        self,
+        symbol: str,
+        *,
+        validate: bool | None = None,
+        return_format: t.ReturnFormat = "model",
+    ) -> (
+        tuple[MT5Models.BookEntry, ...]
+        | tuple[t.BookInfo, ...]
+        | NDArray[np.void]
+        | None
+    ):
         """Get market depth (DOM) data for a symbol.
 
         Args:
             symbol: Symbol name to get market depth for.
+            validate: Validate entries with pydantic (None = validate_models
+                setting); False builds models with model_construct.
+            return_format: "model" (pydantic models), "namedtuple"
+                (MT5Types.BookInfo records in MetaTrader5 field order)
+                or "array" (structured array, DtypeRegistry.BOOK).
 
         Returns:
-            Tuple of BookEntry objects or None.
+            Tuple of BookEntry objects, records or structured array per
+            return_format, or None.
 
         """
-        return self._run(self._async_client.market_book_get(symbol))
+        return self._run(
+            self._async_client.market_book_get(
+                symbol, validate=validate, return_format=return_format
+            )
+        )
 
     def market_book_release(self, symbol: str) -> bool:
         """Unsubscribe from market depth (DOM) for a symbol.
@@ -305,6 +305,18 @@ class MT5Constants:
             "market_book_release": 0,
         }
 
+        # Never hedged (see MT5Utilities.Hedger) whatever their criticality:
+        # a duplicate would trade, or add/release a subscription twice
+        HEDGE_EXCLUDED_OPERATIONS: ClassVar[frozenset[str]] = frozenset(
+            {
+                "order_send",
+                "order_check",
+                "symbol_select",
+                "market_book_add",
+                "market_book_release",
+            }
+        )
+
     # ==================== ORDER MANAGEMENT ====================
     class Order:
         """Order types, states, and trading actions."""
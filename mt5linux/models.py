@@ -19,7 +19,7 @@ Usage:
 from __future__ import annotations
 
 from datetime import datetime  # noqa: TC003 - Pydantic needs datetime at runtime
-from typing import Protocol, Self, runtime_checkable
+from typing import ClassVar, Protocol, Self, runtime_checkable
 
 from pydantic import BaseModel, ConfigDict, Field
 
@@ -83,6 +83,25 @@ class MT5Models:
             # Use from_attributes for objects with direct attribute access
             return cls.model_validate(obj)
 
+        @classmethod
+        def from_proto(cls, message: object) -> Self:
+            """Create model from a typed bridge message without validation.
+
+            The message must declare every model field by name with the
+            field's type (mt5_pb2.Tick, mt5_pb2.SymbolInfo); values are
+            trusted and passed to model_construct as-is.
+
+            Args:
+                message: Typed protobuf message.
+
+            Returns:
+                Model instance.
+
+            """
+            return cls.model_construct(
+                **{name: getattr(message, name) for name in cls.model_fields}
+            )
+
     class OrderRequest(BaseModel):
         """MT5 order request with validation.
 
@@ -338,6 +357,68 @@ class MT5Models:
     class SymbolInfo(Base):
         """MT5 symbol information (complete 96 fields from real MT5)."""
 
+        # Fields that move with quotes and session activity; everything else is
+        # contract metadata (digits, point, volume limits, margin, swaps).
+        VOLATILE_FIELDS: ClassVar[frozenset[str]] = frozenset(
+            {
+                "time",
+                "spread",
+                "bid",
+                "ask",
+                "last",
+                "bidhigh",
+                "bidlow",
+                "askhigh",
+                "asklow",
+                "lasthigh",
+                "lastlow",
+                "price_change",
+                "price_volatility",
+                "price_theoretical",
+                "price_sensitivity",
+                "price_greeks_delta",
+                "price_greeks_gamma",
+                "price_greeks_theta",
+                "price_greeks_vega",
+                "price_greeks_rho",
+                "price_greeks_omega",
+                "trade_tick_value",
+                "trade_tick_value_profit",
+                "trade_tick_value_loss",
+                "volume",
+                "volume_real",
+                "volumehigh",
+                "volumehigh_real",
+                "volumelow",
+                "volumelow_real",
+                "session_volume",
+                "session_turnover",
+                "session_interest",
+                "session_deals",
+                "session_buy_orders",
+                "session_buy_orders_volume",
+                "session_sell_orders",
+                "session_sell_orders_volume",
+                "session_open",
+                "session_close",
+                "session_aw",
+                "session_price_settlement",
+                "session_price_limit_min",
+                "session_price_limit_max",
+            }
+        )
+
+        # Volatile fields that a Tick carries (refreshable without a full fetch);
+        # the rest of VOLATILE_FIELDS need a full fetch to be current
+        QUOTE_FIELDS: ClassVar[tuple[str, ...]] = (
+            "time",
+            "bid",
+            "ask",
+            "last",
+            "volume",
+            "volume_real",
+        )
+
         # Core identification
         name: str
         description: str = ""
@@ -20,7 +20,7 @@ _sym_db = _symbol_database.Default()
 
 
 DESCRIPTOR = _descriptor_pool.Default().AddSerializedFile(
-    b'\n\tmt5.proto\x12\x03mt5"\x07\n\x05\x45mpty"\x1e\n\x0c\x42oolResponse\x12\x0e\n\x06result\x18\x01 \x01(\x08"\x1c\n\x0bIntResponse\x12\r\n\x05value\x18\x01 \x01(\x05"-\n\rFloatResponse\x12\x12\n\x05value\x18\x01 \x01(\x01H\x00\x88\x01\x01\x42\x08\n\x06_value"*\n\tErrorInfo\x12\x0c\n\x04\x63ode\x18\x01 \x01(\x05\x12\x0f\n\x07message\x18\x02 \x01(\t"9\n\nMT5Version\x12\r\n\x05major\x18\x01 \x01(\x05\x12\r\n\x05minor\x18\x02 \x01(\x05\x12\r\n\x05\x62uild\x18\x03 \x01(\t"f\n\tConstants\x12*\n\x06values\x18\x01 \x03(\x0b\x32\x1a.mt5.Constants.ValuesEntry\x1a-\n\x0bValuesEntry\x12\x0b\n\x03key\x18\x01 \x01(\t\x12\r\n\x05value\x18\x02 \x01(\x05:\x02\x38\x01"j\n\rParameterInfo\x12\x0c\n\x04name\x18\x01 \x01(\t\x12\x11\n\ttype_hint\x18\x02 \x01(\t\x12\x0c\n\x04kind\x18\x03 \x01(\t\x12\x13\n\x0bhas_default\x18\x04 \x01(\x08\x12\x15\n\rdefault_value\x18\x05 \x01(\t"l\n\nMethodInfo\x12\x0c\n\x04name\x18\x01 \x01(\t\x12&\n\nparameters\x18\x02 \x03(\x0b\x32\x12.mt5.ParameterInfo\x12\x13\n\x0breturn_type\x18\x03 \x01(\t\x12\x13\n\x0bis_callable\x18\x04 \x01(\x08"B\n\x0fMethodsResponse\x12 \n\x07methods\x18\x01 \x03(\x0b\x32\x0f.mt5.MethodInfo\x12\r\n\x05total\x18\x02 \x01(\x05";\n\tFieldInfo\x12\x0c\n\x04name\x18\x01 \x01(\t\x12\x11\n\ttype_hint\x18\x02 \x01(\t\x12\r\n\x05index\x18\x03 \x01(\x05"P\n\tModelInfo\x12\x0c\n\x04name\x18\x01 \x01(\t\x12\x1e\n\x06\x66ields\x18\x02 \x03(\x0b\x32\x0e.mt5.FieldInfo\x12\x15\n\ris_namedtuple\x18\x03 \x01(\x08"?\n\x0eModelsResponse\x12\x1e\n\x06models\x18\x01 \x03(\x0b\x32\x0e.mt5.ModelInfo\x12\r\n\x05total\x18\x02 \x01(\x05"\x1d\n\x08\x44ictData\x12\x11\n\tjson_data\x18\x01 \x01(\t"\x1e\n\x08\x44ictList\x12\x12\n\njson_items\x18\x01 \x03(\t"8\n\nNumpyArray\x12\x0c\n\x04\x64\x61ta\x18\x01 \x01(\x0c\x12\r\n\x05\x64type\x18\x02 \x01(\t\x12\r\n\x05shape\x18\x03 \x03(\x05"0\n\x0fSymbolsResponse\x12\r\n\x05total\x18\x01 \x01(\x05\x12\x0e\n\x06\x63hunks\x18\x02 \x03(\t"\x7f\n\x0cHealthStatus\x12\x0f\n\x07healthy\x18\x01 \x01(\x08\x12\x15\n\rmt5_available\x18\x02 \x01(\x08\x12\x11\n\tconnected\x18\x03 \x01(\x08\x12\x15\n\rtrade_allowed\x18\x04 \x01(\x08\x12\r\n\x05\x62uild\x18\x05 \x01(\x05\x12\x0e\n\x06reason\x18\x06 \x01(\t"\xbf\x01\n\x0bInitRequest\x12\x11\n\x04path\x18\x01 \x01(\tH\x00\x88\x01\x01\x12\x12\n\x05login\x18\x02 \x01(\x03H\x01\x88\x01\x01\x12\x15\n\x08password\x18\x03 \x01(\tH\x02\x88\x01\x01\x12\x13\n\x06server\x18\x04 \x01(\tH\x03\x88\x01\x01\x12\x14\n\x07timeout\x18\x05 \x01(\x05H\x04\x88\x01\x01\x12\x10\n\x08portable\x18\x06 \x01(\x08\x42\x07\n\x05_pathB\x08\n\x06_loginB\x0b\n\t_passwordB\t\n\x07_serverB\n\n\x08_timeout"P\n\x0cLoginRequest\x12\r\n\x05login\x18\x01 \x01(\x03\x12\x10\n\x08password\x18\x02 \x01(\t\x12\x0e\n\x06server\x18\x03 \x01(\t\x12\x0f\n\x07timeout\x18\x04 \x01(\x05"\x1f\n\rSymbolRequest\x12\x0e\n\x06symbol\x18\x01 \x01(\t".\n\x0eSymbolsRequest\x12\x12\n\x05group\x18\x01 \x01(\tH\x00\x88\x01\x01\x42\x08\n\x06_group"5\n\x13SymbolSelectRequest\x12\x0e\n\x06symbol\x18\x01 \x01(\t\x12\x0e\n\x06\x65nable\x18\x02 \x01(\x08"W\n\x10\x43opyRatesRequest\x12\x0e\n\x06symbol\x18\x01 \x01(\t\x12\x11\n\ttimeframe\x18\x02 \x01(\x05\x12\x11\n\tdate_from\x18\x03 \x01(\x03\x12\r\n\x05\x63ount\x18\x04 \x01(\x05"Z\n\x13\x43opyRatesPosRequest\x12\x0e\n\x06symbol\x18\x01 \x01(\t\x12\x11\n\ttimeframe\x18\x02 \x01(\x05\x12\x11\n\tstart_pos\x18\x03 \x01(\x05\x12\r\n\x05\x63ount\x18\x04 \x01(\x05"^\n\x15\x43opyRatesRangeRequest\x12\x0e\n\x06symbol\x18\x01 \x01(\t\x12\x11\n\ttimeframe\x18\x02 \x01(\x05\x12\x11\n\tdate_from\x18\x03 \x01(\x03\x12\x0f\n\x07\x64\x61te_to\x18\x04 \x01(\x03"S\n\x10\x43opyTicksRequest\x12\x0e\n\x06symbol\x18\x01 \x01(\t\x12\x11\n\tdate_from\x18\x02 \x01(\x03\x12\r\n\x05\x63ount\x18\x03 \x01(\x05\x12\r\n\x05\x66lags\x18\x04 \x01(\x05"Z\n\x15\x43opyTicksRangeRequest\x12\x0e\n\x06symbol\x18\x01 \x01(\t\x12\x11\n\tdate_from\x18\x02 \x01(\x03\x12\x0f\n\x07\x64\x61te_to\x18\x03 \x01(\x03\x12\r\n\x05\x66lags\x18\x04 \x01(\x05"$\n\x0cOrderRequest\x12\x14\n\x0cjson_request\x18\x01 \x01(\t"p\n\x10PositionsRequest\x12\x13\n\x06symbol\x18\x01 \x01(\tH\x00\x88\x01\x01\x12\x12\n\x05group\x18\x02 \x01(\tH\x01\x88\x01\x01\x12\x13\n\x06ticket\x18\x03 \x01(\x03H\x02\x88\x01\x01\x42\t\n\x07_symbolB\x08\n\x06_groupB\t\n\x07_ticket"m\n\rOrdersRequest\x12\x13\n\x06symbol\x18\x01 \x01(\tH\x00\x88\x01\x01\x12\x12\n\x05group\x18\x02 \x01(\tH\x01\x88\x01\x01\x12\x13\n\x06ticket\x18\x03 \x01(\x03H\x02\x88\x01\x01\x42\t\n\x07_symbolB\x08\n\x06_groupB\t\n\x07_ticket"\xba\x01\n\x0eHistoryRequest\x12\x16\n\tdate_from\x18\x01 \x01(\x03H\x00\x88\x01\x01\x12\x14\n\x07\x64\x61te_to\x18\x02 \x01(\x03H\x01\x88\x01\x01\x12\x12\n\x05group\x18\x03 \x01(\tH\x02\x88\x01\x01\x12\x13\n\x06ticket\x18\x04 \x01(\x03H\x03\x88\x01\x01\x12\x15\n\x08position\x18\x05 \x01(\x03H\x04\x88\x01\x01\x42\x0c\n\n_date_fromB\n\n\x08_date_toB\x08\n\x06_groupB\t\n\x07_ticketB\x0b\n\t_position"N\n\rMarginRequest\x12\x0e\n\x06\x61\x63tion\x18\x01 \x01(\x05\x12\x0e\n\x06symbol\x18\x02 \x01(\t\x12\x0e\n\x06volume\x18\x03 \x01(\x01\x12\r\n\x05price\x18\x04 \x01(\x01"h\n\rProfitRequest\x12\x0e\n\x06\x61\x63tion\x18\x01 \x01(\x05\x12\x0e\n\x06symbol\x18\x02 \x01(\t\x12\x0e\n\x06volume\x18\x03 \x01(\x01\x12\x12\n\nprice_open\x18\x04 \x01(\x01\x12\x13\n\x0bprice_close\x18\x05 \x01(\x01"\xb1\x01\n\x12ProvisionedAccount\x12\r\n\x05login\x18\x01 \x01(\x03\x12\x0e\n\x06server\x18\x02 \x01(\t\x12\r\n\x05\x65mail\x18\x03 \x01(\t\x12\x12\n\ncreated_at\x18\x04 \x01(\t\x12\x17\n\x0flogin_confirmed\x18\x05 \x01(\x08\x12\x1d\n\x15\x63redentials_persisted\x18\x06 \x01(\x08\x12\x11\n\tconnected\x18\x07 \x01(\x08\x12\x0e\n\x06source\x18\x08 \x01(\t"z\n\x11\x43reateDemoRequest\x12\x0e\n\x06server\x18\x01 \x01(\t\x12\r\n\x05\x65mail\x18\x02 \x01(\t\x12\r\n\x05phone\x18\x03 \x01(\t\x12\x12\n\nfirst_name\x18\x04 \x01(\t\x12\x11\n\tlast_name\x18\x05 \x01(\t\x12\x10\n\x08\x64ob_year\x18\x06 \x01(\t2\xd5\x0f\n\nMT5Service\x12,\n\x0bHealthCheck\x12\n.mt5.Empty\x1a\x11.mt5.HealthStatus\x12\x31\n\nInitialize\x12\x10.mt5.InitRequest\x1a\x11.mt5.BoolResponse\x12-\n\x05Login\x12\x11.mt5.LoginRequest\x1a\x11.mt5.BoolResponse\x12"\n\x08Shutdown\x12\n.mt5.Empty\x1a\n.mt5.Empty\x12&\n\x07Version\x12\n.mt5.Empty\x1a\x0f.mt5.MT5Version\x12\'\n\tLastError\x12\n.mt5.Empty\x1a\x0e.mt5.ErrorInfo\x12*\n\x0cGetConstants\x12\n.mt5.Empty\x1a\x0e.mt5.Constants\x12.\n\nGetMethods\x12\n.mt5.Empty\x1a\x14.mt5.MethodsResponse\x12,\n\tGetModels\x12\n.mt5.Empty\x1a\x13.mt5.ModelsResponse\x12)\n\x0cTerminalInfo\x12\n.mt5.Empty\x1a\r.mt5.DictData\x12(\n\x0b\x41\x63\x63ountInfo\x12\n.mt5.Empty\x1a\r.mt5.DictData\x12<\n\x15GetProvisionedAccount\x12\n.mt5.Empty\x1a\x17.mt5.ProvisionedAccount\x12\x44\n\x11\x43reateDemoAccount\x12\x16.mt5.CreateDemoRequest\x1a\x17.mt5.ProvisionedAccount\x12,\n\x0cSymbolsTotal\x12\n.mt5.Empty\x1a\x10.mt5.IntResponse\x12\x37\n\nSymbolsGet\x12\x13.mt5.SymbolsRequest\x1a\x14.mt5.SymbolsResponse\x12/\n\nSymbolInfo\x12\x12.mt5.SymbolRequest\x1a\r.mt5.DictData\x12\x33\n\x0eSymbolInfoTick\x12\x12.mt5.SymbolRequest\x1a\r.mt5.DictData\x12;\n\x0cSymbolSelect\x12\x18.mt5.SymbolSelectRequest\x1a\x11.mt5.BoolResponse\x12\x37\n\rCopyRatesFrom\x12\x15.mt5.CopyRatesRequest\x1a\x0f.mt5.NumpyArray\x12=\n\x10\x43opyRatesFromPos\x12\x18.mt5.CopyRatesPosRequest\x1a\x0f.mt5.NumpyArray\x12=\n\x0e\x43opyRatesRange\x12\x1a.mt5.CopyRatesRangeRequest\x1a\x0f.mt5.NumpyArray\x12\x37\n\rCopyTicksFrom\x12\x15.mt5.CopyTicksRequest\x1a\x0f.mt5.NumpyArray\x12=\n\x0e\x43opyTicksRange\x12\x1a.mt5.CopyTicksRangeRequest\x1a\x0f.mt5.NumpyArray\x12\x39\n\x0fOrderCalcMargin\x12\x12.mt5.MarginRequest\x1a\x12.mt5.FloatResponse\x12\x39\n\x0fOrderCalcProfit\x12\x12.mt5.ProfitRequest\x1a\x12.mt5.FloatResponse\x12.\n\nOrderCheck\x12\x11.mt5.OrderRequest\x1a\r.mt5.DictData\x12-\n\tOrderSend\x12\x11.mt5.OrderRequest\x1a\r.mt5.DictData\x12.\n\x0ePositionsTotal\x12\n.mt5.Empty\x1a\x10.mt5.IntResponse\x12\x34\n\x0cPositionsGet\x12\x15.mt5.PositionsRequest\x1a\r.mt5.DictList\x12+\n\x0bOrdersTotal\x12\n.mt5.Empty\x1a\x10.mt5.IntResponse\x12.\n\tOrdersGet\x12\x12.mt5.OrdersRequest\x1a\r.mt5.DictList\x12;\n\x12HistoryOrdersTotal\x12\x13.mt5.HistoryRequest\x1a\x10.mt5.IntResponse\x12\x36\n\x10HistoryOrdersGet\x12\x13.mt5.HistoryRequest\x1a\r.mt5.DictList\x12:\n\x11HistoryDealsTotal\x12\x13.mt5.HistoryRequest\x1a\x10.mt5.IntResponse\x12\x35\n\x0fHistoryDealsGet\x12\x13.mt5.HistoryRequest\x1a\r.mt5.DictList\x12\x36\n\rMarketBookAdd\x12\x12.mt5.SymbolRequest\x1a\x11.mt5.BoolResponse\x12\x32\n\rMarketBookGet\x12\x12.mt5.SymbolRequest\x1a\r.mt5.DictList\x12:\n\x11MarketBookRelease\x12\x12.mt5.SymbolRequest\x1a\x11.mt5.BoolResponseb\x06proto3'
+    b'\n\tmt5.proto\x12\x03mt5"\x07\n\x05\x45mpty"\x1e\n\x0c\x42oolResponse\x12\x0e\n\x06result\x18\x01 \x01(\x08"\x1c\n\x0bIntResponse\x12\r\n\x05value\x18\x01 \x01(\x05"-\n\rFloatResponse\x12\x12\n\x05value\x18\x01 \x01(\x01H\x00\x88\x01\x01\x42\x08\n\x06_value"*\n\tErrorInfo\x12\x0c\n\x04\x63ode\x18\x01 \x01(\x05\x12\x0f\n\x07message\x18\x02 \x01(\t"9\n\nMT5Version\x12\r\n\x05major\x18\x01 \x01(\x05\x12\r\n\x05minor\x18\x02 \x01(\x05\x12\r\n\x05\x62uild\x18\x03 \x01(\t"f\n\tConstants\x12*\n\x06values\x18\x01 \x03(\x0b\x32\x1a.mt5.Constants.ValuesEntry\x1a-\n\x0bValuesEntry\x12\x0b\n\x03key\x18\x01 \x01(\t\x12\r\n\x05value\x18\x02 \x01(\x05:\x02\x38\x01"j\n\rParameterInfo\x12\x0c\n\x04name\x18\x01 \x01(\t\x12\x11\n\ttype_hint\x18\x02 \x01(\t\x12\x0c\n\x04kind\x18\x03 \x01(\t\x12\x13\n\x0bhas_default\x18\x04 \x01(\x08\x12\x15\n\rdefault_value\x18\x05 \x01(\t"l\n\nMethodInfo\x12\x0c\n\x04name\x18\x01 \x01(\t\x12&\n\nparameters\x18\x02 \x03(\x0b\x32\x12.mt5.ParameterInfo\x12\x13\n\x0breturn_type\x18\x03 \x01(\t\x12\x13\n\x0bis_callable\x18\x04 \x01(\x08"B\n\x0fMethodsResponse\x12 \n\x07methods\x18\x01 \x03(\x0b\x32\x0f.mt5.MethodInfo\x12\r\n\x05total\x18\x02 \x01(\x05";\n\tFieldInfo\x12\x0c\n\x04name\x18\x01 \x01(\t\x12\x11\n\ttype_hint\x18\x02 \x01(\t\x12\r\n\x05index\x18\x03 \x01(\x05"P\n\tModelInfo\x12\x0c\n\x04name\x18\x01 \x01(\t\x12\x1e\n\x06\x66ields\x18\x02 \x03(\x0b\x32\x0e.mt5.FieldInfo\x12\x15\n\ris_namedtuple\x18\x03 \x01(\x08"?\n\x0eModelsResponse\x12\x1e\n\x06models\x18\x01 \x03(\x0b\x32\x0e.mt5.ModelInfo\x12\r\n\x05total\x18\x02 \x01(\x05"\x1d\n\x08\x44ictData\x12\x11\n\tjson_data\x18\x01 \x01(\t">\n\x08\x44ictList\x12\x12\n\njson_items\x18\x01 \x03(\t\x12\x1e\n\x05\x61rray\x18\x02 \x01(\x0b\x32\x0f.mt5.NumpyArray"8\n\nNumpyArray\x12\x0c\n\x04\x64\x61ta\x18\x01 \x01(\x0c\x12\r\n\x05\x64type\x18\x02 \x01(\t\x12\r\n\x05shape\x18\x03 \x03(\x05"0\n\x0fSymbolsResponse\x12\r\n\x05total\x18\x01 \x01(\x05\x12\x0e\n\x06\x63hunks\x18\x02 \x03(\t"\x7f\n\x0cHealthStatus\x12\x0f\n\x07healthy\x18\x01 \x01(\x08\x12\x15\n\rmt5_available\x18\x02 \x01(\x08\x12\x11\n\tconnected\x18\x03 \x01(\x08\x12\x15\n\rtrade_allowed\x18\x04 \x01(\x08\x12\r\n\x05\x62uild\x18\x05 \x01(\x05\x12\x0e\n\x06reason\x18\x06 \x01(\t"\xbf\x01\n\x0bInitRequest\x12\x11\n\x04path\x18\x01 \x01(\tH\x00\x88\x01\x01\x12\x12\n\x05login\x18\x02 \x01(\x03H\x01\x88\x01\x01\x12\x15\n\x08password\x18\x03 \x01(\tH\x02\x88\x01\x01\x12\x13\n\x06server\x18\x04 \x01(\tH\x03\x88\x01\x01\x12\x14\n\x07timeout\x18\x05 \x01(\x05H\x04\x88\x01\x01\x12\x10\n\x08portable\x18\x06 \x01(\x08\x42\x07\n\x05_pathB\x08\n\x06_loginB\x0b\n\t_passwordB\t\n\x07_serverB\n\n\x08_timeout"P\n\x0cLoginRequest\x12\r\n\x05login\x18\x01 \x01(\x03\x12\x10\n\x08password\x18\x02 \x01(\t\x12\x0e\n\x06server\x18\x03 \x01(\t\x12\x0f\n\x07timeout\x18\x04 \x01(\x05"\x1f\n\rSymbolRequest\x12\x0e\n\x06symbol\x18\x01 \x01(\t".\n\x0eSymbolsRequest\x12\x12\n\x05group\x18\x01 \x01(\tH\x00\x88\x01\x01\x42\x08\n\x06_group"5\n\x13SymbolSelectRequest\x12\x0e\n\x06symbol\x18\x01 \x01(\t\x12\x0e\n\x06\x65nable\x18\x02 \x01(\x08"W\n\x10\x43opyRatesRequest\x12\x0e\n\x06symbol\x18\x01 \x01(\t\x12\x11\n\ttimeframe\x18\x02 \x01(\x05\x12\x11\n\tdate_from\x18\x03 \x01(\x03\x12\r\n\x05\x63ount\x18\x04 \x01(\x05"Z\n\x13\x43opyRatesPosRequest\x12\x0e\n\x06symbol\x18\x01 \x01(\t\x12\x11\n\ttimeframe\x18\x02 \x01(\x05\x12\x11\n\tstart_pos\x18\x03 \x01(\x05\x12\r\n\x05\x63ount\x18\x04 \x01(\x05"^\n\x15\x43opyRatesRangeRequest\x12\x0e\n\x06symbol\x18\x01 \x01(\t\x12\x11\n\ttimeframe\x18\x02 \x01(\x05\x12\x11\n\tdate_from\x18\x03 \x01(\x03\x12\x0f\n\x07\x64\x61te_to\x18\x04 \x01(\x03"S\n\x10\x43opyTicksRequest\x12\x0e\n\x06symbol\x18\x01 \x01(\t\x12\x11\n\tdate_from\x18\x02 \x01(\x03\x12\r\n\x05\x63ount\x18\x03 \x01(\x05\x12\r\n\x05\x66lags\x18\x04 \x01(\x05"Z\n\x15\x43opyTicksRangeRequest\x12\x0e\n\x06symbol\x18\x01 \x01(\t\x12\x11\n\tdate_from\x18\x02 \x01(\x03\x12\x0f\n\x07\x64\x61te_to\x18\x03 \x01(\x03\x12\r\n\x05\x66lags\x18\x04 \x01(\x05"$\n\x0cOrderRequest\x12\x14\n\x0cjson_request\x18\x01 \x01(\t"6\n\x11OrderBatchRequest\x12!\n\x06orders\x18\x01 \x03(\x0b\x32\x11.mt5.OrderRequest"C\n\x10OrderBatchResult\x12\r\n\x05index\x18\x01 \x01(\x05\x12\x11\n\tjson_data\x18\x02 \x01(\t\x12\r\n\x05\x65rror\x18\x03 \x01(\t",\n\tBatchCall\x12\x0e\n\x06method\x18\x01 \x01(\t\x12\x0f\n\x07request\x18\x02 \x01(\x0c"-\n\x0c\x42\x61tchRequest\x12\x1d\n\x05\x63\x61lls\x18\x01 \x03(\x0b\x32\x0e.mt5.BatchCall".\n\x0b\x42\x61tchResult\x12\x10\n\x08response\x18\x01 \x01(\x0c\x12\r\n\x05\x65rror\x18\x02 \x01(\t"2\n\rBatchResponse\x12!\n\x07results\x18\x01 \x03(\x0b\x32\x10.mt5.BatchResult"\xc7\x01\n\x0cRecordFilter\x12\r\n\x05magic\x18\x01 \x03(\x03\x12\x0c\n\x04type\x18\x02 \x03(\x05\x12\r\n\x05\x65ntry\x18\x03 \x03(\x05\x12\x13\n\x0bposition_id\x18\x04 \x03(\x03\x12\x16\n\ttime_from\x18\x05 \x01(\x03H\x00\x88\x01\x01\x12\x14\n\x07time_to\x18\x06 \x01(\x03H\x01\x88\x01\x01\x12\x1b\n\x0e\x63omment_prefix\x18\x07 \x01(\tH\x02\x88\x01\x01\x42\x0c\n\n_time_fromB\n\n\x08_time_toB\x11\n\x0f_comment_prefix"\xb4\x01\n\x10PositionsRequest\x12\x13\n\x06symbol\x18\x01 \x01(\tH\x00\x88\x01\x01\x12\x12\n\x05group\x18\x02 \x01(\tH\x01\x88\x01\x01\x12\x13\n\x06ticket\x18\x03 \x01(\x03H\x02\x88\x01\x01\x12\x10\n\x08\x61s_array\x18\x04 \x01(\x08\x12\x0e\n\x06\x66ields\x18\x05 \x03(\t\x12 \n\x05where\x18\x06 \x01(\x0b\x32\x11.mt5.RecordFilterB\t\n\x07_symbolB\x08\n\x06_groupB\t\n\x07_ticket"\xb1\x01\n\rOrdersRequest\x12\x13\n\x06symbol\x18\x01 \x01(\tH\x00\x88\x01\x01\x12\x12\n\x05group\x18\x02 \x01(\tH\x01\x88\x01\x01\x12\x13\n\x06ticket\x18\x03 \x01(\x03H\x02\x88\x01\x01\x12\x10\n\x08\x61s_array\x18\x04 \x01(\x08\x12\x0e\n\x06\x66ields\x18\x05 \x03(\t\x12 \n\x05where\x18\x06 \x01(\x0b\x32\x11.mt5.RecordFilterB\t\n\x07_symbolB\x08\n\x06_groupB\t\n\x07_ticket"\xfe\x01\n\x0eHistoryRequest\x12\x16\n\tdate_from\x18\x01 \x01(\x03H\x00\x88\x01\x01\x12\x14\n\x07\x64\x61te_to\x18\x02 \x01(\x03H\x01\x88\x01\x01\x12\x12\n\x05group\x18\x03 \x01(\tH\x02\x88\x01\x01\x12\x13\n\x06ticket\x18\x04 \x01(\x03H\x03\x88\x01\x01\x12\x15\n\x08position\x18\x05 \x01(\x03H\x04\x88\x01\x01\x12\x10\n\x08\x61s_array\x18\x06 \x01(\x08\x12\x0e\n\x06\x66ields\x18\x07 \x03(\t\x12 \n\x05where\x18\x08 \x01(\x0b\x32\x11.mt5.RecordFilterB\x0c\n\n_date_fromB\n\n\x08_date_toB\x08\n\x06_groupB\t\n\x07_ticketB\x0b\n\t_position"N\n\rMarginRequest\x12\x0e\n\x06\x61\x63tion\x18\x01 \x01(\x05\x12\x0e\n\x06symbol\x18\x02 \x01(\t\x12\x0e\n\x06volume\x18\x03 \x01(\x01\x12\r\n\x05price\x18\x04 \x01(\x01"h\n\rProfitRequest\x12\x0e\n\x06\x61\x63tion\x18\x01 \x01(\x05\x12\x0e\n\x06symbol\x18\x02 \x01(\t\x12\x0e\n\x06volume\x18\x03 \x01(\x01\x12\x12\n\nprice_open\x18\x04 \x01(\x01\x12\x13\n\x0bprice_close\x18\x05 \x01(\x01"\x82\x01\n\x04Tick\x12\x0c\n\x04time\x18\x01 \x01(\x03\x12\x0b\n\x03\x62id\x18\x02 \x01(\x01\x12\x0b\n\x03\x61sk\x18\x03 \x01(\x01\x12\x0c\n\x04last\x18\x04 \x01(\x01\x12\x0e\n\x06volume\x18\x05 \x01(\x03\x12\x10\n\x08time_msc\x18\x06 \x01(\x03\x12\r\n\x05\x66lags\x18\x07 \x01(\x03\x12\x13\n\x0bvolume_real\x18\x08 \x01(\x01"\'\n\x0cTickResponse\x12\x17\n\x04tick\x18\x01 \x01(\x0b\x32\t.mt5.Tick"\x82\x11\n\nSymbolInfo\x12\x0c\n\x04name\x18\x01 \x01(\t\x12\x13\n\x0b\x64\x65scription\x18\x02 \x01(\t\x12\x0c\n\x04path\x18\x03 \x01(\t\x12\x0c\n\x04isin\x18\x04 \x01(\t\x12\x0c\n\x04\x62\x61nk\x18\x05 \x01(\t\x12\x0c\n\x04page\x18\x06 \x01(\t\x12\x10\n\x08\x63\x61tegory\x18\x07 \x01(\t\x12\x10\n\x08\x65xchange\x18\x08 \x01(\t\x12\x0f\n\x07\x66ormula\x18\t \x01(\t\x12\r\n\x05\x62\x61sis\x18\n \x01(\t\x12\x15\n\rcurrency_base\x18\x0b \x01(\t\x12\x17\n\x0f\x63urrency_profit\x18\x0c \x01(\t\x12\x17\n\x0f\x63urrency_margin\x18\r \x01(\t\x12\x0f\n\x07visible\x18\x0e \x01(\x08\x12\x0e\n\x06select\x18\x0f \x01(\x08\x12\x0e\n\x06\x63ustom\x18\x10 \x01(\x08\x12\x0c\n\x04time\x18\x11 \x01(\x03\x12\x12\n\nstart_time\x18\x12 \x01(\x03\x12\x17\n\x0f\x65xpiration_time\x18\x13 \x01(\x03\x12\x0e\n\x06\x64igits\x18\x14 \x01(\x03\x12\x0e\n\x06spread\x18\x15 \x01(\x03\x12\x14\n\x0cspread_float\x18\x16 \x01(\x08\x12\x12\n\ntrade_mode\x18\x17 \x01(\x03\x12\x17\n\x0ftrade_calc_mode\x18\x18 \x01(\x03\x12\x19\n\x11trade_stops_level\x18\x19 \x01(\x03\x12\x1a\n\x12trade_freeze_level\x18\x1a \x01(\x03\x12\x15\n\rtrade_exemode\x18\x1b \x01(\x03\x12\x12\n\nchart_mode\x18\x1c \x01(\x03\x12\x14\n\x0c\x66illing_mode\x18\x1d \x01(\x03\x12\x17\n\x0f\x65xpiration_mode\x18\x1e \x01(\x03\x12\x12\n\norder_mode\x18\x1f \x01(\x03\x12\x16\n\x0eorder_gtc_mode\x18  \x01(\x03\x12\x13\n\x0boption_mode\x18! \x01(\x03\x12\x14\n\x0coption_right\x18" \x01(\x03\x12\x15\n\roption_strike\x18# \x01(\x01\x12\x0b\n\x03\x62id\x18$ \x01(\x01\x12\x0b\n\x03\x61sk\x18% \x01(\x01\x12\x0c\n\x04last\x18& \x01(\x01\x12\x0f\n\x07\x62idhigh\x18\' \x01(\x01\x12\x0e\n\x06\x62idlow\x18( \x01(\x01\x12\x0f\n\x07\x61skhigh\x18) \x01(\x01\x12\x0e\n\x06\x61sklow\x18* \x01(\x01\x12\x10\n\x08lasthigh\x18+ \x01(\x01\x12\x0f\n\x07lastlow\x18, \x01(\x01\x12\x14\n\x0cprice_change\x18- \x01(\x01\x12\x18\n\x10price_volatility\x18. \x01(\x01\x12\x19\n\x11price_theoretical\x18/ \x01(\x01\x12\x19\n\x11price_sensitivity\x18\x30 \x01(\x01\x12\x1a\n\x12price_greeks_delta\x18\x31 \x01(\x01\x12\x1a\n\x12price_greeks_gamma\x18\x32 \x01(\x01\x12\x1a\n\x12price_greeks_theta\x18\x33 \x01(\x01\x12\x19\n\x11price_greeks_vega\x18\x34 \x01(\x01\x12\x18\n\x10price_greeks_rho\x18\x35 \x01(\x01\x12\x1a\n\x12price_greeks_omega\x18\x36 \x01(\x01\x12\r\n\x05point\x18\x37 \x01(\x01\x12\x18\n\x10trade_tick_value\x18\x38 \x01(\x01\x12\x1f\n\x17trade_tick_value_profit\x18\x39 \x01(\x01\x12\x1d\n\x15trade_tick_value_loss\x18: \x01(\x01\x12\x17\n\x0ftrade_tick_size\x18; \x01(\x01\x12\x17\n\x0fticks_bookdepth\x18< \x01(\x03\x12\x1b\n\x13trade_contract_size\x18= \x01(\x01\x12\x18\n\x10trade_face_value\x18> \x01(\x01\x12\x1e\n\x16trade_accrued_interest\x18? \x01(\x01\x12\x1c\n\x14trade_liquidity_rate\x18@ \x01(\x01\x12\x0e\n\x06volume\x18\x41 \x01(\x01\x12\x13\n\x0bvolume_real\x18\x42 \x01(\x01\x12\x12\n\nvolume_min\x18\x43 \x01(\x01\x12\x12\n\nvolume_max\x18\x44 \x01(\x01\x12\x13\n\x0bvolume_step\x18\x45 \x01(\x01\x12\x14\n\x0cvolume_limit\x18\x46 \x01(\x01\x12\x12\n\nvolumehigh\x18G \x01(\x01\x12\x17\n\x0fvolumehigh_real\x18H \x01(\x01\x12\x11\n\tvolumelow\x18I \x01(\x01\x12\x16\n\x0evolumelow_real\x18J \x01(\x01\x12\x16\n\x0emargin_initial\x18K \x01(\x01\x12\x1a\n\x12margin_maintenance\x18L \x01(\x01\x12\x15\n\rmargin_hedged\x18M \x01(\x01\x12\x1d\n\x15margin_hedged_use_leg\x18N \x01(\x08\x12\x11\n\tswap_mode\x18O \x01(\x03\x12\x11\n\tswap_long\x18P \x01(\x01\x12\x12\n\nswap_short\x18Q \x01(\x01\x12\x1a\n\x12swap_rollover3days\x18R \x01(\x03\x12\x16\n\x0esession_volume\x18S \x01(\x01\x12\x18\n\x10session_turnover\x18T \x01(\x01\x12\x18\n\x10session_interest\x18U \x01(\x01\x12\x15\n\rsession_deals\x18V \x01(\x01\x12\x1a\n\x12session_buy_orders\x18W \x01(\x01\x12!\n\x19session_buy_orders_volume\x18X \x01(\x01\x12\x1b\n\x13session_sell_orders\x18Y \x01(\x01\x12"\n\x1asession_sell_orders_volume\x18Z \x01(\x01\x12\x14\n\x0csession_open\x18[ \x01(\x01\x12\x15\n\rsession_close\x18\\ \x01(\x01\x12\x12\n\nsession_aw\x18] \x01(\x01\x12 \n\x18session_price_settlement\x18^ \x01(\x01\x12\x1f\n\x17session_price_limit_min\x18_ \x01(\x01\x12\x1f\n\x17session_price_limit_max\x18` \x01(\x01"3\n\x12SymbolInfoResponse\x12\x1d\n\x04info\x18\x01 \x01(\x0b\x32\x0f.mt5.SymbolInfo"`\n\x14TickSubscribeRequest\x12\x0f\n\x07symbols\x18\x01 \x03(\t\x12\x18\n\x0binterval_ms\x18\x02 \x01(\x05H\x00\x88\x01\x01\x12\r\n\x05typed\x18\x03 \x01(\x08\x42\x0e\n\x0c_interval_ms"H\n\nTickUpdate\x12\x0e\n\x06symbol\x18\x01 \x01(\t\x12\x11\n\tjson_data\x18\x02 \x01(\t\x12\x17\n\x04tick\x18\x03 \x01(\x0b\x32\t.mt5.Tick"Q\n\x14\x42ookSubscribeRequest\x12\x0f\n\x07symbols\x18\x01 \x03(\t\x12\x18\n\x0binterval_ms\x18\x02 \x01(\x05H\x00\x88\x01\x01\x42\x0e\n\x0c_interval_ms"L\n\tBookLevel\x12\x0c\n\x04type\x18\x01 \x01(\x05\x12\r\n\x05price\x18\x02 \x01(\x01\x12\x0e\n\x06volume\x18\x03 \x01(\x03\x12\x12\n\nvolume_dbl\x18\x04 \x01(\x01"`\n\nBookUpdate\x12\x0e\n\x06symbol\x18\x01 \x01(\t\x12\x10\n\x08sequence\x18\x02 \x01(\x04\x12\x10\n\x08snapshot\x18\x03 \x01(\x08\x12\x1e\n\x06levels\x18\x04 \x03(\x0b\x32\x0e.mt5.BookLevel"\xb1\x01\n\x12ProvisionedAccount\x12\r\n\x05login\x18\x01 \x01(\x03\x12\x0e\n\x06server\x18\x02 \x01(\t\x12\r\n\x05\x65mail\x18\x03 \x01(\t\x12\x12\n\ncreated_at\x18\x04 \x01(\t\x12\x17\n\x0flogin_confirmed\x18\x05 \x01(\x08\x12\x1d\n\x15\x63redentials_persisted\x18\x06 \x01(\x08\x12\x11\n\tconnected\x18\x07 \x01(\x08\x12\x0e\n\x06source\x18\x08 \x01(\t"z\n\x11\x43reateDemoRequest\x12\x0e\n\x06server\x18\x01 \x01(\t\x12\r\n\x05\x65mail\x18\x02 \x01(\t\x12\r\n\x05phone\x18\x03 \x01(\t\x12\x12\n\nfirst_name\x18\x04 \x01(\t\x12\x11\n\tlast_name\x18\x05 \x01(\t\x12\x10\n\x08\x64ob_year\x18\x06 \x01(\t2\xf4\x12\n\nMT5Service\x12,\n\x0bHealthCheck\x12\n.mt5.Empty\x1a\x11.mt5.HealthStatus\x12\x31\n\nInitialize\x12\x10.mt5.InitRequest\x1a\x11.mt5.BoolResponse\x12-\n\x05Login\x12\x11.mt5.LoginRequest\x1a\x11.mt5.BoolResponse\x12"\n\x08Shutdown\x12\n.mt5.Empty\x1a\n.mt5.Empty\x12&\n\x07Version\x12\n.mt5.Empty\x1a\x0f.mt5.MT5Version\x12\'\n\tLastError\x12\n.mt5.Empty\x1a\x0e.mt5.ErrorInfo\x12*\n\x0cGetConstants\x12\n.mt5.Empty\x1a\x0e.mt5.Constants\x12.\n\nGetMethods\x12\n.mt5.Empty\x1a\x14.mt5.MethodsResponse\x12,\n\tGetModels\x12\n.mt5.Empty\x1a\x13.mt5.ModelsResponse\x12-\n\x10GetBridgeMetrics\x12\n.mt5.Empty\x1a\r.mt5.DictData\x12)\n\x0cTerminalInfo\x12\n.mt5.Empty\x1a\r.mt5.DictData\x12(\n\x0b\x41\x63\x63ountInfo\x12\n.mt5.Empty\x1a\r.mt5.DictData\x12<\n\x15GetProvisionedAccount\x12\n.mt5.Empty\x1a\x17.mt5.ProvisionedAccount\x12\x44\n\x11\x43reateDemoAccount\x12\x16.mt5.CreateDemoRequest\x1a\x17.mt5.ProvisionedAccount\x12,\n\x0cSymbolsTotal\x12\n.mt5.Empty\x1a\x10.mt5.IntResponse\x12\x37\n\nSymbolsGet\x12\x13.mt5.SymbolsRequest\x1a\x14.mt5.SymbolsResponse\x12/\n\nSymbolInfo\x12\x12.mt5.SymbolRequest\x1a\r.mt5.DictData\x12\x33\n\x0eSymbolInfoTick\x12\x12.mt5.SymbolRequest\x1a\r.mt5.DictData\x12>\n\x0fSymbolInfoTyped\x12\x12.mt5.SymbolRequest\x1a\x17.mt5.SymbolInfoResponse\x12<\n\x13SymbolInfoTickTyped\x12\x12.mt5.SymbolRequest\x1a\x11.mt5.TickResponse\x12;\n\x0cSymbolSelect\x12\x18.mt5.SymbolSelectRequest\x1a\x11.mt5.BoolResponse\x12>\n\x0eSubscribeTicks\x12\x19.mt5.TickSubscribeRequest\x1a\x0f.mt5.TickUpdate0\x01\x12=\n\rSubscribeBook\x12\x19.mt5.BookSubscribeRequest\x1a\x0f.mt5.BookUpdate0\x01\x12\x37\n\rCopyRatesFrom\x12\x15.mt5.CopyRatesRequest\x1a\x0f.mt5.NumpyArray\x12=\n\x10\x43opyRatesFromPos\x12\x18.mt5.CopyRatesPosRequest\x1a\x0f.mt5.NumpyArray\x12=\n\x0e\x43opyRatesRange\x12\x1a.mt5.CopyRatesRangeRequest\x1a\x0f.mt5.NumpyArray\x12\x37\n\rCopyTicksFrom\x12\x15.mt5.CopyTicksRequest\x1a\x0f.mt5.NumpyArray\x12=\n\x0e\x43opyTicksRange\x12\x1a.mt5.CopyTicksRangeRequest\x1a\x0f.mt5.NumpyArray\x12\x39\n\x0fOrderCalcMargin\x12\x12.mt5.MarginRequest\x1a\x12.mt5.FloatResponse\x12\x39\n\x0fOrderCalcProfit\x12\x12.mt5.ProfitRequest\x1a\x12.mt5.FloatResponse\x12.\n\nOrderCheck\x12\x11.mt5.OrderRequest\x1a\r.mt5.DictData\x12-\n\tOrderSend\x12\x11.mt5.OrderRequest\x1a\r.mt5.DictData\x12\x41\n\x0eOrderSendBatch\x12\x16.mt5.OrderBatchRequest\x1a\x15.mt5.OrderBatchResult0\x01\x12.\n\x0ePositionsTotal\x12\n.mt5.Empty\x1a\x10.mt5.IntResponse\x12\x34\n\x0cPositionsGet\x12\x15.mt5.PositionsRequest\x1a\r.mt5.DictList\x12+\n\x0bOrdersTotal\x12\n.mt5.Empty\x1a\x10.mt5.IntResponse\x12.\n\tOrdersGet\x12\x12.mt5.OrdersRequest\x1a\r.mt5.DictList\x12;\n\x12HistoryOrdersTotal\x12\x13.mt5.HistoryRequest\x1a\x10.mt5.IntResponse\x12\x36\n\x10HistoryOrdersGet\x12\x13.mt5.HistoryRequest\x1a\r.mt5.DictList\x12:\n\x11HistoryDealsTotal\x12\x13.mt5.HistoryRequest\x1a\x10.mt5.IntResponse\x12\x35\n\x0fHistoryDealsGet\x12\x13.mt5.HistoryRequest\x1a\r.mt5.DictList\x12\x36\n\rMarketBookAdd\x12\x12.mt5.SymbolRequest\x1a\x11.mt5.BoolResponse\x12\x32\n\rMarketBookGet\x12\x12.mt5.SymbolRequest\x1a\r.mt5.DictList\x12:\n\x11MarketBookRelease\x12\x12.mt5.SymbolRequest\x1a\x11.mt5.BoolResponse\x12.\n\x05\x42\x61tch\x12\x11.mt5.BatchRequest\x1a\x12.mt5.BatchResponseb\x06proto3'
 )
 
 _globals = globals()
@@ -61,49 +61,81 @@ if not _descriptor._USE_C_DESCRIPTORS:
     _globals["_DICTDATA"]._serialized_start = 837
     _globals["_DICTDATA"]._serialized_end = 866
     _globals["_DICTLIST"]._serialized_start = 868
-    _globals["_DICTLIST"]._serialized_end = 898
-    _globals["_NUMPYARRAY"]._serialized_start = 900
-    _globals["_NUMPYARRAY"]._serialized_end = 956
-    _globals["_SYMBOLSRESPONSE"]._serialized_start = 958
-    _globals["_SYMBOLSRESPONSE"]._serialized_end = 1006
-    _globals["_HEALTHSTATUS"]._serialized_start = 1008
-    _globals["_HEALTHSTATUS"]._serialized_end = 1135
-    _globals["_INITREQUEST"]._serialized_start = 1138
-    _globals["_INITREQUEST"]._serialized_end = 1329
-    _globals["_LOGINREQUEST"]._serialized_start = 1331
-    _globals["_LOGINREQUEST"]._serialized_end = 1411
-    _globals["_SYMBOLREQUEST"]._serialized_start = 1413
-    _globals["_SYMBOLREQUEST"]._serialized_end = 1444
-    _globals["_SYMBOLSREQUEST"]._serialized_start = 1446
-    _globals["_SYMBOLSREQUEST"]._serialized_end = 1492
-    _globals["_SYMBOLSELECTREQUEST"]._serialized_start = 1494
-    _globals["_SYMBOLSELECTREQUEST"]._serialized_end = 1547
-    _globals["_COPYRATESREQUEST"]._serialized_start = 1549
-    _globals["_COPYRATESREQUEST"]._serialized_end = 1636
-    _globals["_COPYRATESPOSREQUEST"]._serialized_start = 1638
-    _globals["_COPYRATESPOSREQUEST"]._serialized_end = 1728
-    _globals["_COPYRATESRANGEREQUEST"]._serialized_start = 1730
-    _globals["_COPYRATESRANGEREQUEST"]._serialized_end = 1824
-    _globals["_COPYTICKSREQUEST"]._serialized_start = 1826
-    _globals["_COPYTICKSREQUEST"]._serialized_end = 1909
-    _globals["_COPYTICKSRANGEREQUEST"]._serialized_start = 1911
-    _globals["_COPYTICKSRANGEREQUEST"]._serialized_end = 2001
-    _globals["_ORDERREQUEST"]._serialized_start = 2003
-    _globals["_ORDERREQUEST"]._serialized_end = 2039
-    _globals["_POSITIONSREQUEST"]._serialized_start = 2041
-    _globals["_POSITIONSREQUEST"]._serialized_end = 2153
-    _globals["_ORDERSREQUEST"]._serialized_start = 2155
-    _globals["_ORDERSREQUEST"]._serialized_end = 2264
-    _globals["_HISTORYREQUEST"]._serialized_start = 2267
-    _globals["_HISTORYREQUEST"]._serialized_end = 2453
-    _globals["_MARGINREQUEST"]._serialized_start = 2455
-    _globals["_MARGINREQUEST"]._serialized_end = 2533
-    _globals["_PROFITREQUEST"]._serialized_start = 2535
-    _globals["_PROFITREQUEST"]._serialized_end = 2639
-    _globals["_PROVISIONEDACCOUNT"]._serialized_start = 2642
-    _globals["_PROVISIONEDACCOUNT"]._serialized_end = 2819
-    _globals["_CREATEDEMOREQUEST"]._serialized_start = 2821
-    _globals["_CREATEDEMOREQUEST"]._serialized_end = 2943
-    _globals["_MT5SERVICE"]._serialized_start = 2946
-    _globals["_MT5SERVICE"]._serialized_end = 4951
+    _globals["_DICTLIST"]._serialized_end = 930
+    _globals["_NUMPYARRAY"]._serialized_start = 932
+    _globals["_NUMPYARRAY"]._serialized_end = 988
+    _globals["_SYMBOLSRESPONSE"]._serialized_start = 990
+    _globals["_SYMBOLSRESPONSE"]._serialized_end = 1038
+    _globals["_HEALTHSTATUS"]._serialized_start = 1040
+    _globals["_HEALTHSTATUS"]._serialized_end = 1167
+    _globals["_INITREQUEST"]._serialized_start = 1170
+    _globals["_INITREQUEST"]._serialized_end = 1361
+    _globals["_LOGINREQUEST"]._serialized_start = 1363
+    _globals["_LOGINREQUEST"]._serialized_end = 1443
+    _globals["_SYMBOLREQUEST"]._serialized_start = 1445
+    _globals["_SYMBOLREQUEST"]._serialized_end = 1476
+    _globals["_SYMBOLSREQUEST"]._serialized_start = 1478
+    _globals["_SYMBOLSREQUEST"]._serialized_end = 1524
+    _globals["_SYMBOLSELECTREQUEST"]._serialized_start = 1526
+    _globals["_SYMBOLSELECTREQUEST"]._serialized_end = 1579
+    _globals["_COPYRATESREQUEST"]._serialized_start = 1581
+    _globals["_COPYRATESREQUEST"]._serialized_end = 1668
+    _globals["_COPYRATESPOSREQUEST"]._serialized_start = 1670
+    _globals["_COPYRATESPOSREQUEST"]._serialized_end = 1760
+    _globals["_COPYRATESRANGEREQUEST"]._serialized_start = 1762
+    _globals["_COPYRATESRANGEREQUEST"]._serialized_end = 1856
+    _globals["_COPYTICKSREQUEST"]._serialized_start = 1858
+    _globals["_COPYTICKSREQUEST"]._serialized_end = 1941
+    _globals["_COPYTICKSRANGEREQUEST"]._serialized_start = 1943
+    _globals["_COPYTICKSRANGEREQUEST"]._serialized_end = 2033
+    _globals["_ORDERREQUEST"]._serialized_start = 2035
+    _globals["_ORDERREQUEST"]._serialized_end = 2071
+    _globals["_ORDERBATCHREQUEST"]._serialized_start = 2073
+    _globals["_ORDERBATCHREQUEST"]._serialized_end = 2127
+    _globals["_ORDERBATCHRESULT"]._serialized_start = 2129
+    _globals["_ORDERBATCHRESULT"]._serialized_end = 2196
+    _globals["_BATCHCALL"]._serialized_start = 2198
+    _globals["_BATCHCALL"]._serialized_end = 2242
+    _globals["_BATCHREQUEST"]._serialized_start = 2244
+    _globals["_BATCHREQUEST"]._serialized_end = 2289
+    _globals["_BATCHRESULT"]._serialized_start = 2291
+    _globals["_BATCHRESULT"]._serialized_end = 2337
+    _globals["_BATCHRESPONSE"]._serialized_start = 2339
+    _globals["_BATCHRESPONSE"]._serialized_end = 2389
+    _globals["_RECORDFILTER"]._serialized_start = 2392
+    _globals["_RECORDFILTER"]._serialized_end = 2591
+    _globals["_POSITIONSREQUEST"]._serialized_start = 2594
+    _globals["_POSITIONSREQUEST"]._serialized_end = 2774
+    _globals["_ORDERSREQUEST"]._serialized_start = 2777
+    _globals["_ORDERSREQUEST"]._serialized_end = 2954
+    _globals["_HISTORYREQUEST"]._serialized_start = 2957
+    _globals["_HISTORYREQUEST"]._serialized_end = 3211
+    _globals["_MARGINREQUEST"]._serialized_start = 3213
+    _globals["_MARGINREQUEST"]._serialized_end = 3291
+    _globals["_PROFITREQUEST"]._serialized_start = 3293
+    _globals["_PROFITREQUEST"]._serialized_end = 3397
+    _globals["_TICK"]._serialized_start = 3400
+    _globals["_TICK"]._serialized_end = 3530
+    _globals["_TICKRESPONSE"]._serialized_start = 3532
+    _globals["_TICKRESPONSE"]._serialized_end = 3571
+    _globals["_SYMBOLINFO"]._serialized_start = 3574
+    _globals["_SYMBOLINFO"]._serialized_end = 5752
+    _globals["_SYMBOLINFORESPONSE"]._serialized_start = 5754
+    _globals["_SYMBOLINFORESPONSE"]._serialized_end = 5805
+    _globals["_TICKSUBSCRIBEREQUEST"]._serialized_start = 5807
+    _globals["_TICKSUBSCRIBEREQUEST"]._serialized_end = 5903
+    _globals["_TICKUPDATE"]._serialized_start = 5905
+    _globals["_TICKUPDATE"]._serialized_end = 5977
+    _globals["_BOOKSUBSCRIBEREQUEST"]._serialized_start = 5979
+    _globals["_BOOKSUBSCRIBEREQUEST"]._serialized_end = 6060
+    _globals["_BOOKLEVEL"]._serialized_start = 6062
+    _globals["_BOOKLEVEL"]._serialized_end = 6138
+    _globals["_BOOKUPDATE"]._serialized_start = 6140
+    _globals["_BOOKUPDATE"]._serialized_end = 6236
+    _globals["_PROVISIONEDACCOUNT"]._serialized_start = 6239
+    _globals["_PROVISIONEDACCOUNT"]._serialized_end = 6416
+    _globals["_CREATEDEMOREQUEST"]._serialized_start = 6418
+    _globals["_CREATEDEMOREQUEST"]._serialized_end = 6540
+    _globals["_MT5SERVICE"]._serialized_start = 6543
+    _globals["_MT5SERVICE"]._serialized_end = 8963
 # @@protoc_insertion_point(module_scope)
@@ -99,6 +99,12 @@ class MT5ServiceStub(object):
             response_deserializer=mt5__pb2.ModelsResponse.FromString,
             _registered_method=True,
         )
+        self.GetBridgeMetrics = channel.unary_unary(
+            "/mt5.MT5Service/GetBridgeMetrics",
+            request_serializer=mt5__pb2.Empty.SerializeToString,
+            response_deserializer=mt5__pb2.DictData.FromString,
+            _registered_method=True,
+        )
         self.TerminalInfo = channel.unary_unary(
             "/mt5.MT5Service/TerminalInfo",
             request_serializer=mt5__pb2.Empty.SerializeToString,
@@ -147,12 +153,36 @@ class MT5ServiceStub(object):
             response_deserializer=mt5__pb2.DictData.FromString,
             _registered_method=True,
         )
+        self.SymbolInfoTyped = channel.unary_unary(
+            "/mt5.MT5Service/SymbolInfoTyped",
+            request_serializer=mt5__pb2.SymbolRequest.SerializeToString,
+            response_deserializer=mt5__pb2.SymbolInfoResponse.FromString,
+            _registered_method=True,
+        )
+        self.SymbolInfoTickTyped = channel.unary_unary(
+            "/mt5.MT5Service/SymbolInfoTickTyped",
+            request_serializer=mt5__pb2.SymbolRequest.SerializeToString,
+            response_deserializer=mt5__pb2.TickResponse.FromString,
+            _registered_method=True,
+        )
         self.SymbolSelect = channel.unary_unary(
             "/mt5.MT5Service/SymbolSelect",
             request_serializer=mt5__pb2.SymbolSelectRequest.SerializeToString,
             response_deserializer=mt5__pb2.BoolResponse.FromString,
             _registered_method=True,
         )
+        self.SubscribeTicks = channel.unary_stream(
+            "/mt5.MT5Service/SubscribeTicks",
+            request_serializer=mt5__pb2.TickSubscribeRequest.SerializeToString,
+            response_deserializer=mt5__pb2.TickUpdate.FromString,
+            _registered_method=True,
+        )
+        self.SubscribeBook = channel.unary_stream(
+            "/mt5.MT5Service/SubscribeBook",
+            request_serializer=mt5__pb2.BookSubscribeRequest.SerializeToString,
+            response_deserializer=mt5__pb2.BookUpdate.FromString,
+            _registered_method=True,
+        )
         self.CopyRatesFrom = channel.unary_unary(
             "/mt5.MT5Service/CopyRatesFrom",
             request_serializer=mt5__pb2.CopyRatesRequest.SerializeToString,
@@ -207,6 +237,12 @@ class MT5ServiceStub(object):
             response_deserializer=mt5__pb2.DictData.FromString,
             _registered_method=True,
         )
+        self.OrderSendBatch = channel.unary_stream(
+            "/mt5.MT5Service/OrderSendBatch",
+            request_serializer=mt5__pb2.OrderBatchRequest.SerializeToString,
+            response_deserializer=mt5__pb2.OrderBatchResult.FromString,
+            _registered_method=True,
+        )
         self.PositionsTotal = channel.unary_unary(
             "/mt5.MT5Service/PositionsTotal",
             request_serializer=mt5__pb2.Empty.SerializeToString,
@@ -273,6 +309,12 @@ class MT5ServiceStub(object):
             response_deserializer=mt5__pb2.BoolResponse.FromString,
             _registered_method=True,
         )
+        self.Batch = channel.unary_unary(
+            "/mt5.MT5Service/Batch",
+            request_serializer=mt5__pb2.BatchRequest.SerializeToString,
+            response_deserializer=mt5__pb2.BatchResponse.FromString,
+            _registered_method=True,
+        )
 
 
 class MT5ServiceServicer(object):
@@ -336,6 +378,12 @@ class MT5ServiceServicer(object):
         context.set_details("Method not implemented!")
         raise NotImplementedError("Method not implemented!")
 
+    def GetBridgeMetrics(self, request, context):
+        """Diagnostics (bridge runtime metrics, JSON)"""
+        context.set_code(grpc.StatusCode.UNIMPLEMENTED)
+        context.set_details("Method not implemented!")
+        raise NotImplementedError("Method not implemented!")
+
     def TerminalInfo(self, request, context):
         """Account/Terminal info"""
         context.set_code(grpc.StatusCode.UNIMPLEMENTED)
@@ -384,12 +432,36 @@ class MT5ServiceServicer(object):
         context.set_details("Method not implemented!")
         raise NotImplementedError("Method not implemented!")
 
+    def SymbolInfoTyped(self, request, context):
+        """Missing associated documentation comment in .proto file."""
+        context.set_code(grpc.StatusCode.UNIMPLEMENTED)
+        context.set_details("Method not implemented!")
+        raise NotImplementedError("Method not implemented!")
+
+    def SymbolInfoTickTyped(self, request, context):
+        """Missing associated documentation comment in .proto file."""
+        context.set_code(grpc.StatusCode.UNIMPLEMENTED)
+        context.set_details("Method not implemented!")
+        raise NotImplementedError("Method not implemented!")
+
     def SymbolSelect(self, request, context):
         """Missing associated documentation comment in .proto file."""
         context.set_code(grpc.StatusCode.UNIMPLEMENTED)
         context.set_details("Method not implemented!")
         raise NotImplementedError("Method not implemented!")
 
+    def SubscribeTicks(self, request, context):
+        """Missing associated documentation comment in .proto file."""
+        context.set_code(grpc.StatusCode.UNIMPLEMENTED)
+        context.set_details("Method not implemented!")
+        raise NotImplementedError("Method not implemented!")
+
+    def SubscribeBook(self, request, context):
+        """Missing associated documentation comment in .proto file."""
+        context.set_code(grpc.StatusCode.UNIMPLEMENTED)
+        context.set_details("Method not implemented!")
+        raise NotImplementedError("Method not implemented!")
+
     def CopyRatesFrom(self, request, context):
         """Market data - returns numpy arrays as bytes"""
         context.set_code(grpc.StatusCode.UNIMPLEMENTED)
@@ -444,6 +516,12 @@ class MT5ServiceServicer(object):
         context.set_details("Method not implemented!")
         raise NotImplementedError("Method not implemented!")
 
+    def OrderSendBatch(self, request, context):
+        """Missing associated documentation comment in .proto file."""
+        context.set_code(grpc.StatusCode.UNIMPLEMENTED)
+        context.set_details("Method not implemented!")
+        raise NotImplementedError("Method not implemented!")
+
     def PositionsTotal(self, request, context):
         """Position operations"""
         context.set_code(grpc.StatusCode.UNIMPLEMENTED)
@@ -510,6 +588,12 @@ class MT5ServiceServicer(object):
         context.set_details("Method not implemented!")
         raise NotImplementedError("Method not implemented!")
 
+    def Batch(self, request, context):
+        """Pipelined reads (several read RPCs executed back-to-back)"""
+        context.set_code(grpc.StatusCode.UNIMPLEMENTED)
+        context.set_details("Method not implemented!")
+        raise NotImplementedError("Method not implemented!")
+
 
 def add_MT5ServiceServicer_to_server(servicer, server):
     rpc_method_handlers = {
@@ -558,6 +642,11 @@ def add_MT5ServiceServicer_to_server(servicer, server):
             request_deserializer=mt5__pb2.Empty.FromString,
             response_serializer=mt5__pb2.ModelsResponse.SerializeToString,
         ),
+        "GetBridgeMetrics": grpc.unary_unary_rpc_method_handler(
+            servicer.GetBridgeMetrics,
+            request_deserializer=mt5__pb2.Empty.FromString,
+            response_serializer=mt5__pb2.DictData.SerializeToString,
+        ),
         "TerminalInfo": grpc.unary_unary_rpc_method_handler(
             servicer.TerminalInfo,
             request_deserializer=mt5__pb2.Empty.FromString,
@@ -598,11 +687,31 @@ def add_MT5ServiceServicer_to_server(servicer, server):
             request_deserializer=mt5__pb2.SymbolRequest.FromString,
             response_serializer=mt5__pb2.DictData.SerializeToString,
         ),
+        "SymbolInfoTyped": grpc.unary_unary_rpc_method_handler(
+            servicer.SymbolInfoTyped,
+            request_deserializer=mt5__pb2.SymbolRequest.FromString,
+            response_serializer=mt5__pb2.SymbolInfoResponse.SerializeToString,
+        ),
+        "SymbolInfoTickTyped": grpc.unary_unary_rpc_method_handler(
+            servicer.SymbolInfoTickTyped,
+            request_deserializer=mt5__pb2.SymbolRequest.FromString,
+            response_serializer=mt5__pb2.TickResponse.SerializeToString,
+        ),
         "SymbolSelect": grpc.unary_unary_rpc_method_handler(
             servicer.SymbolSelect,
             request_deserializer=mt5__pb2.SymbolSelectRequest.FromString,
             response_serializer=mt5__pb2.BoolResponse.SerializeToString,
         ),
+        "SubscribeTicks": grpc.unary_stream_rpc_method_handler(
+            servicer.SubscribeTicks,
+            request_deserializer=mt5__pb2.TickSubscribeRequest.FromString,
+            response_serializer=mt5__pb2.TickUpdate.SerializeToString,
+        ),
+        "SubscribeBook": grpc.unary_stream_rpc_method_handler(
+            servicer.SubscribeBook,
+            request_deserializer=mt5__pb2.BookSubscribeRequest.FromString,
+            response_serializer=mt5__pb2.BookUpdate.SerializeToString,
+        ),
         "CopyRatesFrom": grpc.unary_unary_rpc_method_handler(
             servicer.CopyRatesFrom,
             request_deserializer=mt5__pb2.CopyRatesRequest.FromString,
@@ -648,6 +757,11 @@ def add_MT5ServiceServicer_to_server(servicer, server):
             request_deserializer=mt5__pb2.OrderRequest.FromString,
             response_serializer=mt5__pb2.DictData.SerializeToString,
         ),
+        "OrderSendBatch": grpc.unary_stream_rpc_method_handler(
+            servicer.OrderSendBatch,
+            request_deserializer=mt5__pb2.OrderBatchRequest.FromString,
+            response_serializer=mt5__pb2.OrderBatchResult.SerializeToString,
+        ),
         "PositionsTotal": grpc.unary_unary_rpc_method_handler(
             servicer.PositionsTotal,
             request_deserializer=mt5__pb2.Empty.FromString,
@@ -703,6 +817,11 @@ def add_MT5ServiceServicer_to_server(servicer, server):
             request_deserializer=mt5__pb2.SymbolRequest.FromString,
             response_serializer=mt5__pb2.BoolResponse.SerializeToString,
         ),
+        "Batch": grpc.unary_unary_rpc_method_handler(
+            servicer.Batch,
+            request_deserializer=mt5__pb2.BatchRequest.FromString,
+            response_serializer=mt5__pb2.BatchResponse.SerializeToString,
+        ),
     }
     generic_handler = grpc.method_handlers_generic_handler(
         "mt5.MT5Service", rpc_method_handlers
@@ -989,6 +1108,36 @@ class MT5Service(object):
             _registered_method=True,
         )
 
+    @staticmethod
+    def GetBridgeMetrics(
+        request,
+        target,
+        options=(),
+        channel_credentials=None,
+        call_credentials=None,
+        insecure=False,
+        compression=None,
+        wait_for_ready=None,
+        timeout=None,
+        metadata=None,
+    ):
+        return grpc.experimental.unary_unary(
+            request,
+            target,
+            "/mt5.MT5Service/GetBridgeMetrics",
+            mt5__pb2.Empty.SerializeToString,
+            mt5__pb2.DictData.FromString,
+            options,
+            channel_credentials,
+            insecure,
+            call_credentials,
+            compression,
+            wait_for_ready,
+            timeout,
+            metadata,
+            _registered_method=True,
+        )
+
     @staticmethod
     def TerminalInfo(
         request,
@@ -1229,6 +1378,66 @@ class MT5Service(object):
             _registered_method=True,
         )
 
+    @staticmethod
+    def SymbolInfoTyped(
+        request,
+        target,
+        options=(),
+        channel_credentials=None,
+        call_credentials=None,
+        insecure=False,
+        compression=None,
+        wait_for_ready=None,
+        timeout=None,
+        metadata=None,
+    ):
+        return grpc.experimental.unary_unary(
+            request,
+            target,
+            "/mt5.MT5Service/SymbolInfoTyped",
+            mt5__pb2.SymbolRequest.SerializeToString,
+            mt5__pb2.SymbolInfoResponse.FromString,
+            options,
+            channel_credentials,
+            insecure,
+            call_credentials,
+            compression,
+            wait_for_ready,
+            timeout,
+            metadata,
+            _registered_method=True,
+        )
+
+    @staticmethod
+    def SymbolInfoTickTyped(
+        request,
+        target,
+        options=(),
+        channel_credentials=None,
+        call_credentials=None,
+        insecure=False,
+        compression=None,
+        wait_for_ready=None,
+        timeout=None,
+        metadata=None,
+    ):
+        return grpc.experimental.unary_unary(
+            request,
+            target,
+            "/mt5.MT5Service/SymbolInfoTickTyped",
+            mt5__pb2.SymbolRequest.SerializeToString,
+            mt5__pb2.TickResponse.FromString,
+            options,
+            channel_credentials,
+            insecure,
+            call_credentials,
+            compression,
+            wait_for_ready,
+            timeout,
+            metadata,
+            _registered_method=True,
+        )
+
     @staticmethod
     def SymbolSelect(
         request,
@@ -1259,6 +1468,66 @@ class MT5Service(object):
             _registered_method=True,
         )
 
+    @staticmethod
+    def SubscribeTicks(
+        request,
+        target,
+        options=(),
+        channel_credentials=None,
+        call_credentials=None,
+        insecure=False,
+        compression=None,
+        wait_for_ready=None,
+        timeout=None,
+        metadata=None,
+    ):
+        return grpc.experimental.unary_stream(
+            request,
+            target,
+            "/mt5.MT5Service/SubscribeTicks",
+            mt5__pb2.TickSubscribeRequest.SerializeToString,
+            mt5__pb2.TickUpdate.FromString,
+            options,
+            channel_credentials,
+            insecure,
+            call_credentials,
+            compression,
+            wait_for_ready,
+            timeout,
+            metadata,
+            _registered_method=True,
+        )
+
+    @staticmethod
+    def SubscribeBook(
+        request,
+        target,
+        options=(),
+        channel_credentials=None,
+        call_credentials=None,
+        insecure=False,
+        compression=None,
+        wait_for_ready=None,
+        timeout=None,
+        metadata=None,
+    ):
+        return grpc.experimental.unary_stream(
+            request,
+            target,
+            "/mt5.MT5Service/SubscribeBook",
+            mt5__pb2.BookSubscribeRequest.SerializeToString,
+            mt5__pb2.BookUpdate.FromString,
+            options,
+            channel_credentials,
+            insecure,
+            call_credentials,
+            compression,
+            wait_for_ready,
+            timeout,
+            metadata,
+            _registered_method=True,
+        )
+
     @staticmethod
     def CopyRatesFrom(
         request,
@@ -1529,6 +1798,36 @@ class MT5Service(object):
             _registered_method=True,
         )
 
+    @staticmethod
+    def OrderSendBatch(
+        request,
+        target,
+        options=(),
+        channel_credentials=None,
+        call_credentials=None,
+        insecure=False,
+        compression=None,
+        wait_for_ready=None,
+        timeout=None,
+        metadata=None,
+    ):
+        return grpc.experimental.unary_stream(
+            request,
+            target,
+            "/mt5.MT5Service/OrderSendBatch",
+            mt5__pb2.OrderBatchRequest.SerializeToString,
+            mt5__pb2.OrderBatchResult.FromString,
+            options,
+            channel_credentials,
+            insecure,
+            call_credentials,
+            compression,
+            wait_for_ready,
+            timeout,
+            metadata,
+            _registered_method=True,
+        )
+
     @staticmethod
     def PositionsTotal(
         request,
@@ -1858,3 +2157,33 @@ class MT5Service(object):
             metadata,
             _registered_method=True,
         )
+
+    @staticmethod
+    def Batch(
+        request,
+        target,
+        options=(),
+        channel_credentials=None,
+        call_credentials=None,
+        insecure=False,
+        compression=None,
+        wait_for_ready=None,
+        timeout=None,
+        metadata=None,
+    ):
+        return grpc.experimental.unary_unary(
+            request,
+            target,
+            "/mt5.MT5Service/Batch",
+            mt5__pb2.BatchRequest.SerializeToString,
+            mt5__pb2.BatchResponse.FromString,
+            options,
+            channel_credentials,
+            insecure,
+            call_credentials,
+            compression,
+            wait_for_ready,
+            timeout,
+            metadata,
+            _registered_method=True,
+        )
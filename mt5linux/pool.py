@@ -0,0 +1,571 @@
+"""Sharded pool of async MT5 clients for mt5linux.
+
+One bridge serves one Wine terminal, so a single AsyncMetaTrader5 is capped
+at what that terminal can answer. MT5Pool spreads calls over several
+bridges logged into the same or different accounts:
+
+- Market data reads (symbol info, ticks, rates) go to the member with the
+  fewest outstanding calls, or - with pool_routing="symbol_hash" - to the
+  member owning the symbol on a consistent-hash ring.
+- Account calls (account_info, positions, orders, history, order_check,
+  order_send) are pinned to a terminal logged into that account.
+- Members that are disconnected or whose circuit breaker is open are
+  skipped; reads fail over to the next member. Disconnected members are
+  reconnected in the background every pool_reconnect_interval seconds,
+  and open circuits half-open after cb_recovery.
+
+Example:
+    >>> pool = MT5Pool.from_endpoints([("mt5-a", 8001), ("mt5-b", 8001)])
+    >>> async with pool:
+    ...     tick = await pool.symbol_info_tick("EURUSD")
+    ...     result = await pool.order_send(request, login=12345)
+
+Hierarchy Level: 4
+- Imports: AsyncMetaTrader5, MT5Settings, MT5Types, MT5Utilities
+- Used by: applications running several mt5docker containers
+
+"""
+
+from __future__ import annotations
+
+import asyncio
+import bisect
+import hashlib
+import logging
+import time
+from contextlib import suppress
+from typing import TYPE_CHECKING, Self
+
+from mt5linux.async_client import AsyncMetaTrader5
+from mt5linux.settings import MT5Settings
+from mt5linux.utilities import MT5Utilities as u
+
+if TYPE_CHECKING:
+    from collections.abc import Awaitable, Callable, Sequence
+    from datetime import datetime
+
+    import numpy as np
+    from numpy.typing import NDArray
+
+    from mt5linux.models import MT5Models
+    from mt5linux.types import MT5Types as t
+
+log = logging.getLogger(__name__)
+
+
+def _ring_hash(key: str) -> int:
+    """Stable 64-bit hash for the consistent-hash ring."""
+    return int.from_bytes(hashlib.blake2b(key.encode(), digest_size=8).digest())
+
+
+class PoolMember:
+    """One pool member: a client, the account it serves and its load."""
+
+    def __init__(
+        self, client: AsyncMetaTrader5, name: str, login: int | None = None
+    ) -> None:
+        """Initialize a member.
+
+        Args:
+            client: Client connected to this member's bridge.
+            name: Member name for logs and status (host:port by default).
+            login: Account the terminal is logged into (None = discover
+                with account_info on connect).
+
+        """
+        self.client = client
+        self.name = name
+        self.login = login
+        self.outstanding = 0
+        self.requests = 0
+        # Earliest time.monotonic() of the next reconnect attempt
+        self.retry_at = 0.0
+
+    @property
+    def available(self) -> bool:
+        """Connected and circuit breaker not open."""
+        return self.client.is_available
+
+    def get_status(self) -> dict[str, object]:
+        """Get member status for monitoring.
+
+        Returns:
+            Name, login, availability, load counters and circuit state.
+
+        """
+        return {
+            "name": self.name,
+            "login": self.login,
+            "available": self.available,
+            "outstanding": self.outstanding,
+            "requests": self.requests,
+            "circuit": self.client.circuit_status,
+            "queue": self.client.queue_status,
+        }
+
+
+class MT5Pool:
+    """Route MT5 calls over several bridges (one terminal each).
+
+    Usage:
+        async with MT5Pool([client_a, client_b], routing="symbol_hash") as pool:
+            rates = await pool.copy_rates_from_pos("EURUSD", 16385, 0, 500)
+            positions = await pool.positions_get(login=12345)
+
+    """
+
+    def __init__(
+        self,
+        clients: Sequence[AsyncMetaTrader5],
+        *,
+        logins: Sequence[int | None] | None = None,
+        names: Sequence[str] | None = None,
+        routing: t.PoolRouting | None = None,
+        config: MT5Settings | None = None,
+    ) -> None:
+        """Initialize the pool.
+
+        Args:
+            clients: One client per bridge.
+            logins: Account per client (None entries are discovered with
+                account_info on connect).
+            names: Member names (default member-<index>).
+            routing: Read routing (default: pool_routing setting).
+            config: Settings for defaults (default: MT5Settings()).
+
+        Raises:
+            ValueError: If clients is empty or logins/names lengths differ.
+
+        """
+        if not clients:
+            msg = "MT5Pool needs at least one client"
+            raise ValueError(msg)
+        if (logins is not None and len(logins) != len(clients)) or (
+            names is not None and len(names) != len(clients)
+        ):
+            msg = "logins and names must match clients one to one"
+            raise ValueError(msg)
+        settings = config or MT5Settings()
+        self._routing: t.PoolRouting = routing or settings.pool_routing
+        self._reconnect_interval = settings.pool_reconnect_interval
+        self._reconnects: dict[str, asyncio.Task[None]] = {}
+        self._members = tuple(
+            PoolMember(
+                client,
+                names[i] if names is not None else f"member-{i}",
+                logins[i] if logins is not None else None,
+            )
+            for i, client in enumerate(clients)
+        )
+        ring = sorted(
+            (_ring_hash(f"{member.name}#{replica}"), index)
+            for index, member in enumerate(self._members)
+            for replica in range(max(settings.pool_hash_replicas, 1))
+        )
+        self._ring_keys = [key for key, _ in ring]
+        self._ring_members = [index for _, index in ring]
+
+    @classmethod
+    def from_endpoints(
+        cls,
+        endpoints: Sequence[tuple[str, int]],
+        *,
+        logins: Sequence[int | None] | None = None,
+        routing: t.PoolRouting | None = None,
+        config: MT5Settings | None = None,
+    ) -> MT5Pool:
+        """Create a pool with one new client per (host, port) bridge.
+
+        Args:
+            endpoints: Bridge addresses.
+            logins: Account per endpoint (None = discover on connect).
+            routing: Read routing (default: pool_routing setting).
+            config: Settings for the pool and its clients (default:
+                MT5Settings()).
+
+        Returns:
+            Pool (not yet connected).
+
+        """
+        return cls(
+            [
+                AsyncMetaTrader5(host=host, port=port, config=config)
+                for host, port in endpoints
+            ],
+            logins=logins,
+            names=[f"{host}:{port}" for host, port in endpoints],
+            routing=routing,
+            config=config,
+        )
+
+    @property
+    def members(self) -> tuple[PoolMember, ...]:
+        """Pool members in construction order."""
+        return self._members
+
+    async def __aenter__(self) -> Self:
+        """Connect all members."""
+        await self.connect()
+        return self
+
+    async def __aexit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc_val: BaseException | None,
+        exc_tb: object,
+    ) -> None:
+        """Disconnect all members."""
+        await self.disconnect()
+
+    async def connect(self) -> None:
+        """Connect all members and discover their accounts.
+
+        Members that fail to connect stay in the pool as unavailable and
+        are reconnected in the background (pool_reconnect_interval).
+
+        Raises:
+            ConnectionError: If no member could be connected.
+
+        """
+        results = await asyncio.gather(
+            *(member.client.connect() for member in self._members),
+            return_exceptions=True,
+        )
+        for member, result in zip(self._members, results, strict=True):
+            if isinstance(result, BaseException):
+                log.warning("Pool member %s failed to connect: %s", member.name, result)
+                # Reset the partial connection so a later connect() starts over
+                with suppress(Exception):
+                    await member.client.disconnect()
+                member.retry_at = time.monotonic() + self._reconnect_interval
+        if not any(member.client.is_connected for member in self._members):
+            msg = "MT5Pool: no member could be connected"
+            raise ConnectionError(msg)
+        try:
+            await self.refresh_accounts()
+        except BaseException:
+            await self.disconnect()
+            raise
+
+    async def refresh_accounts(self) -> None:
+        """Discover the logged-in account of members without a login.
+
+        A member whose account_info fails keeps login None and is not used
+        for account calls until a later refresh succeeds.
+        """
+        pending = [m for m in self._members if m.login is None and m.available]
+        results = await asyncio.gather(
+            *(member.client.account_info() for member in pending),
+            return_exceptions=True,
+        )
+        for member, result in zip(pending, results, strict=True):
+            if isinstance(result, BaseException):
+                log.warning(
+                    "Pool member %s: account_info failed: %s", member.name, result
+                )
+            elif result is not None:
+                member.login = result.login
+
+    async def disconnect(self) -> None:
+        """Disconnect all members."""
+        for task in self._reconnects.values():
+            task.cancel()
+        await asyncio.gather(*self._reconnects.values(), return_exceptions=True)
+        self._reconnects.clear()
+        await asyncio.gather(
+            *(member.client.disconnect() for member in self._members),
+            return_exceptions=True,
+        )
+
+    def get_status(self) -> dict[str, object]:
+        """Get pool status for monitoring.
+
+        Returns:
+            Routing mode and per-member status.
+
+        """
+        return {
+            "routing": self._routing,
+            "members": [member.get_status() for member in self._members],
+        }
+
+    # =========================================================================
+    # ROUTING
+    # =========================================================================
+
+    def _revive(self) -> None:
+        """Start background reconnects of members that are not connected."""
+        if self._reconnect_interval <= 0:
+            return
+        now = time.monotonic()
+        for member in self._members:
+            if (
+                member.client.is_connected
+                or member.name in self._reconnects
+                or now < member.retry_at
+            ):
+                continue
+            member.retry_at = now + self._reconnect_interval
+            self._reconnects[member.name] = asyncio.create_task(self._reconnect(member))
+
+    async def _reconnect(self, member: PoolMember) -> None:
+        """Reconnect a member and discover its account."""
+        try:
+            await member.client.connect()
+        except Exception as e:  # noqa: BLE001 - retried after the interval
+            log.warning("Pool member %s failed to reconnect: %s", member.name, e)
+            with suppress(Exception):
+                await member.client.disconnect()
+            return
+        finally:
+            self._reconnects.pop(member.name, None)
+        log.info("Pool member %s reconnected", member.name)
+        if member.login is None:
+            await self.refresh_accounts()
+
+    def _least_outstanding(self, candidates: Sequence[PoolMember]) -> PoolMember:
+        """Pick the member with the fewest in-flight (then total) calls."""
+        return min(candidates, key=lambda m: (m.outstanding, m.requests))
+
+    def pick(
+        self, symbol: str | None = None, *, exclude: frozenset[str] = frozenset()
+    ) -> PoolMember:
+        """Choose the member for a market data read.
+
+        Args:
+            symbol: Symbol the read is about (used by symbol_hash routing).
+            exclude: Member names already tried (failover).
+
+        Returns:
+            Available member.
+
+        Raises:
+            ConnectionError: If no member is available.
+
+        """
+        candidates = [m for m in self._members if m.available and m.name not in exclude]
+        if not candidates:
+            msg = "MT5Pool: no available member"
+            raise ConnectionError(msg)
+        if self._routing != "symbol_hash" or symbol is None:
+            return self._least_outstanding(candidates)
+        # Walk the ring clockwise to the first available member
+        start = bisect.bisect(self._ring_keys, _ring_hash(symbol))
+        size = len(self._ring_members)
+        for step in range(size):
+            member = self._members[self._ring_members[(start + step) % size]]
+            if member in candidates:
+                return member
+        return self._least_outstanding(candidates)
+
+    def owner(self, login: int | None = None) -> PoolMember:
+        """Choose the member serving an account (for account calls/orders).
+
+        Args:
+            login: Account number; None when all members share one account.
+
+        Members whose account is unknown (discovery failed) are never
+        chosen.
+
+        Returns:
+            Available member logged into the account (least loaded if
+            several terminals serve it).
+
+        Raises:
+            ValueError: If login is None but members serve several accounts.
+            ConnectionError: If no member has a known account or no
+                available member serves the account.
+
+        """
+        if login is None:
+            logins = {m.login for m in self._members if m.login is not None}
+            if len(logins) > 1:
+                msg = "MT5Pool serves several accounts - pass login="
+                raise ValueError(msg)
+            if not logins:
+                msg = "MT5Pool: no member has a known account login"
+                raise ConnectionError(msg)
+            login = logins.pop()
+        candidates = [m for m in self._members if m.available and m.login == login]
+        if not candidates:
+            msg = f"MT5Pool: no available member for account {login}"
+            raise ConnectionError(msg)
+        return self._least_outstanding(candidates)
+
+    async def _dispatch[T](
+        self,
+        member: PoolMember,
+        call: Callable[[AsyncMetaTrader5], Awaitable[T]],
+    ) -> T:
+        """Run a call on a member, tracking its outstanding count."""
+        member.outstanding += 1
+        member.requests += 1
+        try:
+            return await call(member.client)
+        finally:
+            member.outstanding -= 1
+
+    async def read[T](
+        self,
+        call: Callable[[AsyncMetaTrader5], Awaitable[T]],
+        *,
+        symbol: str | None = None,
+    ) -> T:
+        """Run an account-independent read on a routed member.
+
+        A member failing with ConnectionError (circuit open, terminal
+        unavailable) or exhausting its retries is skipped and the read is
+        retried on the next one.
+
+        Args:
+            call: Receives the member client and performs the read.
+            symbol: Symbol the read is about (symbol_hash routing).
+
+        Returns:
+            Result of the call.
+
+        Raises:
+            ConnectionError: If no member is left to try.
+
+        """
+        self._revive()
+        tried: frozenset[str] = frozenset()
+        while True:
+            member = self.pick(symbol, exclude=tried)
+            try:
+                return await self._dispatch(member, call)
+            except (ConnectionError, u.Exceptions.MaxRetriesError) as e:
+                log.warning("Pool read failed on %s, failing over: %s", member.name, e)
+                tried |= {member.name}
+
+    async def on_account[T](
+        self,
+        call: Callable[[AsyncMetaTrader5], Awaitable[T]],
+        *,
+        login: int | None = None,
+    ) -> T:
+        """Run a call on the terminal logged into an account.
+
+        Never fails over to another account's terminal. If no member is
+        known to serve the account, members without a login are asked for
+        theirs once before giving up.
+
+        Args:
+            call: Receives the member client and performs the call.
+            login: Account number (None when the pool serves one account).
+
+        Returns:
+            Result of the call.
+
+        """
+        self._revive()
+        try:
+            member = self.owner(login)
+        except ConnectionError:
+            if not any(m.login is None and m.available for m in self._members):
+                raise
+            await self.refresh_accounts()
+            member = self.owner(login)
+        return await self._dispatch(member, call)
+
+    # =========================================================================
+    # MARKET DATA (routed reads)
+    # =========================================================================
+
+    async def symbol_info(self, symbol: str) -> MT5Models.SymbolInfo | None:
+        """Get symbol information from a routed member."""
+        return await self.read(lambda c: c.symbol_info(symbol), symbol=symbol)
+
+    async def symbol_info_tick(self, symbol: str) -> MT5Models.Tick | None:
+        """Get the current tick from a routed member."""
+        return await self.read(lambda c: c.symbol_info_tick(symbol), symbol=symbol)
+
+    async def copy_rates_from_pos(
+        self, symbol: str, timeframe: int, start_pos: int, count: int
+    ) -> NDArray[np.void] | None:
+        """Copy OHLCV bars by position from a routed member."""
+        return await self.read(
+            lambda c: c.copy_rates_from_pos(symbol, timeframe, start_pos, count),
+            symbol=symbol,
+        )
+
+    async def copy_rates_range(
+        self,
+        symbol: str,
+        timeframe: int,
+        date_from: datetime | int,
+        date_to: datetime | int,
+    ) -> NDArray[np.void] | None:
+        """Copy OHLCV bars in a date range from a routed member."""
+        return await self.read(
+            lambda c: c.copy_rates_range(symbol, timeframe, date_from, date_to),
+            symbol=symbol,
+        )
+
+    async def copy_ticks_from(
+        self, symbol: str, date_from: datetime | int, count: int, flags: int
+    ) -> NDArray[np.void] | None:
+        """Copy ticks from a date from a routed member."""
+        return await self.read(
+            lambda c: c.copy_ticks_from(symbol, date_from, count, flags),
+            symbol=symbol,
+        )
+
+    async def copy_ticks_range(
+        self,
+        symbol: str,
+        date_from: datetime | int,
+        date_to: datetime | int,
+        flags: int,
+    ) -> NDArray[np.void] | None:
+        """Copy ticks in a date range from a routed member."""
+        return await self.read(
+            lambda c: c.copy_ticks_range(symbol, date_from, date_to, flags),
+            symbol=symbol,
+        )
+
+    # =========================================================================
+    # ACCOUNT CALLS (pinned to the account's terminal)
+    # =========================================================================
+
+    async def account_info(
+        self, *, login: int | None = None
+    ) -> MT5Models.AccountInfo | None:
+        """Get account information from the account's terminal."""
+        return await self.on_account(lambda c: c.account_info(), login=login)
+
+    async def positions_get(
+        self, symbol: str | None = None, *, login: int | None = None
+    ) -> tuple[MT5Models.Position, ...] | None:
+        """Get open positions of an account."""
+        return await self.on_account(lambda c: c.positions_get(symbol), login=login)
+
+    async def orders_get(
+        self, symbol: str | None = None, *, login: int | None = None
+    ) -> tuple[MT5Models.Order, ...] | None:
+        """Get pending orders of an account."""
+        return await self.on_account(lambda c: c.orders_get(symbol), login=login)
+
+    async def history_deals_get(
+        self,
+        date_from: datetime | int | None = None,
+        date_to: datetime | int | None = None,
+        *,
+        login: int | None = None,
+    ) -> tuple[MT5Models.Deal, ...] | None:
+        """Get historical deals of an account."""
+        return await self.on_account(
+            lambda c: c.history_deals_get(date_from, date_to), login=login
+        )
+
+    async def order_check(
+        self, request: dict[str, t.JSONValue], *, login: int | None = None
+    ) -> MT5Models.OrderCheckResult | None:
+        """Check an order on the account's terminal."""
+        return await self.on_account(lambda c: c.order_check(request), login=login)
+
+    async def order_send(
+        self, request: dict[str, t.JSONValue], *, login: int | None = None
+    ) -> MT5Models.OrderResult | None:
+        """Send an order through the account's terminal (never failed over)."""
+        return await self.on_account(lambda c: c.order_send(request), login=login)
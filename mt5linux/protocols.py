@@ -29,12 +29,13 @@ from __future__ import annotations
 from typing import TYPE_CHECKING, Protocol, runtime_checkable
 
 if TYPE_CHECKING:
-    from collections.abc import Callable
-    from datetime import datetime
+    from collections.abc import AsyncIterator, Callable, Sequence
+    from datetime import datetime, timedelta
 
     import numpy as np
     from numpy.typing import NDArray
 
+    from mt5linux.async_client import AsyncMT5Batch
     from mt5linux.models import MT5Models
 
 # Type alias for JSON values (single source of truth)
@@ -913,6 +914,156 @@ class AsyncMT5Protocol(Protocol):
         """
         ...
 
+    def subscribe_ticks(
+        self,
+        symbols: str | Sequence[str],
+        *,
+        interval_ms: int | None = None,
+    ) -> AsyncIterator[tuple[str, MT5Models.Tick]]:
+        """Stream tick updates for one or more symbols.
+
+        Server pushes only ticks whose time_msc changed (no per-tick RPC).
+
+        Args:
+            symbols: Symbol name or sequence of symbol names.
+            interval_ms: Server poll interval in milliseconds.
+
+        Returns:
+            Async iterator of (symbol, Tick) tuples.
+
+        """
+        ...
+
+    def subscribe_book(
+        self,
+        symbols: str | Sequence[str],
+        *,
+        interval_ms: int | None = None,
+    ) -> AsyncIterator[tuple[str, NDArray[np.void]]]:
+        """Stream market depth for one or more symbols.
+
+        Server pushes one snapshot, then only changed levels; the book is
+        rebuilt client-side.
+
+        Args:
+            symbols: Symbol name or sequence of symbol names.
+            interval_ms: Server snapshot interval in milliseconds.
+
+        Returns:
+            Async iterator of (symbol, book array) tuples.
+
+        """
+        ...
+
+    def invalidate_symbol(self, symbol: str | None = None) -> None:
+        """Drop cached symbol metadata.
+
+        Args:
+            symbol: Symbol to drop; None clears the whole symbol cache.
+
+        """
+        ...
+
+    async def refresh_symbols(
+        self, group: str | None = None
+    ) -> tuple[MT5Models.SymbolInfo, ...] | None:
+        """Reload symbols from the terminal, bypassing the symbol cache.
+
+        Args:
+            group: Optional group filter pattern.
+
+        Returns:
+            Tuple of SymbolInfo objects or None.
+
+        """
+        ...
+
+    def invalidate_rates(
+        self, symbol: str | None = None, timeframe: int | None = None
+    ) -> None:
+        """Drop cached OHLCV bars.
+
+        Args:
+            symbol: Symbol to drop (None = all symbols).
+            timeframe: Timeframe to drop (None = all timeframes).
+
+        """
+        ...
+
+    def clear_history_store(
+        self, kind: str | None = None, symbol: str | None = None
+    ) -> None:
+        """Delete persisted history.
+
+        Args:
+            kind: "ticks" or "rates" (None = both).
+            symbol: Symbol to delete (None = all symbols).
+
+        """
+        ...
+
+    def iter_ticks(
+        self,
+        symbol: str,
+        date_from: datetime | int,
+        date_to: datetime | int,
+        flags: int = ...,
+        *,
+        chunk: timedelta | int | None = None,
+    ) -> AsyncIterator[NDArray[np.void]]:
+        """Download a large tick range as time-ordered chunks.
+
+        Args:
+            symbol: Symbol name.
+            date_from: Start date as datetime or Unix timestamp.
+            date_to: End date as datetime or Unix timestamp.
+            flags: Copy ticks flags (default COPY_TICKS_ALL).
+            chunk: Window size in seconds.
+
+        Returns:
+            Async iterator of non-empty tick arrays, oldest first.
+
+        """
+        ...
+
+    async def download_ticks(
+        self,
+        symbol: str,
+        date_from: datetime | int,
+        date_to: datetime | int,
+        flags: int = ...,
+        *,
+        chunk: timedelta | int | None = None,
+        on_chunk: Callable[[NDArray[np.void]], object] | None = None,
+    ) -> NDArray[np.void] | None:
+        """Download a large tick range in concurrent chunks.
+
+        Args:
+            symbol: Symbol name.
+            date_from: Start date as datetime or Unix timestamp.
+            date_to: End date as datetime or Unix timestamp.
+            flags: Copy ticks flags (default COPY_TICKS_ALL).
+            chunk: Window size in seconds.
+            on_chunk: Optional per-chunk consumer (nothing is retained).
+
+        Returns:
+            All ticks in time order, or None if empty or on_chunk is given.
+
+        """
+        ...
+
+    def batch(self) -> AsyncMT5Batch:
+        """Start a pipelined read batch.
+
+        Reads queued on the builder are sent as one Batch RPC when its
+        ``async with`` block exits.
+
+        Returns:
+            AsyncMT5Batch builder whose methods return futures.
+
+        """
+        ...
+
 
 # Backwards compatibility aliases (deprecated, will be removed)
 SyncClientProtocol = MT5Protocol
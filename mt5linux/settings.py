@@ -20,6 +20,7 @@ Usage:
 """
 
 import random
+from typing import Literal
 
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
@@ -133,6 +134,16 @@ class MT5Settings(BaseSettings):
     critical_retry_max_delay: float | None = None
     """Max delay for CRITICAL retries. If None, uses retry_max_delay/2."""
 
+    order_batch_rpc: bool = True
+    """Send order_send_batch first attempts through one OrderSendBatch stream.
+
+    WAL logging, verification and retries stay per order; retries use
+    OrderSend. Falls back to OrderSend if the bridge lacks OrderSendBatch.
+    """
+
+    order_batch_linger_ms: float = 2.0
+    """Max wait for the rest of a batch before dispatching the orders ready."""
+
     # =========================================================================
     # RESILIENCE FEATURE FLAGS (enabled by default for production reliability)
     # =========================================================================
@@ -145,15 +156,210 @@ class MT5Settings(BaseSettings):
     enable_circuit_breaker: bool = True
     """Enable circuit breaker pattern for cascading failure prevention."""
 
+    terminal_state_staleness: float = 5.0
+    """Seconds a cached terminal connectivity observation stays valid.
+
+    Within this window the pre-call terminal check is answered from memory;
+    once stale (or after a connectivity error) a live terminal_info probe runs.
+    Set to 0 to probe before every call.
+    """
+
     # =========================================================================
     # REQUEST QUEUE - PARALLEL EXECUTION
     # =========================================================================
     queue_max_concurrent: int = 10
-    """Max SIMULTANEOUS operations executing in parallel (match server workers)."""
+    """Upper bound of the in-flight limit (match server workers).
+
+    The queue starts at this limit and adapts it between queue_min_concurrent
+    and this value from observed latency. Set both bounds equal to fix it.
+    """
+
+    queue_min_concurrent: int = 0
+    """Lower bound of the adaptive in-flight limit (clamped to the maximum).
+
+    0 = a quarter of queue_max_concurrent (at least 1).
+    """
+
+    queue_latency_tolerance: float = 2.0
+    """Latency over an operation's baseline that cuts the in-flight limit.
+
+    A request taking more than this multiple of the fastest recent time of
+    its operation at a similar row count (plus a few milliseconds of jitter
+    slack) signals requests queueing inside the bridge; the limit then
+    shrinks by 10%.
+    """
 
     queue_max_depth: int = 1000
     """Max pending requests before backpressure (raises QueueFullError)."""
 
+    queue_bypass_operations: frozenset[str] = frozenset()
+    """Read operations that skip the queue (no coalescing, no concurrency cap).
+
+    Env: MT5_QUEUE_BYPASS_OPERATIONS='["copy_ticks_range", "last_error"]'
+    """
+
+    # =========================================================================
+    # HEDGED READS (opt-in, tail latency)
+    # =========================================================================
+    hedge_reads: bool = False
+    """Send a duplicate of a slow read and take the first response.
+
+    Applies to read operations with criticality <= NORMAL, never to
+    order_send/order_check. A read is hedged once it has not answered within
+    the hedge_quantile of its recent latencies.
+    """
+
+    hedge_quantile: float = 0.95
+    """Latency quantile (per operation) after which a read is hedged."""
+
+    hedge_min_delay: float = 0.002
+    """Lower bound in seconds on the hedge delay (avoids hedging fast reads)."""
+
+    hedge_min_samples: int = 20
+    """Completed reads of an operation before it is hedged at all."""
+
+    hedge_budget_percent: float = 5.0
+    """Max hedges as a percentage of eligible reads (bounds bridge load)."""
+
+    # =========================================================================
+    # NUMPY RESPONSES
+    # =========================================================================
+    numpy_owned_arrays: bool = False
+    """Return owned, writable copies from copy_rates_*/copy_ticks_*/as_array.
+
+    Default is a read-only zero-copy view over the response bytes; enable
+    when callers mutate the arrays in place.
+    """
+
+    # =========================================================================
+    # RESPONSE MODELS
+    # =========================================================================
+    validate_models: bool = True
+    """Validate bridge responses with pydantic when building models.
+
+    False builds models with model_construct (no checks or coercion), which
+    is much cheaper for large position/order/deal lists. Order results are
+    always validated. Per-call override: validate= on the list getters.
+    """
+
+    validate_models_sample_rate: float = 0.0
+    """Fraction of constructed responses also validated (debug).
+
+    With validate_models=False, sampled responses are validated and compared
+    with the constructed models; mismatches are logged as schema drift.
+    """
+
+    # =========================================================================
+    # TYPED MARKET DATA
+    # =========================================================================
+    typed_market_data: bool = True
+    """Fetch ticks and symbol info as typed protobuf messages.
+
+    symbol_info_tick, symbol_info and subscribe_ticks use the typed bridge
+    RPCs and build models without JSON parsing or re-validation. Bridges
+    without them fall back to the JSON RPCs automatically.
+    """
+
+    # =========================================================================
+    # SYMBOL METADATA CACHE (opt-in)
+    # =========================================================================
+    symbol_cache_ttl: float = 0.0
+    """Seconds symbol_info/symbols_get results are cached (0 disables).
+
+    Contract data (digits, point, volume limits, margin) is served from
+    memory within this window. Use invalidate_symbol()/refresh_symbols()
+    to drop or reload entries explicitly.
+    """
+
+    symbol_cache_quote_ttl: float = 1.0
+    """Seconds cached quote fields (bid/ask/last/volume/time) stay current.
+
+    Past this age a cached symbol_info hit overlays fresh quotes from
+    symbol_info_tick instead of refetching the full symbol. Set it equal
+    to symbol_cache_ttl to never refresh quotes between full fetches.
+    """
+
+    symbol_cache_volatile_ttl: float = 5.0
+    """Max age in seconds of volatile fields a tick does not carry.
+
+    SymbolInfo.VOLATILE_FIELDS that are not quotes (trade_tick_value*,
+    session_*, bidhigh/bidlow, price_change) cannot be overlaid from
+    symbol_info_tick. Past this age since the full fetch, a cached
+    symbol_info is refetched from the terminal instead of served.
+    """
+
+    symbol_cache_max_size: int = 1024
+    """Max symbols (and symbols_get groups) kept before LRU eviction."""
+
+    # =========================================================================
+    # RATES CACHE (opt-in)
+    # =========================================================================
+    rates_cache_max_bytes: int = 0
+    """Memory budget for cached OHLCV bars across all symbols (0 disables).
+
+    When enabled, copy_rates_from_pos(symbol, tf, 0, count) keeps a per
+    (symbol, timeframe) buffer and fetches only bars newer than the last
+    cached one. Least recently used series are evicted past the budget.
+    """
+
+    # =========================================================================
+    # HISTORY STORE (opt-in, on-disk ticks/rates)
+    # =========================================================================
+    history_store_path: str | None = None
+    """Directory for persisted copy_ticks_range/copy_rates_range data.
+
+    When set, ranges already on disk are served from memory-mapped
+    partition files and only missing sub-ranges are fetched from the bridge.
+    Example: "~/.mt5linux/history".
+    """
+
+    history_store_settle: float = 86400.0
+    """Seconds before now that data is considered final and persisted.
+
+    Newer rows are always fetched live (the forming bar/day still changes),
+    and rates are only persisted up to the last bar closed by then. Recent
+    segments are measured against the broker server clock (last tick time),
+    which may run ahead of or behind UTC.
+    """
+
+    # =========================================================================
+    # CHUNKED HISTORY DOWNLOAD
+    # =========================================================================
+    download_chunk_seconds: int = 3600
+    """Window size for download_ticks/iter_ticks (one RPC per window)."""
+
+    download_concurrency: int = 4
+    """Max windows in flight per download (also bounded by the request queue)."""
+
+    # =========================================================================
+    # CLIENT POOL (MT5Pool, several bridges/terminals)
+    # =========================================================================
+    pool_routing: Literal["least_outstanding", "symbol_hash"] = "least_outstanding"
+    """How MT5Pool spreads market data reads over its members.
+
+    "least_outstanding" picks the member with the fewest in-flight calls;
+    "symbol_hash" keeps each symbol on one member (consistent hashing), so
+    terminal-side symbol and history caches stay warm.
+    """
+
+    pool_hash_replicas: int = 64
+    """Virtual nodes per member on the symbol_hash ring."""
+
+    pool_reconnect_interval: float = 5.0
+    """Seconds between background reconnects of a disconnected member (0 = off)."""
+
+    # =========================================================================
+    # STAGE METRICS (opt-in, per-stage request timing)
+    # =========================================================================
+    enable_stage_metrics: bool = False
+    """Time each operation stage into AsyncMetaTrader5.metrics.
+
+    Stages: total, precheck, queue_wait, rpc, transit, decode, validate and
+    the bridge's handler/mt5_queue/mt5_call/encode (from response trailers).
+    Off by default: the gRPC client interceptor it installs adds a task per
+    call (tens of microseconds on a localhost bridge).
+    """
+
     # =========================================================================
     # WRITE-AHEAD LOG (WAL) - ORDER PERSISTENCE
     # =========================================================================
@@ -163,6 +369,16 @@ class MT5Settings(BaseSettings):
     wal_retention_days: int = 7
     """Auto-cleanup verified/failed WAL entries older than this."""
 
+    wal_group_commit_ms: float = 0.0
+    """Group-commit interval in milliseconds (0 = commit every write).
+
+    When enabled, WAL writes are batched into one SQLite commit per interval.
+    log_intent still waits for its batch, so the durability guarantee holds.
+    """
+
+    wal_group_commit_max_entries: int = 64
+    """Flush the group-commit buffer early once this many writes are pending."""
+
     # =========================================================================
     # SERVER (bridge.py)  # noqa: ERA001
     # =========================================================================
@@ -0,0 +1,1730 @@
+"""Simulated MetaTrader5 module for running the bridge without a terminal.
+
+MT5Simulator mimics the MetaTrader5 PyPI module closely enough for the
+bridge to serve it unchanged: same function names and argument order,
+namedtuple records, rates/ticks as numpy structured arrays with the
+terminal's dtypes, last_error() tuples and the MT5 integer constants. It
+lets the real bridge and both clients be load-tested end to end on plain
+Linux, without Wine, a terminal or broker credentials.
+
+- Prices are a pure function of (seed, symbol, tick time): two simulators
+  with the same seed quote identical ticks, bars and depth.
+- Every API call sleeps for a configurable latency (global, per function
+  and seeded jitter) to model terminal IPC cost.
+- One hedging demo account: market orders fill at the current bid/ask,
+  pending orders, expirations and SL/TP are matched against the current
+  tick whenever trading state is read or changed.
+
+It is a load-testing and CI aid, not a market model: there is no order
+book behind the depth snapshots, no swaps/commissions, MN1 bars are not
+generated, tick history only reaches back _MAX_TICKS ticks and profit is
+assumed to be in the account currency.
+
+Usage:
+    python -m mt5linux --server --simulate --sim-latency-ms 2
+
+    servicer = MT5GRPCServicer(mt5_module=MT5Simulator(seed=7))
+
+Hierarchy Level: 1
+- Imports: MT5Constants
+- Used by: bridge (--simulate), tests and benchmarks
+
+"""
+
+from __future__ import annotations
+
+import fnmatch
+import itertools
+import math
+import random
+import threading
+import time
+import zlib
+from datetime import UTC, datetime
+from typing import TYPE_CHECKING, NamedTuple
+
+import numpy as np
+
+from mt5linux.constants import MT5Constants as c
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Iterable, Mapping
+    from enum import Enum
+
+    from numpy.typing import NDArray
+
+# Terminal dtypes of copy_rates_* and copy_ticks_* results
+RATES_DTYPE = np.dtype(
+    [
+        ("time", "<i8"),
+        ("open", "<f8"),
+        ("high", "<f8"),
+        ("low", "<f8"),
+        ("close", "<f8"),
+        ("tick_volume", "<u8"),
+        ("spread", "<i4"),
+        ("real_volume", "<u8"),
+    ]
+)
+TICKS_DTYPE = np.dtype(
+    [
+        ("time", "<i8"),
+        ("bid", "<f8"),
+        ("ask", "<f8"),
+        ("last", "<f8"),
+        ("volume", "<u8"),
+        ("time_msc", "<i8"),
+        ("flags", "<u4"),
+        ("volume_real", "<f8"),
+    ]
+)
+
+# last_error() codes of the MetaTrader5 module
+RES_S_OK = 1
+RES_E_FAIL = -1
+RES_E_INVALID_PARAMS = -2
+RES_E_NOT_FOUND = -4
+RES_E_INTERNAL_FAIL_CONNECT = -10004
+
+# Price path: slow-to-fast sine waves (periods in ticks) plus per-tick noise
+_WAVE_PERIODS = (50.0, 3_000.0, 200_000.0)
+_NOISE_WEIGHT = 0.05
+# Ticks sampled per bar for open/high/low/close
+_BAR_SAMPLES = 16
+# Terminal "Max bars in chart" cap for copy_rates_*
+_MAX_BARS = 100_000
+# Tick history depth for copy_ticks_* (older ticks do not exist); bounds a
+# single response to about 60 MB whatever range is requested
+_MAX_TICKS = 1_000_000
+# Levels per side in market_book_get
+_BOOK_DEPTH = 5
+# Volume limits of every simulated symbol (lots)
+_VOLUME_MIN = 0.01
+_VOLUME_MAX = 100.0
+_VOLUME_STEP = 0.01
+# Tolerance for volume comparisons
+_EPSILON = 1e-9
+
+_MASK64 = 0xFFFF_FFFF_FFFF_FFFF
+_GOLDEN64 = 0x9E37_79B9_7F4A_7C15
+
+_TF_UNIT_MASK = 0xC000
+_TF_HOURS = 0x4000
+_TF_WEEKS = 0x8000
+
+_Action = c.Order.TradeAction
+_OrderType = c.Order.OrderType
+_Retcode = c.Order.TradeRetcode
+
+_BUY_TYPES = frozenset({_OrderType.BUY, _OrderType.BUY_LIMIT, _OrderType.BUY_STOP})
+_PENDING_TYPES = frozenset(
+    {
+        _OrderType.BUY_LIMIT,
+        _OrderType.SELL_LIMIT,
+        _OrderType.BUY_STOP,
+        _OrderType.SELL_STOP,
+    }
+)
+
+_RETCODE_COMMENTS: dict[int, str] = {
+    _Retcode.DONE: "Request executed",
+    _Retcode.REQUOTE: "Requote",
+    _Retcode.INVALID: "Invalid request",
+    _Retcode.INVALID_VOLUME: "Invalid volume",
+    _Retcode.INVALID_PRICE: "Invalid price",
+    _Retcode.INVALID_STOPS: "Invalid stops",
+    _Retcode.NO_MONEY: "No money",
+    _Retcode.INVALID_ORDER: "Invalid order",
+    _Retcode.POSITION_CLOSED: "Position doesn't exist",
+    _Retcode.INVALID_CLOSE_VOLUME: "Invalid close volume",
+}
+
+# MT5 constant prefixes and the enums carrying their values
+_CONSTANT_ENUMS: tuple[tuple[str, type[Enum]], ...] = (
+    ("TIMEFRAME_", c.MarketData.TimeFrame),
+    ("TICK_FLAG_", c.MarketData.TickFlag),
+    ("COPY_TICKS_", c.MarketData.CopyTicksFlag),
+    ("BOOK_TYPE_", c.MarketData.BookType),
+    ("TRADE_ACTION_", c.Order.TradeAction),
+    ("ORDER_TYPE_", c.Order.OrderType),
+    ("ORDER_FILLING_", c.Order.OrderFilling),
+    ("ORDER_TIME_", c.Order.OrderTime),
+    ("ORDER_STATE_", c.Order.OrderState),
+    ("ORDER_REASON_", c.Order.OrderReason),
+    ("TRADE_RETCODE_", c.Order.TradeRetcode),
+    ("POSITION_TYPE_", c.Trading.PositionType),
+    ("POSITION_REASON_", c.Trading.PositionReason),
+    ("DEAL_TYPE_", c.Trading.DealType),
+    ("DEAL_ENTRY_", c.Trading.DealEntry),
+    ("DEAL_REASON_", c.Trading.DealReason),
+    ("ACCOUNT_MARGIN_MODE_", c.Account.MarginMode),
+    ("ACCOUNT_STOPOUT_MODE_", c.Account.StopoutMode),
+    ("ACCOUNT_TRADE_MODE_", c.Account.TradeMode),
+    ("SYMBOL_CALC_MODE_", c.Symbol.CalcMode),
+    ("SYMBOL_CHART_MODE_", c.Symbol.ChartMode),
+    ("SYMBOL_TRADE_MODE_", c.Symbol.TradeMode),
+    ("SYMBOL_SWAP_MODE_", c.Symbol.SwapMode),
+    ("SYMBOL_OPTION_MODE_", c.Symbol.OptionMode),
+    ("SYMBOL_OPTION_RIGHT_", c.Symbol.OptionRight),
+    ("SYMBOL_TRADE_EXECUTION_", c.Symbol.TradeExecution),
+    ("SYMBOL_EXPIRATION_", c.Symbol.ExpirationMode),
+    ("SYMBOL_FILLING_", c.Symbol.FillingMode),
+    ("SYMBOL_ORDER_", c.Symbol.OrderMode),
+    ("DAY_OF_WEEK_", c.Calendar.DayOfWeek),
+)
+
+
+# =============================================================================
+# RECORDS (field order of the MetaTrader5 module namedtuples)
+# =============================================================================
+
+
+class SymbolSpec(NamedTuple):
+    """Static properties of one simulated symbol."""
+
+    name: str
+    price: float
+    digits: int = 5
+    spread: int = 10  # points
+    contract_size: float = 100_000.0
+    volatility: float = 0.002  # relative amplitude of the price path
+    currency_base: str = ""
+    currency_profit: str = "USD"
+
+
+DEFAULT_SYMBOLS = (
+    SymbolSpec("EURUSD", 1.085, currency_base="EUR"),
+    SymbolSpec("GBPUSD", 1.265, spread=14, currency_base="GBP"),
+    SymbolSpec("XAUUSD", 2350.0, digits=2, spread=25, contract_size=100.0),
+    SymbolSpec(
+        "BTCUSD", 65_000.0, digits=2, spread=1500, contract_size=1.0, volatility=0.01
+    ),
+)
+
+
+class TerminalInfo(NamedTuple):
+    """terminal_info() record."""
+
+    community_account: bool = False
+    community_connection: bool = False
+    connected: bool = True
+    dlls_allowed: bool = False
+    trade_allowed: bool = True
+    tradeapi_disabled: bool = False
+    email_enabled: bool = False
+    ftp_enabled: bool = False
+    notifications_enabled: bool = False
+    mqid: bool = False
+    build: int = 0
+    maxbars: int = _MAX_BARS
+    codepage: int = 0
+    ping_last: int = 0
+    community_balance: float = 0.0
+    retransmission: float = 0.0
+    company: str = ""
+    name: str = ""
+    language: str = "English"
+    path: str = ""
+    data_path: str = ""
+    commondata_path: str = ""
+
+
+class AccountInfo(NamedTuple):
+    """account_info() record."""
+
+    login: int
+    trade_mode: int = 0
+    leverage: int = 0
+    limit_orders: int = 0
+    margin_so_mode: int = 0
+    trade_allowed: bool = True
+    trade_expert: bool = True
+    margin_mode: int = 0
+    currency_digits: int = 2
+    fifo_close: bool = False
+    balance: float = 0.0
+    credit: float = 0.0
+    profit: float = 0.0
+    equity: float = 0.0
+    margin: float = 0.0
+    margin_free: float = 0.0
+    margin_level: float = 0.0
+    margin_so_call: float = 0.0
+    margin_so_so: float = 0.0
+    margin_initial: float = 0.0
+    margin_maintenance: float = 0.0
+    assets: float = 0.0
+    liabilities: float = 0.0
+    commission_blocked: float = 0.0
+    name: str = ""
+    server: str = ""
+    currency: str = "USD"
+    company: str = ""
+
+
+class SymbolInfo(NamedTuple):
+    """symbol_info() record."""
+
+    custom: bool = False
+    chart_mode: int = 0
+    select: bool = False
+    visible: bool = False
+    session_deals: int = 0
+    session_buy_orders: int = 0
+    session_sell_orders: int = 0
+    volume: int = 0
+    volumehigh: int = 0
+    volumelow: int = 0
+    time: int = 0
+    digits: int = 0
+    spread: int = 0
+    spread_float: bool = True
+    ticks_bookdepth: int = 0
+    trade_calc_mode: int = 0
+    trade_mode: int = 0
+    start_time: int = 0
+    expiration_time: int = 0
+    trade_stops_level: int = 0
+    trade_freeze_level: int = 0
+    trade_exemode: int = 0
+    swap_mode: int = 0
+    swap_rollover3days: int = 3
+    margin_hedged_use_leg: bool = False
+    expiration_mode: int = 0
+    filling_mode: int = 0
+    order_mode: int = 0
+    order_gtc_mode: int = 0
+    option_mode: int = 0
+    option_right: int = 0
+    bid: float = 0.0
+    bidhigh: float = 0.0
+    bidlow: float = 0.0
+    ask: float = 0.0
+    askhigh: float = 0.0
+    asklow: float = 0.0
+    last: float = 0.0
+    lasthigh: float = 0.0
+    lastlow: float = 0.0
+    volume_real: float = 0.0
+    volumehigh_real: float = 0.0
+    volumelow_real: float = 0.0
+    option_strike: float = 0.0
+    point: float = 0.0
+    trade_tick_value: float = 0.0
+    trade_tick_value_profit: float = 0.0
+    trade_tick_value_loss: float = 0.0
+    trade_tick_size: float = 0.0
+    trade_contract_size: float = 0.0
+    trade_accrued_interest: float = 0.0
+    trade_face_value: float = 0.0
+    trade_liquidity_rate: float = 0.0
+    volume_min: float = 0.0
+    volume_max: float = 0.0
+    volume_step: float = 0.0
+    volume_limit: float = 0.0
+    swap_long: float = 0.0
+    swap_short: float = 0.0
+    margin_initial: float = 0.0
+    margin_maintenance: float = 0.0
+    session_volume: float = 0.0
+    session_turnover: float = 0.0
+    session_interest: float = 0.0
+    session_buy_orders_volume: float = 0.0
+    session_sell_orders_volume: float = 0.0
+    session_open: float = 0.0
+    session_close: float = 0.0
+    session_aw: float = 0.0
+    session_price_settlement: float = 0.0
+    session_price_limit_min: float = 0.0
+    session_price_limit_max: float = 0.0
+    margin_hedged: float = 0.0
+    price_change: float = 0.0
+    price_volatility: float = 0.0
+    price_theoretical: float = 0.0
+    price_greeks_delta: float = 0.0
+    price_greeks_theta: float = 0.0
+    price_greeks_gamma: float = 0.0
+    price_greeks_vega: float = 0.0
+    price_greeks_rho: float = 0.0
+    price_greeks_omega: float = 0.0
+    price_sensitivity: float = 0.0
+    basis: str = ""
+    category: str = ""
+    currency_base: str = ""
+    currency_profit: str = ""
+    currency_margin: str = ""
+    bank: str = ""
+    description: str = ""
+    exchange: str = ""
+    formula: str = ""
+    isin: str = ""
+    name: str = ""
+    page: str = ""
+    path: str = ""
+
+
+class Tick(NamedTuple):
+    """symbol_info_tick() record."""
+
+    time: int
+    bid: float
+    ask: float
+    last: float = 0.0
+    volume: int = 0
+    time_msc: int = 0
+    flags: int = 0
+    volume_real: float = 0.0
+
+
+class BookInfo(NamedTuple):
+    """market_book_get() entry."""
+
+    type: int
+    price: float
+    volume: int
+    volume_dbl: float
+
+
+class TradeRequest(NamedTuple):
+    """Normalized order_send()/order_check() request."""
+
+    action: int = 0
+    magic: int = 0
+    order: int = 0
+    symbol: str = ""
+    volume: float = 0.0
+    price: float = 0.0
+    stoplimit: float = 0.0
+    sl: float = 0.0
+    tp: float = 0.0
+    deviation: int = 0
+    type: int = 0
+    type_filling: int = 0
+    type_time: int = 0
+    expiration: int = 0
+    comment: str = ""
+    position: int = 0
+    position_by: int = 0
+
+
+class OrderCheckResult(NamedTuple):
+    """order_check() result."""
+
+    retcode: int
+    balance: float
+    equity: float
+    profit: float
+    margin: float
+    margin_free: float
+    margin_level: float
+    comment: str
+    request: TradeRequest
+
+
+class OrderSendResult(NamedTuple):
+    """order_send() result."""
+
+    retcode: int
+    deal: int
+    order: int
+    volume: float
+    price: float
+    bid: float
+    ask: float
+    comment: str
+    request_id: int
+    retcode_external: int
+    request: TradeRequest
+
+
+class TradePosition(NamedTuple):
+    """positions_get() record."""
+
+    ticket: int
+    time: int
+    time_msc: int
+    time_update: int
+    time_update_msc: int
+    type: int
+    magic: int
+    identifier: int
+    reason: int
+    volume: float
+    price_open: float
+    sl: float
+    tp: float
+    price_current: float
+    swap: float
+    profit: float
+    symbol: str
+    comment: str
+    external_id: str = ""
+
+
+class TradeOrder(NamedTuple):
+    """orders_get()/history_orders_get() record."""
+
+    ticket: int
+    time_setup: int
+    time_setup_msc: int
+    time_done: int
+    time_done_msc: int
+    time_expiration: int
+    type: int
+    type_time: int
+    type_filling: int
+    state: int
+    magic: int
+    position_id: int
+    position_by_id: int
+    reason: int
+    volume_initial: float
+    volume_current: float
+    price_open: float
+    sl: float
+    tp: float
+    price_current: float
+    price_stoplimit: float
+    symbol: str
+    comment: str
+    external_id: str = ""
+
+
+class TradeDeal(NamedTuple):
+    """history_deals_get() record."""
+
+    ticket: int
+    order: int
+    time: int
+    time_msc: int
+    type: int
+    entry: int
+    magic: int
+    position_id: int
+    reason: int
+    volume: float
+    price: float
+    commission: float
+    swap: float
+    profit: float
+    fee: float
+    symbol: str
+    comment: str
+    external_id: str = ""
+
+
+# history_*_get arguments: date_from, date_to, group, ticket, position
+type _HistoryQuery = tuple[
+    datetime | int | None, datetime | int | None, str | None, int | None, int | None
+]
+
+
+class _Fill(NamedTuple):
+    """Outcome of one executed trade request."""
+
+    retcode: int
+    deal: int = 0
+    order: int = 0
+    volume: float = 0.0
+    price: float = 0.0
+
+
+# =============================================================================
+# HELPERS
+# =============================================================================
+
+
+def _hash_unit(index: NDArray[np.int64], salt: int) -> NDArray[np.float64]:
+    """Map tick indices to deterministic noise in [-1, 1) (splitmix64)."""
+    z = index.astype(np.uint64) + np.uint64((salt * _GOLDEN64) & _MASK64)
+    z = (z ^ (z >> np.uint64(30))) * np.uint64(0xBF58_476D_1CE4_E5B9)
+    z = (z ^ (z >> np.uint64(27))) * np.uint64(0x94D0_49BB_1331_11EB)
+    z ^= z >> np.uint64(31)
+    return (z >> np.uint64(11)).astype(np.float64) / float(1 << 52) - 1.0
+
+
+def _seconds(value: datetime | float) -> int:
+    """Convert an MT5 date argument (datetime or epoch seconds) to seconds."""
+    if isinstance(value, datetime):
+        if value.tzinfo is None:
+            value = value.replace(tzinfo=UTC)
+        return int(value.timestamp())
+    return int(value)
+
+
+def _bar_seconds(timeframe: int) -> int | None:
+    """Bar length of a TIMEFRAME_* value, None for MN1 and unknown values."""
+    try:
+        c.MarketData.TimeFrame(timeframe)
+    except ValueError:
+        return None
+    unit = timeframe & _TF_UNIT_MASK
+    value = timeframe & ~_TF_UNIT_MASK
+    if unit == 0:
+        return 60 * value
+    if unit == _TF_HOURS:
+        return 3600 * value
+    if unit == _TF_WEEKS:
+        return 604_800 * value
+    return None
+
+
+def _in_group(name: str, group: str | None) -> bool:
+    """Match a symbol name against an MT5 group filter ("*USD*,!EUR*")."""
+    if not group:
+        return True
+    included = False
+    for raw in group.split(","):
+        pattern = raw.strip()
+        if pattern.startswith("!"):
+            if fnmatch.fnmatchcase(name, pattern[1:]):
+                return False
+        elif fnmatch.fnmatchcase(name, pattern):
+            included = True
+    return included
+
+
+def _trade_request(request: Mapping[str, object]) -> TradeRequest:
+    """Normalize an order request dict, coercing values to field types."""
+    values: dict[str, object] = {}
+    for name, default in TradeRequest._field_defaults.items():
+        value = request.get(name)
+        values[name] = default if value is None else type(default)(value)
+    trade = TradeRequest(**values)  # type: ignore[arg-type]
+    return trade._replace(comment=trade.comment[: c.Order.MAX_COMMENT_LENGTH])
+
+
+def _is_buy(order_type: int) -> bool:
+    return order_type in _BUY_TYPES
+
+
+def _stops_ok(*, buy: bool, reference: float, sl: float, tp: float) -> bool:
+    """Check SL/TP lie on the losing/winning side of the reference price."""
+    if buy:
+        return (not sl or sl < reference) and (not tp or tp > reference)
+    return (not sl or sl > reference) and (not tp or tp < reference)
+
+
+# =============================================================================
+# SIMULATOR
+# =============================================================================
+
+
+class MT5Simulator:
+    """In-process stand-in for the MetaTrader5 module.
+
+    An instance exposes the module's functions, record types and integer
+    constants as attributes, so it can be assigned to
+    MT5GRPCServicer._mt5_module (or passed as mt5_module=). All calls are
+    thread-safe.
+    """
+
+    def __init__(  # noqa: PLR0913 - load-test knobs are keyword-only
+        self,
+        *,
+        seed: int = 0,
+        symbols: Iterable[SymbolSpec] = DEFAULT_SYMBOLS,
+        extra_symbols: int = 0,
+        tick_interval_ms: int = 100,
+        latency_ms: float = 0.0,
+        jitter_ms: float = 0.0,
+        call_latency_ms: Mapping[str, float] | None = None,
+        balance: float = 10_000.0,
+        leverage: int = 100,
+        login: int = 10_000_001,
+        server: str = "Simulator-Demo",
+        clock: Callable[[], float] = time.time,
+    ) -> None:
+        """Initialize the simulator.
+
+        Args:
+            seed: Seed of the price paths and latency jitter.
+            symbols: Symbols to quote.
+            extra_symbols: Additional synthetic SIMnnnn symbols, for
+                symbols_get load tests.
+            tick_interval_ms: Time between two generated ticks.
+            latency_ms: Delay added to every API call.
+            jitter_ms: Upper bound of a seeded random delay added on top.
+            call_latency_ms: Per-function delay overriding latency_ms
+                (e.g. {"order_send": 40.0}).
+            balance: Initial account balance.
+            leverage: Account leverage.
+            login: Account login.
+            server: Account server name.
+            clock: Time source in epoch seconds (fixed clocks make runs
+                fully reproducible).
+
+        """
+        self._seed = seed
+        self._tick_ms = tick_interval_ms
+        self._latency_ms = latency_ms
+        self._jitter_ms = jitter_ms
+        self._call_latency_ms = dict(call_latency_ms or {})
+        self._leverage = leverage
+        self._login = login
+        self._server = server
+        self._clock = clock
+        self._lock = threading.RLock()
+        self._rng = random.Random(seed)  # noqa: S311 - simulation, not crypto
+        self._initialized = False
+        self._error: tuple[int, str] = (RES_S_OK, "Success")
+
+        specs = list(symbols)
+        spec_rng = random.Random(seed)  # noqa: S311 - simulation, not crypto
+        specs.extend(
+            SymbolSpec(
+                f"SIM{i:04d}",
+                round(spec_rng.uniform(1.0, 200.0), 3),
+                digits=3,
+                spread=20,
+                contract_size=1_000.0,
+            )
+            for i in range(extra_symbols)
+        )
+        self._specs = {spec.name: spec for spec in specs}
+        self._salts = {
+            name: zlib.crc32(name.encode()) ^ (seed & _MASK64) for name in self._specs
+        }
+        self._phases = {
+            name: tuple(
+                random.Random(salt).uniform(0.0, 2 * math.pi)  # noqa: S311
+                for _ in _WAVE_PERIODS
+            )
+            for name, salt in self._salts.items()
+        }
+        self._selected = set(self._specs)
+        self._books: set[str] = set()
+        self._last_quotes: dict[str, tuple[int, float, float]] = {}
+
+        self._tickets = itertools.count(100_000)
+        self._deal_tickets = itertools.count(200_000)
+        self._request_ids = itertools.count(1)
+        self._balance = balance
+        self._positions: dict[int, TradePosition] = {}
+        self._orders: dict[int, TradeOrder] = {}
+        self._history_orders: list[TradeOrder] = []
+        self._deals: list[TradeDeal] = []
+        now_ms = int(self._clock() * 1000)
+        self._deals.append(
+            TradeDeal(
+                next(self._deal_tickets), 0, now_ms // 1000, now_ms,
+                int(c.Trading.DealType.BALANCE), int(c.Trading.DealEntry.IN),
+                0, 0, int(c.Trading.DealReason.CLIENT), 0.0, 0.0, 0.0, 0.0,
+                balance, 0.0, "", "initial deposit",
+            )
+        )  # fmt: skip
+
+    # =========================================================================
+    # CALL PLUMBING
+    # =========================================================================
+
+    def _enter(self, name: str) -> bool:
+        """Apply the call latency and check the terminal is initialized."""
+        delay = self._call_latency_ms.get(name, self._latency_ms)
+        if self._jitter_ms:
+            with self._lock:
+                delay += self._rng.uniform(0.0, self._jitter_ms)
+        if delay > 0:
+            time.sleep(delay / 1000)
+        if not self._initialized:
+            self._error = (RES_E_INTERNAL_FAIL_CONNECT, "No IPC connection")
+            return False
+        self._error = (RES_S_OK, "Success")
+        return True
+
+    def _spec(self, symbol: str) -> SymbolSpec | None:
+        """Return a symbol's spec, recording RES_E_NOT_FOUND when unknown."""
+        spec = self._specs.get(symbol)
+        if spec is None:
+            self._error = (RES_E_NOT_FOUND, f"Terminal: Symbol {symbol} not found")
+        return spec
+
+    def _now_ms(self) -> int:
+        return int(self._clock() * 1000)
+
+    def _now_index(self) -> int:
+        return self._now_ms() // self._tick_ms
+
+    # =========================================================================
+    # PRICE GENERATION
+    # =========================================================================
+
+    def _prices(
+        self, spec: SymbolSpec, index: NDArray[np.int64]
+    ) -> tuple[NDArray[np.float64], NDArray[np.float64]]:
+        """Return bid and ask at the given tick indices (any array shape)."""
+        x = index.astype(np.float64)
+        wave = np.zeros_like(x)
+        phases = self._phases[spec.name]
+        for period, phase in zip(_WAVE_PERIODS, phases, strict=True):
+            wave += np.sin(x / period + phase)
+        noise = _hash_unit(index, self._salts[spec.name])
+        move = wave / len(_WAVE_PERIODS) + _NOISE_WEIGHT * noise
+        bid = np.round(spec.price * (1.0 + spec.volatility * move), spec.digits)
+        ask = np.round(bid + spec.spread * 10.0**-spec.digits, spec.digits)
+        return bid, ask
+
+    def _quote(self, spec: SymbolSpec) -> tuple[float, float]:
+        """Return the current bid and ask of a symbol (memoized per tick)."""
+        index = self._now_index()
+        cached = self._last_quotes.get(spec.name)
+        if cached is not None and cached[0] == index:
+            return cached[1], cached[2]
+        bid, ask = self._prices(spec, np.array([index], dtype=np.int64))
+        self._last_quotes[spec.name] = (index, float(bid[0]), float(ask[0]))
+        return float(bid[0]), float(ask[0])
+
+    def _horizon(self) -> int:
+        """Return the index of the oldest tick in the history."""
+        return self._now_index() + 1 - _MAX_TICKS
+
+    def _ticks(self, spec: SymbolSpec, start: int, stop: int) -> NDArray[np.void]:
+        """Return ticks with indices in [start, stop), up to the current tick.
+
+        Ticks before the history horizon (the last _MAX_TICKS) are skipped.
+        """
+        start = max(start, self._horizon())
+        index = np.arange(start, max(start, min(stop, self._now_index() + 1)))
+        bid, ask = self._prices(spec, index)
+        ticks = np.zeros(len(index), dtype=TICKS_DTYPE)
+        ticks["time_msc"] = index * self._tick_ms
+        ticks["time"] = ticks["time_msc"] // 1000
+        ticks["bid"] = bid
+        ticks["ask"] = ask
+        ticks["flags"] = c.MarketData.TickFlag.BID | c.MarketData.TickFlag.ASK
+        return ticks
+
+    def _rates(
+        self, spec: SymbolSpec, bar: int, opens: NDArray[np.int64]
+    ) -> NDArray[np.void]:
+        """Return bars opening at the given times, sampled from the tick path."""
+        opens = opens[(opens >= 0) & (opens <= self._now_ms() // 1000)][-_MAX_BARS:]
+        first = -((-opens * 1000) // self._tick_ms)
+        last = np.minimum((opens + bar) * 1000 // self._tick_ms - 1, self._now_index())
+        steps = np.linspace(0.0, 1.0, _BAR_SAMPLES)
+        index = first[:, None] + np.round((last - first)[:, None] * steps).astype(
+            np.int64
+        )
+        bid, _ = self._prices(spec, index)
+        activity = 0.75 + 0.25 * _hash_unit(first, self._salts[spec.name])
+        rates = np.zeros(len(opens), dtype=RATES_DTYPE)
+        rates["time"] = opens
+        rates["open"] = bid[:, 0]
+        rates["high"] = bid.max(axis=1, initial=0.0)
+        rates["low"] = bid.min(axis=1, initial=math.inf)
+        rates["close"] = bid[:, -1]
+        rates["tick_volume"] = np.maximum((last - first + 1) * activity, 1)
+        rates["spread"] = spec.spread
+        return rates
+
+    def _bar_args(self, symbol: str, timeframe: int) -> tuple[SymbolSpec, int] | None:
+        """Resolve copy_rates_* symbol and timeframe, recording errors."""
+        spec = self._spec(symbol)
+        bar = _bar_seconds(timeframe)
+        if spec is None:
+            return None
+        if bar is None:
+            self._error = (RES_E_INVALID_PARAMS, f"Invalid timeframe {timeframe}")
+            return None
+        return spec, bar
+
+    # =========================================================================
+    # TERMINAL
+    # =========================================================================
+
+    def initialize(  # noqa: PLR0913 - MetaTrader5 signature
+        self,
+        path: str | None = None,
+        login: int | None = None,
+        password: str | None = None,
+        server: str | None = None,
+        timeout: int | None = None,
+        portable: bool = False,  # noqa: FBT001, FBT002 - MetaTrader5 signature
+    ) -> bool:
+        """Connect to the simulated terminal, optionally logging in."""
+        _ = path, password, timeout, portable
+        with self._lock:
+            self._initialized = True
+            self._error = (RES_S_OK, "Success")
+            if login is not None:
+                self._login = login
+            if server is not None:
+                self._server = server
+        return True
+
+    def login(
+        self,
+        login: int,
+        password: str = "",
+        server: str = "",
+        timeout: int = 60_000,
+    ) -> bool:
+        """Switch the simulated account; any password is accepted."""
+        _ = password, timeout
+        if not self._enter("login"):
+            return False
+        with self._lock:
+            self._login = login
+            if server:
+                self._server = server
+        return True
+
+    def shutdown(self) -> None:
+        """Disconnect from the simulated terminal."""
+        with self._lock:
+            self._initialized = False
+
+    def version(self) -> tuple[int, int, str] | None:
+        """Return the terminal version tuple."""
+        if not self._enter("version"):
+            return None
+        return (500, 5000, "01 Jan 2025")
+
+    def last_error(self) -> tuple[int, str]:
+        """Return the code and description of the last call's error."""
+        return self._error
+
+    def terminal_info(self) -> TerminalInfo | None:
+        """Return the simulated terminal state."""
+        if not self._enter("terminal_info"):
+            return None
+        return TerminalInfo(
+            build=5000,
+            company="mt5linux simulator",
+            name="MetaTrader 5 Simulator",
+            path="/simulator",
+            data_path="/simulator",
+            commondata_path="/simulator",
+        )
+
+    def account_info(self) -> AccountInfo | None:
+        """Return the simulated account, marked to the current tick."""
+        if not self._enter("account_info"):
+            return None
+        with self._lock:
+            self._match()
+            return self._account()
+
+    def _account(self) -> AccountInfo:
+        with self._lock:
+            profit = sum((self._mark(p).profit for p in self._positions.values()), 0.0)
+            margin = sum(
+                (
+                    self._margin(self._specs[p.symbol], p.volume, p.price_open)
+                    for p in self._positions.values()
+                ),
+                0.0,
+            )
+            equity = self._balance + profit
+            return AccountInfo(
+                login=self._login,
+                trade_mode=int(c.Account.TradeMode.DEMO),
+                leverage=self._leverage,
+                limit_orders=200,
+                margin_so_mode=int(c.Account.StopoutMode.PERCENT),
+                margin_mode=int(c.Account.MarginMode.RETAIL_HEDGING),
+                balance=round(self._balance, 2),
+                profit=round(profit, 2),
+                equity=round(equity, 2),
+                margin=round(margin, 2),
+                margin_free=round(equity - margin, 2),
+                margin_level=round(equity / margin * 100, 2) if margin else 0.0,
+                margin_so_call=50.0,
+                margin_so_so=30.0,
+                name="Simulated Account",
+                server=self._server,
+                company="mt5linux simulator",
+            )
+
+    # =========================================================================
+    # SYMBOLS
+    # =========================================================================
+
+    def symbols_total(self) -> int:
+        """Return the number of simulated symbols."""
+        if not self._enter("symbols_total"):
+            return 0
+        return len(self._specs)
+
+    def symbols_get(self, group: str | None = None) -> tuple[SymbolInfo, ...] | None:
+        """Return symbols matching an MT5 group filter."""
+        if not self._enter("symbols_get"):
+            return None
+        return tuple(
+            self._symbol_info(spec)
+            for name, spec in self._specs.items()
+            if _in_group(name, group)
+        )
+
+    def symbol_info(self, symbol: str) -> SymbolInfo | None:
+        """Return a symbol's properties with the current quote."""
+        if not self._enter("symbol_info"):
+            return None
+        spec = self._spec(symbol)
+        return None if spec is None else self._symbol_info(spec)
+
+    def symbol_info_tick(self, symbol: str) -> Tick | None:
+        """Return the current tick of a symbol."""
+        if not self._enter("symbol_info_tick"):
+            return None
+        spec = self._spec(symbol)
+        if spec is None:
+            return None
+        index = self._now_index()
+        (row,) = self._ticks(spec, index, index + 1).tolist()
+        return Tick(*row)
+
+    def symbol_select(
+        self,
+        symbol: str,
+        enable: bool = True,  # noqa: FBT001, FBT002 - MetaTrader5 signature
+    ) -> bool:
+        """Show or hide a symbol in the simulated Market Watch."""
+        if not self._enter("symbol_select") or self._spec(symbol) is None:
+            return False
+        with self._lock:
+            if enable:
+                self._selected.add(symbol)
+            else:
+                self._selected.discard(symbol)
+        return True
+
+    def _symbol_info(self, spec: SymbolSpec) -> SymbolInfo:
+        bid, ask = self._quote(spec)
+        point = 10.0**-spec.digits
+        forex = bool(spec.currency_base)
+        calc_mode = c.Symbol.CalcMode.FOREX if forex else c.Symbol.CalcMode.CFD
+        selected = spec.name in self._selected
+        return SymbolInfo(
+            select=selected,
+            visible=selected,
+            time=self._now_ms() // 1000,
+            digits=spec.digits,
+            spread=spec.spread,
+            ticks_bookdepth=2 * _BOOK_DEPTH,
+            trade_calc_mode=calc_mode,
+            trade_mode=c.Symbol.TradeMode.FULL,
+            trade_exemode=c.Symbol.TradeExecution.MARKET,
+            expiration_mode=int(
+                c.Symbol.ExpirationMode.GTC | c.Symbol.ExpirationMode.SPECIFIED
+            ),
+            filling_mode=int(c.Symbol.FillingMode.FOK | c.Symbol.FillingMode.IOC),
+            order_mode=int(
+                c.Symbol.OrderMode.MARKET
+                | c.Symbol.OrderMode.LIMIT
+                | c.Symbol.OrderMode.STOP
+                | c.Symbol.OrderMode.SL
+                | c.Symbol.OrderMode.TP
+            ),
+            bid=bid,
+            bidhigh=bid,
+            bidlow=bid,
+            ask=ask,
+            askhigh=ask,
+            asklow=ask,
+            point=point,
+            trade_tick_value=spec.contract_size * point,
+            trade_tick_value_profit=spec.contract_size * point,
+            trade_tick_value_loss=spec.contract_size * point,
+            trade_tick_size=point,
+            trade_contract_size=spec.contract_size,
+            volume_min=_VOLUME_MIN,
+            volume_max=_VOLUME_MAX,
+            volume_step=_VOLUME_STEP,
+            margin_hedged=spec.contract_size / 2,
+            currency_base=spec.currency_base or spec.name,
+            currency_profit=spec.currency_profit,
+            currency_margin=spec.currency_base or spec.currency_profit,
+            description=f"Simulated {spec.name}",
+            name=spec.name,
+            path=f"Simulator\\{spec.name}",
+        )
+
+    # =========================================================================
+    # MARKET DATA
+    # =========================================================================
+
+    def copy_rates_from(
+        self,
+        symbol: str,
+        timeframe: int,
+        date_from: datetime | int,
+        count: int,
+    ) -> NDArray[np.void] | None:
+        """Return count bars opening at or before date_from."""
+        if not self._enter("copy_rates_from"):
+            return None
+        args = self._bar_args(symbol, timeframe)
+        if args is None:
+            return None
+        spec, bar = args
+        anchor = min(_seconds(date_from), self._now_ms() // 1000) // bar * bar
+        opens = anchor - bar * np.arange(min(count, _MAX_BARS) - 1, -1, -1)
+        return self._rates(spec, bar, opens)
+
+    def copy_rates_from_pos(
+        self,
+        symbol: str,
+        timeframe: int,
+        start_pos: int,
+        count: int,
+    ) -> NDArray[np.void] | None:
+        """Return count bars ending start_pos bars before the current one."""
+        if not self._enter("copy_rates_from_pos"):
+            return None
+        args = self._bar_args(symbol, timeframe)
+        if args is None:
+            return None
+        spec, bar = args
+        anchor = (self._now_ms() // 1000 // bar - start_pos) * bar
+        opens = anchor - bar * np.arange(min(count, _MAX_BARS) - 1, -1, -1)
+        return self._rates(spec, bar, opens)
+
+    def copy_rates_range(
+        self,
+        symbol: str,
+        timeframe: int,
+        date_from: datetime | int,
+        date_to: datetime | int,
+    ) -> NDArray[np.void] | None:
+        """Return bars opening within [date_from, date_to]."""
+        if not self._enter("copy_rates_range"):
+            return None
+        args = self._bar_args(symbol, timeframe)
+        if args is None:
+            return None
+        spec, bar = args
+        first = -(-_seconds(date_from) // bar) * bar
+        last = min(_seconds(date_to), self._now_ms() // 1000)
+        return self._rates(spec, bar, np.arange(first, last + 1, bar, dtype=np.int64))
+
+    def copy_ticks_from(
+        self,
+        symbol: str,
+        date_from: datetime | int,
+        count: int,
+        flags: int,
+    ) -> NDArray[np.void] | None:
+        """Return up to count ticks from date_from onwards."""
+        if not self._enter("copy_ticks_from"):
+            return None
+        spec = self._spec(symbol)
+        if spec is None:
+            return None
+        start = max(-(-_seconds(date_from) * 1000 // self._tick_ms), self._horizon())
+        if flags == c.MarketData.CopyTicksFlag.TRADE:
+            count = 0  # quotes only: the feed has no trade ticks
+        return self._ticks(spec, start, start + count)
+
+    def copy_ticks_range(
+        self,
+        symbol: str,
+        date_from: datetime | int,
+        date_to: datetime | int,
+        flags: int,
+    ) -> NDArray[np.void] | None:
+        """Return the ticks within [date_from, date_to]."""
+        if not self._enter("copy_ticks_range"):
+            return None
+        spec = self._spec(symbol)
+        if spec is None:
+            return None
+        start = -(-_seconds(date_from) * 1000 // self._tick_ms)
+        stop = _seconds(date_to) * 1000 // self._tick_ms + 1
+        if flags == c.MarketData.CopyTicksFlag.TRADE:
+            stop = start
+        return self._ticks(spec, start, stop)
+
+    # =========================================================================
+    # MARKET DEPTH
+    # =========================================================================
+
+    def market_book_add(self, symbol: str) -> bool:
+        """Subscribe to a symbol's depth of market."""
+        if not self._enter("market_book_add") or self._spec(symbol) is None:
+            return False
+        with self._lock:
+            self._books.add(symbol)
+        return True
+
+    def market_book_get(self, symbol: str) -> tuple[BookInfo, ...] | None:
+        """Return the current depth of market, highest price first."""
+        if not self._enter("market_book_get"):
+            return None
+        spec = self._spec(symbol)
+        if spec is None or symbol not in self._books:
+            return None
+        bid, ask = self._quote(spec)
+        step = 10.0**-spec.digits * max(1, spec.spread // 2)
+        levels = np.arange(_BOOK_DEPTH)
+        sizes = _hash_unit(
+            self._now_index() * 2 * _BOOK_DEPTH + np.arange(2 * _BOOK_DEPTH),
+            self._salts[symbol],
+        )
+        volumes = (5.5 + 4.5 * sizes).astype(np.int64).tolist()
+        sells = [
+            BookInfo(
+                int(c.MarketData.BookType.SELL),
+                round(ask + level * step, spec.digits),
+                volumes[level],
+                float(volumes[level]),
+            )
+            for level in levels[::-1].tolist()
+        ]
+        buys = [
+            BookInfo(
+                int(c.MarketData.BookType.BUY),
+                round(bid - level * step, spec.digits),
+                volumes[_BOOK_DEPTH + level],
+                float(volumes[_BOOK_DEPTH + level]),
+            )
+            for level in levels.tolist()
+        ]
+        return (*sells, *buys)
+
+    def market_book_release(self, symbol: str) -> bool:
+        """Cancel a depth of market subscription."""
+        if not self._enter("market_book_release"):
+            return False
+        with self._lock:
+            self._books.discard(symbol)
+        return True
+
+    # =========================================================================
+    # TRADING
+    # =========================================================================
+
+    def order_calc_margin(
+        self,
+        action: int,
+        symbol: str,
+        volume: float,
+        price: float,
+    ) -> float | None:
+        """Return the margin an order needs, in the account currency."""
+        _ = action
+        if not self._enter("order_calc_margin"):
+            return None
+        spec = self._spec(symbol)
+        return None if spec is None else round(self._margin(spec, volume, price), 2)
+
+    def order_calc_profit(
+        self,
+        action: int,
+        symbol: str,
+        volume: float,
+        price_open: float,
+        price_close: float,
+    ) -> float | None:
+        """Return the profit of a trade, in the account currency."""
+        if not self._enter("order_calc_profit"):
+            return None
+        spec = self._spec(symbol)
+        if spec is None:
+            return None
+        return round(self._profit(spec, action, volume, price_open, price_close), 2)
+
+    def order_check(self, request: Mapping[str, object]) -> OrderCheckResult | None:
+        """Validate a trade request and report the account after it."""
+        if not self._enter("order_check"):
+            return None
+        trade = _trade_request(request)
+        with self._lock:
+            self._match()
+            retcode = self._validate(trade)
+            account = self._account()
+            margin = account.margin
+            spec = self._specs.get(trade.symbol)
+            if retcode == _Retcode.DONE and spec and trade.action == _Action.DEAL:
+                bid, ask = self._quote(spec)
+                price = ask if _is_buy(trade.type) else bid
+                margin += self._margin(spec, trade.volume, price)
+            free = account.equity - margin
+            return OrderCheckResult(
+                # Like the terminal, a passing check reports retcode 0 "Done"
+                retcode=0 if retcode == _Retcode.DONE else retcode,
+                balance=account.balance,
+                equity=account.equity,
+                profit=account.profit,
+                margin=round(margin, 2),
+                margin_free=round(free, 2),
+                margin_level=round(account.equity / margin * 100, 2) if margin else 0.0,
+                comment="Done" if retcode == _Retcode.DONE else _comment(retcode),
+                request=trade,
+            )
+
+    def order_send(self, request: Mapping[str, object]) -> OrderSendResult | None:
+        """Execute a trade request against the simulated account."""
+        if not self._enter("order_send"):
+            return None
+        trade = _trade_request(request)
+        with self._lock:
+            self._match()
+            retcode = self._validate(trade)
+            fill = self._execute(trade) if retcode == _Retcode.DONE else _Fill(retcode)
+            spec = self._specs.get(trade.symbol)
+            bid, ask = self._quote(spec) if spec else (0.0, 0.0)
+            return OrderSendResult(
+                retcode=int(fill.retcode),
+                deal=fill.deal,
+                order=fill.order,
+                volume=fill.volume,
+                price=fill.price,
+                bid=bid if fill.retcode != _Retcode.DONE else 0.0,
+                ask=ask if fill.retcode != _Retcode.DONE else 0.0,
+                comment=_comment(fill.retcode),
+                request_id=next(self._request_ids),
+                retcode_external=0,
+                request=trade,
+            )
+
+    def seed_trades(
+        self,
+        symbol: str,
+        *,
+        positions: int = 0,
+        round_trips: int = 0,
+        volume: float = 0.01,
+    ) -> None:
+        """Book market trades directly, skipping call latency and validation.
+
+        Builds large fixtures (1k positions, 50k deals) for benchmarks.
+
+        Args:
+            symbol: Symbol to trade.
+            positions: Buy positions left open.
+            round_trips: Buys closed right away, two history deals each.
+            volume: Volume of every trade.
+
+        """
+        buy = _trade_request(
+            {
+                "action": _Action.DEAL,
+                "symbol": symbol,
+                "volume": volume,
+                "type": _OrderType.BUY,
+            }
+        )
+        with self._lock:
+            for _ in range(round_trips):
+                opened = self._execute(buy)
+                self._execute(
+                    buy._replace(type=int(_OrderType.SELL), position=opened.order)
+                )
+            for _ in range(positions):
+                self._execute(buy)
+
+    def _validate(self, trade: TradeRequest) -> int:  # noqa: PLR0911 - one retcode per rule
+        """Return the retcode a request would get (DONE when it is valid)."""
+        if trade.action == _Action.SLTP:
+            position = self._positions.get(trade.position)
+            if position is None:
+                return _Retcode.POSITION_CLOSED
+            return self._validate_stops(trade, position.symbol, position.type)
+        if trade.action in {_Action.MODIFY, _Action.REMOVE}:
+            return (
+                _Retcode.DONE if trade.order in self._orders else _Retcode.INVALID_ORDER
+            )
+        spec = self._specs.get(trade.symbol)
+        if spec is None or trade.action not in {_Action.DEAL, _Action.PENDING}:
+            return _Retcode.INVALID
+        lots = round(trade.volume / _VOLUME_STEP) * _VOLUME_STEP
+        if abs(lots - trade.volume) > _EPSILON or not (
+            _VOLUME_MIN - _EPSILON <= trade.volume <= _VOLUME_MAX
+        ):
+            return _Retcode.INVALID_VOLUME
+        if trade.action == _Action.PENDING:
+            return self._validate_pending(trade, spec)
+        if trade.type not in {_OrderType.BUY, _OrderType.SELL}:
+            return _Retcode.INVALID
+        if trade.position:
+            return self._validate_close(trade)
+        return self._validate_open(trade, spec)
+
+    def _validate_open(self, trade: TradeRequest, spec: SymbolSpec) -> int:
+        bid, ask = self._quote(spec)
+        price = ask if _is_buy(trade.type) else bid
+        slippage = (trade.deviation + 0.5) * 10.0**-spec.digits
+        if trade.price and abs(price - trade.price) > slippage:
+            return _Retcode.REQUOTE
+        if not _stops_ok(
+            buy=_is_buy(trade.type),
+            reference=bid if _is_buy(trade.type) else ask,
+            sl=trade.sl,
+            tp=trade.tp,
+        ):
+            return _Retcode.INVALID_STOPS
+        if self._margin(spec, trade.volume, price) > self._account().margin_free:
+            return _Retcode.NO_MONEY
+        return _Retcode.DONE
+
+    def _validate_close(self, trade: TradeRequest) -> int:
+        position = self._positions.get(trade.position)
+        if position is None:
+            return _Retcode.POSITION_CLOSED
+        if position.symbol != trade.symbol or position.type == trade.type:
+            return _Retcode.INVALID
+        if trade.volume > position.volume + _EPSILON:
+            return _Retcode.INVALID_CLOSE_VOLUME
+        return _Retcode.DONE
+
+    def _validate_pending(self, trade: TradeRequest, spec: SymbolSpec) -> int:
+        if trade.type not in _PENDING_TYPES:
+            return _Retcode.INVALID
+        bid, ask = self._quote(spec)
+        valid_price = {
+            _OrderType.BUY_LIMIT: 0 < trade.price < ask,
+            _OrderType.SELL_LIMIT: trade.price > bid,
+            _OrderType.BUY_STOP: trade.price > ask,
+            _OrderType.SELL_STOP: 0 < trade.price < bid,
+        }[_OrderType(trade.type)]
+        if not valid_price:
+            return _Retcode.INVALID_PRICE
+        return self._validate_stops(trade, trade.symbol, trade.type)
+
+    def _validate_stops(self, trade: TradeRequest, symbol: str, order_type: int) -> int:
+        reference = trade.price
+        if trade.action == _Action.SLTP:
+            bid, ask = self._quote(self._specs[symbol])
+            reference = bid if _is_buy(order_type) else ask
+        if _stops_ok(
+            buy=_is_buy(order_type), reference=reference, sl=trade.sl, tp=trade.tp
+        ):
+            return _Retcode.DONE
+        return _Retcode.INVALID_STOPS
+
+    def _execute(self, trade: TradeRequest) -> _Fill:
+        """Apply a validated request to the account."""
+        now = self._now_ms()
+        if trade.action == _Action.SLTP:
+            position = self._positions[trade.position]
+            self._positions[trade.position] = position._replace(
+                sl=trade.sl, tp=trade.tp, time_update=now // 1000, time_update_msc=now
+            )
+            return _Fill(_Retcode.DONE)
+        if trade.action == _Action.MODIFY:
+            order = self._orders[trade.order]
+            self._orders[trade.order] = order._replace(
+                price_open=trade.price or order.price_open, sl=trade.sl, tp=trade.tp
+            )
+            return _Fill(_Retcode.DONE, order=trade.order)
+        if trade.action == _Action.REMOVE:
+            order = self._orders[trade.order]
+            self._finish(order, int(c.Order.OrderState.CANCELED), now)
+            return _Fill(_Retcode.DONE, order=trade.order)
+        ticket = next(self._tickets)
+        order = TradeOrder(
+            ticket, now // 1000, now, 0, 0, trade.expiration, trade.type,
+            trade.type_time, trade.type_filling, int(c.Order.OrderState.PLACED),
+            trade.magic, trade.position, 0, int(c.Order.OrderReason.EXPERT),
+            trade.volume, trade.volume, trade.price, trade.sl, trade.tp,
+            trade.price, trade.stoplimit, trade.symbol, trade.comment,
+        )  # fmt: skip
+        if trade.action == _Action.PENDING:
+            self._orders[ticket] = order
+            return _Fill(_Retcode.DONE, order=ticket, volume=trade.volume)
+        return self._fill(order, now)
+
+    def _fill(self, order: TradeOrder, now: int) -> _Fill:
+        """Execute a market or triggered order at the current bid/ask."""
+        spec = self._specs[order.symbol]
+        bid, ask = self._quote(spec)
+        buy = _is_buy(order.type)
+        price = ask if buy else bid
+        deal_type = int(c.Trading.DealType.BUY if buy else c.Trading.DealType.SELL)
+        position = self._positions.get(order.position_id)
+        profit = 0.0
+        if position is None:
+            entry = int(c.Trading.DealEntry.IN)
+            position_id = order.ticket
+            self._positions[position_id] = TradePosition(
+                position_id, now // 1000, now, now // 1000, now,
+                int(c.Trading.PositionType.BUY if buy else c.Trading.PositionType.SELL),
+                order.magic, position_id, int(c.Trading.PositionReason.EXPERT),
+                order.volume_initial, price, order.sl, order.tp, price,
+                0.0, 0.0, order.symbol, order.comment,
+            )  # fmt: skip
+        else:
+            entry = int(c.Trading.DealEntry.OUT)
+            position_id = position.ticket
+            profit = round(
+                self._profit(
+                    spec,
+                    position.type,
+                    order.volume_initial,
+                    position.price_open,
+                    price,
+                ),
+                2,
+            )
+            self._balance += profit
+            remaining = round(position.volume - order.volume_initial, 8)
+            if remaining > _EPSILON:
+                self._positions[position_id] = position._replace(volume=remaining)
+            else:
+                del self._positions[position_id]
+        deal = next(self._deal_tickets)
+        self._deals.append(
+            TradeDeal(
+                deal, order.ticket, now // 1000, now, deal_type, entry,
+                order.magic, position_id, order.reason, order.volume_initial,
+                price, 0.0, 0.0, profit, 0.0, order.symbol, order.comment,
+            )
+        )  # fmt: skip
+        self._finish(
+            order._replace(position_id=position_id, price_current=price),
+            int(c.Order.OrderState.FILLED),
+            now,
+        )
+        return _Fill(_Retcode.DONE, deal, order.ticket, order.volume_initial, price)
+
+    def _finish(self, order: TradeOrder, state: int, now: int) -> None:
+        """Move an order to history in its final state."""
+        self._orders.pop(order.ticket, None)
+        self._history_orders.append(
+            order._replace(
+                state=state,
+                time_done=now // 1000,
+                time_done_msc=now,
+                volume_current=(
+                    0.0 if state == c.Order.OrderState.FILLED else order.volume_current
+                ),
+            )
+        )
+
+    def _match(self) -> None:
+        """Trigger pending orders, expirations and SL/TP at the current tick."""
+        now = self._now_ms()
+        for order in list(self._orders.values()):
+            if (
+                order.type_time == c.Order.OrderTime.SPECIFIED
+                and order.time_expiration
+                and order.time_expiration <= now // 1000
+            ):
+                self._finish(order, int(c.Order.OrderState.EXPIRED), now)
+                continue
+            bid, ask = self._quote(self._specs[order.symbol])
+            triggered = {
+                _OrderType.BUY_LIMIT: ask <= order.price_open,
+                _OrderType.SELL_LIMIT: bid >= order.price_open,
+                _OrderType.BUY_STOP: ask >= order.price_open,
+                _OrderType.SELL_STOP: bid <= order.price_open,
+            }[_OrderType(order.type)]
+            if triggered:
+                market = int(_OrderType.BUY if _is_buy(order.type) else _OrderType.SELL)
+                self._fill(order._replace(type=market), now)
+        for position in list(self._positions.values()):
+            if not (position.sl or position.tp):
+                continue
+            marked = self._mark(position)
+            price = marked.price_current
+            buy = position.type == c.Trading.PositionType.BUY
+            hit_sl = bool(position.sl) and (
+                price <= position.sl if buy else price >= position.sl
+            )
+            hit_tp = bool(position.tp) and (
+                price >= position.tp if buy else price <= position.tp
+            )
+            if not (hit_sl or hit_tp):
+                continue
+            reason = int(c.Order.OrderReason.SL if hit_sl else c.Order.OrderReason.TP)
+            close = TradeOrder(
+                next(self._tickets), now // 1000, now, 0, 0, 0,
+                int(_OrderType.SELL if buy else _OrderType.BUY), 0, 0,
+                int(c.Order.OrderState.PLACED), position.magic, position.ticket, 0,
+                reason, position.volume, position.volume, price, 0.0, 0.0,
+                price, 0.0, position.symbol, position.comment,
+            )  # fmt: skip
+            self._fill(close, now)
+
+    def _mark(self, position: TradePosition) -> TradePosition:
+        """Return a position with price_current and profit at the current tick."""
+        spec = self._specs[position.symbol]
+        bid, ask = self._quote(spec)
+        price = bid if position.type == c.Trading.PositionType.BUY else ask
+        profit = self._profit(
+            spec, position.type, position.volume, position.price_open, price
+        )
+        return position._replace(price_current=price, profit=round(profit, 2))
+
+    def _margin(self, spec: SymbolSpec, volume: float, price: float) -> float:
+        return volume * spec.contract_size * price / self._leverage
+
+    @staticmethod
+    def _profit(
+        spec: SymbolSpec,
+        action: int,
+        volume: float,
+        price_open: float,
+        price_close: float,
+    ) -> float:
+        direction = 1.0 if _is_buy(action) else -1.0
+        return direction * (price_close - price_open) * volume * spec.contract_size
+
+    # =========================================================================
+    # POSITIONS, ORDERS AND HISTORY
+    # =========================================================================
+
+    def positions_total(self) -> int:
+        """Return the number of open positions."""
+        if not self._enter("positions_total"):
+            return 0
+        with self._lock:
+            self._match()
+            return len(self._positions)
+
+    def positions_get(
+        self,
+        symbol: str | None = None,
+        group: str | None = None,
+        ticket: int | None = None,
+    ) -> tuple[TradePosition, ...] | None:
+        """Return open positions filtered by symbol, group or ticket."""
+        if not self._enter("positions_get"):
+            return None
+        with self._lock:
+            self._match()
+            return tuple(
+                self._mark(p)
+                for p in self._positions.values()
+                if (symbol is None or p.symbol == symbol)
+                and (ticket is None or p.ticket == ticket)
+                and _in_group(p.symbol, group)
+            )
+
+    def orders_total(self) -> int:
+        """Return the number of pending orders."""
+        if not self._enter("orders_total"):
+            return 0
+        with self._lock:
+            self._match()
+            return len(self._orders)
+
+    def orders_get(
+        self,
+        symbol: str | None = None,
+        group: str | None = None,
+        ticket: int | None = None,
+    ) -> tuple[TradeOrder, ...] | None:
+        """Return pending orders filtered by symbol, group or ticket."""
+        if not self._enter("orders_get"):
+            return None
+        with self._lock:
+            self._match()
+            orders: list[TradeOrder] = []
+            for order in self._orders.values():
+                if (
+                    (symbol is None or order.symbol == symbol)
+                    and (ticket is None or order.ticket == ticket)
+                    and _in_group(order.symbol, group)
+                ):
+                    bid, ask = self._quote(self._specs[order.symbol])
+                    current = ask if _is_buy(order.type) else bid
+                    orders.append(order._replace(price_current=current))
+            return tuple(orders)
+
+    def history_orders_total(
+        self, date_from: datetime | int, date_to: datetime | int
+    ) -> int | None:
+        """Return the number of history orders set up within the range."""
+        orders = self.history_orders_get(date_from, date_to)
+        return None if orders is None else len(orders)
+
+    def history_orders_get(
+        self,
+        date_from: datetime | int | None = None,
+        date_to: datetime | int | None = None,
+        group: str | None = None,
+        ticket: int | None = None,
+        position: int | None = None,
+    ) -> tuple[TradeOrder, ...] | None:
+        """Return history orders by ticket, position, or time range and group."""
+        if not self._enter("history_orders_get"):
+            return None
+        with self._lock:
+            self._match()
+            return tuple(
+                order
+                for order in self._history_orders
+                if self._in_history(
+                    order.ticket, order.position_id, order.time_setup, order.symbol,
+                    (date_from, date_to, group, ticket, position),
+                )
+            )  # fmt: skip
+
+    def history_deals_total(
+        self, date_from: datetime | int, date_to: datetime | int
+    ) -> int | None:
+        """Return the number of deals executed within the range."""
+        deals = self.history_deals_get(date_from, date_to)
+        return None if deals is None else len(deals)
+
+    def history_deals_get(
+        self,
+        date_from: datetime | int | None = None,
+        date_to: datetime | int | None = None,
+        group: str | None = None,
+        ticket: int | None = None,
+        position: int | None = None,
+    ) -> tuple[TradeDeal, ...] | None:
+        """Return deals by order ticket, position, or time range and group."""
+        if not self._enter("history_deals_get"):
+            return None
+        with self._lock:
+            self._match()
+            return tuple(
+                deal
+                for deal in self._deals
+                if self._in_history(
+                    deal.order, deal.position_id, deal.time, deal.symbol,
+                    (date_from, date_to, group, ticket, position),
+                )
+            )  # fmt: skip
+
+    @staticmethod
+    def _in_history(
+        ticket: int,
+        position_id: int,
+        when: int,
+        symbol: str,
+        query: _HistoryQuery,
+    ) -> bool:
+        """Apply history_*_get selection: ticket, else position, else range."""
+        date_from, date_to, group, by_ticket, by_position = query
+        if by_ticket is not None:
+            return ticket == by_ticket
+        if by_position is not None:
+            return position_id == by_position
+        if date_from is None or date_to is None:
+            return False
+        return _seconds(date_from) <= when <= _seconds(date_to) and (
+            not symbol or _in_group(symbol, group)
+        )
+
+
+def _comment(retcode: int) -> str:
+    return _RETCODE_COMMENTS.get(retcode, f"Retcode {retcode}")
+
+
+def _install_module_names() -> None:
+    """Expose MT5 constants and record types like the MetaTrader5 module."""
+    for prefix, enum in _CONSTANT_ENUMS:
+        for member in enum:
+            setattr(MT5Simulator, f"{prefix}{member.name}", int(member.value))
+    codes = {
+        "RES_S_OK": RES_S_OK,
+        "RES_E_FAIL": RES_E_FAIL,
+        "RES_E_INVALID_PARAMS": RES_E_INVALID_PARAMS,
+        "RES_E_NOT_FOUND": RES_E_NOT_FOUND,
+        "RES_E_INTERNAL_FAIL_CONNECT": RES_E_INTERNAL_FAIL_CONNECT,
+    }
+    for name, value in codes.items():
+        setattr(MT5Simulator, name, value)
+    for record in (
+        TerminalInfo, AccountInfo, SymbolInfo, Tick, BookInfo, TradeRequest,
+        OrderCheckResult, OrderSendResult, TradePosition, TradeOrder, TradeDeal,
+    ):  # fmt: skip
+        setattr(MT5Simulator, record.__name__, record)
+
+
+_install_module_names()
@@ -19,12 +19,15 @@ Usage:
 
 from __future__ import annotations
 
-from collections.abc import Callable
-from typing import TypedDict, TypeVar
+from collections.abc import Callable, Sequence
+from typing import TYPE_CHECKING, Literal, NamedTuple, TypedDict, TypeVar
 
 import numpy as np
 from numpy.typing import NDArray
 
+if TYPE_CHECKING:
+    from datetime import datetime
+
 T = TypeVar("T")
 
 
@@ -35,9 +38,10 @@ class MT5Types:
 
     Categories:
     - Array types: RatesArray, TicksArray
-    - Dict types: OrderRequestDict, TickDict, RateDict
+    - Dict types: OrderRequestDict, TickDict, RateDict, RecordFilterDict
     - Function types: MT5Function
     - JSON types: JSONPrimitive, JSONValue
+    - Record types: TradePosition, TradeOrder, TradeDeal, BookInfo
 
     Note: MT5Protocol and AsyncMT5Protocol are in mt5linux.protocols module.
 
@@ -70,6 +74,12 @@ class MT5Types:
     type JSONValue = JSONPrimitive | list[JSONValue] | dict[str, JSONValue]
     """Recursive JSON-compatible value type (strict typing, no Any)."""
 
+    type ReturnFormat = Literal["model", "namedtuple", "array"]
+    """Result shape of list getters: pydantic models, records or NumPy array."""
+
+    type PoolRouting = Literal["least_outstanding", "symbol_hash"]
+    """MT5Pool read routing: least in-flight calls or consistent hash on symbol."""
+
     # =========================================================================
     # TYPED DICTS
     # =========================================================================
@@ -114,6 +124,23 @@ class MT5Types:
         flags: int
         volume_real: float
 
+    class RecordFilterDict(TypedDict, total=False):
+        """Bridge-side row filter for positions/orders/history getters.
+
+        Sequence fields keep rows matching any listed value; all given
+        fields must match. Row time is time (time_setup for orders);
+        position_id also matches a position's identifier.
+
+        """
+
+        magic: Sequence[int]
+        type: Sequence[int]
+        entry: Sequence[int]
+        position_id: Sequence[int]
+        time_from: datetime | int
+        time_to: datetime | int
+        comment_prefix: str
+
     class RateDict(TypedDict):
         """MT5 OHLCV bar structure.
 
@@ -129,3 +156,88 @@ class MT5Types:
         tick_volume: int
         spread: int
         real_volume: int
+
+    # =========================================================================
+    # RECORD TYPES (MetaTrader5 namedtuple shapes, return_format="namedtuple")
+    # =========================================================================
+
+    class TradePosition(NamedTuple):
+        """Open position, field order of MetaTrader5.TradePosition."""
+
+        ticket: int
+        time: int = 0
+        time_msc: int = 0
+        time_update: int = 0
+        time_update_msc: int = 0
+        type: int = 0
+        magic: int = 0
+        identifier: int = 0
+        reason: int = 0
+        volume: float = 0.0
+        price_open: float = 0.0
+        sl: float = 0.0
+        tp: float = 0.0
+        price_current: float = 0.0
+        swap: float = 0.0
+        profit: float = 0.0
+        symbol: str = ""
+        comment: str = ""
+        external_id: str = ""
+
+    class TradeOrder(NamedTuple):
+        """Pending or historical order, field order of MetaTrader5.TradeOrder."""
+
+        ticket: int
+        time_setup: int = 0
+        time_setup_msc: int = 0
+        time_done: int = 0
+        time_done_msc: int = 0
+        time_expiration: int = 0
+        type: int = 0
+        type_time: int = 0
+        type_filling: int = 0
+        state: int = 0
+        magic: int = 0
+        position_id: int = 0
+        position_by_id: int = 0
+        reason: int = 0
+        volume_initial: float = 0.0
+        volume_current: float = 0.0
+        price_open: float = 0.0
+        sl: float = 0.0
+        tp: float = 0.0
+        price_current: float = 0.0
+        price_stoplimit: float = 0.0
+        symbol: str = ""
+        comment: str = ""
+        external_id: str = ""
+
+    class TradeDeal(NamedTuple):
+        """Historical deal, field order of MetaTrader5.TradeDeal."""
+
+        ticket: int
+        order: int = 0
+        time: int = 0
+        time_msc: int = 0
+        type: int = 0
+        entry: int = 0
+        magic: int = 0
+        position_id: int = 0
+        reason: int = 0
+        volume: float = 0.0
+        price: float = 0.0
+        commission: float = 0.0
+        swap: float = 0.0
+        profit: float = 0.0
+        fee: float = 0.0
+        symbol: str = ""
+        comment: str = ""
+        external_id: str = ""
+
+    class BookInfo(NamedTuple):
+        """Market depth entry, field order of MetaTrader5.BookInfo."""
+
+        type: int
+        price: float = 0.0
+        volume: int = 0
+        volume_dbl: float = 0.0
@@ -37,16 +37,32 @@ from __future__ import annotations
 import ast
 import asyncio
 import logging
+import math
 import operator
 import random
+import shutil
+import tempfile
 import threading
+import time
 import uuid
-from contextlib import suppress
+from bisect import bisect_left
+from collections import OrderedDict, deque
+from contextlib import contextmanager, suppress
+from contextvars import ContextVar, copy_context
 from dataclasses import dataclass, field
 from datetime import UTC, datetime, timedelta
 from enum import IntEnum
 from pathlib import Path
-from typing import TYPE_CHECKING, NoReturn, Protocol, cast, runtime_checkable
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    ClassVar,
+    NamedTuple,
+    NoReturn,
+    Protocol,
+    cast,
+    runtime_checkable,
+)
 
 import aiosqlite
 import numpy as np
@@ -55,9 +71,19 @@ import orjson
 from mt5linux.constants import MT5Constants as c
 
 if TYPE_CHECKING:
-    from collections.abc import Awaitable, Callable, Coroutine, Sequence
+    from collections.abc import (
+        AsyncIterator,
+        Awaitable,
+        Callable,
+        Coroutine,
+        Iterable,
+        Iterator,
+        Sequence,
+    )
+    from contextvars import Context
 
     from numpy.typing import NDArray
+    from pydantic import BaseModel
 
     from mt5linux.settings import MT5Settings
     from mt5linux.types import T
@@ -81,6 +107,31 @@ class _SymbolsResponseProto(Protocol):
     chunks: Sequence[bytes]
 
 
+class _BookLevelProto(Protocol):
+    """Protocol for BookLevel protobuf message."""
+
+    type: int
+    price: float
+    volume: int
+    volume_dbl: float
+
+
+class _DealProto(Protocol):
+    """Deal fields used by the deal journal."""
+
+    @property
+    def ticket(self) -> int:
+        """Deal ticket."""
+
+    @property
+    def time(self) -> int:
+        """Deal time (Unix seconds, broker server time)."""
+
+    @property
+    def comment(self) -> str:
+        """Deal comment (carries the request_id marker)."""
+
+
 class _CircuitBreakerRecorder(Protocol):
     """Circuit-breaker behavior needed by transaction helpers."""
 
@@ -91,6 +142,11 @@ class _CircuitBreakerRecorder(Protocol):
 log = logging.getLogger(__name__)
 
 
+def _escape_label(value: str) -> str:
+    """Escape an OpenMetrics label value (backslash, quote, newline)."""
+    return value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
 class MT5Utilities:
     """Centralized utilities for mt5linux.
 
@@ -98,6 +154,9 @@ class MT5Utilities:
     - Exceptions: All exception classes
     - Data: All data utilities (validation, wrapping, datetime)
     - CircuitBreaker: Fault tolerance pattern
+    - ConnectivityState: Cached terminal connectivity
+    - Metrics: Per-stage request timing (histograms, OpenMetrics export)
+    - Hedger: Duplicate slow idempotent reads within a budget
 
     Note: All constants moved to MT5Constants.Validation:
     VERSION_TUPLE_LEN, ERROR_TUPLE_LEN, REQUEST_ID_*
@@ -239,6 +298,95 @@ class MT5Utilities:
     class Data:
         """Unified data utilities - validation, wrapping, transformation, datetime."""
 
+        class DtypeRegistry:
+            """Memo of parsed NumpyArray dtype strings.
+
+            Rates and ticks responses carry only a handful of distinct dtype
+            strings, so parsing (ast.literal_eval + np.dtype) happens once per
+            string. The canonical MT5 rates/ticks dtypes are predeclared and
+            never evicted; other strings live in a bounded LRU memo.
+            """
+
+            RATES: ClassVar[np.dtype[Any]] = np.dtype(
+                [
+                    ("time", "<i8"),
+                    ("open", "<f8"),
+                    ("high", "<f8"),
+                    ("low", "<f8"),
+                    ("close", "<f8"),
+                    ("tick_volume", "<u8"),
+                    ("spread", "<i4"),
+                    ("real_volume", "<u8"),
+                ]
+            )
+            TICKS: ClassVar[np.dtype[Any]] = np.dtype(
+                [
+                    ("time", "<i8"),
+                    ("bid", "<f8"),
+                    ("ask", "<f8"),
+                    ("last", "<f8"),
+                    ("volume", "<u8"),
+                    ("time_msc", "<i8"),
+                    ("flags", "<u4"),
+                    ("volume_real", "<f8"),
+                ]
+            )
+            # market_book_get(return_format="array"), built client-side
+            BOOK: ClassVar[np.dtype[Any]] = np.dtype(
+                [
+                    ("type", "<i8"),
+                    ("price", "<f8"),
+                    ("volume", "<i8"),
+                    ("volume_dbl", "<f8"),
+                ]
+            )
+            MAX_SIZE: ClassVar[int] = 64
+
+            _canonical: ClassVar[dict[str, np.dtype[Any]]] = {
+                str(RATES): RATES,
+                str(TICKS): TICKS,
+            }
+            _memo: ClassVar[OrderedDict[str, np.dtype[Any]]] = OrderedDict()
+            _lock: ClassVar[threading.Lock] = threading.Lock()
+
+            @classmethod
+            def get(cls, dtype_str: str) -> np.dtype[Any]:
+                """Return the dtype for a NumpyArray dtype string.
+
+                Args:
+                    dtype_str: Simple ('<f8') or structured
+                        ("[('time', '<i8'), ...]") dtype string.
+
+                Returns:
+                    Parsed (and memoized) numpy dtype.
+
+                """
+                dtype = cls._canonical.get(dtype_str)
+                if dtype is not None:
+                    return dtype
+                with cls._lock:
+                    dtype = cls._memo.get(dtype_str)
+                    if dtype is not None:
+                        cls._memo.move_to_end(dtype_str)
+                        return dtype
+                if dtype_str.startswith("["):
+                    # Structured array dtype - parse the list of tuples
+                    dtype = np.dtype(ast.literal_eval(dtype_str))
+                else:
+                    # Simple dtype like 'float64', '<f8'
+                    dtype = np.dtype(dtype_str)
+                with cls._lock:
+                    cls._memo[dtype_str] = dtype
+                    while len(cls._memo) > cls.MAX_SIZE:
+                        cls._memo.popitem(last=False)
+                return dtype
+
+            @classmethod
+            def size(cls) -> int:
+                """Return the number of memoized (non-canonical) dtypes."""
+                with cls._lock:
+                    return len(cls._memo)
+
         class Wrapper:
             """Wrapper for MT5 data dict with attribute access."""
 
@@ -450,7 +598,8 @@ class MT5Utilities:
             """
             if not json_data:
                 return None
-            parsed = orjson.loads(json_data)
+            with MT5Utilities.Metrics.stage("decode"):
+                parsed = orjson.loads(json_data)
             if not isinstance(parsed, dict):
                 return None
             return cast("dict[str, object]", parsed)
@@ -473,7 +622,8 @@ class MT5Utilities:
             """
             if not json_items:
                 return None
-            return [orjson.loads(item) for item in json_items if item]
+            with MT5Utilities.Metrics.stage("decode"):
+                return [orjson.loads(item) for item in json_items if item]
 
         @staticmethod
         def unwrap_proto_list_to_tuple(
@@ -499,6 +649,8 @@ class MT5Utilities:
         @staticmethod
         def numpy_from_proto(
             proto: _NumpyArrayProto | None,
+            *,
+            copy: bool = False,
         ) -> NDArray[np.void] | None:
             """Convert NumpyArray proto to numpy array.
 
@@ -506,11 +658,14 @@ class MT5Utilities:
             from gRPC NumpyArray protobuf messages.
 
             Handles both simple dtypes ('float64') and structured array dtypes
-            ("[('time', '<i8'), ('open', '<f8'), ...]").
+            ("[('time', '<i8'), ('open', '<f8'), ...]"), parsed once per
+            distinct string via DtypeRegistry.
 
             Args:
                 proto: NumpyArray protobuf message with .data, .dtype, .shape
                  attributes.
+                copy: Return an owned, writable copy instead of a read-only
+                 zero-copy view over the protobuf bytes.
 
             Returns:
                 NumPy structured array or None if empty.
@@ -519,20 +674,73 @@ class MT5Utilities:
             if proto is None or not proto.data or not proto.dtype:
                 return None
 
-            # Parse dtype string to numpy dtype
-            dtype_str = proto.dtype
-            if dtype_str.startswith("["):
-                # Structured array dtype - parse the list of tuples
-                dtype_spec = ast.literal_eval(dtype_str)
-                dtype = np.dtype(dtype_spec)
-            else:
-                # Simple dtype like 'float64', '<f8'
-                dtype = np.dtype(dtype_str)
+            with MT5Utilities.Metrics.stage("decode"):
+                dtype = MT5Utilities.Data.DtypeRegistry.get(proto.dtype)
+                arr: NDArray[np.void] = np.frombuffer(proto.data, dtype=dtype)
+                if proto.shape:
+                    arr = arr.reshape(tuple(proto.shape))
+                if copy:
+                    return arr.copy()
+                arr.flags.writeable = False
+                return arr
 
-            arr: NDArray[np.void] = np.frombuffer(proto.data, dtype=dtype)
-            if proto.shape:
-                arr = arr.reshape(tuple(proto.shape))
-            return arr
+        @staticmethod
+        def records_from_array[R: NamedTuple](
+            record: type[R],
+            arr: NDArray[np.void] | None,
+        ) -> tuple[R, ...] | None:
+            """Convert a columnar structured array into records.
+
+            Rows whose array fields match the record fields in order are built
+            positionally; otherwise fields are matched by name and missing
+            ones take the record defaults.
+
+            Args:
+                record: NamedTuple record class (e.g. MT5Types.TradePosition).
+                arr: Structured array from an as_array response.
+
+            Returns:
+                Tuple of records or None if arr is None.
+
+            """
+            if arr is None:
+                return None
+            names = arr.dtype.names or ()
+            with MT5Utilities.Metrics.stage("decode"):
+                rows = cast("list[tuple[object, ...]]", arr.tolist())
+                if names == record._fields:
+                    return tuple(map(record._make, rows))
+                index = {name: i for i, name in enumerate(names)}
+                picks = [index.get(field) for field in record._fields]
+                defaults = [record._field_defaults.get(f) for f in record._fields]
+                return tuple(
+                    record._make(
+                        row[i] if i is not None else default
+                        for i, default in zip(picks, defaults, strict=True)
+                    )
+                    for row in rows
+                )
+
+        @staticmethod
+        def records_from_dicts[R: NamedTuple](
+            record: type[R],
+            dicts: Sequence[dict[str, object]],
+        ) -> tuple[R, ...]:
+            """Convert bridge dicts into records (missing fields take defaults).
+
+            Args:
+                record: NamedTuple record class (e.g. MT5Types.BookInfo).
+                dicts: Field values, one dict per row.
+
+            Returns:
+                Tuple of records in dict order.
+
+            """
+            defaults = record._field_defaults
+            fields = record._fields
+            return tuple(
+                record._make(d.get(f, defaults.get(f)) for f in fields) for d in dicts
+            )
 
         @staticmethod
         def unwrap_symbols_chunks(
@@ -705,6 +913,30 @@ class MT5Utilities:
 
             return isinstance(error, (TimeoutError, OSError))
 
+        @staticmethod
+        def is_connectivity_error(error: Exception) -> bool:
+            """Check if exception indicates the bridge/terminal link is down.
+
+            Narrower than is_retryable_exception: only UNAVAILABLE and
+            DEADLINE_EXCEEDED gRPC codes, ConnectionError and TimeoutError.
+            Used to invalidate cached connectivity state.
+
+            Args:
+                error: Exception to check.
+
+            Returns:
+                True if exception signals lost connectivity.
+
+            """
+            if hasattr(error, "code") and callable(error.code):
+                code = error.code()
+                code_value = code.value[0] if hasattr(code, "value") else int(code)
+                return code_value in {
+                    c.Resilience.GrpcRetryableCode.UNAVAILABLE,
+                    c.Resilience.GrpcRetryableCode.DEADLINE_EXCEEDED,
+                }
+            return isinstance(error, (ConnectionError, TimeoutError))
+
         @staticmethod
         def classify_mt5_retcode(  # noqa: PLR0911
             retcode: int,
@@ -1334,193 +1566,1520 @@ class MT5Utilities:
                 return status
 
     # =========================================================================
-    # TRANSACTION HANDLER (order_send orchestration)
+    # CONNECTIVITY STATE (cached terminal_info().connected)
     # =========================================================================
 
-    class TransactionHandler:
-        """Handler for critical transaction orchestration.
+    class ConnectivityState:
+        """Cached terminal connectivity with a staleness window.
 
-        Centralizes transaction logic used by _safe_order_send:
-        - Request preparation with idempotency markers
-        - Result classification and outcome determination
-        - Retry decision logic
+        Kept current by the health monitor and by the outcome of regular
+        calls, so the pre-call terminal check can be answered in memory
+        instead of issuing a terminal_info round-trip before every request.
 
-        All methods are static - no state stored.
+        States:
+            UNKNOWN: No observation yet, or invalidated by a connectivity error
+            CONNECTED: Terminal reported connected at last observation
+            DISCONNECTED: Terminal reported not connected at last observation
 
-        Contains RequestTracker as nested class for idempotency tracking.
+        Usage:
+            state = MT5Utilities.ConnectivityState(config=mt5_settings)
+            if state.is_fresh_connected():
+                return  # skip live probe
+            info = await client.terminal_info()
+            state.record(connected=info.connected)
         """
 
-        class RequestTracker:
-            """Track order requests to prevent double execution.
-
-            Uses comment field as idempotency marker since MT5 doesn't have
-            native support for request deduplication. Each order_send gets
-            a unique request_id embedded in the comment field.
-
-            MT5 Limitations:
-            - No native idempotency (each request creates new order)
-            - Comment field is 31 chars max
-            - No "order already exists" detection
-
-            Format: RQ<16chars>|<original_comment>
-            Example: RQ1a2b3c4d5e6f7g8h|my_order
+        def __init__(self, config: MT5Settings) -> None:
+            """Initialize connectivity state.
 
-            CRITICAL FIX v4: Increased from 10 hex chars (40 bits) to 16 hex
-            chars (64 bits) to reduce collision probability:
-            - 10 chars: collision after ~1M requests (Birthday paradox)
-            - 16 chars: collision after ~4B requests (~12 years at 10/sec)
+            Args:
+                config: MT5Settings with terminal_state_staleness.
 
-            Nested inside TransactionHandler since it's only used
-            for transaction idempotency tracking.
             """
+            self._settings = config
+            self._connected: bool | None = None
+            self._updated_at = 0.0
+            self._lock = threading.RLock()
 
-            @staticmethod
-            def generate_request_id() -> str:
-                """Generate unique request ID for idempotency.
-
-                Format: RQ + 16 hex chars = 18 chars total.
-                Uses 64 bits of entropy (16 hex chars) to reduce collision risk.
-                Birthday paradox: collision expected after ~4 billion requests.
-                Fits in MT5 comment field (31 chars max, leaves 12 for original).
-
-                CRITICAL FIX v4: Increased from 10 hex chars (40 bits) to 16 hex
-                chars (64 bits). With 10 chars, collision expected after ~1M requests
-                (in ~1 day at 10 orders/sec). With 16 chars, collision expected
-                after ~4B requests (in ~12 years at 10 orders/sec).
-
-                Returns:
-                    18-character request ID starting with 'RQ'.
+        @property
+        def connected(self) -> bool | None:
+            """Last observed connectivity (None if unknown)."""
+            with self._lock:
+                return self._connected
 
-                """
-                prefix = c.Validation.REQUEST_ID_PREFIX
-                hex_len = c.Validation.REQUEST_ID_HEX_LENGTH
-                return f"{prefix}{uuid.uuid4().hex[:hex_len]}"
+        @property
+        def age(self) -> float:
+            """Seconds since last observation (inf if unknown)."""
+            with self._lock:
+                if self._connected is None:
+                    return float("inf")
+                return time.monotonic() - self._updated_at
 
-            @staticmethod
-            def mark_comment(comment: str | None, request_id: str) -> str:
-                """Add request_id marker to comment field.
+        def record(self, *, connected: bool) -> None:
+            """Record a connectivity observation.
 
-                Embeds request_id at the start of comment for later extraction.
-                Preserves as much of original comment as possible.
+            Args:
+                connected: Whether the terminal is connected to the broker.
 
-                Args:
-                    comment: Original comment (may be None or empty).
-                    request_id: Request ID to embed (18 chars).
+            """
+            with self._lock:
+                self._connected = connected
+                self._updated_at = time.monotonic()
 
-                Returns:
-                    Marked comment: 'RQ<16chars>|<original>' or just 'RQ<16chars>'.
+        def invalidate(self) -> None:
+            """Forget the last observation, forcing a live probe next time."""
+            with self._lock:
+                self._connected = None
+                self._updated_at = 0.0
 
-                """
-                if comment:
-                    # Leave room for request_id + separator + some original
-                    max_original = 31 - len(request_id) - 1
-                    return f"{request_id}|{comment[:max_original]}"
-                return request_id
+        def is_fresh_connected(self) -> bool:
+            """Check if terminal is known connected within the staleness window."""
+            with self._lock:
+                if self._connected is not True:
+                    return False
+                elapsed = time.monotonic() - self._updated_at
+                return elapsed < self._settings.terminal_state_staleness
 
-            @staticmethod
-            def extract_request_id(comment: str | None) -> str | None:
-                """Extract request_id from marked comment field.
+        def get_status(self) -> dict[str, str | float]:
+            """Get connectivity state for monitoring.
 
-                CRITICAL FIX: Added validation to prevent false matches:
-                - Length must be exactly 18 chars (RQ + 16 hex)
-                - Must start with "RQ"
-                - Remaining 16 chars must be valid hex
-                This prevents matching corrupted/concatenated comments.
+            Returns:
+                Dictionary with state name and observation age.
 
-                Args:
-                    comment: Comment field from order/deal.
+            """
+            with self._lock:
+                if self._connected is None:
+                    name = "UNKNOWN"
+                else:
+                    name = "CONNECTED" if self._connected else "DISCONNECTED"
+            return {"state": name, "age": self.age}
 
-                Returns:
-                    Request ID if found and valid, None otherwise.
+    # =========================================================================
+    # MODEL FACTORY (validated or constructed response models)
+    # =========================================================================
 
-                """
-                prefix = c.Validation.REQUEST_ID_PREFIX
-                if not comment or not comment.startswith(prefix):
-                    return None
+    class ModelFactory:
+        """Build response models from bridge dicts, validated or constructed.
 
-                # Extract candidate (before separator if present)
-                candidate = comment.split("|")[0]
+        model_validate checks and coerces every field; model_construct only
+        assigns the values, which is several times cheaper for data coming
+        from our own bridge. When validation is off, a sample of responses
+        (validate_models_sample_rate) is still validated and compared with
+        the constructed models, so schema drift between bridge and models
+        is logged instead of silently producing wrong fields.
 
-                # Validate length
-                if len(candidate) != c.Validation.REQUEST_ID_LENGTH:
-                    log.debug(
-                        "Invalid request_id length: %d (expected %d)",
-                        len(candidate),
-                        c.Validation.REQUEST_ID_LENGTH,
-                    )
-                    return None
+        Usage:
+            models = MT5Utilities.ModelFactory(config=mt5_settings)
+            positions = models.build_many(Position, dicts, validate=False)
+        """
 
-                # Validate hex portion (chars 2-18 should be hex)
-                hex_part = candidate[len(c.Validation.REQUEST_ID_PREFIX) :]
-                try:
-                    int(hex_part, 16)  # Validate hex
-                except ValueError:
-                    log.debug(
-                        "Invalid request_id hex portion: %s",
-                        hex_part,
-                    )
-                    return None
+        def __init__(self, config: MT5Settings) -> None:
+            """Initialize the factory.
 
-                return candidate
+            Args:
+                config: MT5Settings with validate_models and
+                    validate_models_sample_rate.
 
-        @staticmethod
-        def prepare_request(
-            request: dict[str, object],
-            operation: str,
-        ) -> tuple[dict[str, object], str]:
-            """Prepare request with idempotency marker.
+            """
+            self._settings = config
+            self._constructed = 0
+            self._sampled = 0
+            self._drift = 0
 
-            Adds request_id to comment field for tracking and verification.
+        def build[M: BaseModel](
+            self,
+            model: type[M],
+            data: dict[str, object] | None,
+            *,
+            validate: bool | None = None,
+        ) -> M | None:
+            """Build one model (None if data is None).
 
             Args:
-                request: Order request dictionary.
-                operation: Operation name for logging.
+                model: Model class.
+                data: Field values from the bridge.
+                validate: Override validate_models for this call.
 
             Returns:
-                Tuple of (modified_request, request_id).
+                Model instance or None.
 
             """
-            tracker = MT5Utilities.TransactionHandler.RequestTracker
-            request_id = tracker.generate_request_id()
-            original_comment = request.get("comment", "") or ""
-            request["comment"] = tracker.mark_comment(str(original_comment), request_id)
-            log.debug(
-                "TX_PREPARE: %s request_id=%s",
-                operation,
-                request_id,
-            )
-            return request, request_id
+            if data is None:
+                return None
+            return self.build_many(model, [data], validate=validate)[0]
 
-        @staticmethod
-        def classify_result(
-            retcode: int,
-        ) -> c.Resilience.TransactionOutcome:
-            """Classify result retcode into transaction outcome (PUBLIC API).
+        def build_many[M: BaseModel](
+            self,
+            model: type[M],
+            dicts: Sequence[dict[str, object]],
+            *,
+            validate: bool | None = None,
+        ) -> tuple[M, ...]:
+            """Build one model per dict.
 
-            This is the BRIDGE function between:
-            - ErrorClassification (7 values, internal, detailed)
-            - TransactionOutcome (5 values, public, simplified)
+            Args:
+                model: Model class.
+                dicts: Field values from the bridge, one dict per row.
+                validate: Override validate_models for this call.
 
-            Mapping:
-                SUCCESS → SUCCESS
-                PARTIAL → PARTIAL
-                RETRYABLE → RETRY
-                VERIFY_REQUIRED → VERIFY_REQUIRED
-                PERMANENT → PERMANENT_FAILURE
-                CONDITIONAL → VERIFY_REQUIRED (conservative, verify state)
-                UNKNOWN → VERIFY_REQUIRED (conservative, verify state)
+            Returns:
+                Tuple of model instances in dict order.
 
-            Why CONDITIONAL/UNKNOWN → VERIFY_REQUIRED (not PERMANENT_FAILURE)?
-            - These represent ambiguous states where order MAY have executed
-            - Conservative approach: verify state before deciding
-            - Prevents both: double execution (retry when executed) AND
-              missed execution (fail when actually succeeded)
+            """
+            if validate is None:
+                validate = self._settings.validate_models
+            with MT5Utilities.Metrics.stage("validate"):
+                if validate:
+                    return tuple(model.model_validate(d) for d in dicts)
+                built = tuple(
+                    model.model_construct(**cast("dict[str, Any]", d)) for d in dicts
+                )
+            self._constructed += len(built)
+            rate = self._settings.validate_models_sample_rate
+            # S311: sampling for diagnostics - not cryptographic
+            if rate > 0 and random.random() < rate:  # noqa: S311
+                self._check(model, dicts, built)
+            return built
+
+        def _check[M: BaseModel](
+            self,
+            model: type[M],
+            dicts: Sequence[dict[str, object]],
+            built: tuple[M, ...],
+        ) -> None:
+            """Validate a constructed response and log the first mismatch."""
+            self._sampled += 1
+            for data, constructed in zip(dicts, built, strict=True):
+                try:
+                    validated = model.model_validate(data)
+                except ValueError as e:
+                    problem = str(e)
+                else:
+                    fields = [
+                        name
+                        for name in type(validated).model_fields
+                        if getattr(validated, name) != getattr(constructed, name, None)
+                    ]
+                    if not fields:
+                        continue
+                    problem = f"fields differ after validation: {fields}"
+                self._drift += 1
+                log.warning("Schema drift in %s: %s", model.__name__, problem)
+                return
 
-            Args:
-                retcode: MT5 TradeRetcode value.
+        def get_stats(self) -> dict[str, int]:
+            """Get construction statistics for monitoring.
 
             Returns:
-                TransactionOutcome indicating next action for caller.
+                Dictionary with constructed models, sampled responses and
+                responses that failed the sampled validation.
+
+            """
+            return {
+                "constructed": self._constructed,
+                "sampled": self._sampled,
+                "drift": self._drift,
+            }
+
+    # =========================================================================
+    # METRICS (per-stage request timing)
+    # =========================================================================
+
+    class Metrics:
+        """Per-stage timing of client requests with a pluggable recorder.
+
+        AsyncMetaTrader5 opens a scope per operation; code on the request path
+        records stage durations into it without knowing the recorder:
+
+        - total: the whole operation, retries included
+        - precheck: terminal_info connectivity probe before the call
+        - queue_wait: time in RequestQueue before dispatch
+        - rpc: gRPC round trip; transit = rpc - bridge_handler
+        - bridge_<stage>: bridge timings from the mt5-stages trailer
+          (handler, mt5_queue, mt5_call, encode)
+        - decode: JSON/numpy decoding of bridge responses
+        - validate: pydantic model construction or validation
+
+        Outside a scope, stage() and record() do nothing. Any object with
+        observe(operation, stage, seconds) can replace the default
+        Histograms recorder (e.g. to feed an existing metrics library).
+
+        Usage:
+            metrics = MT5Utilities.Metrics.Histograms()
+            with MT5Utilities.Metrics.scope(metrics, "symbol_info_tick"):
+                with MT5Utilities.Metrics.stage("decode"):
+                    ...
+            metrics.snapshot()["symbol_info_tick"]["decode"]["p99"]
+            metrics.to_openmetrics()
+        """
+
+        # Trailing metadata key the bridge sends "stage=ms,..." timings under
+        TRAILER_KEY: ClassVar[str] = "mt5-stages"
+
+        class Recorder(Protocol):
+            """Sink for stage durations."""
+
+            def observe(self, operation: str, stage: str, seconds: float) -> None:
+                """Record one stage duration of an operation."""
+                ...
+
+        class Histograms:
+            """In-memory stage histograms with an OpenMetrics text exporter.
+
+            Thread-safe: histograms are guarded by a single lock.
+            """
+
+            # Bucket upper bounds in seconds (cumulative, +Inf implied)
+            DEFAULT_BUCKETS: ClassVar[tuple[float, ...]] = (
+                0.0001,
+                0.00025,
+                0.0005,
+                0.001,
+                0.0025,
+                0.005,
+                0.01,
+                0.025,
+                0.05,
+                0.1,
+                0.25,
+                0.5,
+                1.0,
+                2.5,
+                5.0,
+                10.0,
+            )
+
+            def __init__(self, buckets: Sequence[float] | None = None) -> None:
+                """Initialize empty histograms.
+
+                Args:
+                    buckets: Increasing bucket upper bounds in seconds.
+
+                """
+                self._buckets = tuple(buckets or self.DEFAULT_BUCKETS)
+                self._lock = threading.Lock()
+                self._counts: dict[tuple[str, str], list[int]] = {}
+                self._sums: dict[tuple[str, str], float] = {}
+
+            def observe(self, operation: str, stage: str, seconds: float) -> None:
+                """Record one stage duration of an operation."""
+                key = (operation, stage)
+                with self._lock:
+                    counts = self._counts.get(key)
+                    if counts is None:
+                        counts = self._counts[key] = [0] * (len(self._buckets) + 1)
+                        self._sums[key] = 0.0
+                    counts[bisect_left(self._buckets, seconds)] += 1
+                    self._sums[key] += seconds
+
+            def quantile(self, operation: str, stage: str, q: float) -> float | None:
+                """Estimate a quantile of a stage in seconds.
+
+                Interpolates linearly inside the bucket holding the rank;
+                values beyond the last bucket report its bound.
+
+                Args:
+                    operation: Operation name (e.g. "symbol_info_tick").
+                    stage: Stage name (e.g. "rpc").
+                    q: Quantile in [0, 1].
+
+                Returns:
+                    Estimated duration, or None before the first observation.
+
+                """
+                with self._lock:
+                    counts = self._counts.get((operation, stage))
+                    if counts is None:
+                        return None
+                    return self._estimate(counts, q)
+
+            def _estimate(self, counts: list[int], q: float) -> float:
+                rank = q * sum(counts)
+                cumulative = 0
+                for index, count in enumerate(counts):
+                    if count and cumulative + count >= rank:
+                        if index == len(self._buckets):
+                            break
+                        lower = self._buckets[index - 1] if index else 0.0
+                        upper = self._buckets[index]
+                        return lower + (upper - lower) * (rank - cumulative) / count
+                    cumulative += count
+                return self._buckets[-1]
+
+            def snapshot(self) -> dict[str, dict[str, dict[str, object]]]:
+                """Return the histograms keyed by operation, then stage.
+
+                Returns:
+                    Per stage: count, sum, p50/p95/p99 estimates (seconds) and
+                    cumulative buckets keyed by upper bound ("+Inf" last).
+
+                """
+                with self._lock:
+                    result: dict[str, dict[str, dict[str, object]]] = {}
+                    for (operation, stage), counts in sorted(self._counts.items()):
+                        buckets: dict[str, int] = {}
+                        cumulative = 0
+                        for bound, count in zip(self._buckets, counts, strict=False):
+                            cumulative += count
+                            buckets[f"{bound:g}"] = cumulative
+                        buckets["+Inf"] = cumulative + counts[-1]
+                        result.setdefault(operation, {})[stage] = {
+                            "count": buckets["+Inf"],
+                            "sum": self._sums[operation, stage],
+                            "p50": self._estimate(counts, 0.5),
+                            "p95": self._estimate(counts, 0.95),
+                            "p99": self._estimate(counts, 0.99),
+                            "buckets": buckets,
+                        }
+                    return result
+
+            def to_openmetrics(self, prefix: str = "mt5linux") -> str:
+                """Render the histograms in the OpenMetrics text format.
+
+                Also parsed by Prometheus' text format scrapers.
+
+                Args:
+                    prefix: Metric name prefix.
+
+                Returns:
+                    One <prefix>_stage_seconds histogram family labelled by
+                    operation and stage, terminated by "# EOF".
+
+                """
+                name = f"{prefix}_stage_seconds"
+                lines = [
+                    f"# TYPE {name} histogram",
+                    f"# UNIT {name} seconds",
+                    f"# HELP {name} Duration of one stage of an MT5 request.",
+                ]
+                with self._lock:
+                    for (operation, stage), counts in sorted(self._counts.items()):
+                        labels = (
+                            f'operation="{_escape_label(operation)}",'
+                            f'stage="{_escape_label(stage)}"'
+                        )
+                        cumulative = 0
+                        for bound, count in zip(self._buckets, counts, strict=False):
+                            cumulative += count
+                            lines.append(
+                                f'{name}_bucket{{{labels},le="{float(bound)!r}"}} '
+                                f"{cumulative}"
+                            )
+                        cumulative += counts[-1]
+                        lines.extend(
+                            (
+                                f'{name}_bucket{{{labels},le="+Inf"}} {cumulative}',
+                                f"{name}_count{{{labels}}} {cumulative}",
+                                (
+                                    f"{name}_sum{{{labels}}} "
+                                    f"{self._sums[operation, stage]!r}"
+                                ),
+                            )
+                        )
+                lines.append("# EOF")
+                return "\n".join(lines) + "\n"
+
+            def reset(self) -> None:
+                """Drop all observations."""
+                with self._lock:
+                    self._counts.clear()
+                    self._sums.clear()
+
+        # (recorder, operation) of the request being handled, None outside
+        _scope: ClassVar[
+            ContextVar[tuple[MT5Utilities.Metrics.Recorder, str] | None]
+        ] = ContextVar("mt5linux_metrics_scope", default=None)
+
+        @classmethod
+        @contextmanager
+        def scope(
+            cls, recorder: MT5Utilities.Metrics.Recorder, operation: str
+        ) -> Iterator[None]:
+            """Record stages in this context (and tasks it starts) for operation."""
+            token = cls._scope.set((recorder, operation))
+            try:
+                yield
+            finally:
+                cls._scope.reset(token)
+
+        @classmethod
+        def current(cls) -> tuple[MT5Utilities.Metrics.Recorder, str] | None:
+            """Return the (recorder, operation) of the active scope, if any."""
+            return cls._scope.get()
+
+        @classmethod
+        def record(cls, stage: str, seconds: float) -> None:
+            """Record a stage duration in the active scope (no-op outside one)."""
+            scope = cls._scope.get()
+            if scope is not None:
+                scope[0].observe(scope[1], stage, seconds)
+
+        @classmethod
+        @contextmanager
+        def stage(cls, name: str) -> Iterator[None]:
+            """Time the with-block as stage name in the active scope."""
+            scope = cls._scope.get()
+            if scope is None:
+                yield
+                return
+            start = time.perf_counter()
+            try:
+                yield
+            finally:
+                scope[0].observe(scope[1], name, time.perf_counter() - start)
+
+        @classmethod
+        def parse_trailer(
+            cls, metadata: Iterable[tuple[str, str | bytes]] | None
+        ) -> dict[str, float]:
+            """Extract bridge stage timings from trailing metadata.
+
+            Args:
+                metadata: Trailing metadata of a bridge response.
+
+            Returns:
+                Seconds per bridge stage (empty if the bridge sent none).
+
+            """
+            for key, value in metadata or ():
+                if key != cls.TRAILER_KEY:
+                    continue
+                text = value.decode() if isinstance(value, bytes) else value
+                stages: dict[str, float] = {}
+                for item in text.split(","):
+                    stage, _, ms = item.partition("=")
+                    with suppress(ValueError):
+                        stages[stage] = float(ms) / 1000.0
+                return stages
+            return {}
+
+        @classmethod
+        def record_rpc(
+            cls,
+            seconds: float,
+            metadata: Iterable[tuple[str, str | bytes]] | None,
+        ) -> None:
+            """Record a gRPC round trip and the bridge stages of its trailer.
+
+            Args:
+                seconds: Round trip as seen by the client.
+                metadata: Trailing metadata of the response.
+
+            """
+            scope = cls._scope.get()
+            if scope is None:
+                return
+            recorder, operation = scope
+            recorder.observe(operation, "rpc", seconds)
+            bridge = cls.parse_trailer(metadata)
+            for stage, value in bridge.items():
+                recorder.observe(operation, f"bridge_{stage}", value)
+            handler = bridge.get("handler")
+            if handler is not None:
+                recorder.observe(operation, "transit", max(seconds - handler, 0.0))
+
+    # =========================================================================
+    # TTL CACHE (client-side metadata caching)
+    # =========================================================================
+
+    class TTLCache[V]:
+        """Bounded LRU cache with a per-entry time-to-live.
+
+        Entries expire ttl seconds after they were stored; the least recently
+        used entry is evicted once max_size is reached. A ttl of 0 disables
+        the cache (get always misses, set is a no-op).
+
+        Usage:
+            cache = MT5Utilities.TTLCache[SymbolInfo](max_size=1024, ttl=300.0)
+            if (info := cache.get("EURUSD")) is None:
+                info = await fetch("EURUSD")
+                cache.set("EURUSD", info)
+        """
+
+        def __init__(self, max_size: int, ttl: float) -> None:
+            """Initialize the cache.
+
+            Args:
+                max_size: Maximum number of entries kept.
+                ttl: Seconds an entry stays valid (0 disables the cache).
+
+            """
+            self._max_size = max_size
+            self._ttl = ttl
+            self._entries: OrderedDict[str, tuple[V, float]] = OrderedDict()
+            self._lock = threading.Lock()
+            self._hits = 0
+            self._misses = 0
+            self._evictions = 0
+
+        @property
+        def enabled(self) -> bool:
+            """Whether caching is active (ttl > 0 and max_size > 0)."""
+            return self._ttl > 0 and self._max_size > 0
+
+        def get_entry(self, key: str) -> tuple[V, float] | None:
+            """Get a live entry with its age.
+
+            Args:
+                key: Cache key.
+
+            Returns:
+                Tuple of (value, age in seconds), or None if missing or expired.
+
+            """
+            with self._lock:
+                entry = self._entries.get(key)
+                if entry is None:
+                    self._misses += 1
+                    return None
+                value, stored_at = entry
+                age = time.monotonic() - stored_at
+                if age >= self._ttl:
+                    del self._entries[key]
+                    self._misses += 1
+                    return None
+                self._entries.move_to_end(key)
+                self._hits += 1
+                return value, age
+
+        def get(self, key: str) -> V | None:
+            """Get a live value (None if missing or expired)."""
+            entry = self.get_entry(key)
+            return entry[0] if entry is not None else None
+
+        def set(self, key: str, value: V) -> None:
+            """Store a value, evicting the least recently used entry if full."""
+            if not self.enabled:
+                return
+            with self._lock:
+                self._entries[key] = (value, time.monotonic())
+                self._entries.move_to_end(key)
+                while len(self._entries) > self._max_size:
+                    self._entries.popitem(last=False)
+                    self._evictions += 1
+
+        def replace(self, key: str, value: V) -> None:
+            """Update a stored value without extending its time-to-live."""
+            with self._lock:
+                entry = self._entries.get(key)
+                if entry is not None:
+                    self._entries[key] = (value, entry[1])
+
+        def pop(self, key: str) -> None:
+            """Remove an entry if present."""
+            with self._lock:
+                self._entries.pop(key, None)
+
+        def clear(self) -> None:
+            """Remove all entries."""
+            with self._lock:
+                self._entries.clear()
+
+        def __len__(self) -> int:
+            """Return the number of stored entries (expired until read)."""
+            with self._lock:
+                return len(self._entries)
+
+        def get_stats(self) -> dict[str, int | float]:
+            """Get cache statistics for monitoring.
+
+            Returns:
+                Dictionary with size, limits, hits, misses and evictions.
+
+            """
+            with self._lock:
+                return {
+                    "size": len(self._entries),
+                    "max_size": self._max_size,
+                    "ttl": self._ttl,
+                    "hits": self._hits,
+                    "misses": self._misses,
+                    "evictions": self._evictions,
+                }
+
+    # =========================================================================
+    # RATES CACHE (incremental OHLCV bars)
+    # =========================================================================
+
+    class RatesCache:
+        """Incremental OHLCV bar cache keyed by (symbol, timeframe).
+
+        Each key holds one contiguous structured array sorted by bar time,
+        grown with amortized doubling so appending a few new bars does not
+        copy the history. Merging new bars replaces any cached bar with the
+        same or later time (the still-forming bar is updated in place).
+        Total buffer memory is bounded by max_bytes: least recently used
+        keys are evicted first, and a single key whose bars alone exceed the
+        budget is not cached (a truncated series could never serve the count
+        it was fetched for).
+
+        Usage:
+            cache = MT5Utilities.RatesCache(max_bytes=64 * 1024 * 1024)
+            if (since := cache.last_time("EURUSD", tf)) is not None:
+                cache.merge("EURUSD", tf, fetch_range(since, now))
+            bars = cache.tail("EURUSD", tf, 5000)
+        """
+
+        def __init__(self, max_bytes: int) -> None:
+            """Initialize the cache.
+
+            Args:
+                max_bytes: Memory budget for all bar buffers (0 disables).
+
+            """
+            self._max_bytes = max_bytes
+            # key -> (buffer, used length); buffer capacity >= used length
+            self._entries: OrderedDict[
+                tuple[str, int], tuple[NDArray[np.void], int]
+            ] = OrderedDict()
+            self._nbytes = 0
+            self._lock = threading.Lock()
+            self._evictions = 0
+
+        @property
+        def enabled(self) -> bool:
+            """Whether caching is active (max_bytes > 0)."""
+            return self._max_bytes > 0
+
+        def __len__(self) -> int:
+            """Return the number of cached (symbol, timeframe) series."""
+            with self._lock:
+                return len(self._entries)
+
+        def count(self, symbol: str, timeframe: int) -> int:
+            """Return the number of cached bars for a series."""
+            with self._lock:
+                entry = self._entries.get((symbol, timeframe))
+                return entry[1] if entry is not None else 0
+
+        def last_time(self, symbol: str, timeframe: int) -> int | None:
+            """Return the open time of the newest cached bar (None if empty)."""
+            with self._lock:
+                entry = self._entries.get((symbol, timeframe))
+                if entry is None or entry[1] == 0:
+                    return None
+                buffer, length = entry
+                return int(buffer["time"][length - 1])
+
+        def tail(
+            self, symbol: str, timeframe: int, count: int
+        ) -> NDArray[np.void] | None:
+            """Return a copy of the newest count bars (None if not cached).
+
+            Args:
+                symbol: Symbol name.
+                timeframe: Timeframe constant.
+                count: Number of bars wanted.
+
+            Returns:
+                Owned array of at most count bars, oldest first.
+
+            """
+            key = (symbol, timeframe)
+            with self._lock:
+                entry = self._entries.get(key)
+                if entry is None or entry[1] == 0:
+                    return None
+                self._entries.move_to_end(key)
+                buffer, length = entry
+                return buffer[max(0, length - count) : length].copy()
+
+        def replace(self, symbol: str, timeframe: int, bars: NDArray[np.void]) -> None:
+            """Replace a series with a freshly fetched, time-sorted array."""
+            if not self.enabled:
+                return
+            key = (symbol, timeframe)
+            with self._lock:
+                self._drop(key)
+                buffer = np.empty(len(bars), dtype=bars.dtype)
+                buffer[:] = bars
+                self._store(key, buffer, len(bars))
+
+        def merge(self, symbol: str, timeframe: int, bars: NDArray[np.void]) -> None:
+            """Append bars newer than the cache, updating the forming bar.
+
+            Cached bars with time >= the first new bar are replaced. A series
+            that is not cached yet, or whose dtype differs, is replaced.
+
+            Args:
+                symbol: Symbol name.
+                timeframe: Timeframe constant.
+                bars: Time-sorted bars, typically from copy_rates_range.
+
+            """
+            if not self.enabled or len(bars) == 0:
+                return
+            key = (symbol, timeframe)
+            with self._lock:
+                entry = self._entries.get(key)
+                if entry is None or entry[0].dtype != bars.dtype:
+                    self._drop(key)
+                    buffer = np.empty(len(bars), dtype=bars.dtype)
+                    buffer[:] = bars
+                    self._store(key, buffer, len(bars))
+                    return
+                buffer, length = entry
+                keep = int(
+                    np.searchsorted(buffer["time"][:length], bars["time"][0], "left")
+                )
+                needed = keep + len(bars)
+                if needed > len(buffer):
+                    grown = np.empty(max(needed, 2 * len(buffer)), dtype=buffer.dtype)
+                    grown[:keep] = buffer[:keep]
+                    self._nbytes -= buffer.nbytes
+                    del self._entries[key]
+                    buffer = grown
+                    self._nbytes += buffer.nbytes
+                buffer[keep:needed] = bars
+                self._entries[key] = (buffer, needed)
+                self._entries.move_to_end(key)
+                self._enforce_budget(key)
+
+        def invalidate(
+            self, symbol: str | None = None, timeframe: int | None = None
+        ) -> None:
+            """Drop cached series.
+
+            Args:
+                symbol: Symbol to drop (None = all symbols).
+                timeframe: Timeframe to drop (None = all timeframes).
+
+            """
+            with self._lock:
+                for key in list(self._entries):
+                    if (symbol is None or key[0] == symbol) and (
+                        timeframe is None or key[1] == timeframe
+                    ):
+                        self._drop(key)
+
+        def get_stats(self) -> dict[str, int]:
+            """Get cache statistics for monitoring.
+
+            Returns:
+                Dictionary with series count, bytes used, budget and evictions.
+
+            """
+            with self._lock:
+                return {
+                    "series": len(self._entries),
+                    "bars": sum(length for _, length in self._entries.values()),
+                    "nbytes": self._nbytes,
+                    "max_bytes": self._max_bytes,
+                    "evictions": self._evictions,
+                }
+
+        def _store(
+            self, key: tuple[str, int], buffer: NDArray[np.void], length: int
+        ) -> None:
+            self._entries[key] = (buffer, length)
+            self._nbytes += buffer.nbytes
+            self._enforce_budget(key)
+
+        def _drop(self, key: tuple[str, int]) -> None:
+            entry = self._entries.pop(key, None)
+            if entry is not None:
+                self._nbytes -= entry[0].nbytes
+
+        def _enforce_budget(self, current: tuple[str, int]) -> None:
+            while self._nbytes > self._max_bytes and len(self._entries) > 1:
+                oldest = next(iter(self._entries))
+                if oldest == current:
+                    self._entries.move_to_end(current)
+                    continue
+                self._drop(oldest)
+                self._evictions += 1
+            if self._nbytes > self._max_bytes:
+                # Single series over budget: drop its spare capacity, or the
+                # whole series if its bars alone do not fit
+                buffer, length = self._entries[current]
+                if length * buffer.dtype.itemsize > self._max_bytes:
+                    self._drop(current)
+                    self._evictions += 1
+                    return
+                exact = buffer[:length].copy()
+                self._nbytes += exact.nbytes - buffer.nbytes
+                self._entries[current] = (exact, length)
+
+    # =========================================================================
+    # BOOK STATE (market depth rebuilt from SubscribeBook deltas)
+    # =========================================================================
+
+    class BookState:
+        """Local market depth for one symbol, rebuilt from stream updates.
+
+        The first update is a snapshot that replaces the book; later ones
+        carry only changed levels keyed by (type, price), with volume 0
+        removing a level. Sequence numbers must follow without gaps.
+
+        Usage:
+            book = MT5Utilities.BookState("EURUSD")
+            book.apply(update.sequence, update.levels, snapshot=update.snapshot)
+            depth = book.to_array()  # DtypeRegistry.BOOK, price descending
+        """
+
+        def __init__(self, symbol: str) -> None:
+            """Initialize an empty book.
+
+            Args:
+                symbol: Symbol name (for error messages).
+
+            """
+            self.symbol = symbol
+            self.sequence = 0
+            self._levels: dict[tuple[int, float], tuple[int, float]] = {}
+
+        def __len__(self) -> int:
+            """Return the number of price levels in the book."""
+            return len(self._levels)
+
+        def apply(
+            self,
+            sequence: int,
+            levels: Iterable[_BookLevelProto],
+            *,
+            snapshot: bool,
+        ) -> None:
+            """Apply a snapshot or delta update.
+
+            Args:
+                sequence: Update sequence number from the bridge.
+                levels: Full book (snapshot) or changed levels.
+                snapshot: Replace the book instead of patching it.
+
+            Raises:
+                MT5Utilities.Exceptions.Error: A delta does not follow the
+                    last applied sequence (missed or reordered update).
+
+            """
+            if snapshot:
+                self._levels.clear()
+            elif sequence != self.sequence + 1:
+                msg = (
+                    f"Book {self.symbol}: got update {sequence} after "
+                    f"{self.sequence}; resubscribe for a new snapshot"
+                )
+                raise MT5Utilities.Exceptions.Error(msg)
+            for level in levels:
+                key = (level.type, level.price)
+                if level.volume_dbl > 0 or level.volume > 0:
+                    self._levels[key] = (level.volume, level.volume_dbl)
+                else:
+                    self._levels.pop(key, None)
+            self.sequence = sequence
+
+        def to_array(self) -> NDArray[np.void]:
+            """Build the book as a structured array.
+
+            Returns:
+                New DtypeRegistry.BOOK array ordered like market_book_get
+                (price descending: sell levels above buy levels).
+
+            """
+            arr = np.array(
+                [
+                    (book_type, price, volume, volume_dbl)
+                    for (book_type, price), (volume, volume_dbl) in (
+                        self._levels.items()
+                    )
+                ],
+                dtype=MT5Utilities.Data.DtypeRegistry.BOOK,
+            )
+            return arr[np.argsort(-arr["price"], kind="stable")]
+
+    # =========================================================================
+    # HISTORY STORE (on-disk ticks/rates, memory-mapped reads)
+    # =========================================================================
+
+    class HistoryStore:
+        """Persistent per-day partitions of tick/rate arrays with a coverage index.
+
+        Layout (one series per kind/symbol/key, key = flags or timeframe):
+
+            {root}/{kind}/{symbol}/{key}/index.json   covered [from, to] ranges
+            {root}/{kind}/{symbol}/{key}/YYYYMMDD.npy raw structured rows
+
+        Partition files keep the exact dtype returned by numpy_from_proto,
+        sorted by "time", and are read back with np.load(mmap_mode="r").
+        Ranges are inclusive Unix seconds (broker server time, like the row
+        times), and a covered second holds all of its rows (ticks up to
+        time_msc .999). Only rows older than the settle window are written or
+        marked covered, and rates only up to the last bar closed by then, so
+        the still-changing recent past is always fetched live.
+
+        Usage:
+            store = MT5Utilities.HistoryStore(config=mt5_settings)
+            for lo, hi, covered in store.plan("ticks", "EURUSD", flags, a, b):
+                part = store.read(...) if covered else fetch(lo, hi)
+        """
+
+        _DAY = 86400
+        # TIMEFRAME_* keeps its unit in bits 14-15 and the count below them
+        _TF_UNIT_MASK = 0xC000
+        _TF_UNIT_SECONDS: ClassVar[dict[int, int]] = {
+            0x0000: 60,
+            0x4000: 3600,
+            0x8000: 604_800,
+        }
+
+        def __init__(self, config: MT5Settings) -> None:
+            """Initialize the store.
+
+            Args:
+                config: MT5Settings with history_store_path and
+                    history_store_settle.
+
+            """
+            self._root = Path(config.history_store_path or "").expanduser()
+            self._settle = config.history_store_settle
+            self._lock = threading.Lock()
+            self._index: dict[Path, list[list[int]]] = {}
+            # Serializes partition merges and index updates of one series
+            self._series_locks: dict[Path, threading.Lock] = {}
+
+        def plan(
+            self, kind: str, symbol: str, key: int, start: int, end: int
+        ) -> list[tuple[int, int, bool]]:
+            """Split [start, end] into covered and missing segments.
+
+            Args:
+                kind: Series kind ("ticks" or "rates").
+                symbol: Symbol name.
+                key: Copy flags (ticks) or timeframe (rates).
+                start: Range start (Unix seconds, inclusive).
+                end: Range end (Unix seconds, inclusive).
+
+            Returns:
+                Time-ordered (from, to, covered) segments spanning the range.
+
+            """
+            segments: list[tuple[int, int, bool]] = []
+            cursor = start
+            with self._lock:
+                ranges = list(self._ranges(self._series_dir(kind, symbol, key)))
+            for lo, hi in ranges:
+                if hi < cursor or lo > end:
+                    continue
+                if lo > cursor:
+                    segments.append((cursor, lo - 1, False))
+                segments.append((max(lo, cursor), min(hi, end), True))
+                cursor = hi + 1
+                if cursor > end:
+                    break
+            if cursor <= end:
+                segments.append((cursor, end, False))
+            return segments
+
+        def read(
+            self, kind: str, symbol: str, key: int, start: int, end: int
+        ) -> NDArray[np.void] | None:
+            """Read stored rows with start <= time <= end.
+
+            A range inside one partition returns a read-only memmap view;
+            ranges spanning partitions are concatenated into memory.
+
+            Returns:
+                Structured array, or None if no rows are stored in the range.
+
+            """
+            series = self._series_dir(kind, symbol, key)
+            parts: list[NDArray[np.void]] = []
+            for day in range(start // self._DAY, end // self._DAY + 1):
+                path = series / self._partition_name(day)
+                if not path.exists():
+                    continue
+                rows = cast("NDArray[np.void]", np.load(path, mmap_mode="r"))
+                times = rows["time"]
+                lo = int(np.searchsorted(times, start, side="left"))
+                hi = int(np.searchsorted(times, end, side="right"))
+                if hi > lo:
+                    parts.append(rows[lo:hi])
+            if not parts:
+                return None
+            if len(parts) == 1:
+                return parts[0]
+            return np.concatenate(parts)
+
+        def write(  # noqa: PLR0913 - series key + segment + server clock
+            self,
+            kind: str,
+            symbol: str,
+            key: int,
+            segment: tuple[int, int],
+            rows: NDArray[np.void] | None,
+            *,
+            server_time: float | None = None,
+        ) -> None:
+            """Store rows fetched for a segment and mark it covered.
+
+            Stored rows inside the segment are replaced (no duplicates on
+            refetch). Rows newer than the settle window are not stored and
+            the covered range is clipped accordingly; rates are clipped to
+            the last bar closed by then (a forming bar is never stored).
+
+            Args:
+                kind: Series kind ("ticks" or "rates").
+                symbol: Symbol name.
+                key: Copy flags (ticks) or timeframe (rates).
+                segment: Fetched (from, to) range, Unix seconds inclusive.
+                rows: Rows returned for the segment (None = nothing returned).
+                server_time: Broker server clock at the fetch (Unix seconds).
+                    None uses the local clock, which is only safe for
+                    segments older than the server's offset from UTC.
+
+            """
+            if rows is None:
+                return
+            start, end = segment
+            now = time.time() if server_time is None else server_time
+            end = min(end, self.settled_end(kind, key, now))
+            if end < start:
+                return
+            series = self._series_dir(kind, symbol, key)
+            series.mkdir(parents=True, exist_ok=True)
+            times = rows["time"]
+            with self._series_lock(series):
+                for day in range(start // self._DAY, end // self._DAY + 1):
+                    lo = max(start, day * self._DAY)
+                    hi = min(end, (day + 1) * self._DAY - 1)
+                    fresh = rows[(times >= lo) & (times <= hi)]
+                    path = series / self._partition_name(day)
+                    self._write_partition(path, fresh, lo, hi)
+                with self._lock:
+                    ranges = [*self._ranges(series), [start, end]]
+                    self._save_index(series, self._merge_ranges(ranges))
+
+        def settled_end(self, kind: str, key: int, now: float) -> int:
+            """Last second whose rows are final at now (broker server clock).
+
+            Rows must be older than the settle window. Rates rows are keyed by
+            bar open time, so a bar opened at t is final once it has closed:
+            t + bar length <= now - settle (MN1 bars close at the next month).
+
+            Args:
+                kind: Series kind ("ticks" or "rates").
+                key: Copy flags (ticks) or timeframe (rates).
+                now: Broker server time, Unix seconds.
+
+            Returns:
+                Latest row time (Unix seconds) that may be marked covered.
+
+            """
+            cutoff = int(now - self._settle)
+            if kind != "rates":
+                return cutoff
+            if key == c.MarketData.TimeFrame.MN1:
+                month = datetime.fromtimestamp(cutoff, UTC).replace(
+                    day=1, hour=0, minute=0, second=0
+                )
+                return int(month.timestamp()) - 1
+            unit = self._TF_UNIT_SECONDS[key & self._TF_UNIT_MASK]
+            return cutoff - unit * (key & ~self._TF_UNIT_MASK)
+
+        def clear(self, kind: str | None = None, symbol: str | None = None) -> None:
+            """Delete stored partitions and coverage.
+
+            Args:
+                kind: Series kind to delete (None = all kinds).
+                symbol: Symbol to delete (None = all symbols).
+
+            """
+            kinds = [kind] if kind is not None else ["ticks", "rates"]
+            with self._lock:
+                for name in kinds:
+                    for symbol_dir in (self._root / name).glob(symbol or "*"):
+                        shutil.rmtree(symbol_dir)
+                self._index.clear()
+
+        def _series_dir(self, kind: str, symbol: str, key: int) -> Path:
+            return self._root / kind / symbol / str(key)
+
+        def _series_lock(self, series: Path) -> threading.Lock:
+            with self._lock:
+                return self._series_locks.setdefault(series, threading.Lock())
+
+        def _partition_name(self, day: int) -> str:
+            return datetime.fromtimestamp(day * self._DAY, UTC).strftime("%Y%m%d.npy")
+
+        def _write_partition(
+            self, path: Path, fresh: NDArray[np.void], lo: int, hi: int
+        ) -> None:
+            if path.exists():
+                existing = cast("NDArray[np.void]", np.load(path))
+                if existing.dtype == fresh.dtype:
+                    times = existing["time"]
+                    kept = existing[(times < lo) | (times > hi)]
+                    fresh = np.concatenate([kept, fresh])
+            if len(fresh) == 0:
+                path.unlink(missing_ok=True)
+                return
+            order = np.argsort(fresh["time"], kind="stable")
+            with tempfile.NamedTemporaryFile(
+                dir=path.parent, suffix=".tmp", delete=False
+            ) as f:
+                np.save(f, fresh[order])
+            Path(f.name).replace(path)
+
+        def _ranges(self, series: Path) -> list[list[int]]:
+            if series not in self._index:
+                path = series / "index.json"
+                loaded: list[list[int]] = []
+                if path.exists():
+                    loaded = cast("list[list[int]]", orjson.loads(path.read_bytes()))
+                self._index[series] = loaded
+            return self._index[series]
+
+        def _save_index(self, series: Path, ranges: list[list[int]]) -> None:
+            self._index[series] = ranges
+            tmp = series / "index.json.tmp"
+            tmp.write_bytes(orjson.dumps(ranges))
+            tmp.replace(series / "index.json")
+
+        @staticmethod
+        def _merge_ranges(ranges: list[list[int]]) -> list[list[int]]:
+            merged: list[list[int]] = []
+            for lo, hi in sorted(ranges):
+                if merged and lo <= merged[-1][1] + 1:
+                    merged[-1][1] = max(merged[-1][1], hi)
+                else:
+                    merged.append([lo, hi])
+            return merged
+
+    # =========================================================================
+    # DEAL JOURNAL (request_id -> deal index for order verification)
+    # =========================================================================
+
+    class DealJournal[D: _DealProto]:
+        """Incremental journal of recent history deals indexed by request_id.
+
+        Replaces a full history_deals_get scan of the verification window on
+        every ambiguous order: refresh() only fetches deals from the newest
+        deal time already seen (inclusive, so same-second deals are not
+        missed), and lookups by the request_id embedded in the deal comment
+        are O(1). Concurrent refresh() calls share one in-flight fetch.
+
+        Deals older than window_seconds before the newest seen deal are
+        pruned. Deal times are broker server time, which can run ahead of
+        UTC, so the fetch always extends LOOKAHEAD past max(now, cursor).
+
+        Usage:
+            journal = MT5Utilities.DealJournal[Deal](window_seconds=900)
+            await journal.refresh(fetch)  # fetch(date_from, date_to)
+            deal = journal.get(request_id)
+        """
+
+        LOOKAHEAD: ClassVar[timedelta] = timedelta(days=1)
+
+        def __init__(self, window_seconds: float) -> None:
+            """Initialize an empty journal.
+
+            Args:
+                window_seconds: How far back the first fetch reaches and how
+                    long deals are kept.
+
+            """
+            self._window = window_seconds
+            self._by_request: dict[str, D] = {}
+            self._tickets: set[int] = set()
+            self._order: deque[tuple[int, int, str | None]] = deque()
+            self._cursor: int | None = None
+            self._inflight: asyncio.Future[bool] | None = None
+            self._fetches = 0
+            self._shared = 0
+
+        @property
+        def cursor(self) -> int | None:
+            """Newest deal time seen (Unix seconds), or None before any deal."""
+            return self._cursor
+
+        def get(self, request_id: str) -> D | None:
+            """Return the first journaled deal carrying request_id."""
+            return self._by_request.get(request_id)
+
+        async def refresh(
+            self,
+            fetch: Callable[[datetime, datetime], Awaitable[Sequence[D] | None]],
+        ) -> bool:
+            """Fetch deals newer than the cursor and index them.
+
+            Args:
+                fetch: Coroutine factory taking (date_from, date_to) and
+                    returning deals, or None on failure.
+
+            Returns:
+                True if the journal is up to date, False if the fetch failed.
+
+            """
+            if self._inflight is not None:
+                self._shared += 1
+                return await asyncio.shield(self._inflight)
+
+            inflight: asyncio.Future[bool] = asyncio.get_running_loop().create_future()
+            self._inflight = inflight
+            ok = False
+            try:
+                now = datetime.now(UTC)
+                if self._cursor is None:
+                    date_from = now - timedelta(seconds=self._window)
+                    date_to = now + self.LOOKAHEAD
+                else:
+                    cursor = datetime.fromtimestamp(self._cursor, UTC)
+                    date_from = cursor
+                    date_to = max(now, cursor) + self.LOOKAHEAD
+                self._fetches += 1
+                deals = await fetch(date_from, date_to)
+                if deals is not None:
+                    self._add(deals)
+                    ok = True
+            finally:
+                self._inflight = None
+                inflight.set_result(ok)
+            return ok
+
+        def _add(self, deals: Sequence[D]) -> None:
+            """Index new deals by request_id and prune past the window."""
+            tracker = MT5Utilities.TransactionHandler.RequestTracker
+            for deal in sorted(deals, key=lambda d: (d.time, d.ticket)):
+                if deal.ticket in self._tickets:
+                    continue
+                request_id = tracker.extract_request_id(deal.comment)
+                self._tickets.add(deal.ticket)
+                self._order.append((deal.time, deal.ticket, request_id))
+                if request_id is not None:
+                    self._by_request.setdefault(request_id, deal)
+                if self._cursor is None or deal.time > self._cursor:
+                    self._cursor = deal.time
+
+            if self._cursor is None:
+                return
+            cutoff = self._cursor - self._window
+            while self._order and self._order[0][0] < cutoff:
+                _, ticket, request_id = self._order.popleft()
+                self._tickets.discard(ticket)
+                if request_id is None:
+                    continue
+                indexed = self._by_request.get(request_id)
+                if indexed is not None and indexed.ticket == ticket:
+                    del self._by_request[request_id]
+
+        def clear(self) -> None:
+            """Drop all deals and reset the cursor (e.g. on account change)."""
+            self._by_request.clear()
+            self._tickets.clear()
+            self._order.clear()
+            self._cursor = None
+
+        def __len__(self) -> int:
+            """Return the number of journaled deals."""
+            return len(self._order)
+
+        def get_stats(self) -> dict[str, int | None]:
+            """Get journal statistics for monitoring.
+
+            Returns:
+                Dictionary with deal/request counts, cursor and fetch counters.
+
+            """
+            return {
+                "deals": len(self._order),
+                "request_ids": len(self._by_request),
+                "cursor": self._cursor,
+                "fetches": self._fetches,
+                "shared_fetches": self._shared,
+            }
+
+    # =========================================================================
+    # TRANSACTION HANDLER (order_send orchestration)
+    # =========================================================================
+
+    class TransactionHandler:
+        """Handler for critical transaction orchestration.
+
+        Centralizes transaction logic used by _safe_order_send:
+        - Request preparation with idempotency markers
+        - Result classification and outcome determination
+        - Retry decision logic
+
+        All methods are static - no state stored.
+
+        Contains RequestTracker as nested class for idempotency tracking.
+        """
+
+        class RequestTracker:
+            """Track order requests to prevent double execution.
+
+            Uses comment field as idempotency marker since MT5 doesn't have
+            native support for request deduplication. Each order_send gets
+            a unique request_id embedded in the comment field.
+
+            MT5 Limitations:
+            - No native idempotency (each request creates new order)
+            - Comment field is 31 chars max
+            - No "order already exists" detection
+
+            Format: RQ<16chars>|<original_comment>
+            Example: RQ1a2b3c4d5e6f7g8h|my_order
+
+            CRITICAL FIX v4: Increased from 10 hex chars (40 bits) to 16 hex
+            chars (64 bits) to reduce collision probability:
+            - 10 chars: collision after ~1M requests (Birthday paradox)
+            - 16 chars: collision after ~4B requests (~12 years at 10/sec)
+
+            Nested inside TransactionHandler since it's only used
+            for transaction idempotency tracking.
+            """
+
+            @staticmethod
+            def generate_request_id() -> str:
+                """Generate unique request ID for idempotency.
+
+                Format: RQ + 16 hex chars = 18 chars total.
+                Uses 64 bits of entropy (16 hex chars) to reduce collision risk.
+                Birthday paradox: collision expected after ~4 billion requests.
+                Fits in MT5 comment field (31 chars max, leaves 12 for original).
+
+                CRITICAL FIX v4: Increased from 10 hex chars (40 bits) to 16 hex
+                chars (64 bits). With 10 chars, collision expected after ~1M requests
+                (in ~1 day at 10 orders/sec). With 16 chars, collision expected
+                after ~4B requests (in ~12 years at 10 orders/sec).
+
+                Returns:
+                    18-character request ID starting with 'RQ'.
+
+                """
+                prefix = c.Validation.REQUEST_ID_PREFIX
+                hex_len = c.Validation.REQUEST_ID_HEX_LENGTH
+                return f"{prefix}{uuid.uuid4().hex[:hex_len]}"
+
+            @staticmethod
+            def mark_comment(comment: str | None, request_id: str) -> str:
+                """Add request_id marker to comment field.
+
+                Embeds request_id at the start of comment for later extraction.
+                Preserves as much of original comment as possible.
+
+                Args:
+                    comment: Original comment (may be None or empty).
+                    request_id: Request ID to embed (18 chars).
+
+                Returns:
+                    Marked comment: 'RQ<16chars>|<original>' or just 'RQ<16chars>'.
+
+                """
+                if comment:
+                    # Leave room for request_id + separator + some original
+                    max_original = 31 - len(request_id) - 1
+                    return f"{request_id}|{comment[:max_original]}"
+                return request_id
+
+            @staticmethod
+            def extract_request_id(comment: str | None) -> str | None:
+                """Extract request_id from marked comment field.
+
+                CRITICAL FIX: Added validation to prevent false matches:
+                - Length must be exactly 18 chars (RQ + 16 hex)
+                - Must start with "RQ"
+                - Remaining 16 chars must be valid hex
+                This prevents matching corrupted/concatenated comments.
+
+                Args:
+                    comment: Comment field from order/deal.
+
+                Returns:
+                    Request ID if found and valid, None otherwise.
+
+                """
+                prefix = c.Validation.REQUEST_ID_PREFIX
+                if not comment or not comment.startswith(prefix):
+                    return None
+
+                # Extract candidate (before separator if present)
+                candidate = comment.split("|")[0]
+
+                # Validate length
+                if len(candidate) != c.Validation.REQUEST_ID_LENGTH:
+                    log.debug(
+                        "Invalid request_id length: %d (expected %d)",
+                        len(candidate),
+                        c.Validation.REQUEST_ID_LENGTH,
+                    )
+                    return None
+
+                # Validate hex portion (chars 2-18 should be hex)
+                hex_part = candidate[len(c.Validation.REQUEST_ID_PREFIX) :]
+                try:
+                    int(hex_part, 16)  # Validate hex
+                except ValueError:
+                    log.debug(
+                        "Invalid request_id hex portion: %s",
+                        hex_part,
+                    )
+                    return None
+
+                return candidate
+
+        @staticmethod
+        def prepare_request(
+            request: dict[str, object],
+            operation: str,
+        ) -> tuple[dict[str, object], str]:
+            """Prepare request with idempotency marker.
+
+            Adds request_id to comment field for tracking and verification.
+            A request already carrying a valid marker (e.g. prepared by
+            order_send_batch) keeps it, so callers and the WAL share one id.
+
+            Args:
+                request: Order request dictionary.
+                operation: Operation name for logging.
+
+            Returns:
+                Tuple of (modified_request, request_id).
+
+            """
+            tracker = MT5Utilities.TransactionHandler.RequestTracker
+            original_comment = request.get("comment", "") or ""
+            existing = tracker.extract_request_id(str(original_comment))
+            if existing is not None:
+                return request, existing
+            request_id = tracker.generate_request_id()
+            request["comment"] = tracker.mark_comment(str(original_comment), request_id)
+            log.debug(
+                "TX_PREPARE: %s request_id=%s",
+                operation,
+                request_id,
+            )
+            return request, request_id
+
+        @staticmethod
+        def classify_result(
+            retcode: int,
+        ) -> c.Resilience.TransactionOutcome:
+            """Classify result retcode into transaction outcome (PUBLIC API).
+
+            This is the BRIDGE function between:
+            - ErrorClassification (7 values, internal, detailed)
+            - TransactionOutcome (5 values, public, simplified)
+
+            Mapping:
+                SUCCESS → SUCCESS
+                PARTIAL → PARTIAL
+                RETRYABLE → RETRY
+                VERIFY_REQUIRED → VERIFY_REQUIRED
+                PERMANENT → PERMANENT_FAILURE
+                CONDITIONAL → VERIFY_REQUIRED (conservative, verify state)
+                UNKNOWN → VERIFY_REQUIRED (conservative, verify state)
+
+            Why CONDITIONAL/UNKNOWN → VERIFY_REQUIRED (not PERMANENT_FAILURE)?
+            - These represent ambiguous states where order MAY have executed
+            - Conservative approach: verify state before deciding
+            - Prevents both: double execution (retry when executed) AND
+              missed execution (fail when actually succeeded)
+
+            Args:
+                retcode: MT5 TradeRetcode value.
+
+            Returns:
+                TransactionOutcome indicating next action for caller.
 
             Example:
                 >>> outcome = TransactionHandler.classify_result(10012)  # TIMEOUT
@@ -1981,6 +3540,140 @@ class MT5Utilities:
             )()
             return await self._deps.verify_state(synthetic_result, request_id)
 
+    # =========================================================================
+    # CONCURRENCY LIMIT - ADAPTIVE IN-FLIGHT CAP
+    # =========================================================================
+
+    class ConcurrencyLimit:
+        """In-flight limit that adapts to observed latency (AIMD).
+
+        A fixed limit must be hand-tuned to the bridge's worker pool; when the
+        terminal slows down, requests beyond what it can serve just wait inside
+        the bridge and latency explodes. Here every finished request reports
+        how long it took and how many rows it returned. Each operation and
+        power-of-two row count keeps a baseline (its fastest recent time,
+        drifting slowly upward), so fast ticks, 100-bar and 100k-bar
+        downloads are each compared with their own kind and share one signal.
+
+        A request slower than queue_latency_tolerance times its baseline (plus
+        SLACK), or one failing with a retryable error, cuts the limit by
+        BACKOFF, at most once per that request's duration. Any other request
+        adds 1/limit, about one slot per full window. The limit starts at
+        queue_max_concurrent and stays within [queue_min_concurrent,
+        queue_max_concurrent]; a queue_min_concurrent of 0 means a quarter of
+        the maximum.
+
+        Usage:
+            limit = MT5Utilities.ConcurrencyLimit(config)
+            await limit.acquire()
+            ...  # execute, measuring elapsed seconds
+            limit.release("copy_rates_from_pos", elapsed, overloaded=False, rows=500)
+        """
+
+        # Multiplicative decrease on congestion
+        BACKOFF: ClassVar[float] = 0.9
+        # Share of the excess over the baseline it drifts up by per request
+        BASELINE_DRIFT: ClassVar[float] = 0.01
+        # Absolute jitter allowance (seconds) so sub-ms calls don't flap
+        SLACK: ClassVar[float] = 0.005
+
+        def __init__(self, config: MT5Settings) -> None:
+            """Initialize the limit at its maximum.
+
+            Args:
+                config: MT5Settings with queue_min_concurrent,
+                    queue_max_concurrent and queue_latency_tolerance.
+
+            """
+            self._max = max(config.queue_max_concurrent, 1)
+            floor = config.queue_min_concurrent or self._max // 4
+            self._min = min(max(floor, 1), self._max)
+            self._tolerance = config.queue_latency_tolerance
+            self._limit = float(self._max)
+            self._in_flight = 0
+            self._baselines: dict[tuple[str, int], float] = {}
+            self._last_cut = -math.inf
+            self._cuts = 0
+            self._released = asyncio.Event()
+
+        @property
+        def limit(self) -> int:
+            """Current number of requests allowed in flight."""
+            return int(self._limit)
+
+        @property
+        def in_flight(self) -> int:
+            """Number of requests holding a slot."""
+            return self._in_flight
+
+        async def acquire(self) -> None:
+            """Wait until fewer than limit requests are in flight, take a slot."""
+            while self._in_flight >= int(self._limit):
+                self._released.clear()
+                await self._released.wait()
+            self._in_flight += 1
+
+        @staticmethod
+        def rows_of(result: object) -> int:
+            """Count the rows of a response (1 for a single object)."""
+            if isinstance(result, (tuple, list, np.ndarray)):
+                return len(result)
+            return 0 if result is None else 1
+
+        def release(
+            self,
+            operation: str,
+            seconds: float,
+            *,
+            overloaded: bool,
+            rows: int = 1,
+        ) -> None:
+            """Return a slot and adapt the limit to the request's outcome.
+
+            Args:
+                operation: Operation name.
+                seconds: Time the request held its slot.
+                overloaded: True if it failed with a retryable error.
+                rows: Rows returned (baselines are per operation and
+                    power-of-two row count).
+
+            """
+            self._in_flight -= 1
+            key = (operation, rows.bit_length())
+            baseline = self._baselines.get(key, seconds)
+            if seconds <= baseline:
+                self._baselines[key] = seconds
+            else:
+                self._baselines[key] = (
+                    baseline + (seconds - baseline) * self.BASELINE_DRIFT
+                )
+            slow = seconds > baseline * self._tolerance + self.SLACK
+            if slow or overloaded:
+                now = time.monotonic()
+                if now - self._last_cut >= seconds:
+                    self._limit = max(self._limit * self.BACKOFF, float(self._min))
+                    self._last_cut = now
+                    self._cuts += 1
+                    log.debug(
+                        "Concurrency limit cut to %d (%s took %.1fms)",
+                        self.limit,
+                        operation,
+                        seconds * 1000,
+                    )
+            else:
+                self._limit = min(self._limit + 1 / self._limit, float(self._max))
+            self._released.set()
+
+        def get_status(self) -> dict[str, int]:
+            """Get the limit, its bounds and how often it was cut."""
+            return {
+                "limit": self.limit,
+                "in_flight": self._in_flight,
+                "min": self._min,
+                "max": self._max,
+                "cuts": self._cuts,
+            }
+
     # =========================================================================
     # REQUEST QUEUE - PARALLEL EXECUTION
     # =========================================================================
@@ -1990,16 +3683,16 @@ class MT5Utilities:
 
         IMPORTANT: This is NOT a sequential queue!
         - Multiple operations execute SIMULTANEOUSLY
-        - Semaphore controls max concurrent (default 10)
+        - Adaptive limit controls max concurrent (at most 10 by default)
         - Priority only affects ORDER of dispatch, not serialization
 
         Architecture:
         1. submit() → enqueue with priority
         2. dispatcher task → picks from queue, fires execution
         3. Multiple executions run in PARALLEL via asyncio.create_task()
-        4. Semaphore limits concurrent to server capacity
+        4. ConcurrencyLimit caps concurrent, adapting to observed latency
 
-        Example with max_concurrent=10:
+        Example with a limit of 10:
             t=0ms: 15 requests submitted
             t=1ms: 10 tasks dispatched and running in parallel
             t=50ms: 3 tasks complete, 3 more dispatched (still 10 running)
@@ -2008,7 +3701,7 @@ class MT5Utilities:
         Features:
         - Priority ordering (CRITICAL > HIGH > NORMAL > LOW)
         - Parallel execution (NOT sequential)
-        - Semaphore-controlled concurrency (match server workers)
+        - Adaptive concurrency within queue_min/max_concurrent
         - Request coalescing (dedupe identical calls)
         - Backpressure when queue full
 
@@ -2034,20 +3727,26 @@ class MT5Utilities:
             key: str = field(compare=False)  # For coalescing
             coro_factory: Callable[[], Awaitable[object]] = field(compare=False)
             future: asyncio.Future[object] = field(compare=False)
+            # Baselines of the concurrency limit are kept per operation
+            operation: str = field(compare=False, default="")
+            # Submitter's context: the execution task runs in it, so metric
+            # scopes and other context variables follow the request
+            context: Context = field(compare=False, default_factory=copy_context)
 
         def __init__(self, config: MT5Settings) -> None:
             """Initialize request queue.
 
             Args:
-                config: MT5Settings with queue_max_concurrent and queue_max_depth.
+                config: MT5Settings with the queue_* concurrency bounds and
+                    queue_max_depth.
 
             """
             self._settings = config
             self._queue: asyncio.PriorityQueue[MT5Utilities.RequestQueue._Request] = (
                 asyncio.PriorityQueue(maxsize=config.queue_max_depth)
             )
-            # Semaphore controls HOW MANY can execute in parallel
-            self._semaphore = asyncio.Semaphore(config.queue_max_concurrent)
+            # Adaptive limit controls HOW MANY can execute in parallel
+            self._limit = MT5Utilities.ConcurrencyLimit(config)
             self._coalesce: dict[str, asyncio.Future[object]] = {}
             self._running = False
             self._dispatcher_task: asyncio.Task[None] | None = None
@@ -2108,10 +3807,11 @@ class MT5Utilities:
             priority = 3 - criticality  # 3 (CRITICAL) -> 0, 0 (LOW) -> 3
 
             # Coalescing: return existing future if identical request pending
+            # shield() so one cancelled waiter doesn't cancel the shared result
             if coalesce_key and coalesce_key in self._coalesce:
                 existing_future = self._coalesce[coalesce_key]
                 log.debug("Request coalesced: %s", coalesce_key)
-                return cast("T", await existing_future)
+                return cast("T", await asyncio.shield(existing_future))
 
             loop = asyncio.get_running_loop()
             future: asyncio.Future[object] = loop.create_future()
@@ -2119,6 +3819,7 @@ class MT5Utilities:
                 priority=priority,
                 timestamp=loop.time(),
                 key=coalesce_key or "",
+                operation=operation,
                 coro_factory=coro_factory,
                 future=future,
             )
@@ -2136,16 +3837,35 @@ class MT5Utilities:
                 raise MT5Utilities.Exceptions.QueueFullError(msg) from None
 
             try:
+                if coalesce_key:
+                    return cast("T", await asyncio.shield(future))
                 return cast("T", await future)
             finally:
                 if coalesce_key:
                     self._coalesce.pop(coalesce_key, None)
 
+        @staticmethod
+        def make_coalesce_key(operation: str, *args: object) -> str:
+            """Build coalescing key from operation name and call arguments.
+
+            Identical (operation, args) pairs map to the same key, so
+            concurrent identical reads share a single in-flight RPC.
+
+            Args:
+                operation: Operation name (e.g., "symbol_info_tick").
+                *args: Positional call arguments (None included).
+
+            Returns:
+                Key string, e.g. "symbol_info_tick:'EURUSD'".
+
+            """
+            return f"{operation}:{','.join(repr(arg) for arg in args)}"
+
         async def _dispatcher(self) -> None:
             """Dispatcher that fires PARALLEL executions.
 
             Does NOT wait for execution to complete before picking next.
-            Uses create_task() to fire-and-forget, semaphore controls concurrency.
+            Uses create_task() to fire-and-forget, the limit controls concurrency.
             """
             while self._running:
                 try:
@@ -2157,26 +3877,40 @@ class MT5Utilities:
                 except TimeoutError:
                     continue
 
-                # Acquire semaphore BEFORE dispatching (controls max parallel)
-                await self._semaphore.acquire()
+                # Acquire a slot BEFORE dispatching (controls max parallel)
+                await self._limit.acquire()
 
                 # Fire execution WITHOUT WAITING - true parallelism
-                task = asyncio.create_task(self._execute_and_release(request))
+                task = asyncio.create_task(
+                    self._execute_and_release(request), context=request.context
+                )
                 self._active_tasks.add(task)
                 task.add_done_callback(self._active_tasks.discard)
 
         async def _execute_and_release(self, request: _Request) -> None:
-            """Execute request and release semaphore when done."""
+            """Execute request and release its slot when done."""
+            loop = asyncio.get_running_loop()
+            started = loop.time()
+            MT5Utilities.Metrics.record("queue_wait", started - request.timestamp)
+            overloaded = False
+            rows = 0
             try:
                 result: object = await request.coro_factory()
+                rows = MT5Utilities.ConcurrencyLimit.rows_of(result)
                 if not request.future.done():
                     request.future.set_result(result)
             except Exception as e:  # noqa: BLE001 - propagate to future
+                overloaded = MT5Utilities.ErrorClassifier.is_retryable_exception(e)
                 if not request.future.done():
                     request.future.set_exception(e)
             finally:
-                # Release semaphore → next request can be dispatched
-                self._semaphore.release()
+                # Release slot → limit adapts, next request can be dispatched
+                self._limit.release(
+                    request.operation,
+                    loop.time() - started,
+                    overloaded=overloaded,
+                    rows=rows,
+                )
 
         @property
         def active_count(self) -> int:
@@ -2193,6 +3927,293 @@ class MT5Utilities:
             """Check if queue is running."""
             return self._running
 
+        @property
+        def concurrency_limit(self) -> int:
+            """Current adaptive in-flight limit."""
+            return self._limit.limit
+
+        def get_status(self) -> dict[str, int]:
+            """Get the concurrency limit status and the pending count."""
+            return {**self._limit.get_status(), "pending": self.pending_count}
+
+    # =========================================================================
+    # HEDGER - DUPLICATE SLOW IDEMPOTENT READS
+    # =========================================================================
+
+    class Hedger:
+        """Hedged requests for idempotent reads.
+
+        A read that has not answered within the hedge_quantile of its
+        operation's recent latencies gets one duplicate request; the first
+        successful response wins and the other call is cancelled. Hedges
+        are paid from a token budget that earns hedge_budget_percent of a
+        token per eligible read, so they stay a bounded share of traffic
+        even when the whole bridge slows down. An operation is not hedged
+        until hedge_min_samples of its reads have completed.
+
+        Only operations listed in OPERATION_CRITICALITY at NORMAL or below
+        and not in HEDGE_EXCLUDED_OPERATIONS are eligible, so order_send and
+        order_check are never duplicated.
+
+        Usage:
+            hedger = MT5Utilities.Hedger(config=mt5_settings)
+            tick = await hedger.run("symbol_info_tick", fetch_tick)
+        """
+
+        # Recent completed latencies kept per operation
+        WINDOW: ClassVar[int] = 256
+        # Observations between recomputations of an operation's hedge delay
+        REFRESH: ClassVar[int] = 16
+        # Unspent budget cap in hedges (bounds the burst after a quiet period)
+        MAX_TOKENS: ClassVar[float] = 10.0
+
+        def __init__(self, config: MT5Settings) -> None:
+            """Initialize the hedger.
+
+            Args:
+                config: MT5Settings with hedge_quantile, hedge_min_delay,
+                    hedge_min_samples and hedge_budget_percent.
+
+            """
+            self._settings = config
+            self._samples: dict[str, deque[float]] = {}
+            self._stale: dict[str, int] = {}
+            self._delays: dict[str, float] = {}
+            self._tokens = 0.0
+            self._reads = 0
+            self._hedged = 0
+            self._hedge_wins = 0
+            self._denied = 0
+
+        @staticmethod
+        def is_eligible(operation: str) -> bool:
+            """Check whether reads of operation may be hedged."""
+            if operation in c.Resilience.HEDGE_EXCLUDED_OPERATIONS:
+                return False
+            criticality = c.Resilience.OPERATION_CRITICALITY.get(
+                operation, c.Resilience.OperationCriticality.CRITICAL
+            )
+            return criticality <= c.Resilience.OperationCriticality.NORMAL
+
+        def delay(self, operation: str) -> float | None:
+            """Seconds a read of operation may take before it is hedged.
+
+            Returns:
+                The tracked quantile (at least hedge_min_delay), or None
+                while fewer than hedge_min_samples reads have completed.
+
+            """
+            return self._delays.get(operation)
+
+        def observe(self, operation: str, seconds: float) -> None:
+            """Record the latency of a completed read of operation."""
+            samples = self._samples.get(operation)
+            if samples is None:
+                samples = self._samples[operation] = deque(maxlen=self.WINDOW)
+            samples.append(seconds)
+            stale = self._stale.get(operation, 0) + 1
+            if len(samples) < self._settings.hedge_min_samples or (
+                operation in self._delays and stale < self.REFRESH
+            ):
+                self._stale[operation] = stale
+                return
+            self._stale[operation] = 0
+            ordered = sorted(samples)
+            rank = int(self._settings.hedge_quantile * len(ordered))
+            self._delays[operation] = max(
+                ordered[min(rank, len(ordered) - 1)], self._settings.hedge_min_delay
+            )
+
+        async def run[T](
+            self, operation: str, call_factory: Callable[[], Awaitable[T]]
+        ) -> T:
+            """Run a read, hedging it if it is slow and the budget allows.
+
+            Args:
+                operation: Operation name (eligibility and latency tracking).
+                call_factory: Starts one request; called again for the hedge.
+
+            Returns:
+                The first successful response.
+
+            Raises:
+                Exception: The primary's error, or the first error when both
+                    the primary and the hedge fail.
+
+            """
+            if not self.is_eligible(operation):
+                return await call_factory()
+            self._reads += 1
+            self._tokens = min(
+                self._tokens + self._settings.hedge_budget_percent / 100.0,
+                self.MAX_TOKENS,
+            )
+            loop = asyncio.get_running_loop()
+            start = loop.time()
+            primary = asyncio.ensure_future(call_factory())
+            try:
+                delay = self._delays.get(operation)
+                if delay is not None:
+                    done, _ = await asyncio.wait({primary}, timeout=delay)
+                    if not done and self._tokens >= 1.0:
+                        self._tokens -= 1.0
+                        result = await self._race(primary, call_factory)
+                        self.observe(operation, loop.time() - start)
+                        return result
+                    if not done:
+                        self._denied += 1
+                result = await primary
+            finally:
+                if not primary.done():
+                    primary.cancel()
+            self.observe(operation, loop.time() - start)
+            return result
+
+        async def _race[T](
+            self, primary: asyncio.Future[T], call_factory: Callable[[], Awaitable[T]]
+        ) -> T:
+            """Start a hedge next to primary and return the first success."""
+            self._hedged += 1
+            hedge = asyncio.ensure_future(call_factory())
+            pending: set[asyncio.Future[T]] = {primary, hedge}
+            error: BaseException | None = None
+            try:
+                while pending:
+                    done, pending = await asyncio.wait(
+                        pending, return_when=asyncio.FIRST_COMPLETED
+                    )
+                    for task in done:
+                        failure = task.exception()
+                        if failure is None:
+                            if task is hedge:
+                                self._hedge_wins += 1
+                            return task.result()
+                        error = error or failure
+            finally:
+                for task in pending:
+                    task.cancel()
+            raise error or asyncio.CancelledError
+
+        def get_stats(self) -> dict[str, int | float]:
+            """Get hedging statistics for monitoring.
+
+            Returns:
+                Eligible reads, hedges sent, hedges that answered first,
+                hedges skipped for lack of budget and the unspent budget.
+
+            """
+            return {
+                "reads": self._reads,
+                "hedged": self._hedged,
+                "hedge_wins": self._hedge_wins,
+                "denied": self._denied,
+                "tokens": self._tokens,
+            }
+
+    # =========================================================================
+    # MICRO-BATCHER - COALESCE CONCURRENT SUBMISSIONS INTO ONE DISPATCH
+    # =========================================================================
+
+    class MicroBatcher[P, R]:
+        """Collects concurrent submissions into one batched dispatch.
+
+        Callers await submit(payload). The first pending payload starts a
+        linger timer; the batch is dispatched when it expires, or at once when
+        every expected submission has arrived. dispatch(payloads) is an async
+        iterator of (index, result) pairs, so each caller is released as soon
+        as its own result streams in. A dispatch error is raised in every
+        caller still waiting on that batch; a caller whose index never comes
+        back gets RuntimeError.
+
+        Usage:
+            batcher = MT5Utilities.MicroBatcher(
+                dispatch, expected=len(orders), linger=0.002
+            )
+            result = await batcher.submit(order)
+        """
+
+        def __init__(
+            self,
+            dispatch: Callable[[list[P]], AsyncIterator[tuple[int, R]]],
+            *,
+            expected: int,
+            linger: float,
+        ) -> None:
+            """Initialize the batcher.
+
+            Args:
+                dispatch: Sends a batch and yields (index, result) pairs.
+                expected: Submissions anticipated; reaching it flushes early.
+                linger: Seconds to wait for more submissions after the first.
+
+            """
+            self._dispatch = dispatch
+            self._remaining = expected
+            self._linger = linger
+            self._items: list[tuple[P, asyncio.Future[R]]] = []
+            self._timer: asyncio.TimerHandle | None = None
+            self._tasks: set[asyncio.Task[None]] = set()
+            self._batches = 0
+
+        @property
+        def batches(self) -> int:
+            """Number of dispatches issued so far."""
+            return self._batches
+
+        async def submit(self, payload: P) -> R:
+            """Add a payload to the next batch and wait for its result.
+
+            Args:
+                payload: Item to dispatch.
+
+            Returns:
+                The result dispatch yielded for this payload.
+
+            Raises:
+                RuntimeError: If the dispatch returned no result for it.
+
+            """
+            loop = asyncio.get_running_loop()
+            future: asyncio.Future[R] = loop.create_future()
+            self._items.append((payload, future))
+            self._remaining -= 1
+            if self._remaining <= 0:
+                self._flush()
+            elif self._timer is None:
+                self._timer = loop.call_later(self._linger, self._flush)
+            return await future
+
+        def _flush(self) -> None:
+            """Dispatch all pending payloads as one batch."""
+            if self._timer is not None:
+                self._timer.cancel()
+                self._timer = None
+            items, self._items = self._items, []
+            if not items:
+                return
+            self._batches += 1
+            task = asyncio.create_task(self._run(items))
+            self._tasks.add(task)
+            task.add_done_callback(self._tasks.discard)
+
+        async def _run(self, items: list[tuple[P, asyncio.Future[R]]]) -> None:
+            """Run one dispatch and resolve each caller's future."""
+            waiters = [future for _, future in items]
+            try:
+                async for index, result in self._dispatch([p for p, _ in items]):
+                    if 0 <= index < len(waiters) and not waiters[index].done():
+                        waiters[index].set_result(result)
+            except Exception as e:  # noqa: BLE001 - delivered to every caller
+                for waiter in waiters:
+                    if not waiter.done():
+                        waiter.set_exception(e)
+                return
+            for waiter in waiters:
+                if not waiter.done():
+                    waiter.set_exception(
+                        RuntimeError("Batch dispatch returned no result for item")
+                    )
+
     # =========================================================================
     # WRITE-AHEAD LOG (WAL) - ORDER PERSISTENCE
     # =========================================================================
@@ -2206,6 +4227,16 @@ class MT5Utilities:
 
         Storage: SQLite with WAL mode for async-friendly writes.
 
+        Group commit (wal_group_commit_ms > 0):
+            Writes are buffered and committed together by a background task
+            every wal_group_commit_ms, or as soon as wal_group_commit_max_entries
+            are pending. log_intent() and mark_recovered() still wait for the
+            commit containing their row, so an order never leaves before its
+            intent is durable. mark_sent/verified/failed return immediately; if
+            the process dies before their batch commits the entry stays
+            PENDING/SENT and is resolved by normal crash recovery. Reads flush
+            first so they always observe earlier writes.
+
         Lifecycle:
         1. log_intent() - Record order request BEFORE sending
         2. mark_sent() - Mark after gRPC call initiated
@@ -2254,6 +4285,10 @@ class MT5Utilities:
             result_json: str | None = None
             error: str | None = None
 
+        # Histogram upper bounds for group-commit flush size and commit time
+        _FLUSH_SIZE_BUCKETS: ClassVar[tuple[int, ...]] = (1, 4, 16, 64, 256)
+        _COMMIT_MS_BUCKETS: ClassVar[tuple[float, ...]] = (1, 5, 10, 50, 100, 500)
+
         def __init__(self, config: MT5Settings) -> None:
             """Initialize WAL.
 
@@ -2266,6 +4301,20 @@ class MT5Utilities:
             self._conn: aiosqlite.Connection | None = None
             self._lock = asyncio.Lock()
             self._initialized = False
+            # Group commit: pending statements and the waiters of durable writes
+            self._group_commit = config.wal_group_commit_ms > 0
+            self._pending: list[tuple[str, tuple[object, ...]]] = []
+            self._waiters: list[asyncio.Future[None]] = []
+            self._has_pending = asyncio.Event()
+            self._batch_full = asyncio.Event()
+            self._flush_task: asyncio.Task[None] | None = None
+            self._flush_size_counts = [0] * (len(self._FLUSH_SIZE_BUCKETS) + 1)
+            self._commit_ms_counts = [0] * (len(self._COMMIT_MS_BUCKETS) + 1)
+            self._flushes = 0
+            self._flushed_entries = 0
+            self._max_flush_size = 0
+            self._commit_ms_sum = 0.0
+            self._commit_ms_max = 0.0
 
         async def initialize(self) -> None:
             """Initialize WAL database. Called by connect()."""
@@ -2299,16 +4348,157 @@ class MT5Utilities:
             """)
             await self._conn.commit()
             self._initialized = True
+            if self._group_commit:
+                self._flush_task = asyncio.create_task(self._flush_loop())
             log.debug("WAL initialized at %s", self._db_path)
 
         async def close(self) -> None:
             """Close WAL database. Called by disconnect()."""
+            if self._flush_task:
+                self._flush_task.cancel()
+                with suppress(asyncio.CancelledError):
+                    await self._flush_task
+                self._flush_task = None
             if self._conn:
+                await self.flush()
                 await self._conn.close()
                 self._conn = None
             self._initialized = False
             log.debug("WAL closed")
 
+        async def _write(
+            self,
+            sql: str,
+            params: tuple[object, ...],
+            *,
+            durable: bool,
+        ) -> None:
+            """Execute a write, committing now or through the group commit.
+
+            Args:
+                sql: Statement to execute.
+                params: Statement parameters.
+                durable: In group-commit mode, wait until the batch holding
+                    this statement is committed.
+
+            """
+            if not self._conn:
+                return
+
+            if not self._group_commit or self._flush_task is None:
+                async with self._lock:
+                    await self._conn.execute(sql, params)
+                    await self._conn.commit()
+                return
+
+            self._pending.append((sql, params))
+            self._has_pending.set()
+            if len(self._pending) >= self._settings.wal_group_commit_max_entries:
+                self._batch_full.set()
+            if durable:
+                waiter: asyncio.Future[None] = (
+                    asyncio.get_running_loop().create_future()
+                )
+                self._waiters.append(waiter)
+                await waiter
+
+        async def _flush_loop(self) -> None:
+            """Commit pending writes every wal_group_commit_ms or when full."""
+            interval = self._settings.wal_group_commit_ms / 1000
+            while True:
+                await self._has_pending.wait()
+                with suppress(TimeoutError):
+                    await asyncio.wait_for(self._batch_full.wait(), timeout=interval)
+                try:
+                    # Shielded so close() never cancels a commit halfway
+                    await asyncio.shield(self.flush())
+                except Exception:
+                    log.exception("WAL: group commit failed")
+
+        async def flush(self) -> None:
+            """Commit all buffered writes in a single transaction.
+
+            No-op outside group-commit mode. Waiters of durable writes are
+            released (or receive the error) once the commit completes.
+
+            """
+            if not self._conn:
+                return
+
+            async with self._lock:
+                pending, self._pending = self._pending, []
+                waiters, self._waiters = self._waiters, []
+                self._has_pending.clear()
+                self._batch_full.clear()
+                if not pending:
+                    return
+                start = time.perf_counter()
+                try:
+                    for sql, params in pending:
+                        await self._conn.execute(sql, params)
+                    await self._conn.commit()
+                except Exception as e:
+                    for waiter in waiters:
+                        if not waiter.done():
+                            waiter.set_exception(e)
+                    raise
+                self._record_flush(len(pending), (time.perf_counter() - start) * 1000)
+            for waiter in waiters:
+                if not waiter.done():
+                    waiter.set_result(None)
+
+        def _record_flush(self, size: int, commit_ms: float) -> None:
+            """Record one group commit in the flush-size/commit-time histograms."""
+            self._flushes += 1
+            self._flushed_entries += size
+            self._max_flush_size = max(self._max_flush_size, size)
+            self._commit_ms_sum += commit_ms
+            self._commit_ms_max = max(self._commit_ms_max, commit_ms)
+            self._flush_size_counts[bisect_left(self._FLUSH_SIZE_BUCKETS, size)] += 1
+            self._commit_ms_counts[bisect_left(self._COMMIT_MS_BUCKETS, commit_ms)] += 1
+
+        def get_stats(self) -> dict[str, object]:
+            """Return group-commit counters and histograms.
+
+            Returns:
+                Dict with pending count and flush_size / commit_ms histograms;
+                buckets are cumulative and keyed by their upper bound.
+
+            """
+
+            def cumulative(
+                bounds: tuple[float, ...], counts: list[int]
+            ) -> dict[str, int]:
+                buckets: dict[str, int] = {}
+                total = 0
+                for bound, count in zip(bounds, counts, strict=False):
+                    total += count
+                    buckets[f"{bound:g}"] = total
+                buckets["+Inf"] = total + counts[-1]
+                return buckets
+
+            return {
+                "group_commit": self._group_commit,
+                "pending": len(self._pending),
+                "flushes": self._flushes,
+                "flush_size": {
+                    "count": self._flushes,
+                    "sum": self._flushed_entries,
+                    "max": self._max_flush_size,
+                    "buckets": cumulative(
+                        self._FLUSH_SIZE_BUCKETS, self._flush_size_counts
+                    ),
+                },
+                "commit_ms": {
+                    "count": self._flushes,
+                    "sum": self._commit_ms_sum,
+                    "max": self._commit_ms_max,
+                    "buckets": cumulative(
+                        self._COMMIT_MS_BUCKETS, self._commit_ms_counts
+                    ),
+                },
+            }
+
         async def log_intent(self, request_id: str, request: dict[str, object]) -> None:
             """Log order intent BEFORE sending.
 
@@ -2320,19 +4510,18 @@ class MT5Utilities:
             if not self._conn:
                 return
 
-            async with self._lock:
-                await self._conn.execute(
-                    """INSERT OR REPLACE INTO orders
-                       (request_id, timestamp, request_json, status, updated_at)
-                       VALUES (?, ?, ?, ?, CURRENT_TIMESTAMP)""",
-                    (
-                        request_id,
-                        datetime.now(UTC).isoformat(),
-                        orjson.dumps(request).decode(),
-                        self.Status.PENDING,
-                    ),
-                )
-                await self._conn.commit()
+            await self._write(
+                """INSERT OR REPLACE INTO orders
+                   (request_id, timestamp, request_json, status, updated_at)
+                   VALUES (?, ?, ?, ?, CURRENT_TIMESTAMP)""",
+                (
+                    request_id,
+                    datetime.now(UTC).isoformat(),
+                    orjson.dumps(request).decode(),
+                    self.Status.PENDING,
+                ),
+                durable=True,
+            )
             log.debug("WAL: logged intent %s", request_id)
 
         async def mark_sent(self, request_id: str) -> None:
@@ -2345,13 +4534,12 @@ class MT5Utilities:
             if not self._conn:
                 return
 
-            async with self._lock:
-                await self._conn.execute(
-                    """UPDATE orders SET status = ?, updated_at = CURRENT_TIMESTAMP
-                       WHERE request_id = ?""",
-                    (self.Status.SENT, request_id),
-                )
-                await self._conn.commit()
+            await self._write(
+                """UPDATE orders SET status = ?, updated_at = CURRENT_TIMESTAMP
+                   WHERE request_id = ?""",
+                (self.Status.SENT, request_id),
+                durable=False,
+            )
             log.debug("WAL: marked sent %s", request_id)
 
         async def mark_verified(
@@ -2369,18 +4557,17 @@ class MT5Utilities:
             if not self._conn:
                 return
 
-            async with self._lock:
-                await self._conn.execute(
-                    """UPDATE orders SET status = ?, result_json = ?,
-                       updated_at = CURRENT_TIMESTAMP
-                       WHERE request_id = ?""",
-                    (
-                        self.Status.VERIFIED,
-                        orjson.dumps(result).decode(),
-                        request_id,
-                    ),
-                )
-                await self._conn.commit()
+            await self._write(
+                """UPDATE orders SET status = ?, result_json = ?,
+                   updated_at = CURRENT_TIMESTAMP
+                   WHERE request_id = ?""",
+                (
+                    self.Status.VERIFIED,
+                    orjson.dumps(result).decode(),
+                    request_id,
+                ),
+                durable=False,
+            )
             log.debug("WAL: marked verified %s", request_id)
 
         async def mark_failed(self, request_id: str, error: str) -> None:
@@ -2394,14 +4581,13 @@ class MT5Utilities:
             if not self._conn:
                 return
 
-            async with self._lock:
-                await self._conn.execute(
-                    """UPDATE orders SET status = ?, error = ?,
-                       updated_at = CURRENT_TIMESTAMP
-                       WHERE request_id = ?""",
-                    (self.Status.FAILED, error, request_id),
-                )
-                await self._conn.commit()
+            await self._write(
+                """UPDATE orders SET status = ?, error = ?,
+                   updated_at = CURRENT_TIMESTAMP
+                   WHERE request_id = ?""",
+                (self.Status.FAILED, error, request_id),
+                durable=False,
+            )
             log.debug("WAL: marked failed %s", request_id)
 
         async def mark_recovered(
@@ -2419,26 +4605,26 @@ class MT5Utilities:
             if not self._conn:
                 return
 
-            async with self._lock:
-                if result:
-                    await self._conn.execute(
-                        """UPDATE orders SET status = ?, result_json = ?,
-                           updated_at = CURRENT_TIMESTAMP
-                           WHERE request_id = ?""",
-                        (
-                            self.Status.RECOVERED,
-                            orjson.dumps(result).decode(),
-                            request_id,
-                        ),
-                    )
-                else:
-                    await self._conn.execute(
-                        """UPDATE orders SET status = ?,
-                           updated_at = CURRENT_TIMESTAMP
-                           WHERE request_id = ?""",
-                        (self.Status.RECOVERED, request_id),
-                    )
-                await self._conn.commit()
+            if result:
+                await self._write(
+                    """UPDATE orders SET status = ?, result_json = ?,
+                       updated_at = CURRENT_TIMESTAMP
+                       WHERE request_id = ?""",
+                    (
+                        self.Status.RECOVERED,
+                        orjson.dumps(result).decode(),
+                        request_id,
+                    ),
+                    durable=True,
+                )
+            else:
+                await self._write(
+                    """UPDATE orders SET status = ?,
+                       updated_at = CURRENT_TIMESTAMP
+                       WHERE request_id = ?""",
+                    (self.Status.RECOVERED, request_id),
+                    durable=True,
+                )
             log.debug("WAL: marked recovered %s", request_id)
 
         async def get_incomplete(self) -> list[Entry]:
@@ -2451,6 +4637,7 @@ class MT5Utilities:
             if not self._conn:
                 return []
 
+            await self.flush()
             async with self._lock:
                 cursor = await self._conn.execute(
                     """SELECT request_id, timestamp, request_json, status,
@@ -2486,6 +4673,7 @@ class MT5Utilities:
             if not self._conn:
                 return None
 
+            await self.flush()
             async with self._lock:
                 cursor = await self._conn.execute(
                     """SELECT request_id, timestamp, request_json, status,
@@ -2525,6 +4713,7 @@ class MT5Utilities:
             retention = days if days is not None else self._settings.wal_retention_days
             cutoff = datetime.now(UTC) - timedelta(days=retention)
 
+            await self.flush()
             async with self._lock:
                 cursor = await self._conn.execute(
                     """DELETE FROM orders
@@ -0,0 +1 @@
+"""Benchmark suites - pytest-benchmark against a local simulated bridge."""
@@ -0,0 +1,114 @@
+"""pytest-benchmark suites for end-to-end RPC latency.
+
+Benchmarks verify:
+1. Every mt5linux.bench scenario on AsyncMetaTrader5 (own event loop)
+2. Every scenario except order_send_batch on the sync MetaTrader5
+3. Each call returns the seeded row count (10/1k positions, 50k deals)
+
+No live bridge: mt5linux.bench.LocalBridge serves a seeded MT5Simulator
+through the real bridge on localhost. Run and save for comparison with:
+
+    pytest tests/benchmarks --benchmark-autosave
+    pytest tests/benchmarks --benchmark-compare
+"""
+
+from __future__ import annotations
+
+import asyncio
+from typing import TYPE_CHECKING, cast
+
+import pytest
+
+from mt5linux.async_client import AsyncMetaTrader5
+from mt5linux.bench import LocalBridge, Scenario, async_call, scenarios, sync_call
+from mt5linux.client import MetaTrader5
+from mt5linux.settings import MT5Settings
+from tests.constants import TestConstants as tc
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Iterator
+
+    from pytest_benchmark.fixture import BenchmarkFixture
+
+pytest.importorskip("pytest_benchmark")
+
+pytestmark = pytest.mark.slow
+
+_SCENARIOS = scenarios()
+_SYNC_SCENARIOS = [s for s in _SCENARIOS if not s.async_only]
+
+
+def _pedantic(
+    benchmark: BenchmarkFixture, call: Callable[[], object], scenario: Scenario
+) -> object:
+    # BenchmarkFixture.pedantic is untyped
+    pedantic = cast("Callable[..., object]", benchmark.pedantic)
+    rounds = (
+        tc.Benchmark.RPC_HEAVY_ROUNDS if scenario.heavy else tc.Benchmark.RPC_ROUNDS
+    )
+    return pedantic(call, rounds=rounds, warmup_rounds=tc.Benchmark.RPC_WARMUP_ROUNDS)
+
+
+@pytest.fixture(scope="module")
+def bridge() -> Iterator[LocalBridge]:
+    """Seeded simulator served by the real bridge."""
+    with LocalBridge() as local:
+        yield local
+
+
+@pytest.fixture(scope="module")
+def settings(tmp_path_factory: pytest.TempPathFactory) -> MT5Settings:
+    """Client settings with a benchmark-local WAL."""
+    return MT5Settings(wal_path=str(tmp_path_factory.mktemp("bench") / "wal.db"))
+
+
+@pytest.fixture(scope="module")
+def async_client(
+    bridge: LocalBridge, settings: MT5Settings
+) -> Iterator[tuple[AsyncMetaTrader5, asyncio.AbstractEventLoop]]:
+    """Yield a connected async client and the loop it runs on."""
+    loop = asyncio.new_event_loop()
+    client = AsyncMetaTrader5(host="127.0.0.1", port=bridge.port, config=settings)
+    loop.run_until_complete(client.connect())
+    loop.run_until_complete(client.initialize())
+    yield client, loop
+    loop.run_until_complete(client.disconnect())
+    loop.close()
+
+
+@pytest.fixture(scope="module")
+def sync_client(bridge: LocalBridge, settings: MT5Settings) -> Iterator[MetaTrader5]:
+    """Yield a connected sync client."""
+    client = MetaTrader5(host="127.0.0.1", port=bridge.port, config=settings)
+    with client:
+        client.initialize()
+        yield client
+
+
+@pytest.mark.parametrize("scenario", _SCENARIOS, ids=lambda s: s.name)
+def test_async_rpc(
+    benchmark: BenchmarkFixture,
+    async_client: tuple[AsyncMetaTrader5, asyncio.AbstractEventLoop],
+    scenario: Scenario,
+) -> None:
+    """AsyncMetaTrader5 call latency through the bridge."""
+    client, loop = async_client
+    call = async_call(client, scenario)
+    result = _pedantic(benchmark, lambda: loop.run_until_complete(call()), scenario)
+
+    assert result is not None
+    if scenario.rows is not None:
+        assert len(result) >= scenario.rows
+
+
+@pytest.mark.parametrize("scenario", _SYNC_SCENARIOS, ids=lambda s: s.name)
+def test_sync_rpc(
+    benchmark: BenchmarkFixture, sync_client: MetaTrader5, scenario: Scenario
+) -> None:
+    """MetaTrader5 call latency through the bridge."""
+    call = sync_call(sync_client, scenario)
+    result = _pedantic(benchmark, call, scenario)
+
+    assert result is not None
+    if scenario.rows is not None:
+        assert len(result) >= scenario.rows
@@ -89,6 +89,39 @@ MT5_settings: dict[str, str | int | None] = {
 }
 
 
+# =============================================================================
+# IN-PROCESS STUB CLIENT (unit tests without a bridge)
+# =============================================================================
+
+
+def stub_client(
+    stub: object, config: MT5Settings | None = None, **overrides: object
+) -> AsyncMetaTrader5:
+    """Build an AsyncMetaTrader5 served by an in-process gRPC stub.
+
+    The constructor builds every settings-derived component from the config,
+    so only the stub is swapped in and the terminal marked connected. The
+    request queue and hedger are created by connect() and stay unset.
+
+    Args:
+        stub: Object implementing the gRPC methods the test calls.
+        config: Complete settings (overrides are ignored when given).
+        **overrides: MT5Settings fields (terminal_state_staleness is 60s
+            unless overridden, so no terminal_info probe runs).
+
+    Returns:
+        Client ready for calls against the stub.
+
+    """
+    if config is None:
+        settings: dict[str, object] = {"terminal_state_staleness": 60.0, **overrides}
+        config = MT5Settings(**settings)
+    client = AsyncMetaTrader5(host="testhost", port=12345, config=config)
+    client._stub = cast("mt5_pb2_grpc.MT5ServiceStub", stub)
+    client._connectivity.record(connected=True)
+    return client
+
+
 # =============================================================================
 # TIMING INSTRUMENTATION (matches mt5docker pattern)
 # =============================================================================
@@ -204,10 +237,14 @@ def is_mt5_terminal_available() -> bool:
         return False
 
     if not _is_container_running():
-        _log(f"MT5 terminal unavailable: container '{TEST_CONTAINER_NAME}' is not running")
+        _log(
+            f"MT5 terminal unavailable: container '{TEST_CONTAINER_NAME}' is not running"
+        )
         return False
 
-    if not is_grpc_service_ready(TEST_GRPC_HOST, TEST_GRPC_PORT, timeout=tc.FAST_TIMEOUT):
+    if not is_grpc_service_ready(
+        TEST_GRPC_HOST, TEST_GRPC_PORT, timeout=tc.FAST_TIMEOUT
+    ):
         _log(
             f"MT5 terminal unavailable: gRPC not ready on {TEST_GRPC_HOST}:{TEST_GRPC_PORT}"
         )
@@ -420,6 +420,9 @@ class TestConstants:
         ITERATIONS: Final[int] = 100
         PERF_P99_PERCENTILE: Final[float] = 0.99
         CACHE_TTL_DEFAULT: Final[float] = 60.0
+        RPC_ROUNDS: Final[int] = 20
+        RPC_HEAVY_ROUNDS: Final[int] = 3
+        RPC_WARMUP_ROUNDS: Final[int] = 2
 
     # =========================================================================
     # TEST DATA & VALIDATION CONSTANTS
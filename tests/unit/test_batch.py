@@ -0,0 +1,210 @@
+"""Tests for pipelined reads through the Batch RPC.
+
+Tests verify:
+1. Reads queued on mt5.batch() are sent as one Batch RPC, in order
+2. Futures resolve with the same models as the standalone methods
+3. A per-call bridge error fails only its own future
+4. Bridges without Batch fall back to individual concurrent calls
+5. An exception inside the block cancels the batch without sending it
+6. The sync client's batch() sends when the with block exits
+
+No live bridge: a minimal in-process stub stands in for the gRPC stub so the
+real builder, dispatch and parsing path are exercised end to end.
+"""
+
+from __future__ import annotations
+
+import asyncio
+from typing import TYPE_CHECKING
+
+import grpc
+import grpc.aio
+import numpy as np
+import orjson
+import pytest
+
+from mt5linux import mt5_pb2
+from mt5linux.client import MetaTrader5
+from mt5linux.utilities import MT5Utilities as u
+from tests.conftest import stub_client
+
+if TYPE_CHECKING:
+    from mt5linux.mt5_pb2 import BatchRequest, BatchResponse
+
+_ACCOUNT = {"login": 1, "balance": 1000.0, "equity": 1010.0, "currency": "USD"}
+_TICK = {"time": 1_700_000_000, "bid": 1.085, "ask": 1.0851, "time_msc": 1}
+_POSITION = {"ticket": 7, "symbol": "EURUSD", "volume": 0.1, "type": 0}
+
+
+class _BatchStub:
+    """In-process stub answering Batch and the standalone read RPCs."""
+
+    def __init__(self, *, batch_supported: bool = True) -> None:
+        self.batch_supported = batch_supported
+        self.batches: list[list[str]] = []
+        self.single_calls: list[str] = []
+
+    def _respond(self, method: str, request: object) -> object:
+        if method == "AccountInfo":
+            return mt5_pb2.DictData(json_data=orjson.dumps(_ACCOUNT).decode())
+        if method == "SymbolInfoTick":
+            assert isinstance(request, mt5_pb2.SymbolRequest)
+            if request.symbol != "EURUSD":
+                msg = f"unknown symbol {request.symbol}"
+                raise ValueError(msg)
+            return mt5_pb2.DictData(json_data=orjson.dumps(_TICK).decode())
+        if method == "PositionsTotal":
+            return mt5_pb2.IntResponse(value=1)
+        if method == "PositionsGet":
+            return mt5_pb2.DictList(json_items=[orjson.dumps(_POSITION).decode()])
+        rates = np.zeros(3, dtype=u.Data.DtypeRegistry.RATES)
+        return mt5_pb2.NumpyArray(
+            data=rates.tobytes(), dtype=str(rates.dtype), shape=[3]
+        )
+
+    async def Batch(  # noqa: N802 - gRPC method name
+        self,
+        request: BatchRequest,
+        timeout: float | None = None,  # noqa: ASYNC109 - gRPC stub signature
+    ) -> BatchResponse:
+        _ = timeout
+        if not self.batch_supported:
+            raise grpc.aio.AioRpcError(
+                grpc.StatusCode.UNIMPLEMENTED,
+                grpc.aio.Metadata(),
+                grpc.aio.Metadata(),
+                details="Batch not implemented",
+                debug_error_string="",
+            )
+        self.batches.append([call.method for call in request.calls])
+        results = []
+        for call in request.calls:
+            request_cls = {
+                "SymbolInfoTick": mt5_pb2.SymbolRequest,
+                "PositionsGet": mt5_pb2.PositionsRequest,
+                "CopyRatesFromPos": mt5_pb2.CopyRatesPosRequest,
+            }.get(call.method, mt5_pb2.Empty)
+            try:
+                response = self._respond(
+                    call.method, request_cls.FromString(call.request)
+                )
+            except ValueError as e:
+                results.append(mt5_pb2.BatchResult(error=f"ValueError: {e}"))
+                continue
+            results.append(mt5_pb2.BatchResult(response=response.SerializeToString()))
+        return mt5_pb2.BatchResponse(results=results)
+
+    def __getattr__(self, method: str) -> object:
+        async def _single(
+            request: object,
+            timeout: float | None = None,  # noqa: ASYNC109 - gRPC stub signature
+        ) -> object:
+            _ = timeout
+            self.single_calls.append(method)
+            return self._respond(method, request)
+
+        return _single
+
+
+class TestAsyncBatch:
+    """Test AsyncMetaTrader5.batch()."""
+
+    async def test_one_rpc_for_all_reads(self) -> None:
+        """Queued reads go out in one Batch RPC and resolve in order."""
+        stub = _BatchStub()
+        async with stub_client(stub).batch() as b:
+            account = b.account_info()
+            tick = b.symbol_info_tick("EURUSD")
+            total = b.positions_total()
+            positions = b.positions_get(symbol="EURUSD")
+            rates = b.copy_rates_from_pos("EURUSD", 16385, 0, 3)
+            assert not account.done()
+
+        assert stub.batches == [
+            [
+                "AccountInfo",
+                "SymbolInfoTick",
+                "PositionsTotal",
+                "PositionsGet",
+                "CopyRatesFromPos",
+            ]
+        ]
+        assert stub.single_calls == []
+        info = account.result()
+        assert info is not None
+        assert info.equity == 1010.0
+        quote = tick.result()
+        assert quote is not None
+        assert quote.bid == 1.085
+        assert total.result() == 1
+        rows = positions.result()
+        assert rows is not None
+        assert rows[0].ticket == 7
+        bars = rates.result()
+        assert bars is not None
+        assert len(bars) == 3
+
+    async def test_call_error_fails_only_its_future(self) -> None:
+        """A bridge-side error in one call leaves the others resolved."""
+        stub = _BatchStub()
+        async with stub_client(stub).batch() as b:
+            good = b.symbol_info_tick("EURUSD")
+            bad = b.symbol_info_tick("XXXYYY")
+
+        assert good.result() is not None
+        with pytest.raises(u.Exceptions.Error, match="unknown symbol"):
+            bad.result()
+
+    async def test_fallback_without_batch_rpc(self) -> None:
+        """UNIMPLEMENTED falls back to one standalone RPC per read."""
+        stub = _BatchStub(batch_supported=False)
+        async with stub_client(stub).batch() as b:
+            account = b.account_info()
+            total = b.positions_total()
+
+        assert sorted(stub.single_calls) == ["AccountInfo", "PositionsTotal"]
+        assert account.result() is not None
+        assert total.result() == 1
+
+    async def test_exception_in_block_cancels(self) -> None:
+        """An exception raised in the block sends nothing."""
+        stub = _BatchStub()
+        batch = stub_client(stub).batch()
+        account = batch.account_info()
+        error = RuntimeError("abort")
+        await batch.__aexit__(RuntimeError, error, None)
+
+        assert stub.batches == []
+        with pytest.raises(u.Exceptions.Error, match="cancelled"):
+            account.result()
+
+    async def test_empty_batch_sends_nothing(self) -> None:
+        """A batch with no reads does not call the bridge."""
+        stub = _BatchStub()
+        async with stub_client(stub).batch() as b:
+            assert len(b) == 0
+
+        assert stub.batches == []
+
+
+class TestSyncBatch:
+    """Test MetaTrader5.batch()."""
+
+    def test_sends_on_exit(self) -> None:
+        """The sync with block sends one Batch RPC on exit."""
+        stub = _BatchStub()
+        mt5 = MetaTrader5(host="testhost", port=12345)
+        mt5._async_client = stub_client(stub)
+        try:
+            with mt5.batch() as b:
+                account = b.account_info()
+                total = b.positions_total()
+
+            assert stub.batches == [["AccountInfo", "PositionsTotal"]]
+            info = account.result()
+            assert info is not None
+            assert info.balance == 1000.0
+            assert total.result() == 1
+        finally:
+            mt5._get_loop().close()
+            asyncio.set_event_loop(None)
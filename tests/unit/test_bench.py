@@ -0,0 +1,98 @@
+"""Tests for the end-to-end benchmark runner (mt5linux.bench).
+
+Tests verify:
+1. seed_trades books positions and round-trip deals without call latency
+2. run_benchmarks reports percentiles, throughput and rows per client
+3. compare() renders p50/p99 changes against a baseline report
+4. The JSON report round-trips through python -m mt5linux bench
+
+No live bridge: LocalBridge serves a seeded MT5Simulator through the real
+bridge on localhost.
+"""
+
+from __future__ import annotations
+
+import time
+from typing import TYPE_CHECKING, cast
+
+import orjson
+
+from mt5linux.__main__ import main as cli_main
+from mt5linux.bench import compare, run_benchmarks
+from mt5linux.simulator import MT5Simulator
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+    import pytest
+
+
+def _report(p50: float, p99: float) -> dict[str, object]:
+    row = {"client": "async", "scenario": "symbol_info_tick"}
+    return {"commit": "abc1234", "results": [{**row, "p50_ms": p50, "p99_ms": p99}]}
+
+
+class TestSeedTrades:
+    """Test MT5Simulator.seed_trades."""
+
+    def test_books_positions_and_deals(self) -> None:
+        """Positions stay open; round trips leave two deals each."""
+        sim = MT5Simulator(latency_ms=20.0)
+        sim.initialize()
+        start = time.perf_counter()
+        sim.seed_trades("EURUSD", positions=3, round_trips=4)
+
+        assert time.perf_counter() - start < 0.2
+        assert sim.positions_total() == 3
+        deals = sim.history_deals_get(0, 2**31, group="EURUSD") or ()
+        assert len([d for d in deals if d.symbol == "EURUSD"]) == 11
+
+
+class TestRunBenchmarks:
+    """Test the benchmark runner."""
+
+    def test_report_per_client(self) -> None:
+        """Each selected scenario gets a result per client."""
+        report = run_benchmarks(iterations=5, only=["symbol_info_tick", "positions"])
+        results = cast("list[dict[str, object]]", report["results"])
+
+        assert [(r["client"], r["scenario"]) for r in results] == [
+            ("async", "symbol_info_tick"),
+            ("async", "positions_get[10]"),
+            ("async", "positions_get[1000]"),
+            ("sync", "symbol_info_tick"),
+            ("sync", "positions_get[10]"),
+            ("sync", "positions_get[1000]"),
+        ]
+        assert [r["rows"] for r in results] == [1, 10, 1000, 1, 10, 1000]
+        for row in results:
+            assert row["iterations"] == 5
+            assert 0 < cast("float", row["p50_ms"]) <= cast("float", row["p99_ms"])
+            assert cast("float", row["throughput"]) > 0
+
+    def test_compare(self) -> None:
+        """Changes are shown relative to the baseline."""
+        text = compare(_report(1.0, 4.0), _report(0.5, 5.0))
+
+        assert "abc1234" in text
+        assert "p50 1.000->0.500 (-50%)" in text
+        assert "p99 4.000->5.000 (+25%)" in text
+
+    def test_cli_writes_json(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """The bench subcommand writes a loadable report."""
+        output = tmp_path / "bench.json"
+        monkeypatch.setattr(
+            "sys.argv",
+            ["mt5linux", "bench", "-n", "3", "-k", "order_send", "-o", str(output)],
+        )
+
+        assert cli_main() == 0
+        report = orjson.loads(output.read_bytes())
+        assert report["iterations"] == 3
+        assert [r["scenario"] for r in report["results"]] == [
+            "order_send",
+            "order_send_batch[10]",
+            "order_send",
+        ]
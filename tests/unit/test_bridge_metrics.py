@@ -0,0 +1,108 @@
+"""Tests for the GetBridgeMetrics RPC client side.
+
+Tests verify:
+1. AsyncMetaTrader5.bridge_metrics returns the decoded metrics dict
+2. bridge_metrics skips the terminal connectivity check
+
+NO MOCKING - a real in-process grpc.aio server implements GetBridgeMetrics.
+"""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, cast
+
+import grpc
+import grpc.aio
+import orjson
+import pytest
+
+from mt5linux import mt5_pb2, mt5_pb2_grpc
+from mt5linux.async_client import AsyncMetaTrader5, _make_stub
+
+if TYPE_CHECKING:
+    from collections.abc import AsyncGenerator, Callable
+
+    from mt5linux.mt5_pb2 import DictData, Empty
+
+_METRICS = {
+    "mt5_executor": {
+        "max_workers": 4,
+        "timeout": 30.0,
+        "queued": 0,
+        "running": 1,
+        "hung": 0,
+        "completed": 12,
+        "errors": 1,
+        "timeouts": 0,
+        "rejected": 0,
+        "latency_ms": {
+            "count": 13,
+            "sum": 84.5,
+            "max": 20.1,
+            "buckets": {"1": 2, "5": 9, "10": 11, "25": 13, "+Inf": 13},
+        },
+    }
+}
+
+
+class _MetricsServicer(mt5_pb2_grpc.MT5ServiceServicer):
+    """Serves fixed bridge metrics."""
+
+    def __init__(self) -> None:
+        self.calls = 0
+
+    async def GetBridgeMetrics(  # noqa: N802 - gRPC method name
+        self,
+        request: Empty,
+        context: grpc.aio.ServicerContext[object, object],
+    ) -> DictData:
+        self.calls += 1
+        return mt5_pb2.DictData(json_data=orjson.dumps(_METRICS).decode())
+
+
+@pytest.fixture
+async def client() -> AsyncGenerator[tuple[AsyncMetaTrader5, _MetricsServicer]]:
+    """Client attached to an in-process server, terminal state unknown."""
+    servicer = _MetricsServicer()
+    srv = grpc.aio.server()
+    register = cast(
+        "Callable[[mt5_pb2_grpc.MT5ServiceServicer, grpc.aio.Server], None]",
+        mt5_pb2_grpc.add_MT5ServiceServicer_to_server,
+    )
+    register(servicer, srv)
+    port = srv.add_insecure_port("127.0.0.1:0")
+    await srv.start()
+
+    mt5 = AsyncMetaTrader5(host="127.0.0.1", port=port)
+    mt5._channel = grpc.aio.insecure_channel(f"127.0.0.1:{port}")
+    mt5._stub = _make_stub(mt5._channel)
+    yield mt5, servicer
+
+    await mt5._channel.close(grace=None)
+    await srv.stop(grace=None)
+
+
+class TestBridgeMetrics:
+    """Test AsyncMetaTrader5.bridge_metrics."""
+
+    async def test_returns_metrics_dict(
+        self, client: tuple[AsyncMetaTrader5, _MetricsServicer]
+    ) -> None:
+        """The JSON payload is decoded into a plain dict."""
+        mt5, servicer = client
+        metrics = await mt5.bridge_metrics()
+
+        assert servicer.calls == 1
+        assert metrics == _METRICS
+
+    async def test_skips_terminal_check(
+        self, client: tuple[AsyncMetaTrader5, _MetricsServicer]
+    ) -> None:
+        """Diagnostics work without a known terminal connection."""
+        mt5, _ = client
+        assert mt5._connectivity.connected is None
+
+        metrics = await mt5.bridge_metrics()
+
+        assert "mt5_executor" in metrics
+        assert mt5._connectivity.connected is None
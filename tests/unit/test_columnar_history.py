@@ -0,0 +1,195 @@
+"""Tests for columnar (as_array) positions/orders/history responses.
+
+Tests verify:
+1. as_array=True sets the request flag and returns a structured array
+2. Default mode still returns validated models from json_items
+3. String fields survive the NumpyArray dtype round-trip
+4. Empty results return None in both modes
+
+NO MOCKING - a real in-process grpc.aio server implements HistoryDealsGet
+and PositionsGet, encoding rows the same way the bridge does.
+"""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, cast
+
+import grpc
+import grpc.aio
+import numpy as np
+import orjson
+import pytest
+
+from mt5linux import mt5_pb2, mt5_pb2_grpc
+from mt5linux.async_client import AsyncMetaTrader5, _make_stub
+from mt5linux.models import MT5Models
+
+if TYPE_CHECKING:
+    from collections.abc import AsyncGenerator, Callable
+
+    from mt5linux.mt5_pb2 import DictList, HistoryRequest, PositionsRequest
+
+_DEALS = [
+    {
+        "ticket": 1001,
+        "order": 2001,
+        "time": 1700000000,
+        "time_msc": 1700000000123,
+        "type": 0,
+        "entry": 0,
+        "magic": 42,
+        "position_id": 3001,
+        "reason": 3,
+        "volume": 0.1,
+        "price": 1.0851,
+        "commission": -0.5,
+        "swap": 0.0,
+        "profit": 0.0,
+        "fee": 0.0,
+        "symbol": "EURUSD",
+        "comment": "RQabc",
+        "external_id": "",
+    },
+    {
+        "ticket": 1002,
+        "order": 2002,
+        "time": 1700000060,
+        "time_msc": 1700000060456,
+        "type": 1,
+        "entry": 1,
+        "magic": 42,
+        "position_id": 3001,
+        "reason": 3,
+        "volume": 0.1,
+        "price": 1.0861,
+        "commission": -0.5,
+        "swap": 0.0,
+        "profit": 10.0,
+        "fee": 0.0,
+        "symbol": "EURUSD",
+        "comment": "close",
+        "external_id": "",
+    },
+]
+
+
+def _to_array(rows: list[dict[str, object]]) -> np.ndarray:
+    dtype = []
+    for name, value in rows[0].items():
+        if isinstance(value, str):
+            width = max(len(str(r[name])) for r in rows) or 1
+            dtype.append((name, f"<U{width}"))
+        elif isinstance(value, float):
+            dtype.append((name, "<f8"))
+        else:
+            dtype.append((name, "<i8"))
+    return np.array([tuple(r.values()) for r in rows], dtype=dtype)
+
+
+class _HistoryServicer(mt5_pb2_grpc.MT5ServiceServicer):
+    """Serves fixed deals; positions are always empty."""
+
+    def __init__(self) -> None:
+        self.requests: list[HistoryRequest] = []
+
+    async def HistoryDealsGet(  # noqa: N802 - gRPC method name
+        self,
+        request: HistoryRequest,
+        context: grpc.aio.ServicerContext[object, object],
+    ) -> DictList:
+        self.requests.append(request)
+        if request.as_array:
+            arr = _to_array(_DEALS)
+            return mt5_pb2.DictList(
+                array=mt5_pb2.NumpyArray(
+                    data=arr.tobytes(), dtype=str(arr.dtype), shape=list(arr.shape)
+                )
+            )
+        return mt5_pb2.DictList(json_items=[orjson.dumps(d).decode() for d in _DEALS])
+
+    async def PositionsGet(  # noqa: N802 - gRPC method name
+        self,
+        request: PositionsRequest,
+        context: grpc.aio.ServicerContext[object, object],
+    ) -> DictList:
+        return mt5_pb2.DictList()
+
+
+@pytest.fixture
+async def client() -> AsyncGenerator[tuple[AsyncMetaTrader5, _HistoryServicer]]:
+    """Client attached to an in-process server."""
+    servicer = _HistoryServicer()
+    srv = grpc.aio.server()
+    register = cast(
+        "Callable[[mt5_pb2_grpc.MT5ServiceServicer, grpc.aio.Server], None]",
+        mt5_pb2_grpc.add_MT5ServiceServicer_to_server,
+    )
+    register(servicer, srv)
+    port = srv.add_insecure_port("127.0.0.1:0")
+    await srv.start()
+
+    mt5 = AsyncMetaTrader5(host="127.0.0.1", port=port)
+    mt5._channel = grpc.aio.insecure_channel(f"127.0.0.1:{port}")
+    mt5._stub = _make_stub(mt5._channel)
+    mt5._connectivity.record(connected=True)
+    yield mt5, servicer
+
+    await mt5._channel.close(grace=None)
+    await srv.stop(grace=None)
+
+
+class TestColumnarHistory:
+    """Test history_deals_get(as_array=True)."""
+
+    async def test_as_array_returns_structured_array(
+        self, client: tuple[AsyncMetaTrader5, _HistoryServicer]
+    ) -> None:
+        """as_array=True returns one record per deal with named fields."""
+        mt5, servicer = client
+        deals = await mt5.history_deals_get(1699990000, 1700090000, as_array=True)
+
+        assert servicer.requests[-1].as_array is True
+        assert isinstance(deals, np.ndarray)
+        assert len(deals) == len(_DEALS)
+        assert deals["ticket"].tolist() == [1001, 1002]
+        assert deals["profit"].sum() == pytest.approx(10.0)
+        assert deals["symbol"][0] == "EURUSD"
+        assert deals["comment"].tolist() == ["RQabc", "close"]
+
+    async def test_default_returns_models(
+        self, client: tuple[AsyncMetaTrader5, _HistoryServicer]
+    ) -> None:
+        """Default mode still validates models from json_items."""
+        mt5, servicer = client
+        deals = await mt5.history_deals_get(1699990000, 1700090000)
+
+        assert servicer.requests[-1].as_array is False
+        assert deals is not None
+        assert all(isinstance(d, MT5Models.Deal) for d in deals)
+        assert [d.ticket for d in deals] == [1001, 1002]
+
+    async def test_array_matches_models(
+        self, client: tuple[AsyncMetaTrader5, _HistoryServicer]
+    ) -> None:
+        """Both encodings carry the same values."""
+        mt5, _ = client
+        arr = await mt5.history_deals_get(1699990000, 1700090000, as_array=True)
+        models = await mt5.history_deals_get(1699990000, 1700090000)
+
+        assert arr is not None
+        assert models is not None
+        for row, model in zip(arr, models, strict=True):
+            assert int(row["position_id"]) == model.position_id
+            assert float(row["price"]) == model.price
+            assert str(row["comment"]) == model.comment
+
+    @pytest.mark.parametrize("as_array", [True, False])
+    async def test_empty_result_is_none(
+        self,
+        client: tuple[AsyncMetaTrader5, _HistoryServicer],
+        *,
+        as_array: bool,
+    ) -> None:
+        """Empty responses return None in both modes."""
+        mt5, _ = client
+        assert await mt5.positions_get(as_array=as_array) is None
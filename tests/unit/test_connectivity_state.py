@@ -0,0 +1,217 @@
+"""Tests for u.ConnectivityState - cached terminal connectivity gate.
+
+Tests verify:
+1. Fresh CONNECTED observation short-circuits the pre-call terminal check
+2. Stale, unknown or DISCONNECTED state forces a live terminal_info probe
+3. Connectivity errors invalidate the cached state
+4. ErrorClassifier.is_connectivity_error classification
+
+NO MOCKING of the state object - terminal_info is replaced on the client
+instance only to count live probes (no bridge available in unit tests).
+"""
+
+from __future__ import annotations
+
+import asyncio
+
+import pytest
+
+from mt5linux.async_client import AsyncMetaTrader5
+from mt5linux.models import MT5Models
+from mt5linux.settings import MT5Settings
+from mt5linux.utilities import MT5Utilities as u
+
+
+def _client(staleness: float) -> AsyncMetaTrader5:
+    config = MT5Settings(terminal_state_staleness=staleness)
+    return AsyncMetaTrader5(host="testhost", port=12345, config=config)
+
+
+def _count_probes(
+    client: AsyncMetaTrader5,
+    monkeypatch: pytest.MonkeyPatch,
+    *,
+    connected: bool = True,
+) -> dict[str, int]:
+    calls = {"terminal_info": 0}
+
+    async def fake_terminal_info() -> MT5Models.TerminalInfo | None:
+        calls["terminal_info"] += 1
+        return MT5Models.TerminalInfo(connected=connected)
+
+    monkeypatch.setattr(client, "terminal_info", fake_terminal_info)
+    return calls
+
+
+class TestConnectivityState:
+    """Test state transitions and staleness window."""
+
+    def test_initial_state_unknown(self) -> None:
+        """New state has no observation and is not fresh."""
+        state = u.ConnectivityState(config=MT5Settings())
+        assert state.connected is None
+        assert state.age == float("inf")
+        assert state.is_fresh_connected() is False
+        assert state.get_status()["state"] == "UNKNOWN"
+
+    def test_record_connected_is_fresh(self) -> None:
+        """CONNECTED observation is fresh within the staleness window."""
+        state = u.ConnectivityState(
+            config=MT5Settings(terminal_state_staleness=60.0),
+        )
+        state.record(connected=True)
+        assert state.connected is True
+        assert state.is_fresh_connected() is True
+        assert state.get_status()["state"] == "CONNECTED"
+
+    def test_record_disconnected_not_fresh(self) -> None:
+        """DISCONNECTED observation never short-circuits the check."""
+        state = u.ConnectivityState(
+            config=MT5Settings(terminal_state_staleness=60.0),
+        )
+        state.record(connected=False)
+        assert state.connected is False
+        assert state.is_fresh_connected() is False
+
+    def test_zero_staleness_always_stale(self) -> None:
+        """terminal_state_staleness=0 disables the cache."""
+        state = u.ConnectivityState(config=MT5Settings(terminal_state_staleness=0))
+        state.record(connected=True)
+        assert state.is_fresh_connected() is False
+
+    def test_invalidate(self) -> None:
+        """invalidate() returns to UNKNOWN."""
+        state = u.ConnectivityState(
+            config=MT5Settings(terminal_state_staleness=60.0),
+        )
+        state.record(connected=True)
+        state.invalidate()
+        assert state.connected is None
+        assert state.is_fresh_connected() is False
+
+
+class TestTerminalGate:
+    """Test AsyncMetaTrader5 pre-call terminal check uses cached state."""
+
+    def test_fresh_state_skips_probe(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Fresh CONNECTED state answers the check without terminal_info."""
+        client = _client(staleness=60.0)
+        calls = _count_probes(client, monkeypatch)
+        client._connectivity.record(connected=True)
+
+        for _ in range(10):
+            asyncio.run(
+                client._ensure_terminal_connected_for_operation("symbol_info_tick")
+            )
+        assert calls["terminal_info"] == 0
+
+    def test_unknown_state_probes_once(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        """First check probes live, later checks reuse the observation."""
+        client = _client(staleness=60.0)
+        calls = _count_probes(client, monkeypatch)
+
+        for _ in range(5):
+            asyncio.run(
+                client._ensure_terminal_connected_for_operation("positions_get")
+            )
+        assert calls["terminal_info"] == 1
+        assert client._connectivity.connected is True
+
+    def test_stale_state_probes(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        """With zero staleness every check probes live."""
+        client = _client(staleness=0)
+        calls = _count_probes(client, monkeypatch)
+
+        for _ in range(3):
+            asyncio.run(client._ensure_terminal_connected_for_operation("symbol_info"))
+        assert calls["terminal_info"] == 3
+
+    def test_excluded_operations_skip_check(
+        self, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """initialize/terminal_info/version never probe."""
+        client = _client(staleness=0)
+        calls = _count_probes(client, monkeypatch)
+
+        for op in ("initialize", "login", "shutdown", "terminal_info", "version"):
+            asyncio.run(client._ensure_terminal_connected_for_operation(op))
+        assert calls["terminal_info"] == 0
+
+    def test_connectivity_failure_invalidates(
+        self, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """A connectivity error drops cached state, forcing a live probe."""
+        client = _client(staleness=60.0)
+        calls = _count_probes(client, monkeypatch)
+        client._connectivity.record(connected=True)
+
+        client._record_call_failure(ConnectionError("Connection lost"))
+        assert client._connectivity.connected is None
+
+        asyncio.run(client._ensure_terminal_connected_for_operation("symbol_info"))
+        assert calls["terminal_info"] == 1
+
+    def test_non_connectivity_failure_keeps_state(self) -> None:
+        """Application errors do not invalidate connectivity."""
+        client = _client(staleness=60.0)
+        client._connectivity.record(connected=True)
+
+        client._record_call_failure(ValueError("bad symbol"))
+        assert client._connectivity.is_fresh_connected() is True
+
+    def test_call_success_refreshes_state(self) -> None:
+        """Login-dependent call returning data records CONNECTED."""
+        client = _client(staleness=60.0)
+        client._record_call_success("symbol_info_tick", object())
+        assert client._connectivity.is_fresh_connected() is True
+
+    def test_none_result_does_not_refresh(self) -> None:
+        """A None result (how MT5 reports failures) records nothing."""
+        client = _client(staleness=60.0)
+        client._record_call_success("symbol_info_tick", None)
+        assert client._connectivity.connected is None
+
+    def test_none_results_let_state_go_stale(
+        self, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Calls returning None do not keep a dead terminal looking fresh."""
+        client = _client(staleness=0.2)
+        calls = _count_probes(client, monkeypatch)
+
+        async def none_call() -> None:
+            return None
+
+        async def run() -> None:
+            # Probe at t=0, then calls inside the window must not extend it
+            for _ in range(3):
+                await client._resilient_call("symbol_info_tick", none_call)
+                await asyncio.sleep(0.12)
+
+        asyncio.run(run())
+        assert calls["terminal_info"] == 2
+
+    def test_terminal_info_success_does_not_refresh(self) -> None:
+        """terminal_info succeeding says nothing about broker connectivity."""
+        client = _client(staleness=60.0)
+        client._record_call_success("terminal_info", object())
+        assert client._connectivity.connected is None
+
+
+class TestIsConnectivityError:
+    """Test ErrorClassifier.is_connectivity_error."""
+
+    @pytest.mark.parametrize(
+        "error",
+        [ConnectionError("lost"), TimeoutError("deadline")],
+    )
+    def test_connectivity_errors(self, error: Exception) -> None:
+        """Connection and timeout errors signal lost connectivity."""
+        assert u.ErrorClassifier.is_connectivity_error(error) is True
+
+    @pytest.mark.parametrize(
+        "error",
+        [ValueError("bad"), u.Exceptions.PermanentError(10013, "Invalid request")],
+    )
+    def test_other_errors(self, error: Exception) -> None:
+        """Application errors are not connectivity errors."""
+        assert u.ErrorClassifier.is_connectivity_error(error) is False
@@ -0,0 +1,191 @@
+"""Tests for the request_id-indexed deal journal used by order verification.
+
+Tests verify:
+1. u.DealJournal indexes deals by the request_id in their comment
+2. refresh() fetches only from the newest deal time already seen
+3. Concurrent refresh() calls share one fetch
+4. Deals past the window are pruned; clear() resets the cursor
+5. _verify_by_comment resolves from the journal with delta fetches
+
+No live bridge: a minimal in-process stub stands in for the gRPC stub so the
+real journal and verification path are exercised end to end.
+"""
+
+from __future__ import annotations
+
+import asyncio
+from typing import TYPE_CHECKING
+
+import orjson
+
+from mt5linux import mt5_pb2
+from mt5linux.constants import MT5Constants as c
+from mt5linux.models import MT5Models
+from mt5linux.utilities import MT5Utilities as u
+from tests.conftest import stub_client
+
+if TYPE_CHECKING:
+    from datetime import datetime
+
+    from mt5linux.mt5_pb2 import DictList, HistoryRequest
+
+
+_T0 = 1_700_000_000
+_RQ = "RQ0123456789abcdef"
+
+
+def _deal(ticket: int, time: int, comment: str = "") -> dict[str, int | float | str]:
+    return {
+        "ticket": ticket,
+        "order": ticket + 1000,
+        "time": time,
+        "volume": 0.1,
+        "price": 1.085,
+        "symbol": "EURUSD",
+        "comment": comment,
+    }
+
+
+class _DealsStub:
+    """HistoryDealsGet stub filtering a growing deal list by time."""
+
+    def __init__(self) -> None:
+        self.deals: list[dict[str, int | float | str]] = []
+        self.requests: list[tuple[int, int]] = []
+
+    async def HistoryDealsGet(  # noqa: N802 - gRPC method name
+        self,
+        request: HistoryRequest,
+        timeout: float | None = None,  # noqa: ASYNC109 - gRPC stub signature
+    ) -> DictList:
+        _ = timeout
+        self.requests.append((request.date_from, request.date_to))
+        await asyncio.sleep(0.01)
+        return mt5_pb2.DictList(
+            json_items=[
+                orjson.dumps(d).decode()
+                for d in self.deals
+                if request.date_from <= int(d["time"]) <= request.date_to
+            ]
+        )
+
+
+def _models(*deals: dict[str, int | float | str]) -> tuple[MT5Models.Deal, ...]:
+    return tuple(MT5Models.Deal.model_validate(d) for d in deals)
+
+
+class TestDealJournal:
+    """Test u.DealJournal."""
+
+    async def test_indexes_by_request_id(self) -> None:
+        """Deals with a marked comment are found by request_id."""
+        journal: u.DealJournal[MT5Models.Deal] = u.DealJournal(window_seconds=900)
+
+        async def fetch(_from: datetime, _to: datetime) -> tuple[MT5Models.Deal, ...]:
+            return _models(_deal(1, _T0, f"{_RQ}|tp"), _deal(2, _T0 + 1, "manual"))
+
+        assert await journal.refresh(fetch) is True
+        deal = journal.get(_RQ)
+        assert deal is not None
+        assert deal.ticket == 1
+        assert journal.cursor == _T0 + 1
+        assert len(journal) == 2
+
+    async def test_delta_fetch_from_cursor(self) -> None:
+        """After the first fetch, only deals from the cursor second are asked."""
+        journal: u.DealJournal[MT5Models.Deal] = u.DealJournal(window_seconds=900)
+        froms: list[int] = []
+        batches = [
+            _models(_deal(1, _T0), _deal(2, _T0 + 5)),
+            _models(_deal(2, _T0 + 5), _deal(3, _T0 + 9, _RQ)),
+        ]
+
+        async def fetch(
+            date_from: datetime, _to: datetime
+        ) -> tuple[MT5Models.Deal, ...]:
+            froms.append(int(date_from.timestamp()))
+            return batches[len(froms) - 1]
+
+        await journal.refresh(fetch)
+        await journal.refresh(fetch)
+
+        assert froms[1] == _T0 + 5
+        assert len(journal) == 3
+        assert journal.get(_RQ) is not None
+
+    async def test_concurrent_refresh_shares_fetch(self) -> None:
+        """Callers arriving during a fetch wait for it instead of refetching."""
+        journal: u.DealJournal[MT5Models.Deal] = u.DealJournal(window_seconds=900)
+        calls = 0
+
+        async def fetch(_from: datetime, _to: datetime) -> tuple[MT5Models.Deal, ...]:
+            nonlocal calls
+            calls += 1
+            await asyncio.sleep(0.01)
+            return _models(_deal(1, _T0, _RQ))
+
+        results = await asyncio.gather(*[journal.refresh(fetch) for _ in range(5)])
+
+        assert results == [True] * 5
+        assert calls == 1
+        assert journal.get_stats()["shared_fetches"] == 4
+
+    async def test_failed_fetch_keeps_cursor(self) -> None:
+        """A None result reports failure and does not move the cursor."""
+        journal: u.DealJournal[MT5Models.Deal] = u.DealJournal(window_seconds=900)
+
+        async def fetch(_from: datetime, _to: datetime) -> None:
+            return None
+
+        assert await journal.refresh(fetch) is False
+        assert journal.cursor is None
+
+    def test_prunes_past_window_and_clear(self) -> None:
+        """Deals older than window before the cursor are dropped."""
+        journal: u.DealJournal[MT5Models.Deal] = u.DealJournal(window_seconds=60)
+        journal._add(_models(_deal(1, _T0, _RQ), _deal(2, _T0 + 30)))
+        journal._add(_models(_deal(3, _T0 + 120)))
+
+        assert journal.get(_RQ) is None
+        assert len(journal) == 1
+        journal.clear()
+        assert journal.cursor is None
+        assert len(journal) == 0
+
+
+class TestVerifyByComment:
+    """Test _verify_by_comment served through the deal journal."""
+
+    async def test_found_after_delta_fetch(self) -> None:
+        """A deal appearing later is found by the next, narrower fetch."""
+        stub = _DealsStub()
+        stub.deals = [_deal(1, _T0, "other")]
+        client = stub_client(stub)
+        client._deal_journal = u.DealJournal(window_seconds=10**9)
+        ambiguous = MT5Models.OrderResult(retcode=0)
+
+        assert await client._verify_by_comment(_RQ, ambiguous) is None
+        stub.deals.append(_deal(2, _T0 + 3, f"{_RQ}|x"))
+        verified = await client._verify_by_comment(_RQ, ambiguous)
+
+        assert verified is not None
+        assert verified.retcode == c.Order.TradeRetcode.DONE
+        assert verified.deal == 2
+        assert verified.order == 1002
+        assert stub.requests[1][0] == _T0
+
+    async def test_concurrent_verifications_share_fetch(self) -> None:
+        """Parallel verifications of a burst cost a single history fetch."""
+        stub = _DealsStub()
+        ids = [f"RQ{i:016x}" for i in range(20)]
+        stub.deals = [_deal(i + 1, _T0, rq) for i, rq in enumerate(ids)]
+        client = stub_client(stub)
+        client._deal_journal = u.DealJournal(window_seconds=10**9)
+        ambiguous = MT5Models.OrderResult(retcode=0)
+
+        results = await asyncio.gather(
+            *[client._verify_by_comment(rq, ambiguous) for rq in ids]
+        )
+
+        assert [r.deal if r else None for r in results] == list(range(1, 21))
+        assert len(stub.requests) == 1
@@ -0,0 +1,179 @@
+"""Tests for chunked, concurrent tick downloads.
+
+Tests verify:
+1. download_ticks reassembles windows without gaps or duplicates, also when
+   its preallocated result has to grow past the first-window estimate
+2. Windows run concurrently, bounded by download_concurrency
+3. iter_ticks yields chunks in time order
+4. on_chunk receives every chunk and nothing is returned
+5. Concurrent windows of one day are all persisted by the history store
+
+No live bridge: a minimal in-process stub stands in for the gRPC stub so the
+real request queue and resilience path are exercised end to end.
+"""
+
+from __future__ import annotations
+
+import asyncio
+from datetime import timedelta
+from typing import TYPE_CHECKING
+
+import numpy as np
+
+from mt5linux import mt5_pb2
+from tests.conftest import stub_client
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+    from mt5linux.mt5_pb2 import CopyTicksRangeRequest, NumpyArray
+
+
+_TICK_DTYPE = np.dtype(
+    [
+        ("time", "<i8"),
+        ("bid", "<f8"),
+        ("ask", "<f8"),
+        ("last", "<f8"),
+        ("volume", "<u8"),
+        ("time_msc", "<i8"),
+        ("flags", "<u4"),
+        ("volume_real", "<f8"),
+    ]
+)
+_T0 = 1_700_000_000
+_SPAN = 10_000
+
+
+def _all_ticks() -> np.ndarray:
+    # One tick every 250 ms, so several ticks share each boundary second;
+    # the last one is at (_T0 + _SPAN - 1).000, the end of the test ranges
+    msc = _T0 * 1000 + np.arange(0, (_SPAN - 1) * 1000 + 1, 250)
+    ticks = np.zeros(len(msc), dtype=_TICK_DTYPE)
+    ticks["time_msc"] = msc
+    ticks["time"] = msc // 1000
+    return ticks
+
+
+class _TicksStub:
+    """CopyTicksRange stub; date_to is an exact instant, as on the terminal."""
+
+    def __init__(self) -> None:
+        self.ticks = _all_ticks()
+        self.calls = 0
+        self.in_flight = 0
+        self.max_in_flight = 0
+
+    async def CopyTicksRange(  # noqa: N802 - gRPC method name
+        self,
+        request: CopyTicksRangeRequest,
+        timeout: float | None = None,  # noqa: ASYNC109 - gRPC stub signature
+    ) -> NumpyArray:
+        _ = timeout
+        self.calls += 1
+        self.in_flight += 1
+        self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        try:
+            await asyncio.sleep(0.01)
+        finally:
+            self.in_flight -= 1
+        msc = self.ticks["time_msc"]
+        window = self.ticks[
+            (msc >= request.date_from * 1000) & (msc <= request.date_to * 1000)
+        ]
+        return mt5_pb2.NumpyArray(
+            data=window.tobytes(), dtype=str(window.dtype), shape=list(window.shape)
+        )
+
+
+class TestDownloadTicks:
+    """Test download_ticks / iter_ticks."""
+
+    async def test_reassembles_without_gaps_or_duplicates(self) -> None:
+        """The assembled array equals a single full-range fetch."""
+        stub = _TicksStub()
+        client = stub_client(stub, download_concurrency=3)
+        ticks = await client.download_ticks(
+            "EURUSD", _T0, _T0 + _SPAN - 1, chunk=timedelta(seconds=1000)
+        )
+
+        assert ticks is not None
+        assert np.array_equal(ticks, stub.ticks)
+        assert stub.calls == 10
+
+    async def test_result_grows_past_sparse_first_window(self) -> None:
+        """A quiet first window underestimates the size; the result still fits."""
+        stub = _TicksStub()
+        quiet = stub.ticks["time"] < _T0 + 1000
+        stub.ticks = stub.ticks[~quiet | (stub.ticks["time_msc"] % 100_000 == 0)]
+        client = stub_client(stub, download_concurrency=3)
+        ticks = await client.download_ticks(
+            "EURUSD", _T0, _T0 + _SPAN - 1, chunk=timedelta(seconds=1000)
+        )
+
+        assert ticks is not None
+        assert np.array_equal(ticks, stub.ticks)
+        assert ticks.flags.owndata
+
+    async def test_concurrency_bounded(self) -> None:
+        """At most download_concurrency windows are in flight."""
+        stub = _TicksStub()
+        client = stub_client(stub, download_concurrency=3)
+        await client.download_ticks("EURUSD", _T0, _T0 + _SPAN - 1, chunk=500)
+
+        assert stub.max_in_flight == 3
+
+    async def test_iter_ticks_in_order(self) -> None:
+        """Chunks arrive oldest first and do not overlap."""
+        stub = _TicksStub()
+        client = stub_client(stub, download_concurrency=3)
+        last = -1
+        total = 0
+        async for chunk in client.iter_ticks("EURUSD", _T0, _T0 + _SPAN - 1, chunk=700):
+            assert int(chunk["time_msc"][0]) > last
+            last = int(chunk["time_msc"][-1])
+            total += len(chunk)
+
+        assert total == len(stub.ticks)
+
+    async def test_on_chunk_streams(self) -> None:
+        """With on_chunk, chunks go to the callback and nothing is returned."""
+        stub = _TicksStub()
+        client = stub_client(stub, download_concurrency=3)
+        received: list[int] = []
+
+        async def consume(chunk: np.ndarray) -> None:
+            received.append(len(chunk))
+
+        result = await client.download_ticks(
+            "EURUSD", _T0, _T0 + _SPAN - 1, chunk=2500, on_chunk=consume
+        )
+
+        assert result is None
+        assert sum(received) == len(stub.ticks)
+        assert len(received) == 4
+
+    async def test_empty_range(self) -> None:
+        """No ticks in range returns None."""
+        stub = _TicksStub()
+        client = stub_client(stub, download_concurrency=3)
+        assert await client.download_ticks("EURUSD", 0, 100) is None
+
+    async def test_history_store_keeps_concurrent_windows(self, tmp_path: Path) -> None:
+        """Windows written in parallel are all stored; a rerun is served locally."""
+        stub = _TicksStub()
+        client = stub_client(
+            stub,
+            download_concurrency=4,
+            history_store_path=str(tmp_path),
+            history_store_settle=0.0,
+        )
+        first = await client.download_ticks("EURUSD", _T0, _T0 + _SPAN - 1, chunk=500)
+        calls = stub.calls
+        second = await client.download_ticks("EURUSD", _T0, _T0 + _SPAN - 1, chunk=500)
+
+        assert stub.calls == calls
+        assert first is not None
+        assert second is not None
+        assert np.array_equal(first, stub.ticks)
+        assert np.array_equal(second, stub.ticks)
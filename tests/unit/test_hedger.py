@@ -0,0 +1,140 @@
+"""Tests for hedged reads (MT5Utilities.Hedger).
+
+Tests verify:
+1. Only NORMAL-or-lower reads are eligible, never order_send/order_check
+2. An operation is hedged only after hedge_min_samples completed reads
+3. A slow primary is raced by one hedge and the loser is cancelled
+4. The hedge budget caps hedges as a share of reads
+5. Errors propagate when every request fails
+
+No bridge: requests are coroutines with scripted delays.
+"""
+
+from __future__ import annotations
+
+import asyncio
+
+import pytest
+
+from mt5linux.settings import MT5Settings
+from mt5linux.utilities import MT5Utilities as u
+
+
+def _hedger(**overrides: object) -> u.Hedger:
+    settings: dict[str, object] = {
+        "hedge_min_samples": 3,
+        "hedge_min_delay": 0.001,
+        "hedge_budget_percent": 100.0,
+    }
+    settings.update(overrides)
+    hedger = u.Hedger(config=MT5Settings(**settings))
+    for _ in range(3):
+        hedger.observe("symbol_info_tick", 0.005)
+    return hedger
+
+
+class _Script:
+    """Call factory whose n-th request sleeps delays[n] and returns n."""
+
+    def __init__(self, *delays: float, fail: bool = False) -> None:
+        self.delays = delays
+        self.fail = fail
+        self.started = 0
+        self.cancelled = 0
+
+    async def __call__(self) -> int:
+        index = self.started
+        self.started += 1
+        try:
+            await asyncio.sleep(self.delays[index])
+        except asyncio.CancelledError:
+            self.cancelled += 1
+            raise
+        if self.fail:
+            msg = f"request {index} failed"
+            raise ConnectionError(msg)
+        return index
+
+
+class TestEligibility:
+    """Test which operations may be hedged."""
+
+    @pytest.mark.parametrize(
+        ("operation", "eligible"),
+        [
+            ("symbol_info_tick", True),
+            ("copy_rates_from_pos", True),
+            ("market_book_get", True),
+            ("positions_get", False),
+            ("order_send", False),
+            ("order_check", False),
+            ("symbol_select", False),
+            ("unknown_rpc", False),
+        ],
+    )
+    def test_is_eligible(self, operation: str, *, eligible: bool) -> None:
+        """Criticality and the exclusion list decide eligibility."""
+        assert u.Hedger.is_eligible(operation) is eligible
+
+    def test_delay_needs_samples(self) -> None:
+        """The delay is the tracked quantile once enough reads completed."""
+        hedger = u.Hedger(config=MT5Settings(hedge_min_samples=3))
+        hedger.observe("symbol_info", 0.010)
+        hedger.observe("symbol_info", 0.030)
+
+        assert hedger.delay("symbol_info") is None
+        hedger.observe("symbol_info", 0.020)
+        assert hedger.delay("symbol_info") == 0.030
+
+
+class TestRun:
+    """Test hedged execution."""
+
+    async def test_fast_primary_is_not_hedged(self) -> None:
+        """A primary answering within the delay runs alone."""
+        hedger = _hedger()
+        script = _Script(0.0)
+
+        assert await hedger.run("symbol_info_tick", script) == 0
+        assert script.started == 1
+        assert hedger.get_stats()["hedged"] == 0
+
+    async def test_slow_primary_loses_to_hedge(self) -> None:
+        """The hedge answers first and the stalled primary is cancelled."""
+        hedger = _hedger()
+        script = _Script(1.0, 0.0)
+
+        assert await hedger.run("symbol_info_tick", script) == 1
+        await asyncio.sleep(0)
+        assert script.cancelled == 1
+        assert hedger.get_stats()["hedge_wins"] == 1
+
+    async def test_budget_limits_hedges(self) -> None:
+        """At 50% budget, one of two slow reads is hedged."""
+        hedger = _hedger(hedge_budget_percent=50.0)
+        first = _Script(0.02, 0.0)
+        second = _Script(0.02, 0.0)
+
+        assert await hedger.run("symbol_info_tick", first) == 0
+        assert await hedger.run("symbol_info_tick", second) == 1
+        stats = hedger.get_stats()
+        assert (stats["hedged"], stats["denied"]) == (1, 1)
+
+    async def test_ineligible_operation_runs_once(self) -> None:
+        """order_send is never duplicated, however slow."""
+        hedger = _hedger()
+        for _ in range(3):
+            hedger.observe("order_send", 0.001)
+        script = _Script(0.02, 0.0)
+
+        assert await hedger.run("order_send", script) == 0
+        assert script.started == 1
+
+    async def test_both_fail(self) -> None:
+        """When primary and hedge fail, the first error is raised."""
+        hedger = _hedger()
+        script = _Script(0.01, 0.02, fail=True)
+
+        with pytest.raises(ConnectionError, match="request 0 failed"):
+            await hedger.run("symbol_info_tick", script)
+        assert script.started == 2
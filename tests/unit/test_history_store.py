@@ -0,0 +1,386 @@
+"""Tests for the on-disk history store.
+
+Tests verify:
+1. u.HistoryStore plan() splits a range into covered/missing segments
+2. write() persists per-day partitions and merges the coverage index,
+   also with concurrent writers of one partition
+3. read() returns memory-mapped rows for covered ranges
+4. Rows inside the settle window are never persisted
+5. Rates are covered only up to the last closed bar (month-aware for MN1)
+6. copy_ticks_range fetches only missing sub-ranges from the bridge
+7. Sub-second ticks at segment boundaries are stored exactly once
+8. Recent rates are clipped by the broker server clock, not the local one
+
+No live bridge: a minimal in-process stub stands in for the gRPC stub so the
+real store, queue and resilience path are exercised end to end.
+"""
+
+from __future__ import annotations
+
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import TYPE_CHECKING
+
+import numpy as np
+import orjson
+
+from mt5linux import mt5_pb2
+from mt5linux.constants import MT5Constants as c
+from mt5linux.settings import MT5Settings
+from mt5linux.utilities import MT5Utilities as u
+from tests.conftest import stub_client
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+    from mt5linux.mt5_pb2 import (
+        CopyRatesRangeRequest,
+        CopyTicksRangeRequest,
+        DictData,
+        NumpyArray,
+        SymbolRequest,
+    )
+
+
+_TICK_DTYPE = np.dtype(
+    [
+        ("time", "<i8"),
+        ("bid", "<f8"),
+        ("ask", "<f8"),
+        ("last", "<f8"),
+        ("volume", "<u8"),
+        ("time_msc", "<i8"),
+        ("flags", "<u4"),
+        ("volume_real", "<f8"),
+    ]
+)
+_RATES_DTYPE = np.dtype([("time", "<i8"), ("open", "<f8"), ("close", "<f8")])
+_DAY = 86400
+_T0 = 1_700_006_400  # 2023-11-15 00:00:00 UTC
+_FLAGS = 1
+_H1 = c.MarketData.TimeFrame.H1
+_MN1 = c.MarketData.TimeFrame.MN1
+
+
+def _ticks(start: int, end: int, step: int = 3600) -> np.ndarray:
+    times = np.arange(start, end + 1, step)
+    ticks = np.zeros(len(times), dtype=_TICK_DTYPE)
+    ticks["time"] = times
+    ticks["time_msc"] = times * 1000
+    ticks["bid"] = 1.0 + (times - _T0) / 1e6
+    return ticks
+
+
+def _rates(opens: list[int]) -> np.ndarray:
+    rates = np.zeros(len(opens), dtype=_RATES_DTYPE)
+    rates["time"] = opens
+    return rates
+
+
+def _store(tmp_path: Path, settle: float = 0.0) -> u.HistoryStore:
+    return u.HistoryStore(
+        config=MT5Settings(
+            history_store_path=str(tmp_path), history_store_settle=settle
+        )
+    )
+
+
+class _TicksStub:
+    """In-process stub serving ticks every hour over any range."""
+
+    def __init__(self) -> None:
+        self.ranges: list[tuple[int, int]] = []
+
+    async def CopyTicksRange(  # noqa: N802 - gRPC method name
+        self,
+        request: CopyTicksRangeRequest,
+        timeout: float | None = None,  # noqa: ASYNC109 - gRPC stub signature
+    ) -> NumpyArray:
+        _ = timeout
+        self.ranges.append((request.date_from, request.date_to))
+        first = -(-request.date_from // 3600) * 3600
+        ticks = _ticks(first, request.date_to)
+        return mt5_pb2.NumpyArray(
+            data=ticks.tobytes(), dtype=str(ticks.dtype), shape=list(ticks.shape)
+        )
+
+
+class _SubSecondTicksStub:
+    """In-process stub with a tick every 250 ms; date_to is an exact instant."""
+
+    async def CopyTicksRange(  # noqa: N802 - gRPC method name
+        self,
+        request: CopyTicksRangeRequest,
+        timeout: float | None = None,  # noqa: ASYNC109 - gRPC stub signature
+    ) -> NumpyArray:
+        _ = timeout
+        msc = np.arange(request.date_from * 1000, request.date_to * 1000 + 1, 250)
+        ticks = np.zeros(len(msc), dtype=_TICK_DTYPE)
+        ticks["time_msc"] = msc
+        ticks["time"] = msc // 1000
+        return mt5_pb2.NumpyArray(
+            data=ticks.tobytes(), dtype=str(ticks.dtype), shape=list(ticks.shape)
+        )
+
+
+class _RatesStub:
+    """In-process stub serving H1 bars; the broker clock lags UTC by 5h."""
+
+    def __init__(self) -> None:
+        self.server_time = int(time.time()) - 5 * 3600
+
+    async def CopyRatesRange(  # noqa: N802 - gRPC method name
+        self,
+        request: CopyRatesRangeRequest,
+        timeout: float | None = None,  # noqa: ASYNC109 - gRPC stub signature
+    ) -> NumpyArray:
+        _ = timeout
+        first = -(-request.date_from // 3600) * 3600
+        last = min(request.date_to, self.server_time)
+        rates = _rates(list(range(first, last + 1, 3600)))
+        return mt5_pb2.NumpyArray(
+            data=rates.tobytes(), dtype=str(rates.dtype), shape=list(rates.shape)
+        )
+
+    async def SymbolInfoTick(  # noqa: N802 - gRPC method name
+        self,
+        request: SymbolRequest,
+        timeout: float | None = None,  # noqa: ASYNC109 - gRPC stub signature
+    ) -> DictData:
+        _ = timeout
+        tick = {"time": self.server_time, "bid": 1.1, "ask": 1.2}
+        payload = {**tick, "symbol": request.symbol}
+        return mt5_pb2.DictData(json_data=orjson.dumps(payload).decode())
+
+
+class TestHistoryStore:
+    """Test u.HistoryStore."""
+
+    def test_empty_store_plans_one_missing_segment(self, tmp_path: Path) -> None:
+        """Nothing stored: the whole range is missing."""
+        store = _store(tmp_path)
+        assert store.plan("ticks", "EURUSD", _FLAGS, _T0, _T0 + 10) == [
+            (_T0, _T0 + 10, False)
+        ]
+
+    def test_write_then_read_across_days(self, tmp_path: Path) -> None:
+        """Rows are split into day partitions and read back in order."""
+        store = _store(tmp_path)
+        ticks = _ticks(_T0, _T0 + 2 * _DAY)
+        store.write("ticks", "EURUSD", _FLAGS, (_T0, _T0 + 2 * _DAY), ticks)
+
+        files = sorted(p.name for p in (tmp_path / "ticks/EURUSD/1").glob("*.npy"))
+        assert files == ["20231115.npy", "20231116.npy", "20231117.npy"]
+        rows = store.read("ticks", "EURUSD", _FLAGS, _T0, _T0 + 2 * _DAY)
+        assert rows is not None
+        assert np.array_equal(rows, ticks)
+
+    def test_single_partition_read_is_memmap(self, tmp_path: Path) -> None:
+        """A range inside one day is a view on the memory-mapped file."""
+        store = _store(tmp_path)
+        store.write(
+            "ticks",
+            "EURUSD",
+            _FLAGS,
+            (_T0, _T0 + _DAY - 1),
+            _ticks(_T0, _T0 + _DAY - 1),
+        )
+
+        rows = store.read("ticks", "EURUSD", _FLAGS, _T0 + 3600, _T0 + 7200)
+        assert isinstance(rows, np.memmap)
+        assert rows["time"].tolist() == [_T0 + 3600, _T0 + 7200]
+
+    def test_plan_reports_gaps(self, tmp_path: Path) -> None:
+        """Covered ranges are merged; gaps between them are missing."""
+        store = _store(tmp_path)
+        store.write("ticks", "EURUSD", _FLAGS, (_T0, _T0 + 99), _ticks(_T0, _T0 + 99))
+        store.write(
+            "ticks",
+            "EURUSD",
+            _FLAGS,
+            (_T0 + 100, _T0 + 199),
+            _ticks(_T0 + 100, _T0 + 199),
+        )
+        store.write(
+            "ticks",
+            "EURUSD",
+            _FLAGS,
+            (_T0 + 300, _T0 + 399),
+            _ticks(_T0 + 300, _T0 + 399),
+        )
+
+        assert store.plan("ticks", "EURUSD", _FLAGS, _T0 + 50, _T0 + 500) == [
+            (_T0 + 50, _T0 + 199, True),
+            (_T0 + 200, _T0 + 299, False),
+            (_T0 + 300, _T0 + 399, True),
+            (_T0 + 400, _T0 + 500, False),
+        ]
+
+    def test_rewrite_replaces_rows(self, tmp_path: Path) -> None:
+        """Refetching a segment does not duplicate stored rows."""
+        store = _store(tmp_path)
+        ticks = _ticks(_T0, _T0 + 7200)
+        store.write("ticks", "EURUSD", _FLAGS, (_T0, _T0 + 7200), ticks)
+        store.write("ticks", "EURUSD", _FLAGS, (_T0, _T0 + 7200), ticks)
+
+        rows = store.read("ticks", "EURUSD", _FLAGS, _T0, _T0 + 7200)
+        assert rows is not None
+        assert len(rows) == len(ticks)
+
+    def test_settle_window_not_persisted(self, tmp_path: Path) -> None:
+        """Rows newer than now - settle are not stored or covered."""
+        store = _store(tmp_path, settle=10 * 365 * _DAY)
+        store.write("ticks", "EURUSD", _FLAGS, (_T0, _T0 + 10), _ticks(_T0, _T0 + 10))
+
+        assert store.plan("ticks", "EURUSD", _FLAGS, _T0, _T0 + 10)[0][2] is False
+        assert not (tmp_path / "ticks").exists()
+
+    def test_rates_covered_to_last_closed_bar(self, tmp_path: Path) -> None:
+        """The bar still forming at the settle cutoff is not stored or covered."""
+        store = _store(tmp_path)
+        opens = [_T0 + h * 3600 for h in range(6)]
+        now = _T0 + 5 * 3600 + 1800  # halfway through the 05:00 bar
+        store.write(
+            "rates", "EURUSD", _H1, (_T0, _T0 + _DAY), _rates(opens), server_time=now
+        )
+
+        rows = store.read("rates", "EURUSD", _H1, _T0, _T0 + _DAY)
+        assert rows is not None
+        assert rows["time"].tolist() == opens[:5]
+        assert store.plan("rates", "EURUSD", _H1, _T0, _T0 + _DAY)[0] == (
+            _T0,
+            now - 3600,
+            True,
+        )
+
+    def test_mn1_covered_to_month_start(self, tmp_path: Path) -> None:
+        """MN1 bars close at the next month start, whatever the month length."""
+        store = _store(tmp_path)
+        oct1, nov1 = 1_696_118_400, 1_698_796_800  # 2023-10-01, 2023-11-01
+        store.write(
+            "rates",
+            "EURUSD",
+            _MN1,
+            (oct1, _T0),
+            _rates([oct1, nov1]),
+            server_time=_T0,
+        )
+
+        rows = store.read("rates", "EURUSD", _MN1, oct1, _T0)
+        assert rows is not None
+        assert rows["time"].tolist() == [oct1]
+        assert store.plan("rates", "EURUSD", _MN1, oct1, _T0)[0] == (
+            oct1,
+            nov1 - 1,
+            True,
+        )
+
+    def test_concurrent_writes_to_one_day(self, tmp_path: Path) -> None:
+        """Parallel writers of one partition keep every row and the index."""
+        store = _store(tmp_path)
+        hours = [(_T0 + h * 3600, _T0 + h * 3600 + 3599) for h in range(24)]
+        with ThreadPoolExecutor(max_workers=8) as pool:
+            list(
+                pool.map(
+                    lambda seg: store.write(
+                        "ticks", "EURUSD", _FLAGS, seg, _ticks(seg[0], seg[1], 60)
+                    ),
+                    hours,
+                )
+            )
+
+        rows = store.read("ticks", "EURUSD", _FLAGS, _T0, _T0 + _DAY - 1)
+        assert rows is not None
+        assert len(rows) == 24 * 60
+        assert store.plan("ticks", "EURUSD", _FLAGS, _T0, _T0 + _DAY - 1) == [
+            (_T0, _T0 + _DAY - 1, True)
+        ]
+        assert not list((tmp_path / "ticks").rglob("*.tmp"))
+
+    def test_clear(self, tmp_path: Path) -> None:
+        """clear() drops partitions and coverage."""
+        store = _store(tmp_path)
+        store.write("ticks", "EURUSD", _FLAGS, (_T0, _T0 + 10), _ticks(_T0, _T0 + 10))
+        store.clear("ticks", "EURUSD")
+
+        assert store.read("ticks", "EURUSD", _FLAGS, _T0, _T0 + 10) is None
+        assert store.plan("ticks", "EURUSD", _FLAGS, _T0, _T0 + 10)[0][2] is False
+
+
+class TestStoredCopyTicksRange:
+    """Test copy_ticks_range served through the history store."""
+
+    async def test_second_read_served_from_disk(self, tmp_path: Path) -> None:
+        """A covered range makes no bridge call."""
+        stub = _TicksStub()
+        client = stub_client(
+            stub, history_store_path=str(tmp_path), history_store_settle=0.0
+        )
+        first = await client.copy_ticks_range("EURUSD", _T0, _T0 + _DAY, _FLAGS)
+        second = await client.copy_ticks_range("EURUSD", _T0, _T0 + _DAY, _FLAGS)
+
+        assert stub.ranges == [(_T0, _T0 + _DAY + 1)]
+        assert first is not None
+        assert second is not None
+        assert np.array_equal(first, second)
+
+    async def test_extension_fetches_only_missing(self, tmp_path: Path) -> None:
+        """Extending a covered range fetches just the new sub-range."""
+        stub = _TicksStub()
+        client = stub_client(
+            stub, history_store_path=str(tmp_path), history_store_settle=0.0
+        )
+        await client.copy_ticks_range("EURUSD", _T0, _T0 + _DAY, _FLAGS)
+        ticks = await client.copy_ticks_range("EURUSD", _T0, _T0 + 2 * _DAY, _FLAGS)
+
+        assert stub.ranges == [
+            (_T0, _T0 + _DAY + 1),
+            (_T0 + _DAY + 1, _T0 + 2 * _DAY + 1),
+        ]
+        assert ticks is not None
+        assert np.array_equal(ticks, _ticks(_T0, _T0 + 2 * _DAY))
+
+    async def test_sub_second_ticks_at_boundaries(self, tmp_path: Path) -> None:
+        """Ticks after hi.000 in a boundary second are neither lost nor doubled."""
+        stub = _SubSecondTicksStub()
+        client = stub_client(
+            stub, history_store_path=str(tmp_path), history_store_settle=0.0
+        )
+        live = stub_client(stub)
+        await client.copy_ticks_range("EURUSD", _T0 + 10, _T0 + 20, _FLAGS)
+        await client.copy_ticks_range("EURUSD", _T0 + 30, _T0 + 40, _FLAGS)
+        stored = await client.copy_ticks_range("EURUSD", _T0, _T0 + 50, _FLAGS)
+        again = await client.copy_ticks_range("EURUSD", _T0, _T0 + 50, _FLAGS)
+        expected = await live.copy_ticks_range("EURUSD", _T0, _T0 + 50, _FLAGS)
+
+        assert expected is not None
+        assert len(expected) == 50 * 4 + 1
+        assert stored is not None
+        assert again is not None
+        assert np.array_equal(stored, expected)
+        assert np.array_equal(again, expected)
+
+
+class TestStoredCopyRatesRange:
+    """Test copy_rates_range served through the history store."""
+
+    async def test_recent_rates_clipped_by_server_clock(self, tmp_path: Path) -> None:
+        """A broker clock behind UTC keeps its forming bar out of the store."""
+        stub = _RatesStub()
+        client = stub_client(
+            stub,
+            history_store_path=str(tmp_path),
+            history_store_settle=0.0,
+            typed_market_data=False,
+        )
+        start = stub.server_time - _DAY
+        rates = await client.copy_rates_range("EURUSD", _H1, start, int(time.time()))
+
+        assert rates is not None
+        store = client._history_store
+        assert store is not None
+        covered = store.plan("rates", "EURUSD", _H1, start, int(time.time()))[0]
+        assert covered == (start, stub.server_time - 3600, True)
+        stored = store.read("rates", "EURUSD", _H1, start, int(time.time()))
+        assert stored is not None
+        assert int(stored["time"][-1]) + 3600 <= stub.server_time
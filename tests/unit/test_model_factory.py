@@ -0,0 +1,123 @@
+"""Tests for validated vs constructed response models.
+
+Tests verify:
+1. u.ModelFactory validates by default and constructs when disabled
+2. The per-call validate argument overrides the setting
+3. Sampled validation logs schema drift for constructed responses
+4. positions_get(validate=False) builds models without validation
+
+No live bridge: a minimal in-process stub stands in for the gRPC stub so the
+real client parsing path is exercised end to end.
+"""
+
+from __future__ import annotations
+
+import logging
+from typing import TYPE_CHECKING
+
+import orjson
+
+from mt5linux import mt5_pb2
+from mt5linux.models import MT5Models
+from mt5linux.settings import MT5Settings
+from mt5linux.utilities import MT5Utilities as u
+from tests.conftest import stub_client
+
+if TYPE_CHECKING:
+    import pytest
+
+    from mt5linux.mt5_pb2 import DictList, PositionsRequest
+
+
+_POSITION = {"ticket": 7, "symbol": "EURUSD", "volume": 0.1, "profit": 2.5}
+
+
+class _PositionsStub:
+    """PositionsGet stub returning fixed rows."""
+
+    def __init__(self, rows: list[dict[str, object]]) -> None:
+        self.rows = rows
+        self.calls = 0
+
+    async def PositionsGet(  # noqa: N802 - gRPC method name
+        self,
+        request: PositionsRequest,
+        timeout: float | None = None,  # noqa: ASYNC109 - gRPC stub signature
+    ) -> DictList:
+        _ = timeout, request
+        self.calls += 1
+        return mt5_pb2.DictList(
+            json_items=[orjson.dumps(row).decode() for row in self.rows]
+        )
+
+
+class TestModelFactory:
+    """Test u.ModelFactory."""
+
+    def test_validates_by_default(self) -> None:
+        """Default settings coerce values through model_validate."""
+        factory = u.ModelFactory(config=MT5Settings())
+        (position,) = factory.build_many(MT5Models.Position, [{"ticket": "7"}])
+
+        assert position.ticket == 7
+        assert factory.get_stats()["constructed"] == 0
+
+    def test_constructs_when_disabled(self) -> None:
+        """validate_models=False assigns values as-is."""
+        factory = u.ModelFactory(config=MT5Settings(validate_models=False))
+        (position,) = factory.build_many(MT5Models.Position, [{"ticket": "7"}])
+
+        # Unvalidated: the raw string is stored despite the int annotation
+        assert vars(position)["ticket"] == "7"
+        assert position.symbol == ""
+        assert factory.get_stats()["constructed"] == 1
+
+    def test_per_call_override(self) -> None:
+        """validate= wins over the setting in both directions."""
+        constructing = u.ModelFactory(config=MT5Settings(validate_models=False))
+        validating = u.ModelFactory(config=MT5Settings())
+
+        forced = constructing.build(MT5Models.Tick, {"time": "1"}, validate=True)
+        trusted = validating.build(MT5Models.Tick, {"time": "1"}, validate=False)
+
+        assert forced is not None
+        assert forced.time == 1
+        assert trusted is not None
+        assert vars(trusted)["time"] == "1"
+        assert constructing.build(MT5Models.Tick, None) is None
+
+    def test_sampled_drift_is_logged(self, caplog: pytest.LogCaptureFixture) -> None:
+        """A sampled response that validates differently is reported."""
+        config = MT5Settings(validate_models=False, validate_models_sample_rate=1.0)
+        factory = u.ModelFactory(config=config)
+
+        with caplog.at_level(logging.WARNING, logger="mt5linux.utilities"):
+            factory.build_many(MT5Models.Position, [_POSITION, {"ticket": "7"}])
+
+        assert factory.get_stats() == {"constructed": 2, "sampled": 1, "drift": 1}
+        assert "Schema drift in Position" in caplog.text
+        assert "ticket" in caplog.text
+
+    def test_matching_sample_is_silent(self) -> None:
+        """Well-formed bridge rows pass the sampled check."""
+        config = MT5Settings(validate_models=False, validate_models_sample_rate=1.0)
+        factory = u.ModelFactory(config=config)
+        factory.build_many(MT5Models.Position, [_POSITION])
+
+        assert factory.get_stats()["drift"] == 0
+
+
+class TestClientConstruct:
+    """Test the validate argument on client getters."""
+
+    async def test_positions_get_without_validation(self) -> None:
+        """validate=False returns constructed models equal to validated ones."""
+        stub = _PositionsStub([_POSITION])
+        client = stub_client(stub, MT5Settings(terminal_state_staleness=60.0))
+
+        constructed = await client.positions_get(validate=False)
+        validated = await client.positions_get()
+
+        assert constructed == validated
+        assert stub.calls == 2
+        assert client._models.get_stats()["constructed"] == 1
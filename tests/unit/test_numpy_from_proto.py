@@ -0,0 +1,82 @@
+"""Tests for u.Data.numpy_from_proto and the dtype registry.
+
+Tests verify:
+1. Canonical rates/ticks dtype strings resolve without parsing
+2. Other dtype strings are parsed once and memoized (bounded)
+3. Default result is a read-only zero-copy view over the bytes
+4. copy=True returns an owned, writable array
+"""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+import numpy as np
+import pytest
+
+from mt5linux import mt5_pb2
+from mt5linux.utilities import MT5Utilities as u
+
+if TYPE_CHECKING:
+    from mt5linux.mt5_pb2 import NumpyArray
+
+
+def _proto(arr: np.ndarray) -> NumpyArray:
+    return mt5_pb2.NumpyArray(
+        data=arr.tobytes(), dtype=str(arr.dtype), shape=list(arr.shape)
+    )
+
+
+class TestDtypeRegistry:
+    """Test u.Data.DtypeRegistry."""
+
+    @pytest.mark.parametrize("name", ["RATES", "TICKS"])
+    def test_canonical_dtypes_predeclared(self, name: str) -> None:
+        """The bridge's str(dtype) of rates/ticks maps to the shared instance."""
+        canonical = getattr(u.Data.DtypeRegistry, name)
+        rebuilt = np.dtype(canonical.descr)
+        assert u.Data.DtypeRegistry.get(str(rebuilt)) is canonical
+
+    def test_other_dtypes_memoized(self) -> None:
+        """Repeated lookups return the same parsed dtype."""
+        spec = "[('ticket', '<i8'), ('price', '<f8')]"
+        first = u.Data.DtypeRegistry.get(spec)
+        assert u.Data.DtypeRegistry.get(spec) is first
+        assert first.names == ("ticket", "price")
+
+    def test_memo_bounded(self) -> None:
+        """The memo never exceeds MAX_SIZE entries."""
+        for i in range(u.Data.DtypeRegistry.MAX_SIZE + 10):
+            u.Data.DtypeRegistry.get(f"[('f{i}', '<i8')]")
+        assert u.Data.DtypeRegistry.size() <= u.Data.DtypeRegistry.MAX_SIZE
+
+
+class TestNumpyFromProto:
+    """Test view vs owned-copy results."""
+
+    def test_default_is_readonly_view(self) -> None:
+        """Without copy the array is a read-only view over the proto bytes."""
+        rates = np.zeros(3, dtype=u.Data.DtypeRegistry.RATES)
+        arr = u.Data.numpy_from_proto(_proto(rates))
+
+        assert arr is not None
+        assert arr.dtype is u.Data.DtypeRegistry.RATES
+        assert arr.flags.writeable is False
+        assert arr.base is not None
+        with pytest.raises(ValueError, match="read-only"):
+            arr["close"][0] = 1.0
+
+    def test_copy_is_owned_and_writable(self) -> None:
+        """copy=True returns an owned, writable array with the same data."""
+        ticks = np.zeros(2, dtype=u.Data.DtypeRegistry.TICKS)
+        ticks["bid"] = [1.1, 1.2]
+        arr = u.Data.numpy_from_proto(_proto(ticks), copy=True)
+
+        assert arr is not None
+        assert arr.flags.owndata is True
+        arr["bid"][0] = 2.0
+        assert arr["bid"].tolist() == [2.0, 1.2]
+
+    def test_empty_is_none(self) -> None:
+        """Empty payload returns None."""
+        assert u.Data.numpy_from_proto(mt5_pb2.NumpyArray()) is None
@@ -0,0 +1,334 @@
+"""Tests for order_send_batch over the OrderSendBatch streaming RPC.
+
+Tests verify:
+1. u.MicroBatcher flushes on the expected count or after the linger
+2. Dispatch errors and missing results reach every waiting caller
+3. order_send_batch sends first attempts in one OrderSendBatch stream
+4. Orders the bridge reports as errored are verified, not resent
+5. Bridges without OrderSendBatch fall back to per-order OrderSend
+6. A stream that fails midway leaves unconfirmed orders verified, not resent,
+   and its deadline grows per wave of bridge workers, not per order
+7. The bridge rejects a batch with a malformed order before sending any
+
+No live bridge: a minimal in-process stub stands in for the gRPC stub so the
+real orchestrator, verification and batching path are exercised end to end.
+"""
+
+from __future__ import annotations
+
+import asyncio
+from concurrent import futures
+from typing import TYPE_CHECKING, cast
+
+import grpc
+import grpc.aio
+import orjson
+import pytest
+
+from mt5linux import mt5_pb2, mt5_pb2_grpc
+from mt5linux.bridge import MT5GRPCServicer
+from mt5linux.constants import MT5Constants as c
+from mt5linux.models import MT5Models
+from mt5linux.settings import MT5Settings
+from mt5linux.simulator import MT5Simulator
+from mt5linux.utilities import MT5Utilities as u
+from tests.conftest import stub_client
+
+if TYPE_CHECKING:
+    from collections.abc import AsyncIterator, Callable
+    from types import ModuleType
+
+    from mt5linux.async_client import AsyncMetaTrader5
+    from mt5linux.mt5_pb2 import (
+        DictData,
+        DictList,
+        HistoryRequest,
+        OrderBatchRequest,
+        OrderBatchResult,
+        OrderRequest,
+    )
+
+_DONE = int(c.Order.TradeRetcode.DONE)
+_CONFIG = MT5Settings(
+    terminal_state_staleness=60.0,
+    tx_verify_propagation_delay=0.0,
+    order_batch_linger_ms=50.0,
+)
+
+
+def _order(i: int) -> dict[str, object]:
+    return {"action": 1, "symbol": "EURUSD", "volume": 0.1, "type": 0, "magic": i}
+
+
+def _result(ticket: int, comment: str) -> str:
+    return orjson.dumps(
+        {"retcode": _DONE, "deal": ticket, "order": ticket, "comment": comment}
+    ).decode()
+
+
+class _OrderStub:
+    """In-process stub for OrderSendBatch, OrderSend and HistoryDealsGet."""
+
+    def __init__(self, *, batch_supported: bool = True) -> None:
+        self.batch_supported = batch_supported
+        self.batches: list[int] = []
+        self.timeouts: list[float | None] = []
+        self.single_sends = 0
+        self.fail_index: int | None = None
+        self.break_after: int | None = None
+        self.deals: list[dict[str, object]] = []
+
+    def OrderSendBatch(  # noqa: N802 - gRPC method name
+        self,
+        request: OrderBatchRequest,
+        timeout: float | None = None,
+    ) -> AsyncIterator[OrderBatchResult]:
+        self.timeouts.append(timeout)
+        return self._stream(request)
+
+    async def _stream(
+        self, request: OrderBatchRequest
+    ) -> AsyncIterator[OrderBatchResult]:
+        if not self.batch_supported:
+            raise grpc.aio.AioRpcError(
+                grpc.StatusCode.UNIMPLEMENTED,
+                grpc.aio.Metadata(),
+                grpc.aio.Metadata(),
+                details="OrderSendBatch not implemented",
+                debug_error_string="",
+            )
+        self.batches.append(len(request.orders))
+        # Complete in reverse order to exercise index routing
+        for sent, index in enumerate(reversed(range(len(request.orders)))):
+            await asyncio.sleep(0)
+            comment = orjson.loads(request.orders[index].json_request)["comment"]
+            ticket = 5000 + index
+            if sent == self.break_after:
+                # Every order ran, but the stream broke before the rest arrived
+                for rest in range(index, -1, -1):
+                    order = orjson.loads(request.orders[rest].json_request)
+                    self.deals.append(
+                        {
+                            "ticket": 5000 + rest,
+                            "order": 5000 + rest,
+                            "time": 0,
+                            "comment": order["comment"],
+                        }
+                    )
+                raise grpc.aio.AioRpcError(
+                    grpc.StatusCode.UNAVAILABLE,
+                    grpc.aio.Metadata(),
+                    grpc.aio.Metadata(),
+                    details="stream broken",
+                    debug_error_string="",
+                )
+            if index == self.fail_index:
+                # Executed by MT5, but the bridge lost the result
+                self.deals.append(
+                    {"ticket": ticket, "order": ticket, "time": 0, "comment": comment}
+                )
+                yield mt5_pb2.OrderBatchResult(index=index, error="timed out")
+                continue
+            yield mt5_pb2.OrderBatchResult(
+                index=index, json_data=_result(ticket, comment)
+            )
+
+    async def OrderSend(  # noqa: N802 - gRPC method name
+        self,
+        request: OrderRequest,
+        timeout: float | None = None,  # noqa: ASYNC109 - gRPC stub signature
+    ) -> DictData:
+        _ = timeout
+        self.single_sends += 1
+        comment = orjson.loads(request.json_request)["comment"]
+        return mt5_pb2.DictData(json_data=_result(9000 + self.single_sends, comment))
+
+    async def HistoryDealsGet(  # noqa: N802 - gRPC method name
+        self,
+        request: HistoryRequest,
+        timeout: float | None = None,  # noqa: ASYNC109 - gRPC stub signature
+    ) -> DictList:
+        _ = timeout, request
+        return mt5_pb2.DictList(
+            json_items=[orjson.dumps(d).decode() for d in self.deals]
+        )
+
+
+async def _send_all(
+    client: AsyncMetaTrader5, count: int
+) -> dict[str, MT5Models.OrderResult | Exception]:
+    done: asyncio.Future[dict[str, MT5Models.OrderResult | Exception]] = (
+        asyncio.get_running_loop().create_future()
+    )
+    await client.order_send_batch(
+        [_order(i) for i in range(count)],  # type: ignore[misc]
+        on_all_complete=done.set_result,
+    )
+    return await asyncio.wait_for(done, timeout=5.0)
+
+
+async def _indexed(items: list[int]) -> AsyncIterator[tuple[int, int]]:
+    for index, item in enumerate(items):
+        yield index, item * 10
+
+
+class TestMicroBatcher:
+    """Test u.MicroBatcher."""
+
+    async def test_flushes_when_expected_reached(self) -> None:
+        """All expected submissions go out in a single dispatch."""
+        batcher: u.MicroBatcher[int, int] = u.MicroBatcher(
+            _indexed, expected=5, linger=10.0
+        )
+        results = await asyncio.gather(*[batcher.submit(i) for i in range(5)])
+
+        assert results == [0, 10, 20, 30, 40]
+        assert batcher.batches == 1
+
+    async def test_linger_flushes_partial_batch(self) -> None:
+        """Missing submissions do not block the ones that arrived."""
+        batcher: u.MicroBatcher[int, int] = u.MicroBatcher(
+            _indexed, expected=10, linger=0.01
+        )
+        results = await asyncio.gather(*[batcher.submit(i) for i in range(3)])
+
+        assert results == [0, 10, 20]
+        assert batcher.batches == 1
+
+    async def test_dispatch_error_reaches_all_callers(self) -> None:
+        """An error raised by dispatch is raised in every caller."""
+
+        async def failing(_items: list[int]) -> AsyncIterator[tuple[int, int]]:
+            yield 0, 0
+            msg = "stream broken"
+            raise ConnectionError(msg)
+
+        batcher: u.MicroBatcher[int, int] = u.MicroBatcher(
+            failing, expected=2, linger=10.0
+        )
+        first, second = await asyncio.gather(
+            batcher.submit(1), batcher.submit(2), return_exceptions=True
+        )
+
+        assert first == 0
+        assert isinstance(second, ConnectionError)
+
+    async def test_missing_result_raises(self) -> None:
+        """A payload without a result gets RuntimeError."""
+
+        async def partial(_items: list[int]) -> AsyncIterator[tuple[int, int]]:
+            yield 1, 7
+
+        batcher: u.MicroBatcher[int, int] = u.MicroBatcher(
+            partial, expected=2, linger=10.0
+        )
+        first, second = await asyncio.gather(
+            batcher.submit(1), batcher.submit(2), return_exceptions=True
+        )
+
+        assert isinstance(first, RuntimeError)
+        assert second == 7
+
+
+class TestOrderSendBatchRPC:
+    """Test order_send_batch through OrderSendBatch."""
+
+    async def test_single_stream_for_batch(self) -> None:
+        """N orders cost one OrderSendBatch call and no OrderSend."""
+        stub = _OrderStub()
+        results = await _send_all(stub_client(stub, _CONFIG), 20)
+
+        assert stub.batches == [20]
+        assert stub.single_sends == 0
+        assert all(isinstance(r, MT5Models.OrderResult) for r in results.values())
+        for rid, result in results.items():
+            assert isinstance(result, MT5Models.OrderResult)
+            assert result.comment.startswith(rid)
+
+    async def test_stream_deadline_grows_per_wave(self) -> None:
+        """The deadline allows one timeout per wave of bridge workers, plus one."""
+        stub = _OrderStub()
+        client = stub_client(stub, _CONFIG)
+        await _send_all(client, 20)
+
+        assert stub.timeouts == [client._timeout * 6]
+
+    async def test_errored_order_is_verified_not_resent(self) -> None:
+        """An order executed but reported as errored is found by comment."""
+        stub = _OrderStub()
+        stub.fail_index = 3
+        results = await _send_all(stub_client(stub, _CONFIG), 5)
+
+        assert stub.single_sends == 0
+        deals = sorted(
+            r.deal for r in results.values() if isinstance(r, MT5Models.OrderResult)
+        )
+        assert deals == [5000, 5001, 5002, 5003, 5004]
+
+    async def test_broken_stream_verifies_unconfirmed(self) -> None:
+        """Orders without a result when the stream fails are found, not resent."""
+        stub = _OrderStub()
+        stub.break_after = 2
+        results = await _send_all(stub_client(stub, _CONFIG), 5)
+
+        assert stub.batches == [5]
+        assert stub.single_sends == 0
+        deals = sorted(
+            r.deal for r in results.values() if isinstance(r, MT5Models.OrderResult)
+        )
+        assert deals == [5000, 5001, 5002, 5003, 5004]
+
+    async def test_fallback_without_batch_rpc(self) -> None:
+        """UNIMPLEMENTED falls back to one OrderSend per order."""
+        stub = _OrderStub(batch_supported=False)
+        results = await _send_all(stub_client(stub, _CONFIG), 4)
+
+        assert stub.single_sends == 4
+        assert all(isinstance(r, MT5Models.OrderResult) for r in results.values())
+
+    async def test_disabled_uses_order_send(self) -> None:
+        """order_batch_rpc=False keeps per-order OrderSend."""
+        stub = _OrderStub()
+        config = _CONFIG.model_copy(update={"order_batch_rpc": False})
+        await _send_all(stub_client(stub, config), 3)
+
+        assert stub.batches == []
+        assert stub.single_sends == 3
+
+
+class TestBridgeOrderSendBatch:
+    """Test OrderSendBatch on the real bridge servicer."""
+
+    def test_malformed_order_rejects_whole_batch(self) -> None:
+        """A malformed order aborts the batch before any order is sent."""
+        sim = MT5Simulator(seed=7)
+        server = grpc.server(futures.ThreadPoolExecutor(max_workers=2))
+        servicer = MT5GRPCServicer(mt5_module=cast("ModuleType", sim))
+        register = cast(
+            "Callable[[mt5_pb2_grpc.MT5ServiceServicer, grpc.Server], None]",
+            mt5_pb2_grpc.add_MT5ServiceServicer_to_server,
+        )
+        register(servicer, server)
+        port = server.add_insecure_port("127.0.0.1:0")
+        server.start()
+        valid = orjson.dumps({**_order(0), "comment": "ok"}).decode()
+        request = mt5_pb2.OrderBatchRequest(
+            orders=[
+                mt5_pb2.OrderRequest(json_request=valid),
+                mt5_pb2.OrderRequest(json_request="{not json"),
+            ]
+        )
+        try:
+            with grpc.insecure_channel(f"127.0.0.1:{port}") as channel:
+                stub = cast(
+                    "Callable[[grpc.Channel], mt5_pb2_grpc.MT5ServiceStub]",
+                    mt5_pb2_grpc.MT5ServiceStub,
+                )(channel)
+                with pytest.raises(grpc.RpcError) as exc_info:
+                    list(stub.OrderSendBatch(request))
+        finally:
+            server.stop(grace=None)
+            servicer.close()
+
+        assert exc_info.value.code() == grpc.StatusCode.INVALID_ARGUMENT
+        assert sim.positions_total() == 0
@@ -0,0 +1,232 @@
+"""Tests for MT5Pool routing over several bridges.
+
+Tests verify:
+1. least_outstanding spreads concurrent reads over the members
+2. symbol_hash keeps a symbol on one member and skips unavailable ones
+3. Reads fail over to another member on ConnectionError
+4. Account calls are pinned to the terminal logged into the account
+5. refresh_accounts() discovers member accounts with account_info, and a
+   member whose discovery fails is never used for account calls
+6. Disconnected members are reconnected in the background
+
+No live bridge: minimal in-process stubs stand in for each member's gRPC
+stub so the real clients and routing are exercised end to end.
+"""
+
+from __future__ import annotations
+
+import asyncio
+from typing import TYPE_CHECKING
+
+import grpc.aio
+import orjson
+import pytest
+
+from mt5linux import mt5_pb2
+from mt5linux.async_client import AsyncMetaTrader5
+from mt5linux.client import MetaTrader5
+from mt5linux.pool import MT5Pool
+from mt5linux.settings import MT5Settings
+from tests.conftest import stub_client
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+    from mt5linux.mt5_pb2 import DictData, Empty, SymbolRequest, TickResponse
+
+_TICK = {"time": 1, "bid": 1.085, "ask": 1.0851, "time_msc": 1}
+
+
+class _MemberStub:
+    """Per-member stub serving ticks and account_info."""
+
+    def __init__(
+        self, login: int, *, fail: bool = False, fail_account: bool = False
+    ) -> None:
+        self.login = login
+        self.fail = fail
+        self.fail_account = fail_account
+        self.ticks: list[str] = []
+        self.accounts = 0
+
+    async def SymbolInfoTickTyped(  # noqa: N802 - gRPC method name
+        self,
+        request: SymbolRequest,
+        timeout: float | None = None,  # noqa: ASYNC109 - gRPC stub signature
+    ) -> TickResponse:
+        _ = timeout
+        if self.fail:
+            msg = "terminal unavailable"
+            raise ConnectionError(msg)
+        self.ticks.append(request.symbol)
+        await asyncio.sleep(0.01)
+        return mt5_pb2.TickResponse(tick=mt5_pb2.Tick(**_TICK))
+
+    async def AccountInfo(  # noqa: N802 - gRPC method name
+        self,
+        request: Empty,
+        timeout: float | None = None,  # noqa: ASYNC109 - gRPC stub signature
+    ) -> DictData:
+        _ = timeout, request
+        self.accounts += 1
+        if self.fail_account:
+            msg = "terminal unavailable"
+            raise ConnectionError(msg)
+        data = {"login": self.login, "balance": 100.0, "currency": "USD"}
+        return mt5_pb2.DictData(json_data=orjson.dumps(data).decode())
+
+
+def _member(stub: _MemberStub) -> AsyncMetaTrader5:
+    client = stub_client(stub, retry_initial_delay=0.0)
+    client._channel = grpc.aio.insecure_channel("127.0.0.1:1")
+    return client
+
+
+def _pool(stubs: list[_MemberStub], routing: str = "least_outstanding") -> MT5Pool:
+    return MT5Pool(
+        [_member(stub) for stub in stubs],
+        logins=[stub.login for stub in stubs],
+        routing=routing,
+    )
+
+
+class TestReadRouting:
+    """Test market data read routing."""
+
+    async def test_least_outstanding_spreads_reads(self) -> None:
+        """Concurrent reads land on every member evenly."""
+        stubs = [_MemberStub(1), _MemberStub(1), _MemberStub(1)]
+        pool = _pool(stubs)
+        await asyncio.gather(*(pool.symbol_info_tick("EURUSD") for _ in range(9)))
+
+        assert [len(stub.ticks) for stub in stubs] == [3, 3, 3]
+        assert all(m.outstanding == 0 for m in pool.members)
+
+    async def test_symbol_hash_is_sticky(self) -> None:
+        """A symbol always maps to the same member."""
+        stubs = [_MemberStub(1), _MemberStub(1), _MemberStub(1)]
+        pool = _pool(stubs, routing="symbol_hash")
+        symbols = [f"SYM{i}" for i in range(30)]
+        first = {s: pool.pick(s).name for s in symbols}
+        second = {s: pool.pick(s).name for s in symbols}
+
+        assert first == second
+        assert len(set(first.values())) == 3
+
+    async def test_symbol_hash_skips_open_circuit(self) -> None:
+        """A member with an open circuit breaker gets no reads."""
+        stubs = [_MemberStub(1), _MemberStub(1)]
+        pool = _pool(stubs, routing="symbol_hash")
+        owner = pool.pick("EURUSD")
+        breaker = owner.client._circuit_breaker
+        assert breaker is not None
+        for _ in range(owner.client._settings.cb_threshold):
+            breaker.record_failure()
+
+        assert not owner.available
+        assert pool.pick("EURUSD") is not owner
+
+    async def test_failover_on_connection_error(self) -> None:
+        """A read failing with ConnectionError is retried elsewhere."""
+        stubs = [_MemberStub(1, fail=True), _MemberStub(1)]
+        pool = _pool(stubs)
+        tick = await pool.symbol_info_tick("EURUSD")
+
+        assert tick is not None
+        assert stubs[1].ticks == ["EURUSD"]
+
+
+class TestAccountRouting:
+    """Test account-pinned calls."""
+
+    async def test_pinned_to_owner(self) -> None:
+        """account_info for a login only reaches that account's terminal."""
+        stubs = [_MemberStub(111), _MemberStub(222)]
+        pool = _pool(stubs)
+        info = await pool.account_info(login=222)
+
+        assert info is not None
+        assert info.login == 222
+        assert [stub.accounts for stub in stubs] == [0, 1]
+
+    async def test_login_required_with_several_accounts(self) -> None:
+        """Ambiguous account calls are rejected, not guessed."""
+        pool = _pool([_MemberStub(111), _MemberStub(222)])
+        with pytest.raises(ValueError, match="login="):
+            pool.owner()
+        with pytest.raises(ConnectionError, match="333"):
+            pool.owner(333)
+
+    async def test_refresh_discovers_logins(self) -> None:
+        """Members without a login learn it from account_info."""
+        stubs = [_MemberStub(111), _MemberStub(222)]
+        pool = MT5Pool([_member(stub) for stub in stubs])
+        await pool.refresh_accounts()
+
+        assert [m.login for m in pool.members] == [111, 222]
+        assert pool.owner(222).name == "member-1"
+
+    async def test_failed_discovery_is_not_routed(self) -> None:
+        """A member whose account_info fails gets no account calls."""
+        stubs = [_MemberStub(111), _MemberStub(222, fail_account=True)]
+        pool = MT5Pool([_member(stub) for stub in stubs])
+        await pool.connect()
+
+        assert [m.login for m in pool.members] == [111, None]
+        assert pool.owner().name == "member-0"
+        with pytest.raises(ConnectionError, match="222"):
+            await pool.account_info(login=222)
+
+    async def test_no_known_login_raises(self) -> None:
+        """Without any discovered account, account calls are refused."""
+        pool = MT5Pool([_member(_MemberStub(111, fail_account=True))])
+        await pool.refresh_accounts()
+
+        with pytest.raises(ConnectionError, match="known account"):
+            pool.owner()
+
+
+class TestMembership:
+    """Test pool construction and member recovery."""
+
+    def test_from_endpoints_passes_config(self) -> None:
+        """Clients built from endpoints use the pool's settings."""
+        config = MT5Settings(symbol_cache_ttl=30.0)
+        pool = MT5Pool.from_endpoints([("a", 1), ("b", 2)], config=config)
+
+        assert all(m.client._settings is config for m in pool.members)
+
+    def test_client_constructors_take_config(self, tmp_path: Path) -> None:
+        """config= builds every settings-derived client component."""
+        config = MT5Settings(
+            history_store_path=str(tmp_path), enable_circuit_breaker=True
+        )
+        client = AsyncMetaTrader5(host="a", port=1, config=config)
+        sync = MetaTrader5(host="a", port=1, config=config)
+
+        assert client._settings is config
+        assert client._history_store is not None
+        assert client._circuit_breaker is not None
+        assert sync._async_client._settings is config
+
+    async def test_disconnected_member_is_reconnected(
+        self, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """A member that is not connected is reconnected by a later call."""
+        stubs = [_MemberStub(1), _MemberStub(1)]
+        pool = _pool(stubs)
+        client = pool.members[1].client
+        client._channel = None
+
+        async def connect() -> None:
+            client._channel = grpc.aio.insecure_channel("127.0.0.1:1")
+
+        monkeypatch.setattr(client, "connect", connect)
+        assert not pool.members[1].available
+
+        await pool.symbol_info_tick("EURUSD")
+        await asyncio.sleep(0)
+
+        assert pool.members[1].available
+        await asyncio.gather(*(pool.symbol_info_tick("EURUSD") for _ in range(4)))
+        assert len(stubs[1].ticks) > 0
@@ -0,0 +1,130 @@
+"""Tests for AsyncMetaTrader5 read methods routed through u.RequestQueue.
+
+Tests verify:
+1. Concurrent identical reads coalesce into a single RPC
+2. Different arguments are not coalesced
+3. queue_max_concurrent bounds in-flight RPCs
+4. queue_bypass_operations opts an operation out of the queue
+
+No live bridge: a minimal in-process stub stands in for the gRPC stub so the
+real RequestQueue and resilience path are exercised end to end.
+"""
+
+from __future__ import annotations
+
+import asyncio
+from typing import TYPE_CHECKING
+
+import orjson
+
+from mt5linux import mt5_pb2
+from mt5linux.settings import MT5Settings
+from mt5linux.utilities import MT5Utilities as u
+from tests.conftest import stub_client
+from tests.constants import TestConstants as tc
+
+if TYPE_CHECKING:
+    from mt5linux.async_client import AsyncMetaTrader5
+    from mt5linux.mt5_pb2 import DictData, SymbolRequest
+
+
+class _TickStub:
+    """In-process SymbolInfoTick stub counting calls and concurrency."""
+
+    def __init__(self, delay: float = 0.05) -> None:
+        self.calls = 0
+        self.in_flight = 0
+        self.max_in_flight = 0
+        self._delay = delay
+
+    async def SymbolInfoTick(  # noqa: N802 - gRPC method name
+        self,
+        request: SymbolRequest,
+        timeout: float | None = None,  # noqa: ASYNC109 - gRPC stub signature
+    ) -> DictData:
+        _ = timeout
+        self.calls += 1
+        self.in_flight += 1
+        self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        try:
+            await asyncio.sleep(self._delay)
+        finally:
+            self.in_flight -= 1
+        tick = {"time": 1, "bid": 1.1, "ask": 1.2, "time_msc": 1000}
+        payload = {**tick, "symbol": request.symbol}
+        return mt5_pb2.DictData(json_data=orjson.dumps(payload).decode())
+
+
+async def _client(config: MT5Settings, stub: _TickStub) -> AsyncMetaTrader5:
+    client = stub_client(stub, config)
+    client._queue = u.RequestQueue(config)
+    await client._queue.start()
+    return client
+
+
+def _config(**overrides: object) -> MT5Settings:
+    return MT5Settings(
+        queue_max_concurrent=tc.Queue.MAX_CONCURRENT_DUAL,
+        queue_max_depth=tc.Queue.MAX_DEPTH_LARGE,
+        terminal_state_staleness=60.0,
+        typed_market_data=False,  # stub serves the JSON RPCs
+        **overrides,
+    )
+
+
+class TestQueuedReads:
+    """Test read-path queue routing and coalescing."""
+
+    async def test_identical_reads_coalesce(self) -> None:
+        """Concurrent identical symbol_info_tick calls share one RPC."""
+        stub = _TickStub()
+        client = await _client(_config(), stub)
+        try:
+            ticks = await asyncio.gather(
+                *(client.symbol_info_tick("EURUSD") for _ in range(50))
+            )
+        finally:
+            await client._queue.stop()
+
+        assert stub.calls == 1
+        assert all(t is not None and t.bid == 1.1 for t in ticks)
+
+    async def test_different_symbols_not_coalesced(self) -> None:
+        """Different arguments produce separate RPCs."""
+        stub = _TickStub()
+        client = await _client(_config(), stub)
+        try:
+            await asyncio.gather(
+                client.symbol_info_tick("EURUSD"),
+                client.symbol_info_tick("GBPUSD"),
+            )
+        finally:
+            await client._queue.stop()
+
+        assert stub.calls == 2
+
+    async def test_concurrency_bounded_by_queue(self) -> None:
+        """queue_max_concurrent bounds in-flight RPCs on the bridge."""
+        stub = _TickStub()
+        client = await _client(_config(), stub)
+        symbols = [f"SYM{i}" for i in range(tc.Queue.MAX_DEPTH_DEFAULT)]
+        try:
+            await asyncio.gather(*(client.symbol_info_tick(s) for s in symbols))
+        finally:
+            await client._queue.stop()
+
+        assert stub.calls == len(symbols)
+        assert stub.max_in_flight <= tc.Queue.MAX_CONCURRENT_DUAL
+
+    async def test_bypass_operation_skips_queue(self) -> None:
+        """Operations in queue_bypass_operations are neither queued nor coalesced."""
+        stub = _TickStub()
+        config = _config(queue_bypass_operations=frozenset({"symbol_info_tick"}))
+        client = await _client(config, stub)
+        try:
+            await asyncio.gather(*(client.symbol_info_tick("EURUSD") for _ in range(5)))
+        finally:
+            await client._queue.stop()
+
+        assert stub.calls == 5
+        assert stub.max_in_flight == 5
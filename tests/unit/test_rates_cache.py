@@ -0,0 +1,243 @@
+"""Tests for the incremental OHLCV rates cache.
+
+Tests verify:
+1. u.RatesCache merge appends new bars and updates the forming bar
+2. Buffers grow without losing history; tail() returns owned copies
+3. Memory budget evicts least recently used series; a series that alone
+   exceeds it is not cached
+4. copy_rates_from_pos(start_pos=0) fetches only new bars via copy_rates_range
+5. A failed incremental fetch falls back to a full fetch, never stale bars
+
+No live bridge: a minimal in-process stub stands in for the gRPC stub so the
+real cache, queue and resilience path are exercised end to end.
+"""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+import numpy as np
+
+from mt5linux import mt5_pb2
+from mt5linux.utilities import MT5Utilities as u
+from tests.conftest import stub_client
+
+if TYPE_CHECKING:
+    from mt5linux.mt5_pb2 import CopyRatesPosRequest, CopyRatesRangeRequest, NumpyArray
+
+_RATES_DTYPE = np.dtype(
+    [
+        ("time", "<i8"),
+        ("open", "<f8"),
+        ("high", "<f8"),
+        ("low", "<f8"),
+        ("close", "<f8"),
+        ("tick_volume", "<u8"),
+        ("spread", "<i4"),
+        ("real_volume", "<u8"),
+    ]
+)
+_M1 = 60
+_TF_M1 = 1
+
+
+def _bars(start: int, count: int, close: float = 1.0) -> np.ndarray:
+    bars = np.zeros(count, dtype=_RATES_DTYPE)
+    bars["time"] = start + np.arange(count) * _M1
+    bars["close"] = close
+    return bars
+
+
+def _proto(arr: np.ndarray) -> NumpyArray:
+    return mt5_pb2.NumpyArray(
+        data=arr.tobytes(), dtype=str(arr.dtype), shape=list(arr.shape)
+    )
+
+
+class _RatesStub:
+    """In-process stub serving a growing M1 series."""
+
+    def __init__(self, start: int, count: int) -> None:
+        self.series = _bars(start, count)
+        self.calls: dict[str, int] = {"CopyRatesFromPos": 0, "CopyRatesRange": 0}
+        self.range_from: list[int] = []
+        self.range_fails = False
+
+    async def CopyRatesFromPos(  # noqa: N802 - gRPC method name
+        self,
+        request: CopyRatesPosRequest,
+        timeout: float | None = None,  # noqa: ASYNC109 - gRPC stub signature
+    ) -> NumpyArray:
+        _ = timeout
+        self.calls["CopyRatesFromPos"] += 1
+        end = len(self.series) - request.start_pos
+        return _proto(self.series[max(0, end - request.count) : end])
+
+    async def CopyRatesRange(  # noqa: N802 - gRPC method name
+        self,
+        request: CopyRatesRangeRequest,
+        timeout: float | None = None,  # noqa: ASYNC109 - gRPC stub signature
+    ) -> NumpyArray:
+        _ = timeout
+        self.calls["CopyRatesRange"] += 1
+        self.range_from.append(request.date_from)
+        if self.range_fails:
+            return mt5_pb2.NumpyArray(data=b"", dtype="", shape=[])
+        times = self.series["time"]
+        mask = (times >= request.date_from) & (times <= request.date_to)
+        return _proto(self.series[mask])
+
+
+class TestRatesCache:
+    """Test u.RatesCache."""
+
+    def test_merge_appends_and_updates_forming_bar(self) -> None:
+        """Bars at or after the first new time are replaced."""
+        cache = u.RatesCache(max_bytes=1 << 20)
+        cache.replace("EURUSD", _TF_M1, _bars(0, 10))
+        cache.merge("EURUSD", _TF_M1, _bars(9 * _M1, 3, close=2.0))
+
+        bars = cache.tail("EURUSD", _TF_M1, 100)
+        assert bars is not None
+        assert len(bars) == 12
+        assert bars["time"].tolist() == [i * _M1 for i in range(12)]
+        assert bars["close"][8] == 1.0
+        assert bars["close"][9] == 2.0
+        assert cache.last_time("EURUSD", _TF_M1) == 11 * _M1
+
+    def test_growth_keeps_history(self) -> None:
+        """Repeated small merges keep all bars in order."""
+        cache = u.RatesCache(max_bytes=1 << 20)
+        cache.replace("EURUSD", _TF_M1, _bars(0, 4))
+        for i in range(4, 40):
+            cache.merge("EURUSD", _TF_M1, _bars(i * _M1, 1))
+
+        bars = cache.tail("EURUSD", _TF_M1, 1000)
+        assert bars is not None
+        assert np.array_equal(bars["time"], np.arange(40) * _M1)
+        assert cache.count("EURUSD", _TF_M1) == 40
+
+    def test_tail_is_a_copy(self) -> None:
+        """Later merges do not mutate arrays already handed out."""
+        cache = u.RatesCache(max_bytes=1 << 20)
+        cache.replace("EURUSD", _TF_M1, _bars(0, 5))
+        first = cache.tail("EURUSD", _TF_M1, 1)
+        cache.merge("EURUSD", _TF_M1, _bars(4 * _M1, 1, close=9.0))
+
+        assert first is not None
+        assert first["close"][0] == 1.0
+
+    def test_lru_eviction(self) -> None:
+        """Least recently used series is evicted past the budget."""
+        cache = u.RatesCache(max_bytes=_RATES_DTYPE.itemsize * 25)
+        cache.replace("EURUSD", _TF_M1, _bars(0, 10))
+        cache.replace("GBPUSD", _TF_M1, _bars(0, 10))
+        cache.tail("EURUSD", _TF_M1, 1)
+        cache.replace("USDJPY", _TF_M1, _bars(0, 10))
+
+        assert cache.count("GBPUSD", _TF_M1) == 0
+        assert cache.count("EURUSD", _TF_M1) == 10
+        assert cache.get_stats()["evictions"] == 1
+        assert cache.get_stats()["nbytes"] <= _RATES_DTYPE.itemsize * 25
+
+    def test_single_series_over_budget_not_cached(self) -> None:
+        """A lone series over budget is dropped rather than truncated."""
+        cache = u.RatesCache(max_bytes=_RATES_DTYPE.itemsize * 5)
+        cache.replace("EURUSD", _TF_M1, _bars(0, 8))
+
+        assert cache.tail("EURUSD", _TF_M1, 100) is None
+        assert cache.get_stats()["nbytes"] == 0
+
+    def test_growth_capacity_shrinks_to_budget(self) -> None:
+        """Spare capacity past the budget is released, bars are kept."""
+        cache = u.RatesCache(max_bytes=_RATES_DTYPE.itemsize * 12)
+        cache.replace("EURUSD", _TF_M1, _bars(0, 8))
+        cache.merge("EURUSD", _TF_M1, _bars(8 * _M1, 2))
+
+        assert cache.count("EURUSD", _TF_M1) == 10
+        assert cache.get_stats()["nbytes"] == _RATES_DTYPE.itemsize * 10
+
+    def test_invalidate(self) -> None:
+        """Invalidation filters by symbol and timeframe."""
+        cache = u.RatesCache(max_bytes=1 << 20)
+        cache.replace("EURUSD", 1, _bars(0, 2))
+        cache.replace("EURUSD", 5, _bars(0, 2))
+        cache.replace("GBPUSD", 1, _bars(0, 2))
+        cache.invalidate("EURUSD", 1)
+        assert len(cache) == 2
+        cache.invalidate("EURUSD")
+        assert len(cache) == 1
+        cache.invalidate()
+        assert len(cache) == 0
+
+
+class TestCachedCopyRatesFromPos:
+    """Test copy_rates_from_pos served through the rates cache."""
+
+    async def test_incremental_fetch(self) -> None:
+        """After the first call only bars from the last cached time are fetched."""
+        start = 1_700_000_000
+        stub = _RatesStub(start, 100)
+        client = stub_client(stub, rates_cache_max_bytes=1 << 20)
+
+        first = await client.copy_rates_from_pos("EURUSD", _TF_M1, 0, 50)
+        stub.series = np.concatenate([stub.series, _bars(start + 100 * _M1, 2)])
+        second = await client.copy_rates_from_pos("EURUSD", _TF_M1, 0, 50)
+
+        assert first is not None
+        assert second is not None
+        assert stub.calls == {"CopyRatesFromPos": 1, "CopyRatesRange": 1}
+        assert stub.range_from == [start + 99 * _M1]
+        assert np.array_equal(second, stub.series[-50:])
+
+    async def test_larger_count_refetches(self) -> None:
+        """Asking for more bars than cached falls back to a full fetch."""
+        stub = _RatesStub(1_700_000_000, 100)
+        client = stub_client(stub, rates_cache_max_bytes=1 << 20)
+
+        await client.copy_rates_from_pos("EURUSD", _TF_M1, 0, 10)
+        bars = await client.copy_rates_from_pos("EURUSD", _TF_M1, 0, 60)
+
+        assert stub.calls["CopyRatesFromPos"] == 2
+        assert bars is not None
+        assert len(bars) == 60
+
+    async def test_over_budget_series_is_fetched_in_full(self) -> None:
+        """A series too large to cache is fetched live, never truncated."""
+        stub = _RatesStub(1_700_000_000, 100)
+        client = stub_client(stub, rates_cache_max_bytes=_RATES_DTYPE.itemsize * 20)
+
+        for _ in range(3):
+            bars = await client.copy_rates_from_pos("EURUSD", _TF_M1, 0, 50)
+            assert bars is not None
+            assert len(bars) == 50
+
+        assert stub.calls == {"CopyRatesFromPos": 3, "CopyRatesRange": 0}
+
+    async def test_failed_range_fetch_is_not_served_stale(self) -> None:
+        """A None incremental fetch falls back to a full fetch."""
+        start = 1_700_000_000
+        stub = _RatesStub(start, 100)
+        client = stub_client(stub, rates_cache_max_bytes=1 << 20)
+
+        await client.copy_rates_from_pos("EURUSD", _TF_M1, 0, 50)
+        stub.series = np.concatenate([stub.series, _bars(start + 100 * _M1, 2)])
+        stub.range_fails = True
+        bars = await client.copy_rates_from_pos("EURUSD", _TF_M1, 0, 50)
+
+        assert stub.calls == {"CopyRatesFromPos": 2, "CopyRatesRange": 1}
+        assert bars is not None
+        assert np.array_equal(bars, stub.series[-50:])
+
+    async def test_disabled_or_offset_bypasses_cache(self) -> None:
+        """start_pos != 0 or a zero budget always goes to the bridge."""
+        stub = _RatesStub(1_700_000_000, 100)
+        client = stub_client(stub, rates_cache_max_bytes=1 << 20)
+        await client.copy_rates_from_pos("EURUSD", _TF_M1, 5, 10)
+        await client.copy_rates_from_pos("EURUSD", _TF_M1, 5, 10)
+
+        disabled = stub_client(stub, rates_cache_max_bytes=0)
+        await disabled.copy_rates_from_pos("EURUSD", _TF_M1, 0, 10)
+        await disabled.copy_rates_from_pos("EURUSD", _TF_M1, 0, 10)
+
+        assert stub.calls == {"CopyRatesFromPos": 4, "CopyRatesRange": 0}
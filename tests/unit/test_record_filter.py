@@ -0,0 +1,93 @@
+"""Tests for bridge-side projection and row filters on list getters.
+
+Tests verify:
+1. fields and where are sent in the list request (datetimes as seconds)
+2. Projected rows build models with defaults for the dropped fields
+3. Different filters are not coalesced into one request
+
+No live bridge: a minimal in-process stub stands in for the gRPC stub so the
+real client request and parsing path is exercised end to end.
+"""
+
+from __future__ import annotations
+
+import asyncio
+from datetime import UTC, datetime
+from typing import TYPE_CHECKING
+
+import orjson
+
+from mt5linux import mt5_pb2
+from mt5linux.utilities import MT5Utilities as u
+from tests.conftest import stub_client
+
+if TYPE_CHECKING:
+    from mt5linux.mt5_pb2 import DictList, HistoryRequest
+
+_DEAL = {"ticket": 11, "price": 1.085, "volume": 0.1, "profit": 4.2}
+
+
+class _HistoryStub:
+    """HistoryDealsGet stub recording requests and serving projected rows."""
+
+    def __init__(self) -> None:
+        self.requests: list[HistoryRequest] = []
+
+    async def HistoryDealsGet(  # noqa: N802 - gRPC method name
+        self,
+        request: HistoryRequest,
+        timeout: float | None = None,  # noqa: ASYNC109 - gRPC stub signature
+    ) -> DictList:
+        _ = timeout
+        self.requests.append(request)
+        await asyncio.sleep(0)
+        return mt5_pb2.DictList(json_items=[orjson.dumps(_DEAL).decode()])
+
+
+class TestRecordFilter:
+    """Test fields/where on history_deals_get."""
+
+    async def test_request_carries_projection_and_filter(self) -> None:
+        """Projection and predicates reach the bridge request."""
+        stub = _HistoryStub()
+        since = datetime(2024, 1, 1, tzinfo=UTC)
+        deals = await stub_client(stub).history_deals_get(
+            fields=["price", "volume", "profit"],
+            where={"magic": [42], "entry": [1], "time_from": since},
+        )
+
+        (request,) = stub.requests
+        assert list(request.fields) == ["price", "volume", "profit"]
+        assert list(request.where.magic) == [42]
+        assert list(request.where.entry) == [1]
+        assert request.where.time_from == int(since.timestamp())
+        assert not request.where.HasField("_time_to")
+        assert deals is not None
+        assert deals[0].profit == 4.2
+        assert deals[0].symbol == ""
+
+    async def test_unfiltered_request_is_unchanged(self) -> None:
+        """Without fields/where the request has no projection or filter."""
+        stub = _HistoryStub()
+        await stub_client(stub).history_deals_get()
+
+        (request,) = stub.requests
+        assert list(request.fields) == []
+        assert not request.HasField("where")
+
+    async def test_distinct_filters_not_coalesced(self) -> None:
+        """Concurrent reads with different filters each reach the bridge."""
+        stub = _HistoryStub()
+        client = stub_client(stub)
+        client._queue = u.RequestQueue(client._settings)
+        await client._queue.start()
+        try:
+            await asyncio.gather(
+                client.history_deals_get(where={"magic": [1]}),
+                client.history_deals_get(where={"magic": [2]}),
+                client.history_deals_get(where={"magic": [2]}),
+            )
+        finally:
+            await client._queue.stop()
+
+        assert sorted(r.where.magic[0] for r in stub.requests) == [1, 2]
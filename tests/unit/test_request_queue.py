@@ -3,7 +3,7 @@
 Tests verify:
 1. Priority ordering (CRITICAL > HIGH > NORMAL > LOW)
 2. Parallel execution (NOT sequential)
-3. Semaphore-controlled concurrency
+3. Adaptive concurrency limit (AIMD on latency, within min/max bounds)
 4. Request coalescing (dedupe identical calls)
 5. Backpressure when queue full
 6. Graceful shutdown
@@ -369,6 +369,55 @@ class TestRequestQueueCoalescing:
         # Each order should execute separately
         assert call_count == 3
 
+    async def test_cancelled_waiter_does_not_cancel_shared_result(
+        self, queue: RequestQueue
+    ) -> None:
+        """Cancelling the first submitter leaves coalesced waiters intact."""
+
+        async def slow() -> str:
+            await asyncio.sleep(0.1)
+            return "result"
+
+        key = "symbol_info_tick:EURUSD"
+        owner = asyncio.create_task(queue.submit("symbol_info_tick", slow, key))
+        await asyncio.sleep(0)
+        follower = asyncio.create_task(queue.submit("symbol_info_tick", slow, key))
+        await asyncio.sleep(0.01)
+
+        owner.cancel()
+        with contextlib.suppress(asyncio.CancelledError):
+            await owner
+
+        assert await follower == "result"
+
+
+class TestRequestQueueCoalesceKey:
+    """Test automatic coalesce key derivation."""
+
+    def test_same_arguments_same_key(self) -> None:
+        """Identical operation and arguments produce the same key."""
+        key_a = RequestQueue.make_coalesce_key("symbol_info_tick", "EURUSD")
+        key_b = RequestQueue.make_coalesce_key("symbol_info_tick", "EURUSD")
+        assert key_a == key_b
+
+    def test_different_arguments_different_key(self) -> None:
+        """Different arguments never share a key."""
+        key_a = RequestQueue.make_coalesce_key("symbol_info_tick", "EURUSD")
+        key_b = RequestQueue.make_coalesce_key("symbol_info_tick", "GBPUSD")
+        assert key_a != key_b
+
+    def test_operation_is_part_of_key(self) -> None:
+        """Same arguments for different operations never share a key."""
+        key_a = RequestQueue.make_coalesce_key("symbol_info", "EURUSD")
+        key_b = RequestQueue.make_coalesce_key("symbol_info_tick", "EURUSD")
+        assert key_a != key_b
+
+    def test_none_and_string_none_differ(self) -> None:
+        """None filter and literal "None" string map to different keys."""
+        key_a = RequestQueue.make_coalesce_key("positions_get", None)
+        key_b = RequestQueue.make_coalesce_key("positions_get", "None")
+        assert key_a != key_b
+
 
 class TestRequestQueueBackpressure:
     """Test backpressure when queue is full."""
@@ -555,3 +604,110 @@ class TestRequestQueueGracefulShutdown:
 
         # Cleanup
         await asyncio.gather(*tasks, return_exceptions=True)
+
+
+async def _complete(
+    limit: u.ConcurrencyLimit,
+    operation: str,
+    seconds: float,
+    *,
+    overloaded: bool,
+    rows: int = 1,
+) -> None:
+    """Take a slot and release it as a request of the given outcome."""
+    await limit.acquire()
+    limit.release(operation, seconds, overloaded=overloaded, rows=rows)
+
+
+class TestConcurrencyLimit:
+    """Test the adaptive in-flight limit."""
+
+    async def test_slow_request_cuts_once_per_duration(self) -> None:
+        """A request far above its baseline cuts the limit, once per RTT."""
+        limit = u.ConcurrencyLimit(MT5Settings(queue_max_concurrent=10))
+        await _complete(limit, "symbol_info_tick", 0.001, overloaded=False)
+        assert limit.limit == 10
+
+        await _complete(limit, "symbol_info_tick", 0.05, overloaded=False)
+        await _complete(limit, "symbol_info_tick", 0.05, overloaded=False)
+        assert limit.get_status()["limit"] == 9
+        assert limit.get_status()["cuts"] == 1
+
+    async def test_baselines_are_per_operation(self) -> None:
+        """A slow operation is not congestion relative to a fast one."""
+        limit = u.ConcurrencyLimit(MT5Settings(queue_max_concurrent=10))
+        await _complete(limit, "symbol_info_tick", 0.001, overloaded=False)
+        await _complete(limit, "copy_ticks_range", 0.2, overloaded=False)
+        assert limit.limit == 10
+
+    async def test_mixed_sizes_of_one_operation_do_not_cut(self) -> None:
+        """Large downloads are judged against large downloads, not small ones."""
+        limit = u.ConcurrencyLimit(MT5Settings(queue_max_concurrent=10))
+        for _ in range(200):
+            await _complete(
+                limit, "copy_rates_from_pos", 0.002, overloaded=False, rows=100
+            )
+            await _complete(
+                limit, "copy_rates_from_pos", 0.08, overloaded=False, rows=100_000
+            )
+        assert limit.get_status()["cuts"] == 0
+        assert limit.limit == 10
+
+    async def test_default_min_is_a_quarter_of_max(self) -> None:
+        """Without an explicit minimum the limit stops at max / 4."""
+        limit = u.ConcurrencyLimit(MT5Settings(queue_max_concurrent=12))
+        for _ in range(50):
+            await _complete(limit, "positions_get", 0.0, overloaded=True)
+        assert limit.limit == 3
+        assert limit.get_status()["min"] == 3
+
+    async def test_overload_cuts_to_min_and_recovers(self) -> None:
+        """Retryable failures shrink to the minimum; successes grow back."""
+        config = MT5Settings(queue_max_concurrent=10, queue_min_concurrent=3)
+        limit = u.ConcurrencyLimit(config)
+        for _ in range(50):
+            await _complete(limit, "positions_get", 0.0, overloaded=True)
+        assert limit.limit == 3
+
+        for _ in range(100):
+            await _complete(limit, "positions_get", 0.0, overloaded=False)
+        assert limit.limit == 10
+
+    async def test_equal_bounds_fix_the_limit(self) -> None:
+        """Equal min and max bounds keep a fixed limit."""
+        config = MT5Settings(queue_max_concurrent=4, queue_min_concurrent=4)
+        limit = u.ConcurrencyLimit(config)
+        await _complete(limit, "positions_get", 0.0, overloaded=True)
+        assert limit.get_status() == {
+            "limit": 4,
+            "in_flight": 0,
+            "min": 4,
+            "max": 4,
+            "cuts": 1,
+        }
+
+    async def test_queue_reports_limit(self) -> None:
+        """Retryable errors through the queue lower its reported limit."""
+        queue = RequestQueue(MT5Settings(queue_max_concurrent=5))
+        await queue.start()
+
+        async def fail() -> None:
+            msg = "Connection lost"
+            raise ConnectionError(msg)
+
+        async def fail_permanently() -> None:
+            msg = "bad symbol"
+            raise ValueError(msg)
+
+        try:
+            with pytest.raises(ValueError, match="bad symbol"):
+                await queue.submit("symbol_info", fail_permanently)
+            assert queue.concurrency_limit == 5
+            with pytest.raises(ConnectionError):
+                await queue.submit("symbol_info", fail)
+        finally:
+            await queue.stop()
+
+        status = queue.get_status()
+        assert queue.concurrency_limit == status["limit"] == 4
+        assert (status["in_flight"], status["pending"]) == (0, 0)
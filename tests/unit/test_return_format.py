@@ -0,0 +1,137 @@
+"""Tests for the return_format option on list getters.
+
+Tests verify:
+1. u.Data.records_from_array builds records positionally or by field name
+2. positions_get(return_format="namedtuple") builds records from the array
+3. return_format="array" matches as_array=True
+4. market_book_get returns BookInfo records or a BOOK structured array
+
+No live bridge: a minimal in-process stub stands in for the gRPC stub so the
+real client parsing path is exercised end to end.
+"""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+import numpy as np
+import orjson
+
+from mt5linux import mt5_pb2
+from mt5linux.types import MT5Types as t
+from mt5linux.utilities import MT5Utilities as u
+from tests.conftest import stub_client
+
+if TYPE_CHECKING:
+    from numpy.typing import NDArray
+
+    from mt5linux.mt5_pb2 import DictList, PositionsRequest, SymbolRequest
+
+
+_BOOK = [
+    {"type": 1, "price": 1.0852, "volume": 10, "volume_dbl": 10.0},
+    {"type": 2, "price": 1.0850, "volume": 5, "volume_dbl": 5.0},
+]
+
+
+def _positions_array() -> NDArray[np.void]:
+    arr = np.zeros(2, dtype=[("ticket", "<i8"), ("symbol", "<U6")])
+    arr["ticket"] = [7, 8]
+    arr["symbol"] = ["EURUSD", "GBPUSD"]
+    return arr
+
+
+class _ListStub:
+    """PositionsGet/MarketBookGet stub recording the as_array flag."""
+
+    def __init__(self) -> None:
+        self.as_array: list[bool] = []
+
+    async def PositionsGet(  # noqa: N802 - gRPC method name
+        self,
+        request: PositionsRequest,
+        timeout: float | None = None,  # noqa: ASYNC109 - gRPC stub signature
+    ) -> DictList:
+        _ = timeout
+        self.as_array.append(request.as_array)
+        arr = _positions_array()
+        return mt5_pb2.DictList(
+            array=mt5_pb2.NumpyArray(
+                data=arr.tobytes(), dtype=str(arr.dtype.descr), shape=[len(arr)]
+            )
+        )
+
+    async def MarketBookGet(  # noqa: N802 - gRPC method name
+        self,
+        request: SymbolRequest,
+        timeout: float | None = None,  # noqa: ASYNC109 - gRPC stub signature
+    ) -> DictList:
+        _ = timeout, request
+        return mt5_pb2.DictList(
+            json_items=[orjson.dumps(row).decode() for row in _BOOK]
+        )
+
+
+class TestRecordsFromArray:
+    """Test u.Data.records_from_array."""
+
+    def test_positional_when_fields_match(self) -> None:
+        """An array with the record's exact fields maps row for row."""
+        arr = np.array([(1, 1.5, 3, 3.0)], dtype=u.Data.DtypeRegistry.BOOK)
+        (record,) = u.Data.records_from_array(t.BookInfo, arr) or ()
+
+        assert record == t.BookInfo(type=1, price=1.5, volume=3, volume_dbl=3.0)
+
+    def test_by_name_with_defaults(self) -> None:
+        """Missing fields take defaults; extra array fields are ignored."""
+        arr = np.zeros(1, dtype=[("price", "<f8"), ("type", "<i8"), ("x", "<i8")])
+        arr["price"] = 2.5
+        arr["type"] = 2
+        (record,) = u.Data.records_from_array(t.BookInfo, arr) or ()
+
+        assert record == t.BookInfo(type=2, price=2.5)
+
+    def test_none_passthrough(self) -> None:
+        """None (empty response) stays None."""
+        assert u.Data.records_from_array(t.BookInfo, None) is None
+
+
+class TestClientReturnFormat:
+    """Test return_format on client getters."""
+
+    async def test_positions_namedtuple(self) -> None:
+        """Namedtuple records come from the columnar array response."""
+        stub = _ListStub()
+        positions = await stub_client(stub).positions_get(return_format="namedtuple")
+
+        assert stub.as_array == [True]
+        assert positions is not None
+        assert [p.ticket for p in positions] == [7, 8]
+        assert positions[1].symbol == "GBPUSD"
+        assert positions[0].volume == 0.0
+        assert isinstance(positions[0], t.TradePosition)
+
+    async def test_positions_array_matches_as_array(self) -> None:
+        """return_format="array" is the same as as_array=True."""
+        client = stub_client(_ListStub())
+        by_format = await client.positions_get(return_format="array")
+        by_flag = await client.positions_get(as_array=True)
+
+        assert by_format is not None
+        assert by_flag is not None
+        assert by_format.tolist() == by_flag.tolist()
+
+    async def test_market_book_formats(self) -> None:
+        """market_book_get converts DOM entries to records or an array."""
+        client = stub_client(_ListStub())
+        models = await client.market_book_get("EURUSD")
+        records = await client.market_book_get("EURUSD", return_format="namedtuple")
+        arr = await client.market_book_get("EURUSD", return_format="array")
+
+        assert models is not None
+        assert records is not None
+        assert arr is not None
+        assert records[0] == t.BookInfo(1, 1.0852, 10, 10.0)
+        assert arr.dtype == u.Data.DtypeRegistry.BOOK
+        assert [r.price for r in records] == [m.price for m in models]
+        assert arr["volume"].tolist() == [10, 5]
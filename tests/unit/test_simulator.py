@@ -0,0 +1,428 @@
+"""Tests for the simulated MetaTrader5 module (MT5Simulator).
+
+Tests verify:
+1. Ticks and bars are a pure function of seed and time, with terminal dtypes
+2. Calls fail like the terminal before initialize() and honor call latency
+3. Market orders open/close positions with deals; bad requests get retcodes
+4. Pending orders and stop loss are matched as the price path moves
+5. The real bridge serves the simulator to AsyncMetaTrader5 over localhost
+6. Bridge streams are capped and their polls time out on the MT5 executor
+7. Batch calls not started within the MT5 call timeout are reported, not run
+
+No live terminal: the simulator is served by the real MT5GRPCServicer on an
+in-process gRPC server.
+"""
+
+from __future__ import annotations
+
+import time
+from concurrent import futures
+from typing import TYPE_CHECKING, cast
+
+import grpc
+import numpy as np
+import pytest
+
+from mt5linux import bridge, mt5_pb2, mt5_pb2_grpc
+from mt5linux.async_client import AsyncMetaTrader5
+from mt5linux.bridge import MT5GRPCServicer
+from mt5linux.constants import MT5Constants as c
+from mt5linux.settings import MT5Settings
+from mt5linux.simulator import (
+    RES_E_INTERNAL_FAIL_CONNECT,
+    RES_E_INVALID_PARAMS,
+    MT5Simulator,
+)
+from mt5linux.utilities import MT5Utilities as u
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Iterator
+    from pathlib import Path
+    from types import ModuleType
+
+    from mt5linux.simulator import OrderSendResult, Tick
+
+_NOW = 1_700_000_000.0
+_BUY = c.Order.OrderType.BUY
+_SELL = c.Order.OrderType.SELL
+
+
+class _Clock:
+    """Settable clock for reproducible simulator time."""
+
+    def __init__(self, now: float = _NOW) -> None:
+        self.now = now
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def _simulator(seed: int = 7, clock: _Clock | None = None) -> MT5Simulator:
+    sim = MT5Simulator(seed=seed, clock=clock or _Clock())
+    sim.initialize()
+    return sim
+
+
+def _market(sim: MT5Simulator, order_type: int, **extra: object) -> OrderSendResult:
+    request: dict[str, object] = {
+        "action": c.Order.TradeAction.DEAL,
+        "symbol": "EURUSD",
+        "volume": 0.1,
+        "type": order_type,
+        "deviation": 20,
+    }
+    request.update(extra)
+    result = sim.order_send(request)
+    assert result is not None
+    return result
+
+
+def _advance_until(
+    sim: MT5Simulator, clock: _Clock, hit: Callable[[Tick], bool]
+) -> bool:
+    """Move the clock tick by tick until hit(tick) holds (max 5000 ticks)."""
+    for _ in range(5000):
+        clock.now += 0.1
+        tick = sim.symbol_info_tick("EURUSD")
+        if tick is not None and hit(tick):
+            return True
+    return False
+
+
+class TestPriceGeneration:
+    """Test deterministic ticks and bars."""
+
+    def test_same_seed_same_ticks(self) -> None:
+        """Two simulators with one seed quote identical ticks."""
+        first = _simulator().copy_ticks_range("EURUSD", _NOW - 60, _NOW, -1)
+        second = _simulator().copy_ticks_range("EURUSD", _NOW - 60, _NOW, -1)
+        other = _simulator(seed=8).copy_ticks_range("EURUSD", _NOW - 60, _NOW, -1)
+
+        assert first is not None
+        assert second is not None
+        assert other is not None
+        assert first.dtype == u.Data.DtypeRegistry.TICKS
+        assert len(first) == 601
+        assert np.array_equal(first, second)
+        assert not np.array_equal(first["bid"], other["bid"])
+        assert (first["ask"] > first["bid"]).all()
+
+    def test_bars_match_terminal_layout(self) -> None:
+        """Bars use the rates dtype, align to the timeframe and are consistent."""
+        sim = _simulator()
+        rates = sim.copy_rates_from_pos("EURUSD", c.MarketData.TimeFrame.H1, 0, 24)
+
+        assert rates is not None
+        assert rates.dtype == u.Data.DtypeRegistry.RATES
+        assert len(rates) == 24
+        assert (rates["time"] % 3600 == 0).all()
+        assert rates["time"][-1] <= _NOW < rates["time"][-1] + 3600
+        assert (rates["high"] >= np.maximum(rates["open"], rates["close"])).all()
+        assert (rates["low"] <= np.minimum(rates["open"], rates["close"])).all()
+
+    def test_tick_history_is_bounded(self) -> None:
+        """A range from the epoch returns the last million ticks, not years."""
+        sim = _simulator()
+        ticks = sim.copy_ticks_range("EURUSD", 0, _NOW, -1)
+        first = sim.copy_ticks_from("EURUSD", 0, 10, -1)
+
+        assert ticks is not None
+        assert first is not None
+        assert len(ticks) == 1_000_000
+        assert ticks["time_msc"][-1] == _NOW * 1000
+        assert np.array_equal(first, ticks[:10])
+
+    def test_unsupported_timeframe(self) -> None:
+        """MN1 is not generated and reports invalid params."""
+        sim = _simulator()
+
+        assert (
+            sim.copy_rates_from_pos("EURUSD", c.MarketData.TimeFrame.MN1, 0, 1) is None
+        )
+        assert sim.last_error()[0] == RES_E_INVALID_PARAMS
+
+
+class TestCallBehavior:
+    """Test terminal-like call behavior."""
+
+    def test_requires_initialize(self) -> None:
+        """Calls before initialize() fail with the IPC error."""
+        sim = MT5Simulator()
+
+        assert sim.symbol_info_tick("EURUSD") is None
+        assert sim.last_error()[0] == RES_E_INTERNAL_FAIL_CONNECT
+
+    def test_per_call_latency(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        """call_latency_ms overrides latency_ms for the named function only."""
+        sim = MT5Simulator(latency_ms=5.0, call_latency_ms={"symbol_info_tick": 30.0})
+        sim.initialize()
+        sleeps: list[float] = []
+        monkeypatch.setattr(time, "sleep", sleeps.append)
+        sim.symbol_info("EURUSD")
+        sim.symbol_info_tick("EURUSD")
+
+        assert sleeps == [0.005, 0.03]
+
+    def test_exposes_module_names(self) -> None:
+        """Constants and record types are attributes, like MetaTrader5."""
+        sim = MT5Simulator()
+
+        assert sim.TRADE_RETCODE_DONE == 10009
+        assert sim.TIMEFRAME_H1 == c.MarketData.TimeFrame.H1
+        assert sim.TradePosition._fields[0] == "ticket"
+
+
+class TestOrderMatching:
+    """Test the account and order matching model."""
+
+    def test_open_and_close_position(self) -> None:
+        """A buy opens a position; an opposite deal closes it and books profit."""
+        clock = _Clock()
+        sim = _simulator(clock=clock)
+        opened = _market(sim, _BUY, comment="open")
+        (position,) = sim.positions_get() or ()
+        clock.now += 600
+        closed = _market(sim, _SELL, position=position.ticket)
+        deals = sim.history_deals_get(position=position.ticket) or ()
+        account = sim.account_info()
+
+        assert opened.retcode == c.Order.TradeRetcode.DONE
+        assert position.comment == "open"
+        assert closed.retcode == c.Order.TradeRetcode.DONE
+        assert sim.positions_total() == 0
+        assert [d.entry for d in deals] == [
+            c.Trading.DealEntry.IN,
+            c.Trading.DealEntry.OUT,
+        ]
+        assert account is not None
+        assert account.balance == pytest.approx(10_000.0 + deals[1].profit)
+
+    def test_rejections(self) -> None:
+        """Invalid volume, stale price and unknown positions get retcodes."""
+        sim = _simulator()
+        tick = sim.symbol_info_tick("EURUSD")
+        assert tick is not None
+
+        assert _market(sim, _BUY, volume=0.015).retcode == 10014
+        assert _market(sim, _BUY, price=tick.ask + 0.01).retcode == 10004
+        assert _market(sim, _SELL, position=999).retcode == 10036
+        check = sim.order_check({"action": 1, "symbol": "EURUSD", "volume": 0.1})
+        assert check is not None
+        assert check.retcode == 0
+        assert check.margin > 0
+
+    def test_buy_limit_fills_when_ask_drops(self) -> None:
+        """A buy limit below the market turns into a position once reached."""
+        clock = _Clock()
+        sim = _simulator(clock=clock)
+        tick = sim.symbol_info_tick("EURUSD")
+        assert tick is not None
+        limit = round(tick.ask - 0.0002, 5)
+        sent = sim.order_send(
+            {
+                "action": c.Order.TradeAction.PENDING,
+                "symbol": "EURUSD",
+                "volume": 0.2,
+                "type": c.Order.OrderType.BUY_LIMIT,
+                "price": limit,
+            }
+        )
+        assert sent is not None
+        assert sim.orders_total() == 1
+
+        assert _advance_until(sim, clock, lambda t: t.ask <= limit)
+        (position,) = sim.positions_get() or ()
+        assert sim.orders_total() == 0
+        assert position.ticket == sent.order
+        assert position.volume == 0.2
+
+    def test_stop_loss_closes_position(self) -> None:
+        """A buy whose bid falls to the stop loss is closed with reason SL."""
+        clock = _Clock()
+        sim = _simulator(clock=clock)
+        tick = sim.symbol_info_tick("EURUSD")
+        assert tick is not None
+        stop = round(tick.bid - 0.0002, 5)
+        _market(sim, _BUY, sl=stop)
+
+        assert _advance_until(sim, clock, lambda t: t.bid <= stop)
+        assert sim.positions_total() == 0
+        deals = sim.history_deals_get(_NOW - 1, clock.now + 1) or ()
+        assert deals[-1].reason == c.Trading.DealReason.SL
+
+
+def _stub(channel: grpc.Channel) -> mt5_pb2_grpc.MT5ServiceStub:
+    return cast(
+        "Callable[[grpc.Channel], mt5_pb2_grpc.MT5ServiceStub]",
+        mt5_pb2_grpc.MT5ServiceStub,
+    )(channel)
+
+
+@pytest.fixture
+def bridge_port() -> Iterator[int]:
+    """Serve a simulator through the real bridge servicer on localhost."""
+    server = grpc.server(futures.ThreadPoolExecutor(max_workers=4))
+    servicer = MT5GRPCServicer(
+        mt5_module=cast("ModuleType", MT5Simulator(seed=7, latency_ms=1.0))
+    )
+    register = cast(
+        "Callable[[mt5_pb2_grpc.MT5ServiceServicer, grpc.Server], None]",
+        mt5_pb2_grpc.add_MT5ServiceServicer_to_server,
+    )
+    register(servicer, server)
+    port = server.add_insecure_port("127.0.0.1:0")
+    server.start()
+    yield port
+    server.stop(grace=None)
+    servicer.close()
+
+
+class TestBridgeEndToEnd:
+    """Test the async client against the bridge serving the simulator."""
+
+    async def test_market_data_and_trading(
+        self, bridge_port: int, tmp_path: Path
+    ) -> None:
+        """Constants, ticks, rates and an order round-trip over gRPC."""
+        client = AsyncMetaTrader5(
+            host="127.0.0.1",
+            port=bridge_port,
+            config=MT5Settings(wal_path=str(tmp_path / "wal.db")),
+        )
+        async with client:
+            assert await client.initialize()
+            tick = await client.symbol_info_tick("EURUSD")
+            rates = await client.copy_rates_from_pos(
+                "EURUSD", client.TIMEFRAME_M1, 0, 100
+            )
+            result = await client.order_send(
+                {
+                    "action": client.TRADE_ACTION_DEAL,
+                    "symbol": "EURUSD",
+                    "volume": 0.1,
+                    "type": client.ORDER_TYPE_BUY,
+                    "deviation": 20,
+                }
+            )
+            positions = await client.positions_get(symbol="EURUSD")
+
+        assert tick is not None
+        assert tick.ask > tick.bid
+        assert rates is not None
+        assert rates.dtype == u.Data.DtypeRegistry.RATES
+        assert len(rates) == 100
+        assert result is not None
+        assert result.is_success
+        assert positions is not None
+        assert [p.ticket for p in positions] == [result.order]
+
+
+def _serve_streams(
+    sim: MT5Simulator, server_workers: int
+) -> tuple[grpc.Server, MT5GRPCServicer, int]:
+    """Serve a simulator through a servicer sized for server_workers."""
+    server = grpc.server(futures.ThreadPoolExecutor(max_workers=server_workers))
+    servicer = MT5GRPCServicer(
+        mt5_module=cast("ModuleType", sim), server_workers=server_workers
+    )
+    register = cast(
+        "Callable[[mt5_pb2_grpc.MT5ServiceServicer, grpc.Server], None]",
+        mt5_pb2_grpc.add_MT5ServiceServicer_to_server,
+    )
+    register(servicer, server)
+    port = server.add_insecure_port("127.0.0.1:0")
+    server.start()
+    return server, servicer, port
+
+
+class TestBridgeStreams:
+    """Test Subscribe* streams on the real bridge servicer."""
+
+    def test_streams_beyond_worker_share_are_rejected(self) -> None:
+        """Half the server workers may stream; the next stream is rejected."""
+        server, servicer, port = _serve_streams(MT5Simulator(seed=7), 4)
+        request = mt5_pb2.TickSubscribeRequest(symbols=["EURUSD"], interval_ms=10)
+        try:
+            with grpc.insecure_channel(f"127.0.0.1:{port}") as channel:
+                stub = _stub(channel)
+                streams = [stub.SubscribeTicks(request) for _ in range(2)]
+                for stream in streams:
+                    assert next(stream).symbol == "EURUSD"
+
+                rejected = stub.SubscribeTicks(request)
+                with pytest.raises(grpc.RpcError) as exc_info:
+                    next(rejected)
+                assert exc_info.value.code() == grpc.StatusCode.RESOURCE_EXHAUSTED
+
+                # A unary RPC still finds a free worker
+                assert stub.SymbolsTotal(mt5_pb2.Empty()).value > 0
+                for stream in streams:
+                    stream.cancel()
+        finally:
+            server.stop(grace=None)
+            servicer.close()
+
+    def test_hung_poll_ends_stream(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        """A poll exceeding the MT5 call timeout ends the stream."""
+        monkeypatch.setattr(bridge, "_mt5_call_timeout", 0.05)
+        sim = MT5Simulator(seed=7, call_latency_ms={"symbol_info_tick": 500.0})
+        server, servicer, port = _serve_streams(sim, 4)
+        request = mt5_pb2.TickSubscribeRequest(symbols=["EURUSD"])
+        try:
+            with grpc.insecure_channel(f"127.0.0.1:{port}") as channel:
+                stub = _stub(channel)
+                with pytest.raises(grpc.RpcError) as exc_info:
+                    next(stub.SubscribeTicks(request))
+            assert exc_info.value.code() == grpc.StatusCode.DEADLINE_EXCEEDED
+        finally:
+            server.stop(grace=None)
+            servicer.close()
+
+    def test_book_streams_share_the_cap(self) -> None:
+        """A book stream counts against the same cap as tick streams."""
+        server, servicer, port = _serve_streams(MT5Simulator(seed=7), 2)
+        try:
+            with grpc.insecure_channel(f"127.0.0.1:{port}") as channel:
+                stub = _stub(channel)
+                book = stub.SubscribeBook(
+                    mt5_pb2.BookSubscribeRequest(symbols=["EURUSD"], interval_ms=10)
+                )
+                assert next(book).snapshot
+
+                ticks = stub.SubscribeTicks(
+                    mt5_pb2.TickSubscribeRequest(symbols=["EURUSD"])
+                )
+                with pytest.raises(grpc.RpcError) as exc_info:
+                    next(ticks)
+                assert exc_info.value.code() == grpc.StatusCode.RESOURCE_EXHAUSTED
+                book.cancel()
+        finally:
+            server.stop(grace=None)
+            servicer.close()
+
+
+class TestBridgeBatch:
+    """Test the Batch RPC on the real bridge servicer."""
+
+    def test_calls_past_the_deadline_are_not_run(
+        self, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Once the batch exceeds the call timeout, the rest are skipped."""
+        monkeypatch.setattr(bridge, "_mt5_call_timeout", 0.05)
+        sim = MT5Simulator(seed=7, call_latency_ms={"account_info": 100.0})
+        server, servicer, port = _serve_streams(sim, 4)
+        call = mt5_pb2.BatchCall(
+            method="AccountInfo", request=mt5_pb2.Empty().SerializeToString()
+        )
+        try:
+            with grpc.insecure_channel(f"127.0.0.1:{port}") as channel:
+                stub = _stub(channel)
+                response = stub.Batch(mt5_pb2.BatchRequest(calls=[call, call]))
+        finally:
+            server.stop(grace=None)
+            servicer.close()
+
+        first, second = response.results
+        assert first.response
+        assert not first.error
+        assert second.error == "AccountInfo not run: batch exceeded 0.05s"
@@ -0,0 +1,244 @@
+"""Tests for per-stage request timing (MT5Utilities.Metrics).
+
+Tests verify:
+1. Histograms count, estimate quantiles and render OpenMetrics text
+2. Stages are recorded only inside a scope, under its operation
+3. Bridge trailers become bridge_<stage> and transit timings
+4. RequestQueue records queue_wait in the submitter's scope
+5. Client and bridge record every stage of a call over gRPC, orders included
+
+No live bridge: the simulator is served by the real MT5GRPCServicer with its
+stage interceptor on an in-process gRPC server.
+"""
+
+from __future__ import annotations
+
+import asyncio
+from concurrent import futures
+from typing import TYPE_CHECKING, cast
+
+import grpc
+import pytest
+
+from mt5linux import mt5_pb2_grpc
+from mt5linux.async_client import AsyncMetaTrader5
+from mt5linux.bridge import MT5GRPCServicer
+from mt5linux.settings import MT5Settings
+from mt5linux.simulator import MT5Simulator
+from mt5linux.utilities import MT5Utilities as u
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Iterator
+    from pathlib import Path
+    from types import ModuleType
+
+
+class TestHistograms:
+    """Test the in-memory recorder."""
+
+    def test_snapshot_and_quantiles(self) -> None:
+        """Counts are cumulative; quantiles interpolate within buckets."""
+        metrics = u.Metrics.Histograms(buckets=[0.001, 0.01, 0.1])
+        for seconds in (0.0005, 0.002, 0.004, 0.006, 0.008, 0.5):
+            metrics.observe("symbol_info_tick", "rpc", seconds)
+
+        stage = metrics.snapshot()["symbol_info_tick"]["rpc"]
+        assert stage["count"] == 6
+        assert stage["sum"] == pytest.approx(0.5205)
+        assert stage["buckets"] == {"0.001": 1, "0.01": 5, "0.1": 5, "+Inf": 6}
+        assert stage["p50"] == pytest.approx(0.001 + 0.009 * 2 / 4)
+        assert stage["p99"] == 0.1
+        assert metrics.quantile("symbol_info_tick", "decode", 0.5) is None
+
+    def test_openmetrics(self) -> None:
+        """One histogram family, escaped labels, +Inf bucket and EOF."""
+        metrics = u.Metrics.Histograms(buckets=[0.001])
+        metrics.observe('odd"op', "rpc", 0.002)
+
+        lines = metrics.to_openmetrics(prefix="bot").splitlines()
+        labels = 'operation="odd\\"op",stage="rpc"'
+        assert lines[0] == "# TYPE bot_stage_seconds histogram"
+        assert f'bot_stage_seconds_bucket{{{labels},le="0.001"}} 0' in lines
+        assert f'bot_stage_seconds_bucket{{{labels},le="+Inf"}} 1' in lines
+        assert f"bot_stage_seconds_count{{{labels}}} 1" in lines
+        assert f"bot_stage_seconds_sum{{{labels}}} 0.002" in lines
+        assert lines[-1] == "# EOF"
+
+        metrics.reset()
+        assert metrics.snapshot() == {}
+
+
+class TestScope:
+    """Test scoped stage recording."""
+
+    def test_stages_need_a_scope(self) -> None:
+        """Outside a scope nothing is recorded; nested scopes restore."""
+        metrics = u.Metrics.Histograms()
+        with u.Metrics.stage("decode"):
+            pass
+        u.Metrics.record("rpc", 0.1)
+        with u.Metrics.scope(metrics, "positions_get"):
+            with u.Metrics.stage("decode"):
+                pass
+            with u.Metrics.scope(metrics, "terminal_info"):
+                u.Metrics.record("rpc", 0.1)
+            u.Metrics.record("rpc", 0.2)
+
+        snapshot = metrics.snapshot()
+        assert u.Metrics.current() is None
+        assert set(snapshot["positions_get"]) == {"decode", "rpc"}
+        assert snapshot["positions_get"]["rpc"]["sum"] == pytest.approx(0.2)
+        assert snapshot["terminal_info"]["rpc"]["count"] == 1
+
+    def test_record_rpc_with_trailer(self) -> None:
+        """Bridge stages are prefixed; transit is rpc minus the handler."""
+        metrics = u.Metrics.Histograms()
+        trailer = [("mt5-stages", "handler=3.000,mt5_call=2.500,encode=0.250")]
+        with u.Metrics.scope(metrics, "copy_rates_from_pos"):
+            u.Metrics.record_rpc(0.005, trailer)
+
+        sums = {
+            stage: data["sum"]
+            for stage, data in metrics.snapshot()["copy_rates_from_pos"].items()
+        }
+        assert sums == pytest.approx(
+            {
+                "rpc": 0.005,
+                "bridge_handler": 0.003,
+                "bridge_mt5_call": 0.0025,
+                "bridge_encode": 0.00025,
+                "transit": 0.002,
+            }
+        )
+        assert u.Metrics.parse_trailer([("other", "x")]) == {}
+        assert u.Metrics.parse_trailer(None) == {}
+
+    async def test_queue_wait_in_submitter_scope(self) -> None:
+        """The dispatched task runs in the scope of the submitting call."""
+        metrics = u.Metrics.Histograms()
+        queue = u.RequestQueue(MT5Settings())
+        await queue.start()
+        try:
+            with u.Metrics.scope(metrics, "symbol_info"):
+
+                async def fetch() -> object:
+                    return u.Metrics.current()
+
+                scope = await queue.submit("symbol_info", fetch)
+        finally:
+            await queue.stop()
+
+        assert scope == (metrics, "symbol_info")
+        assert metrics.snapshot()["symbol_info"]["queue_wait"]["count"] == 1
+
+
+@pytest.fixture
+def bridge() -> Iterator[tuple[int, MT5GRPCServicer]]:
+    """Serve a simulator through the bridge with its stage interceptor."""
+    servicer = MT5GRPCServicer(
+        mt5_module=cast("ModuleType", MT5Simulator(seed=7, latency_ms=1.0))
+    )
+    server = grpc.server(
+        futures.ThreadPoolExecutor(max_workers=4),
+        interceptors=[servicer.stage_interceptor()],
+    )
+    register = cast(
+        "Callable[[mt5_pb2_grpc.MT5ServiceServicer, grpc.Server], None]",
+        mt5_pb2_grpc.add_MT5ServiceServicer_to_server,
+    )
+    register(servicer, server)
+    port = server.add_insecure_port("127.0.0.1:0")
+    server.start()
+    yield port, servicer
+    server.stop(grace=None)
+    servicer.close()
+
+
+class TestEndToEnd:
+    """Test stage timings of calls through the bridge."""
+
+    async def test_client_and_bridge_stages(
+        self, bridge: tuple[int, MT5GRPCServicer], tmp_path: Path
+    ) -> None:
+        """Each stage of a list call is recorded on both sides."""
+        port, _ = bridge
+        config = MT5Settings(
+            wal_path=str(tmp_path / "wal.db"), enable_stage_metrics=True
+        )
+        client = AsyncMetaTrader5(host="127.0.0.1", port=port, config=config)
+        async with client:
+            await client.initialize()
+            await client.positions_get(symbol="EURUSD")
+            await client.copy_rates_from_pos("EURUSD", client.TIMEFRAME_M1, 0, 10)
+            bridge_stages = await client.bridge_metrics()
+
+        metrics = cast("u.Metrics.Histograms", client.metrics)
+        snapshot = metrics.snapshot()
+        assert {
+            "total",
+            "queue_wait",
+            "rpc",
+            "transit",
+            "bridge_handler",
+            "bridge_mt5_call",
+            "bridge_encode",
+            "decode",
+        } <= set(snapshot["copy_rates_from_pos"])
+        rates = snapshot["copy_rates_from_pos"]
+        # The simulator sleeps 1 ms per MT5 call
+        assert cast("float", rates["bridge_mt5_call"]["sum"]) >= 0.001
+        assert cast("float", rates["rpc"]["sum"]) >= cast(
+            "float", rates["bridge_handler"]["sum"]
+        )
+        stages = cast("dict[str, dict[str, object]]", bridge_stages["stages"])
+        assert {"handler", "mt5_queue", "mt5_call", "encode"} <= set(
+            stages["CopyRatesFromPos"]
+        )
+        assert "mt5_call" in stages["PositionsGet"]
+
+    async def test_orders_recorded(
+        self, bridge: tuple[int, MT5GRPCServicer], tmp_path: Path
+    ) -> None:
+        """order_send and order_send_batch are timed like reads."""
+        port, _ = bridge
+        config = MT5Settings(
+            wal_path=str(tmp_path / "wal.db"), enable_stage_metrics=True
+        )
+        client = AsyncMetaTrader5(host="127.0.0.1", port=port, config=config)
+        async with client:
+            await client.initialize()
+            order = {
+                "action": client.TRADE_ACTION_DEAL,
+                "symbol": "EURUSD",
+                "volume": 0.1,
+                "type": client.ORDER_TYPE_BUY,
+                "deviation": 20,
+            }
+            result = await client.order_send(order)
+            done: asyncio.Future[dict[str, object]] = (
+                asyncio.get_running_loop().create_future()
+            )
+            await client.order_send_batch(
+                [order, order],  # type: ignore[list-item]
+                on_all_complete=done.set_result,
+            )
+            await asyncio.wait_for(done, timeout=10.0)
+
+        assert result is not None
+        assert result.is_success
+        snapshot = cast("u.Metrics.Histograms", client.metrics).snapshot()
+        assert {"total", "rpc", "bridge_mt5_call"} <= set(snapshot["order_send"])
+        assert snapshot["order_send_batch"]["total"]["count"] == 2
+
+    async def test_disabled_by_default(
+        self, bridge: tuple[int, MT5GRPCServicer], tmp_path: Path
+    ) -> None:
+        """Without enable_stage_metrics the client records nothing."""
+        port, _ = bridge
+        config = MT5Settings(wal_path=str(tmp_path / "wal.db"))
+        client = AsyncMetaTrader5(host="127.0.0.1", port=port, config=config)
+        async with client:
+            await client.initialize()
+            await client.symbol_info_tick("EURUSD")
+
+        assert cast("u.Metrics.Histograms", client.metrics).snapshot() == {}
@@ -0,0 +1,137 @@
+"""Tests for market depth streaming (SubscribeBook) on the client side.
+
+Tests verify:
+1. u.BookState applies a snapshot, then changed and removed levels
+2. Sequence gaps raise instead of silently corrupting the book
+3. subscribe_book yields the rebuilt book per update, ordered like MT5
+4. The request carries symbols and the optional interval
+
+No live bridge: a minimal in-process stub stands in for the gRPC stub so the
+real stream handling and book reconstruction are exercised end to end.
+"""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+import pytest
+
+from mt5linux import mt5_pb2
+from mt5linux.utilities import MT5Utilities as u
+from tests.conftest import stub_client
+
+if TYPE_CHECKING:
+    from collections.abc import AsyncIterator
+
+    from mt5linux.mt5_pb2 import BookLevel, BookSubscribeRequest, BookUpdate
+
+
+_SELL = 1
+_BUY = 2
+
+
+def _level(book_type: int, price: float, volume: float = 0.0) -> BookLevel:
+    return mt5_pb2.BookLevel(
+        type=book_type, price=price, volume=int(volume), volume_dbl=volume
+    )
+
+
+_UPDATES = [
+    mt5_pb2.BookUpdate(
+        symbol="EURUSD",
+        sequence=1,
+        snapshot=True,
+        levels=[_level(_BUY, 1.0850, 5.0), _level(_SELL, 1.0852, 10.0)],
+    ),
+    mt5_pb2.BookUpdate(
+        symbol="EURUSD",
+        sequence=2,
+        levels=[_level(_SELL, 1.0853, 2.0), _level(_BUY, 1.0850)],
+    ),
+]
+
+
+class _BookStub:
+    """SubscribeBook stub replaying fixed updates."""
+
+    def __init__(self, updates: list[BookUpdate]) -> None:
+        self.updates = updates
+        self.requests: list[BookSubscribeRequest] = []
+
+    def SubscribeBook(  # noqa: N802 - gRPC method name
+        self, request: BookSubscribeRequest
+    ) -> _BookCall:
+        self.requests.append(request)
+        return _BookCall(self.updates)
+
+
+class _BookCall:
+    """Minimal streaming call: async iterable with cancel()."""
+
+    def __init__(self, updates: list[BookUpdate]) -> None:
+        self._updates = updates
+
+    async def _iter(self) -> AsyncIterator[BookUpdate]:
+        for update in self._updates:
+            yield update
+
+    def __aiter__(self) -> AsyncIterator[BookUpdate]:
+        return self._iter()
+
+    def cancel(self) -> bool:
+        return True
+
+
+class TestBookState:
+    """Test u.BookState."""
+
+    def test_snapshot_then_delta(self) -> None:
+        """Deltas add, change and remove levels of the snapshot."""
+        book = u.BookState("EURUSD")
+        for update in _UPDATES:
+            book.apply(update.sequence, update.levels, snapshot=update.snapshot)
+
+        depth = book.to_array()
+        assert depth.dtype == u.Data.DtypeRegistry.BOOK
+        assert depth["price"].tolist() == [1.0853, 1.0852]
+        assert depth["volume_dbl"].tolist() == [2.0, 10.0]
+        assert book.sequence == 2
+
+    def test_snapshot_replaces_book(self) -> None:
+        """A new snapshot drops levels it does not list."""
+        book = u.BookState("EURUSD")
+        book.apply(1, _UPDATES[0].levels, snapshot=True)
+        book.apply(5, [_level(_BUY, 1.0840, 1.0)], snapshot=True)
+
+        assert len(book) == 1
+        assert book.sequence == 5
+
+    def test_sequence_gap_raises(self) -> None:
+        """A missed delta is reported, not applied."""
+        book = u.BookState("EURUSD")
+        book.apply(1, _UPDATES[0].levels, snapshot=True)
+
+        with pytest.raises(u.Exceptions.Error, match="resubscribe"):
+            book.apply(3, [_level(_SELL, 1.09, 1.0)], snapshot=False)
+        assert len(book) == 2
+
+
+class TestSubscribeBook:
+    """Test AsyncMetaTrader5.subscribe_book."""
+
+    async def test_yields_rebuilt_book(self) -> None:
+        """Each update yields the full local book for its symbol."""
+        stub = _BookStub(_UPDATES)
+        books = [
+            (symbol, depth.copy())
+            async for symbol, depth in stub_client(stub).subscribe_book(
+                "EURUSD", interval_ms=20
+            )
+        ]
+
+        (request,) = stub.requests
+        assert list(request.symbols) == ["EURUSD"]
+        assert request.interval_ms == 20
+        assert [symbol for symbol, _ in books] == ["EURUSD", "EURUSD"]
+        assert books[0][1]["price"].tolist() == [1.0852, 1.0850]
+        assert books[1][1]["type"].tolist() == [_SELL, _SELL]
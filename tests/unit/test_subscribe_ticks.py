@@ -0,0 +1,191 @@
+"""Tests for the SubscribeTicks server-streaming RPC client side.
+
+Tests verify:
+1. AsyncMetaTrader5.subscribe_ticks yields (symbol, Tick) per streamed update
+2. Breaking out of the iterator cancels the server stream
+3. MetaTrader5.subscribe_ticks sync generator delivers the same updates
+4. Request carries symbols and optional interval_ms
+
+NO MOCKING - a real in-process grpc.aio server implements SubscribeTicks.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import threading
+from concurrent import futures
+from typing import TYPE_CHECKING, cast
+
+import grpc
+import grpc.aio
+import orjson
+import pytest
+
+from mt5linux import mt5_pb2, mt5_pb2_grpc
+from mt5linux.async_client import AsyncMetaTrader5, _make_stub
+from mt5linux.client import MetaTrader5
+
+if TYPE_CHECKING:
+    from collections.abc import AsyncGenerator, AsyncIterator, Callable, Iterator
+
+    from mt5linux.mt5_pb2 import TickSubscribeRequest, TickUpdate
+
+
+class _TickServicer(mt5_pb2_grpc.MT5ServiceServicer):
+    """Streams a fixed sequence of ticks, then idles until cancelled."""
+
+    def __init__(self) -> None:
+        self.requests: list[TickSubscribeRequest] = []
+        self.cancelled = asyncio.Event()
+
+    async def SubscribeTicks(  # noqa: N802 - gRPC method name
+        self,
+        request: TickSubscribeRequest,
+        context: grpc.aio.ServicerContext[object, object],
+    ) -> AsyncIterator[TickUpdate]:
+        _ = context
+        self.requests.append(request)
+        # Cancellation lands either in the idle wait (CancelledError) or
+        # while grpc writes an update (generator closed at the yield)
+        try:
+            for i, symbol in enumerate(list(request.symbols) * 2):
+                tick = {"time": 1, "bid": 1.0 + i, "ask": 1.1 + i, "time_msc": i}
+                yield mt5_pb2.TickUpdate(
+                    symbol=symbol, json_data=orjson.dumps(tick).decode()
+                )
+            await asyncio.Event().wait()
+        finally:
+            self.cancelled.set()
+
+
+@pytest.fixture
+async def server() -> AsyncGenerator[tuple[grpc.aio.Server, _TickServicer, int]]:
+    """Start in-process gRPC server with the tick servicer."""
+    servicer = _TickServicer()
+    srv = grpc.aio.server()
+    register = cast(
+        "Callable[[mt5_pb2_grpc.MT5ServiceServicer, grpc.aio.Server], None]",
+        mt5_pb2_grpc.add_MT5ServiceServicer_to_server,
+    )
+    register(servicer, srv)
+    port = srv.add_insecure_port("127.0.0.1:0")
+    await srv.start()
+    yield srv, servicer, port
+    await srv.stop(grace=None)
+
+
+def _attach(client: AsyncMetaTrader5, port: int) -> None:
+    client._channel = grpc.aio.insecure_channel(f"127.0.0.1:{port}")
+    client._stub = _make_stub(client._channel)
+    client._connectivity.record(connected=True)
+
+
+class TestAsyncSubscribeTicks:
+    """Test AsyncMetaTrader5.subscribe_ticks."""
+
+    async def test_yields_symbol_and_tick(
+        self, server: tuple[grpc.aio.Server, _TickServicer, int]
+    ) -> None:
+        """Each streamed update becomes a (symbol, Tick) pair."""
+        _, servicer, port = server
+        client = AsyncMetaTrader5(host="127.0.0.1", port=port)
+        _attach(client, port)
+
+        received = []
+        stream = client.subscribe_ticks(["EURUSD", "GBPUSD"], interval_ms=10)
+        async for symbol, tick in stream:
+            received.append((symbol, tick.bid))
+            if len(received) == 4:
+                break
+        await stream.aclose()
+        await client._channel.close(grace=None)
+
+        assert [s for s, _ in received] == ["EURUSD", "GBPUSD", "EURUSD", "GBPUSD"]
+        assert received[0][1] == 1.0
+        assert list(servicer.requests[0].symbols) == ["EURUSD", "GBPUSD"]
+        assert servicer.requests[0].interval_ms == 10
+
+    async def test_single_symbol_string(
+        self, server: tuple[grpc.aio.Server, _TickServicer, int]
+    ) -> None:
+        """A bare symbol string is accepted and interval is left unset."""
+        _, servicer, port = server
+        client = AsyncMetaTrader5(host="127.0.0.1", port=port)
+        _attach(client, port)
+
+        stream = client.subscribe_ticks("EURUSD")
+        symbol, _ = await anext(stream)
+        await stream.aclose()
+        await client._channel.close(grace=None)
+
+        assert symbol == "EURUSD"
+        assert not servicer.requests[0].HasField("interval_ms")
+
+    async def test_close_cancels_server_stream(
+        self, server: tuple[grpc.aio.Server, _TickServicer, int]
+    ) -> None:
+        """Closing the iterator cancels the RPC on the server."""
+        _, servicer, port = server
+        client = AsyncMetaTrader5(host="127.0.0.1", port=port)
+        _attach(client, port)
+
+        stream = client.subscribe_ticks(["EURUSD"])
+        await anext(stream)
+        await stream.aclose()
+
+        await asyncio.wait_for(servicer.cancelled.wait(), timeout=5.0)
+        await client._channel.close(grace=None)
+
+
+class _SyncTickServicer(mt5_pb2_grpc.MT5ServiceServicer):
+    """Thread-based servicer (same model as the bridge) streaming ticks."""
+
+    def SubscribeTicks(  # noqa: N802 - gRPC method name
+        self,
+        request: TickSubscribeRequest,
+        context: grpc.ServicerContext,
+    ) -> Iterator[TickUpdate]:
+        stopped = threading.Event()
+        context.add_callback(stopped.set)
+        for i, symbol in enumerate(list(request.symbols) * 2):
+            tick = {"time": 1, "bid": 1.0, "ask": 1.1, "time_msc": i}
+            yield mt5_pb2.TickUpdate(
+                symbol=symbol, json_data=orjson.dumps(tick).decode()
+            )
+        stopped.wait(timeout=5.0)
+
+
+class TestSyncSubscribeTicks:
+    """Test MetaTrader5.subscribe_ticks sync generator."""
+
+    def test_sync_generator(self) -> None:
+        """Sync generator yields updates and closes cleanly."""
+        srv = grpc.server(futures.ThreadPoolExecutor(max_workers=2))
+        register = cast(
+            "Callable[[mt5_pb2_grpc.MT5ServiceServicer, grpc.Server], None]",
+            mt5_pb2_grpc.add_MT5ServiceServicer_to_server,
+        )
+        register(_SyncTickServicer(), srv)
+        port = srv.add_insecure_port("127.0.0.1:0")
+        srv.start()
+
+        mt5 = MetaTrader5(host="127.0.0.1", port=port)
+
+        async def attach() -> None:
+            _attach(mt5._async_client, port)
+
+        async def detach() -> None:
+            await mt5._async_client._channel.close(grace=None)
+
+        mt5._run(attach())
+        received = []
+        try:
+            for symbol, tick in mt5.subscribe_ticks(["EURUSD", "GBPUSD"]):
+                received.append((symbol, tick.time_msc))
+                if len(received) == 3:
+                    break
+        finally:
+            mt5._run(detach())
+            srv.stop(grace=None)
+
+        assert received == [("EURUSD", 0), ("GBPUSD", 1), ("EURUSD", 2)]
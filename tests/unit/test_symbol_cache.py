@@ -0,0 +1,302 @@
+"""Tests for the opt-in symbol metadata cache.
+
+Tests verify:
+1. u.TTLCache expiry, LRU eviction and disabled mode
+2. symbol_info serves contract data from the cache within symbol_cache_ttl
+3. Stale quotes are overlaid from symbol_info_tick (spread included) and
+   the overlay is cached, not a full refetch
+4. Volatile fields a tick does not carry are refetched past
+   symbol_cache_volatile_ttl
+5. symbols_get caches groups and warms per-symbol entries
+6. invalidate_symbol()/refresh_symbols()/symbol_select() drop cached data
+
+No live bridge: a minimal in-process stub stands in for the gRPC stub so the
+real cache, queue and resilience path are exercised end to end.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import time
+from typing import TYPE_CHECKING
+
+import orjson
+import pytest
+
+from mt5linux import mt5_pb2
+from mt5linux.models import MT5Models
+from mt5linux.utilities import MT5Utilities as u
+from tests.conftest import stub_client
+
+if TYPE_CHECKING:
+    from mt5linux.mt5_pb2 import (
+        BoolResponse,
+        DictData,
+        SymbolRequest,
+        SymbolSelectRequest,
+        SymbolsRequest,
+        SymbolsResponse,
+    )
+
+
+def _symbol(name: str, bid: float = 1.1) -> dict[str, object]:
+    return {
+        "name": name,
+        "digits": 5,
+        "point": 0.00001,
+        "volume_min": 0.01,
+        "volume_step": 0.01,
+        "trade_tick_size": 0.00001,
+        "trade_tick_value": bid,
+        "bid": bid,
+        "ask": bid + 0.0001,
+    }
+
+
+class _SymbolStub:
+    """In-process stub counting SymbolInfo/SymbolInfoTick/SymbolsGet calls."""
+
+    def __init__(self) -> None:
+        self.calls: dict[str, int] = {
+            "SymbolInfo": 0,
+            "SymbolInfoTick": 0,
+            "SymbolsGet": 0,
+        }
+        self.bid = 1.1
+
+    async def SymbolInfo(  # noqa: N802 - gRPC method name
+        self,
+        request: SymbolRequest,
+        timeout: float | None = None,  # noqa: ASYNC109 - gRPC stub signature
+    ) -> DictData:
+        _ = timeout
+        self.calls["SymbolInfo"] += 1
+        payload = _symbol(request.symbol, self.bid)
+        return mt5_pb2.DictData(json_data=orjson.dumps(payload).decode())
+
+    async def SymbolInfoTick(  # noqa: N802 - gRPC method name
+        self,
+        request: SymbolRequest,
+        timeout: float | None = None,  # noqa: ASYNC109 - gRPC stub signature
+    ) -> DictData:
+        _ = timeout, request
+        self.calls["SymbolInfoTick"] += 1
+        tick = {"time": 2, "bid": self.bid, "ask": self.bid + 0.0001, "volume": 7}
+        return mt5_pb2.DictData(json_data=orjson.dumps(tick).decode())
+
+    async def SymbolsGet(  # noqa: N802 - gRPC method name
+        self,
+        request: SymbolsRequest,
+        timeout: float | None = None,  # noqa: ASYNC109 - gRPC stub signature
+    ) -> SymbolsResponse:
+        _ = timeout, request
+        self.calls["SymbolsGet"] += 1
+        symbols = [_symbol("EURUSD", self.bid), _symbol("GBPUSD", self.bid)]
+        return mt5_pb2.SymbolsResponse(
+            total=len(symbols), chunks=[orjson.dumps(symbols).decode()]
+        )
+
+    async def SymbolSelect(  # noqa: N802 - gRPC method name
+        self,
+        request: SymbolSelectRequest,
+        timeout: float | None = None,  # noqa: ASYNC109 - gRPC stub signature
+    ) -> BoolResponse:
+        _ = timeout, request
+        return mt5_pb2.BoolResponse(result=True)
+
+
+class TestTTLCache:
+    """Test u.TTLCache."""
+
+    def test_set_get(self) -> None:
+        """Stored values are returned with their age."""
+        cache: u.TTLCache[int] = u.TTLCache(max_size=4, ttl=60.0)
+        cache.set("a", 1)
+        entry = cache.get_entry("a")
+        assert entry is not None
+        assert entry[0] == 1
+        assert entry[1] < 1.0
+        assert cache.get_stats()["hits"] == 1
+
+    def test_expiry(self) -> None:
+        """Entries older than ttl are dropped on read."""
+        cache: u.TTLCache[int] = u.TTLCache(max_size=4, ttl=0.01)
+        cache.set("a", 1)
+        time.sleep(0.02)
+        assert cache.get("a") is None
+        assert len(cache) == 0
+
+    def test_lru_eviction(self) -> None:
+        """The least recently used entry is evicted when full."""
+        cache: u.TTLCache[int] = u.TTLCache(max_size=2, ttl=60.0)
+        cache.set("a", 1)
+        cache.set("b", 2)
+        assert cache.get("a") == 1
+        cache.set("c", 3)
+        assert cache.get("b") is None
+        assert cache.get("a") == 1
+        assert cache.get("c") == 3
+        assert cache.get_stats()["evictions"] == 1
+
+    def test_disabled(self) -> None:
+        """ttl=0 disables storing."""
+        cache: u.TTLCache[int] = u.TTLCache(max_size=4, ttl=0)
+        cache.set("a", 1)
+        assert cache.enabled is False
+        assert cache.get("a") is None
+
+
+class TestSymbolInfoCache:
+    """Test symbol_info/symbols_get caching on AsyncMetaTrader5."""
+
+    async def test_disabled_by_default(self) -> None:
+        """Without symbol_cache_ttl every call reaches the bridge."""
+        stub = _SymbolStub()
+        client = stub_client(stub, typed_market_data=False)
+        for _ in range(3):
+            await client.symbol_info("EURUSD")
+        assert stub.calls["SymbolInfo"] == 3
+
+    async def test_cached_within_ttl(self) -> None:
+        """Repeated symbol_info calls are served from memory."""
+        stub = _SymbolStub()
+        client = stub_client(
+            stub,
+            typed_market_data=False,
+            symbol_cache_ttl=60.0,
+            symbol_cache_quote_ttl=60.0,
+        )
+        infos = [await client.symbol_info("EURUSD") for _ in range(5)]
+
+        assert stub.calls["SymbolInfo"] == 1
+        assert stub.calls["SymbolInfoTick"] == 0
+        assert all(i is not None and i.volume_step == 0.01 for i in infos)
+
+    async def test_stale_quotes_overlaid_from_tick(self) -> None:
+        """Past symbol_cache_quote_ttl, quotes come from symbol_info_tick."""
+        stub = _SymbolStub()
+        client = stub_client(
+            stub,
+            typed_market_data=False,
+            symbol_cache_ttl=60.0,
+            symbol_cache_quote_ttl=0,
+        )
+        first = await client.symbol_info("EURUSD")
+        stub.bid = 1.2
+        second = await client.symbol_info("EURUSD")
+
+        assert first is not None
+        assert second is not None
+        assert stub.calls["SymbolInfo"] == 1
+        assert stub.calls["SymbolInfoTick"] == 1
+        assert first.bid == pytest.approx(1.1)
+        assert second.bid == pytest.approx(1.2)
+        assert second.volume == 7
+        assert second.digits == first.digits
+
+    async def test_overlay_is_cached_for_quote_ttl(self) -> None:
+        """A refreshed quote is kept, so the next call costs no tick RPC."""
+        stub = _SymbolStub()
+        client = stub_client(
+            stub,
+            typed_market_data=False,
+            symbol_cache_ttl=60.0,
+            symbol_cache_quote_ttl=0.05,
+        )
+        await client.symbol_info("EURUSD")
+        await asyncio.sleep(0.06)
+        stub.bid = 1.2
+        refreshed = await client.symbol_info("EURUSD")
+        again = await client.symbol_info("EURUSD")
+
+        assert stub.calls == {"SymbolInfo": 1, "SymbolInfoTick": 1, "SymbolsGet": 0}
+        assert again is refreshed
+        assert refreshed is not None
+        assert refreshed.bid == pytest.approx(1.2)
+        assert refreshed.spread == 10
+
+    async def test_stale_volatile_fields_refetched(self) -> None:
+        """Past symbol_cache_volatile_ttl, a full fetch replaces the entry."""
+        stub = _SymbolStub()
+        client = stub_client(
+            stub,
+            typed_market_data=False,
+            symbol_cache_ttl=60.0,
+            symbol_cache_quote_ttl=0,
+            symbol_cache_volatile_ttl=0.05,
+        )
+        await client.symbol_info("EURUSD")
+        await asyncio.sleep(0.06)
+        stub.bid = 1.2
+        info = await client.symbol_info("EURUSD")
+
+        assert "trade_tick_value" in MT5Models.SymbolInfo.VOLATILE_FIELDS
+        assert stub.calls["SymbolInfo"] == 2
+        assert stub.calls["SymbolInfoTick"] == 0
+        assert info is not None
+        assert info.trade_tick_value == pytest.approx(1.2)
+
+    async def test_symbols_get_warms_symbol_info(self) -> None:
+        """symbols_get caches the group and each symbol."""
+        stub = _SymbolStub()
+        client = stub_client(
+            stub,
+            typed_market_data=False,
+            symbol_cache_ttl=60.0,
+            symbol_cache_quote_ttl=60.0,
+        )
+        await client.symbols_get()
+        await client.symbols_get()
+        info = await client.symbol_info("GBPUSD")
+
+        assert stub.calls["SymbolsGet"] == 1
+        assert stub.calls["SymbolInfo"] == 0
+        assert info is not None
+        assert info.name == "GBPUSD"
+
+    async def test_invalidate_symbol(self) -> None:
+        """invalidate_symbol forces the next symbol_info to refetch."""
+        stub = _SymbolStub()
+        client = stub_client(
+            stub,
+            typed_market_data=False,
+            symbol_cache_ttl=60.0,
+            symbol_cache_quote_ttl=60.0,
+        )
+        await client.symbol_info("EURUSD")
+        client.invalidate_symbol("EURUSD")
+        await client.symbol_info("EURUSD")
+        assert stub.calls["SymbolInfo"] == 2
+
+    async def test_symbol_select_invalidates(self) -> None:
+        """symbol_select drops the symbol's cached metadata."""
+        stub = _SymbolStub()
+        client = stub_client(
+            stub,
+            typed_market_data=False,
+            symbol_cache_ttl=60.0,
+            symbol_cache_quote_ttl=60.0,
+        )
+        await client.symbol_info("EURUSD")
+        await client.symbol_select("EURUSD")
+        await client.symbol_info("EURUSD")
+        assert stub.calls["SymbolInfo"] == 2
+
+    async def test_refresh_symbols_bypasses_cache(self) -> None:
+        """refresh_symbols refetches and updates cached entries."""
+        stub = _SymbolStub()
+        client = stub_client(
+            stub,
+            typed_market_data=False,
+            symbol_cache_ttl=60.0,
+            symbol_cache_quote_ttl=60.0,
+        )
+        await client.symbols_get()
+        stub.bid = 1.3
+        refreshed = await client.refresh_symbols()
+        info = await client.symbol_info("EURUSD")
+
+        assert stub.calls["SymbolsGet"] == 2
+        assert refreshed is not None
+        assert info is not None
+        assert info.bid == pytest.approx(1.3)
@@ -0,0 +1,195 @@
+"""Tests for typed protobuf ticks and symbol info.
+
+Tests verify:
+1. mt5_pb2.Tick/SymbolInfo declare every model field with the same name
+2. Base.from_proto builds the same model as validating the JSON dict
+3. symbol_info_tick/symbol_info use the typed RPCs; unset means None
+4. Bridges without typed RPCs fall back to JSON once and stay there
+5. subscribe_ticks requests and parses typed tick updates
+
+No live bridge: a minimal in-process stub stands in for the gRPC stub so the
+real client parsing path is exercised end to end.
+"""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+import grpc
+import grpc.aio
+import orjson
+import pytest
+
+from mt5linux import mt5_pb2
+from mt5linux.models import MT5Models
+from tests.conftest import stub_client
+
+if TYPE_CHECKING:
+    from collections.abc import AsyncIterator
+
+    from pydantic import BaseModel
+
+    from mt5linux.mt5_pb2 import (
+        DictData,
+        SymbolInfoResponse,
+        SymbolRequest,
+        TickResponse,
+        TickSubscribeRequest,
+        TickUpdate,
+    )
+
+
+_TICK = {
+    "time": 1_700_000_000,
+    "bid": 1.085,
+    "ask": 1.0851,
+    "last": 0.0,
+    "volume": 3,
+    "time_msc": 1_700_000_000_123,
+    "flags": 6,
+    "volume_real": 3.0,
+}
+_SYMBOL = {"name": "EURUSD", "digits": 5, "point": 1e-05, "visible": True}
+
+
+def _unimplemented() -> grpc.aio.AioRpcError:
+    return grpc.aio.AioRpcError(
+        grpc.StatusCode.UNIMPLEMENTED,
+        grpc.aio.Metadata(),
+        grpc.aio.Metadata(),
+        details="Method not implemented",
+        debug_error_string="",
+    )
+
+
+class _TypedStub:
+    """Stub serving the typed and JSON tick/symbol RPCs."""
+
+    def __init__(self, *, typed_supported: bool = True) -> None:
+        self.typed_supported = typed_supported
+        self.calls: list[str] = []
+        self.subscribe_requests: list[TickSubscribeRequest] = []
+
+    async def SymbolInfoTickTyped(  # noqa: N802 - gRPC method name
+        self,
+        request: SymbolRequest,
+        timeout: float | None = None,  # noqa: ASYNC109 - gRPC stub signature
+    ) -> TickResponse:
+        _ = timeout
+        self.calls.append("SymbolInfoTickTyped")
+        if not self.typed_supported:
+            raise _unimplemented()
+        if request.symbol != "EURUSD":
+            return mt5_pb2.TickResponse()
+        return mt5_pb2.TickResponse(tick=mt5_pb2.Tick(**_TICK))
+
+    async def SymbolInfoTick(  # noqa: N802 - gRPC method name
+        self,
+        request: SymbolRequest,
+        timeout: float | None = None,  # noqa: ASYNC109 - gRPC stub signature
+    ) -> DictData:
+        _ = timeout, request
+        self.calls.append("SymbolInfoTick")
+        return mt5_pb2.DictData(json_data=orjson.dumps(_TICK).decode())
+
+    async def SymbolInfoTyped(  # noqa: N802 - gRPC method name
+        self,
+        request: SymbolRequest,
+        timeout: float | None = None,  # noqa: ASYNC109 - gRPC stub signature
+    ) -> SymbolInfoResponse:
+        _ = timeout, request
+        self.calls.append("SymbolInfoTyped")
+        return mt5_pb2.SymbolInfoResponse(info=mt5_pb2.SymbolInfo(**_SYMBOL))
+
+    def SubscribeTicks(  # noqa: N802 - gRPC method name
+        self, request: TickSubscribeRequest
+    ) -> _TickCall:
+        self.subscribe_requests.append(request)
+        return _TickCall(
+            [mt5_pb2.TickUpdate(symbol="EURUSD", tick=mt5_pb2.Tick(**_TICK))]
+        )
+
+
+class _TickCall:
+    """Minimal streaming call: async iterable with cancel()."""
+
+    def __init__(self, updates: list[TickUpdate]) -> None:
+        self._updates = updates
+
+    async def _iter(self) -> AsyncIterator[TickUpdate]:
+        for update in self._updates:
+            yield update
+
+    def __aiter__(self) -> AsyncIterator[TickUpdate]:
+        return self._iter()
+
+    def cancel(self) -> bool:
+        return True
+
+
+class TestTypedMessages:
+    """Test typed message schema and from_proto."""
+
+    @pytest.mark.parametrize(
+        ("message", "model"),
+        [
+            (mt5_pb2.Tick, MT5Models.Tick),
+            (mt5_pb2.SymbolInfo, MT5Models.SymbolInfo),
+        ],
+    )
+    def test_message_declares_model_fields(
+        self, message: type, model: type[BaseModel]
+    ) -> None:
+        """Every model field has a same-named message field."""
+        declared = set(message.DESCRIPTOR.fields_by_name)
+        assert set(model.model_fields) <= declared
+
+    def test_from_proto_matches_validated_model(self) -> None:
+        """from_proto equals the model validated from the JSON dict."""
+        typed = MT5Models.Tick.from_proto(mt5_pb2.Tick(**_TICK))
+        assert typed == MT5Models.Tick.model_validate(_TICK)
+
+
+class TestTypedClient:
+    """Test client use of the typed RPCs."""
+
+    async def test_tick_uses_typed_rpc(self) -> None:
+        """symbol_info_tick reads SymbolInfoTickTyped only."""
+        stub = _TypedStub()
+        tick = await stub_client(stub).symbol_info_tick("EURUSD")
+
+        assert stub.calls == ["SymbolInfoTickTyped"]
+        assert tick == MT5Models.Tick.model_validate(_TICK)
+
+    async def test_unset_tick_is_none(self) -> None:
+        """An unset tick (MT5 returned None) maps to None."""
+        stub = _TypedStub()
+        assert await stub_client(stub).symbol_info_tick("XXXYYY") is None
+
+    async def test_symbol_info_uses_typed_rpc(self) -> None:
+        """symbol_info reads SymbolInfoTyped."""
+        stub = _TypedStub()
+        info = await stub_client(stub).symbol_info("EURUSD")
+
+        assert stub.calls == ["SymbolInfoTyped"]
+        assert info is not None
+        assert info.digits == 5
+        assert info.visible is True
+
+    async def test_fallback_is_remembered(self) -> None:
+        """UNIMPLEMENTED switches the client to the JSON RPCs for good."""
+        stub = _TypedStub(typed_supported=False)
+        client = stub_client(stub)
+        first = await client.symbol_info_tick("EURUSD")
+        second = await client.symbol_info_tick("EURUSD")
+
+        assert first == second == MT5Models.Tick.model_validate(_TICK)
+        assert stub.calls == ["SymbolInfoTickTyped", "SymbolInfoTick", "SymbolInfoTick"]
+
+    async def test_subscribe_ticks_typed(self) -> None:
+        """subscribe_ticks asks for typed updates and builds ticks from them."""
+        stub = _TypedStub()
+        received = [item async for item in stub_client(stub).subscribe_ticks("EURUSD")]
+
+        assert stub.subscribe_requests[0].typed is True
+        assert received == [("EURUSD", MT5Models.Tick.model_validate(_TICK))]
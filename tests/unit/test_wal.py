@@ -6,6 +6,7 @@ Tests verify:
 3. Recovery of incomplete entries
 4. Cleanup of old entries
 5. Concurrent access safety
+6. Group commit batching, intent durability and flush histograms
 
 NO MOCKING - tests use real SQLite database in temp directory.
 """
@@ -315,6 +316,83 @@ class TestWALConcurrency:
         assert len(incomplete) == 0
 
 
+class TestWALGroupCommit:
+    """Test group-commit batching (wal_group_commit_ms > 0)."""
+
+    @pytest.fixture
+    async def group_wal(self, temp_db_path: str) -> AsyncGenerator[WAL]:
+        """Return initialized WAL in group-commit mode."""
+        w = WAL(
+            MT5Settings(
+                wal_path=temp_db_path,
+                wal_group_commit_ms=20.0,
+                wal_group_commit_max_entries=50,
+            )
+        )
+        await w.initialize()
+        yield w
+        await w.close()
+        await asyncio.to_thread(_unlink_path, temp_db_path)
+
+    async def test_burst_is_batched(self, group_wal: WAL) -> None:
+        """Concurrent intents share commits and are durable on return."""
+        await asyncio.gather(
+            *[group_wal.log_intent(f"RQ{i:03d}", {"index": i}) for i in range(200)]
+        )
+
+        stats = group_wal.get_stats()
+        assert stats["pending"] == 0
+        assert stats["flushes"] < 200
+        flush_size = stats["flush_size"]
+        assert isinstance(flush_size, dict)
+        assert flush_size["sum"] == 200
+        assert flush_size["max"] <= 200
+        assert flush_size["buckets"]["+Inf"] == stats["flushes"]
+
+    async def test_log_intent_waits_for_commit(
+        self, group_wal: WAL, temp_db_path: str
+    ) -> None:
+        """After log_intent returns the row is visible to another connection."""
+        await group_wal.log_intent("RQ001", {"action": 1})
+
+        other = WAL(MT5Settings(wal_path=temp_db_path))
+        await other.initialize()
+        try:
+            entry = await other.get_entry("RQ001")
+        finally:
+            await other.close()
+        assert entry is not None
+        assert entry.status == WAL.Status.PENDING
+
+    async def test_marks_are_buffered_then_visible(self, group_wal: WAL) -> None:
+        """mark_* return before commit; reads flush so they see the update."""
+        await group_wal.log_intent("RQ001", {"action": 1})
+        await group_wal.mark_sent("RQ001")
+        await group_wal.mark_verified("RQ001", {"retcode": 10009})
+        assert group_wal.get_stats()["pending"] == 2
+
+        entry = await group_wal.get_entry("RQ001")
+        assert entry is not None
+        assert entry.status == WAL.Status.VERIFIED
+
+    async def test_close_flushes_pending(
+        self, group_wal: WAL, temp_db_path: str
+    ) -> None:
+        """Buffered writes are committed on close."""
+        await group_wal.log_intent("RQ001", {"action": 1})
+        await group_wal.mark_failed("RQ001", "rejected")
+        await group_wal.close()
+
+        reopened = WAL(MT5Settings(wal_path=temp_db_path))
+        await reopened.initialize()
+        try:
+            entry = await reopened.get_entry("RQ001")
+        finally:
+            await reopened.close()
+        assert entry is not None
+        assert entry.status == WAL.Status.FAILED
+
+
 class TestWALStatusEnum:
     """Test WAL.Status enum values."""
 